@@ -0,0 +1,29 @@
+"""Benchmark agno's own overhead offline, with a scripted mock model instead of a provider."""
+
+from agno.agent import Agent
+from agno.eval.benchmarks import run_benchmarks
+from agno.eval.performance import PerformanceEval
+from agno.models.mock import MockModel
+
+agent = Agent(
+    model=MockModel(default_response="The capital of France is Paris.", latency=0.05, record_calls=False),
+    telemetry=False,
+)
+
+
+def run_agent():
+    return agent.run("What is the capital of France?")
+
+
+mock_response_perf = PerformanceEval(
+    name="Mock Model Performance Evaluation",
+    func=run_agent,
+    num_iterations=10,
+    warmup_runs=2,
+)
+
+if __name__ == "__main__":
+    mock_response_perf.run(print_results=True, print_summary=True)
+
+    # The packaged suite: agent runs, tools, streaming, teams, workflows and storage
+    run_benchmarks(num_iterations=10).print_summary()
@@ -61,11 +61,20 @@ from agno.run.cancel import (
     raise_if_cancelled,
     register_run,
 )
+from agno.run.context import (
+    RunContext,
+    RunScopedAttribute,
+    aiterate_with_run_context,
+    await_with_run_context,
+    iterate_with_run_context,
+    use_run_context,
+)
 from agno.run.messages import RunMessages
 from agno.run.team import TeamRunOutputEvent
 from agno.session import AgentSession, SessionSummaryManager
 from agno.tools import Toolkit
 from agno.tools.function import Function
+from agno.utils.blob_store import offload_media
 from agno.utils.common import is_typed_dict, validate_typed_dict
 from agno.utils.events import (
     create_memory_update_completed_event,
@@ -121,6 +130,13 @@ from agno.utils.response import (
 from agno.utils.safe_formatter import SafeFormatter
 from agno.utils.string import generate_id_from_name, parse_response_model_str
 from agno.utils.timer import Timer
+from agno.utils.tokens import (
+    Tokenizer,
+    fit_messages_to_token_budget,
+    fit_texts_to_token_budget,
+    get_default_tokenizer,
+    truncate_tool_results,
+)
 
 
 @dataclass(init=False)
@@ -186,6 +202,18 @@ class Agent:
     # Number of historical runs to include in the messages
     num_history_runs: int = 3
 
+    # --- Context Token Budgets ---
+    # If set, history is filled newest-first up to this many tokens (instead of the last num_history_runs runs)
+    max_history_tokens: Optional[int] = None
+    # If set, tool results added from history are truncated to this many tokens
+    max_tool_result_tokens: Optional[int] = None
+    # If set, knowledge references are added in ranked order up to this many tokens
+    max_knowledge_tokens: Optional[int] = None
+    # If set, the most recent user memories are added to the system message up to this many tokens
+    max_memory_tokens: Optional[int] = None
+    # Tokenizer used to count tokens for the budgets. Defaults to tiktoken, or a character estimate if unavailable
+    tokenizer: Optional[Tokenizer] = None
+
     # --- Knowledge ---
     knowledge: Optional[Knowledge] = None
     # Enable RAG by adding references from Knowledge to the user prompt.
@@ -356,6 +384,15 @@ class Agent:
     # This helps us improve the Agent and provide better support
     telemetry: bool = True
 
+    # --- Run-scoped state ---
+    # Built by each run in its RunContext, so concurrent runs of the same Agent don't share them
+    _tool_instructions = RunScopedAttribute[Optional[List[str]]]()
+    _tools_for_model = RunScopedAttribute[Optional[List[Dict[str, Any]]]]()
+    _functions_for_model = RunScopedAttribute[Optional[Dict[str, Function]]]()
+    _rebuild_tools = RunScopedAttribute[bool]()
+    _stream = RunScopedAttribute[bool]()
+    _stream_intermediate_steps = RunScopedAttribute[bool]()
+
     def __init__(
         self,
         *,
@@ -384,6 +421,11 @@ class Agent:
         session_summary_manager: Optional[SessionSummaryManager] = None,
         add_history_to_context: bool = False,
         num_history_runs: int = 3,
+        max_history_tokens: Optional[int] = None,
+        max_tool_result_tokens: Optional[int] = None,
+        max_knowledge_tokens: Optional[int] = None,
+        max_memory_tokens: Optional[int] = None,
+        tokenizer: Optional[Tokenizer] = None,
         store_media: bool = True,
         knowledge: Optional[Knowledge] = None,
         knowledge_filters: Optional[Dict[str, Any]] = None,
@@ -479,6 +521,12 @@ class Agent:
         self.add_history_to_context = add_history_to_context
         self.num_history_runs = num_history_runs
 
+        self.max_history_tokens = max_history_tokens
+        self.max_tool_result_tokens = max_tool_result_tokens
+        self.max_knowledge_tokens = max_knowledge_tokens
+        self.max_memory_tokens = max_memory_tokens
+        self.tokenizer = tokenizer
+
         if add_history_to_context and not db:
             log_warning(
                 "add_history_to_context is True, but no database has been assigned to the agent. History will not be added to the context."
@@ -569,10 +617,13 @@ class Agent:
         # If we are caching the agent session
         self._agent_session: Optional[AgentSession] = None
 
-        self._tool_instructions: Optional[List[str]] = None
-        self._tools_for_model: Optional[List[Dict[str, Any]]] = None
-        self._functions_for_model: Optional[Dict[str, Function]] = None
-        self._rebuild_tools: bool = True
+        self._tool_instructions = None
+        self._tools_for_model = None
+        self._functions_for_model = None
+        self._rebuild_tools = True
+        # Tools built by a previous run that didn't depend on it, reused by the next runs: (key, tools, functions,
+        # instructions)
+        self._tools_cache: Optional[Tuple[Tuple, List[Dict[str, Any]], Dict[str, Function], List[str]]] = None
 
         self._formatter: Optional[SafeFormatter] = None
 
@@ -715,10 +766,12 @@ class Agent:
             self.tools = []
         self.tools.append(tool)
         self._rebuild_tools = True
+        self._tools_cache = None
 
     def set_tools(self, tools: Sequence[Union[Toolkit, Callable, Function, Dict]]):
         self.tools = list(tools) if tools else []
         self._rebuild_tools = True
+        self._tools_cache = None
 
     def _initialize_session(
         self,
@@ -1326,9 +1379,6 @@ class Agent:
         if stream is False:
             stream_intermediate_steps = False
 
-        self.stream = self.stream or stream
-        self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
-
         # Prepare arguments for the model
         response_format = self._get_response_format() if self.parser_model is None else None
         self.model = cast(Model, self.model)
@@ -1362,47 +1412,54 @@ class Agent:
         # If no retries are set, use the agent's default retries
         retries = retries if retries is not None else self.retries
 
+        run_context = RunContext(run_id=run_id, stream=stream, stream_intermediate_steps=stream_intermediate_steps)
+
         last_exception = None
         num_attempts = retries + 1
 
         for attempt in range(num_attempts):
             try:
                 if stream:
-                    response_iterator = self._run_stream(
-                        run_response=run_response,
-                        session=agent_session,
-                        session_state=session_state,
-                        user_id=user_id,
-                        knowledge_filters=effective_filters,
-                        add_history_to_context=add_history,
-                        add_dependencies_to_context=add_dependencies,
-                        add_session_state_to_context=add_session_state,
-                        metadata=metadata,
-                        dependencies=run_dependencies,
-                        response_format=response_format,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        workflow_context=workflow_context,
-                        yield_run_response=yield_run_response,
-                        debug_mode=debug_mode,
-                        **kwargs,
+                    response_iterator = iterate_with_run_context(
+                        self,
+                        run_context,
+                        self._run_stream(
+                            run_response=run_response,
+                            session=agent_session,
+                            session_state=session_state,
+                            user_id=user_id,
+                            knowledge_filters=effective_filters,
+                            add_history_to_context=add_history,
+                            add_dependencies_to_context=add_dependencies,
+                            add_session_state_to_context=add_session_state,
+                            metadata=metadata,
+                            dependencies=run_dependencies,
+                            response_format=response_format,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                            workflow_context=workflow_context,
+                            yield_run_response=yield_run_response,
+                            debug_mode=debug_mode,
+                            **kwargs,
+                        ),
                     )
                     return response_iterator
                 else:
-                    response = self._run(
-                        run_response=run_response,
-                        session=agent_session,
-                        session_state=session_state,
-                        user_id=user_id,
-                        knowledge_filters=effective_filters,
-                        add_history_to_context=add_history,
-                        add_dependencies_to_context=add_dependencies,
-                        add_session_state_to_context=add_session_state,
-                        metadata=metadata,
-                        dependencies=run_dependencies,
-                        response_format=response_format,
-                        debug_mode=debug_mode,
-                        **kwargs,
-                    )
+                    with use_run_context(self, run_context):
+                        response = self._run(
+                            run_response=run_response,
+                            session=agent_session,
+                            session_state=session_state,
+                            user_id=user_id,
+                            knowledge_filters=effective_filters,
+                            add_history_to_context=add_history,
+                            add_dependencies_to_context=add_dependencies,
+                            add_session_state_to_context=add_session_state,
+                            metadata=metadata,
+                            dependencies=run_dependencies,
+                            response_format=response_format,
+                            debug_mode=debug_mode,
+                            **kwargs,
+                        )
                     return response
             except (InputCheckError, OutputCheckError) as e:
                 log_error(f"Validation failed: {str(e)} | Check: {e.check_trigger}")
@@ -2021,9 +2078,6 @@ class Agent:
         if stream is False:
             stream_intermediate_steps = False
 
-        self.stream = self.stream or stream
-        self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
-
         # Prepare arguments for the model
         response_format = self._get_response_format() if self.parser_model is None else None
         self.model = cast(Model, self.model)
@@ -2056,6 +2110,8 @@ class Agent:
         run_response.metrics = Metrics()
         run_response.metrics.start_timer()
 
+        run_context = RunContext(run_id=run_id, stream=stream, stream_intermediate_steps=stream_intermediate_steps)
+
         last_exception = None
         num_attempts = retries + 1
 
@@ -2063,42 +2119,50 @@ class Agent:
             try:
                 # Pass the new run_response to _arun
                 if stream:
-                    return self._arun_stream(  # type: ignore
-                        run_response=run_response,
-                        session=agent_session,
-                        user_id=user_id,
-                        session_state=session_state,
-                        knowledge_filters=effective_filters,
-                        add_history_to_context=add_history,
-                        add_dependencies_to_context=add_dependencies,
-                        add_session_state_to_context=add_session_state,
-                        metadata=metadata,
-                        response_format=response_format,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        workflow_context=workflow_context,
-                        yield_run_response=yield_run_response,
-                        dependencies=run_dependencies,
-                        debug_mode=debug_mode,
-                        **kwargs,
+                    return aiterate_with_run_context(
+                        self,
+                        run_context,
+                        self._arun_stream(  # type: ignore
+                            run_response=run_response,
+                            session=agent_session,
+                            user_id=user_id,
+                            session_state=session_state,
+                            knowledge_filters=effective_filters,
+                            add_history_to_context=add_history,
+                            add_dependencies_to_context=add_dependencies,
+                            add_session_state_to_context=add_session_state,
+                            metadata=metadata,
+                            response_format=response_format,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                            workflow_context=workflow_context,
+                            yield_run_response=yield_run_response,
+                            dependencies=run_dependencies,
+                            debug_mode=debug_mode,
+                            **kwargs,
+                        ),
                     )  # type: ignore[assignment]
                 else:
-                    return self._arun(  # type: ignore
-                        run_response=run_response,
-                        user_id=user_id,
-                        session=agent_session,
-                        session_state=session_state,
-                        knowledge_filters=knowledge_filters,
-                        add_history_to_context=add_history,
-                        add_dependencies_to_context=add_dependencies,
-                        add_session_state_to_context=add_session_state,
-                        metadata=metadata,
-                        response_format=response_format,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        workflow_context=workflow_context,
-                        yield_run_response=yield_run_response,
-                        dependencies=run_dependencies,
-                        debug_mode=debug_mode,
-                        **kwargs,
+                    return await_with_run_context(
+                        self,
+                        run_context,
+                        self._arun(  # type: ignore
+                            run_response=run_response,
+                            user_id=user_id,
+                            session=agent_session,
+                            session_state=session_state,
+                            knowledge_filters=knowledge_filters,
+                            add_history_to_context=add_history,
+                            add_dependencies_to_context=add_dependencies,
+                            add_session_state_to_context=add_session_state,
+                            metadata=metadata,
+                            response_format=response_format,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                            workflow_context=workflow_context,
+                            yield_run_response=yield_run_response,
+                            dependencies=run_dependencies,
+                            debug_mode=debug_mode,
+                            **kwargs,
+                        ),
                     )
 
             except (InputCheckError, OutputCheckError) as e:
@@ -2269,9 +2333,6 @@ class Agent:
         if stream is False:
             stream_intermediate_steps = False
 
-        self.stream = self.stream or stream
-        self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
-
         # Run can be continued from previous run response or from passed run_response context
         if run_response is not None:
             # The run is continued from a provided run_response. This contains the updated tools.
@@ -2295,16 +2356,20 @@ class Agent:
         response_format = self._get_response_format()
         self.model = cast(Model, self.model)
 
-        self._determine_tools_for_model(
-            model=self.model,
-            run_response=run_response,
-            session=agent_session,
-            session_state=session_state,
-            dependencies=run_dependencies,
-            user_id=user_id,
-            async_mode=False,
-            knowledge_filters=effective_filters,
+        run_context = RunContext(
+            run_id=run_response.run_id, stream=stream, stream_intermediate_steps=stream_intermediate_steps
         )
+        with use_run_context(self, run_context):
+            self._determine_tools_for_model(
+                model=self.model,
+                run_response=run_response,
+                session=agent_session,
+                session_state=session_state,
+                dependencies=run_dependencies,
+                user_id=user_id,
+                async_mode=False,
+                knowledge_filters=effective_filters,
+            )
 
         last_exception = None
         num_attempts = retries + 1
@@ -2323,25 +2388,30 @@ class Agent:
 
             try:
                 if stream:
-                    response_iterator = self._continue_run_stream(
-                        run_response=run_response,
-                        run_messages=run_messages,
-                        user_id=user_id,
-                        session=agent_session,
-                        response_format=response_format,
-                        stream_intermediate_steps=stream_intermediate_steps,
+                    response_iterator = iterate_with_run_context(
+                        self,
+                        run_context,
+                        self._continue_run_stream(
+                            run_response=run_response,
+                            run_messages=run_messages,
+                            user_id=user_id,
+                            session=agent_session,
+                            response_format=response_format,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                        ),
                     )
                     return response_iterator
                 else:
-                    response = self._continue_run(
-                        run_response=run_response,
-                        run_messages=run_messages,
-                        user_id=user_id,
-                        session=agent_session,
-                        response_format=response_format,
-                        debug_mode=debug_mode,
-                        **kwargs,
-                    )
+                    with use_run_context(self, run_context):
+                        response = self._continue_run(
+                            run_response=run_response,
+                            run_messages=run_messages,
+                            user_id=user_id,
+                            session=agent_session,
+                            response_format=response_format,
+                            debug_mode=debug_mode,
+                            **kwargs,
+                        )
                     return response
             except ModelProviderError as e:
                 log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
@@ -2665,9 +2735,6 @@ class Agent:
         if stream is False:
             stream_intermediate_steps = False
 
-        self.stream = self.stream or stream
-        self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
-
         # Run can be continued from previous run response or from passed run_response context
         if run_response is not None:
             # The run is continued from a provided run_response. This contains the updated tools.
@@ -2690,15 +2757,19 @@ class Agent:
         response_format = self._get_response_format()
         self.model = cast(Model, self.model)
 
-        self._determine_tools_for_model(
-            model=self.model,
-            run_response=run_response,
-            session=agent_session,
-            session_state=session_state,
-            user_id=user_id,
-            async_mode=True,
-            knowledge_filters=effective_filters,
+        run_context = RunContext(
+            run_id=run_response.run_id, stream=stream, stream_intermediate_steps=stream_intermediate_steps
         )
+        with use_run_context(self, run_context):
+            self._determine_tools_for_model(
+                model=self.model,
+                run_response=run_response,
+                session=agent_session,
+                session_state=session_state,
+                user_id=user_id,
+                async_mode=True,
+                knowledge_filters=effective_filters,
+            )
 
         last_exception = None
         num_attempts = retries + 1
@@ -2717,25 +2788,33 @@ class Agent:
 
             try:
                 if stream:
-                    return self._acontinue_run_stream(
-                        run_response=run_response,
-                        run_messages=run_messages,
-                        user_id=user_id,
-                        session=agent_session,
-                        response_format=response_format,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        dependencies=run_dependencies,
+                    return aiterate_with_run_context(
+                        self,
+                        run_context,
+                        self._acontinue_run_stream(
+                            run_response=run_response,
+                            run_messages=run_messages,
+                            user_id=user_id,
+                            session=agent_session,
+                            response_format=response_format,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                            dependencies=run_dependencies,
+                        ),
                     )
                 else:
-                    return self._acontinue_run(  # type: ignore
-                        run_response=run_response,
-                        run_messages=run_messages,
-                        user_id=user_id,
-                        session=agent_session,
-                        response_format=response_format,
-                        dependencies=run_dependencies,
-                        debug_mode=debug_mode,
-                        **kwargs,
+                    return await_with_run_context(
+                        self,
+                        run_context,
+                        self._acontinue_run(  # type: ignore
+                            run_response=run_response,
+                            run_messages=run_messages,
+                            user_id=user_id,
+                            session=agent_session,
+                            response_format=response_format,
+                            dependencies=run_dependencies,
+                            debug_mode=debug_mode,
+                            **kwargs,
+                        ),
                     )
             except ModelProviderError as e:
                 log_warning(f"Attempt {attempt + 1}/{num_attempts} failed: {str(e)}")
@@ -4113,7 +4192,7 @@ class Agent:
                 )
 
             if futures:
-                if self.stream_intermediate_steps:
+                if self._stream_intermediate_steps:
                     yield self._handle_event(
                         create_memory_update_started_event(from_run_response=run_response), run_response
                     )
@@ -4127,7 +4206,7 @@ class Agent:
                         log_warning(f"Error in memory/summary operation: {str(e)}")
 
                 print(f'{self.name} cost: {time.time() - t1}s')
-                if self.stream_intermediate_steps:
+                if self._stream_intermediate_steps:
                     yield self._handle_event(
                         create_memory_update_completed_event(from_run_response=run_response), run_response
                     )
@@ -4185,7 +4264,7 @@ class Agent:
             )
 
         if tasks:
-            if self.stream_intermediate_steps:
+            if self._stream_intermediate_steps:
                 yield self._handle_event(
                     create_memory_update_started_event(from_run_response=run_response), run_response
                 )
@@ -4196,7 +4275,7 @@ class Agent:
             except Exception as e:
                 log_warning(f"Error in memory/summary operation: {str(e)}")
 
-            if self.stream_intermediate_steps:
+            if self._stream_intermediate_steps:
                 yield self._handle_event(
                     create_memory_update_completed_event(from_run_response=run_response), run_response
                 )
@@ -4462,6 +4541,27 @@ class Agent:
         async_mode: bool = False,
         knowledge_filters: Optional[Dict[str, Any]] = None,
     ) -> None:
+        # Everything the tools are built from, besides the run itself
+        tools_cache_key = (
+            id(model),
+            async_mode,
+            tuple(
+                (id(tool), tuple(tool.functions) if isinstance(tool, Toolkit) else None) for tool in self.tools or []
+            ),
+            id(self.tool_hooks),
+            id(self.output_schema),
+            self.structured_outputs,
+            self.use_json_mode,
+            self.max_tool_result_tokens,
+        )
+        if self._rebuild_tools and self._tools_cache is not None and self._tools_cache[0] == tools_cache_key:
+            # Reuse the tools built by a previous run, copying the functions that hold the state of a run
+            self._rebuild_tools = False
+            _, tools_for_model, functions_for_model, tool_instructions = self._tools_cache
+            self._tools_for_model = list(tools_for_model)
+            self._functions_for_model = {name: func.model_copy() for name, func in functions_for_model.items()}
+            self._tool_instructions = list(tool_instructions)
+
         if self._rebuild_tools:
             self._rebuild_tools = False
 
@@ -4502,12 +4602,15 @@ class Agent:
                         for name, func in tool.functions.items():
                             # If the function does not exist in self.functions
                             if name not in self._functions_for_model:
+                                func = func.copy_for_run()
                                 func._agent = self
                                 func.process_entrypoint(strict=strict)
                                 if strict and func.strict is None:
                                     func.strict = True
                                 if self.tool_hooks is not None:
                                     func.tool_hooks = self.tool_hooks
+                                if self.max_tool_result_tokens is not None:
+                                    func._truncate_result = self._truncate_tool_result
                                 self._functions_for_model[name] = func
                                 self._tools_for_model.append({"type": "function", "function": func.to_dict()})
                                 log_debug(f"Added tool {name} from {tool.name}")
@@ -4518,12 +4621,15 @@ class Agent:
 
                     elif isinstance(tool, Function):
                         if tool.name not in self._functions_for_model:
+                            tool = tool.copy_for_run()
                             tool._agent = self
                             tool.process_entrypoint(strict=strict)
                             if strict and tool.strict is None:
                                 tool.strict = True
                             if self.tool_hooks is not None:
                                 tool.tool_hooks = self.tool_hooks
+                            if self.max_tool_result_tokens is not None:
+                                tool._truncate_result = self._truncate_tool_result
                             self._functions_for_model[tool.name] = tool
                             self._tools_for_model.append({"type": "function", "function": tool.to_dict()})
                             log_debug(f"Added tool {tool.name}")
@@ -4542,19 +4648,36 @@ class Agent:
                                     func.strict = True
                                 if self.tool_hooks is not None:
                                     func.tool_hooks = self.tool_hooks
+                                if self.max_tool_result_tokens is not None:
+                                    func._truncate_result = self._truncate_tool_result
                                 self._functions_for_model[func.name] = func
                                 self._tools_for_model.append({"type": "function", "function": func.to_dict()})
                                 log_debug(f"Added tool {func.name}")
                         except Exception as e:
                             log_warning(f"Could not add tool {tool}: {e}")
 
+            # get_tools() asks for a rebuild on the next run when the tools depend on this run
+            if self._rebuild_tools:
+                self._tools_cache = None
+            else:
+                self._tools_cache = (
+                    tools_cache_key,
+                    list(self._tools_for_model),
+                    {name: func.model_copy() for name, func in self._functions_for_model.items()},
+                    list(self._tool_instructions),
+                )
+
         # Update the session state for the functions
         if self._functions_for_model:
-            from inspect import signature
+            from agno.tools.schema_cache import get_schema_cache
+
+            schema_cache = get_schema_cache()
 
             # Check if any functions need media before collecting
             needs_media = any(
-                any(param in signature(func.entrypoint).parameters for param in ["images", "videos", "audios", "files"])
+                not schema_cache.get_parameter_names(func.entrypoint).isdisjoint(
+                    ["images", "videos", "audios", "files"]
+                )
                 for func in self._functions_for_model.values()
                 if func.entrypoint is not None
             )
@@ -4688,7 +4811,8 @@ class Agent:
         try:
             if not self.db:
                 raise ValueError("Db not initialized")
-            return self.db.upsert_session(session=session)  # type: ignore
+            with offload_media():
+                return self.db.upsert_session(session=session)  # type: ignore
         except Exception as e:
             log_warning(f"Error upserting session into db: {e}")
             return None
@@ -5327,6 +5451,8 @@ class Agent:
                 system_message_content += (
                     "You have access to memories from previous interactions with the user that you can use:\n\n"
                 )
+                if self.max_memory_tokens is not None:
+                    user_memories = self._fit_memories_to_token_budget(user_memories)
                 system_message_content += "<memories_from_previous_interactions>"
                 for _memory in user_memories:  # type: ignore
                     system_message_content += f"\n- {_memory.memory}"
@@ -5666,16 +5792,23 @@ class Agent:
                 self.system_message_role if self.system_message_role not in ["user", "assistant", "tool"] else None
             )
 
-            history: List[Message] = session.get_messages_from_last_n_runs(
-                last_n=self.num_history_runs,
-                skip_role=skip_role,
-                agent_id=self.id if self.team_id is not None else None,
-            )
+            # With a token budget, history is limited by tokens instead of by the number of runs
+            if self.max_history_tokens is not None:
+                history: List[Message] = self._get_history_within_token_budget(session, skip_role=skip_role)
+            else:
+                history = session.get_messages_from_last_n_runs(
+                    last_n=self.num_history_runs,
+                    skip_role=skip_role,
+                    agent_id=self.id if self.team_id is not None else None,
+                )
 
             if len(history) > 0:
                 # Create a deep copy of the history messages to avoid modifying the original messages
                 history_copy = [deepcopy(msg) for msg in history]
 
+                if self.max_tool_result_tokens is not None:
+                    truncate_tool_results(history_copy, self.max_tool_result_tokens, tokenizer=self._get_tokenizer())
+
                 # Tag each message as coming from history
                 for _msg in history_copy:
                     _msg.from_history = True
@@ -6002,10 +6135,64 @@ class Agent:
             log_warning(f"Error searching knowledge base: {e}")
             raise e
 
+    def _get_tokenizer(self) -> Tokenizer:
+        return self.tokenizer or get_default_tokenizer()
+
+    def _truncate_tool_result(self, result: str) -> str:
+        return self._get_tokenizer().truncate(result, self.max_tool_result_tokens)  # type: ignore
+
+    def _get_history_within_token_budget(self, session: AgentSession, skip_role: Optional[str] = None) -> List[Message]:
+        """The newest history messages that fit in max_history_tokens.
+
+        Runs are fetched newest first, in batches that double in size until the budget is full or the session has
+        no older runs, so long sessions aren't read in full on every run.
+        """
+        num_runs = len(session.runs or [])
+        last_n = max(self.num_history_runs or 1, 1)
+        while True:
+            history = session.get_messages_from_last_n_runs(
+                last_n=last_n,
+                skip_role=skip_role,
+                agent_id=self.id if self.team_id is not None else None,
+            )
+            kept = fit_messages_to_token_budget(
+                history,
+                self.max_history_tokens,  # type: ignore
+                user_role=self.user_message_role,
+                tokenizer=self._get_tokenizer(),
+                max_tool_result_tokens=self.max_tool_result_tokens,
+            )
+            if len(kept) < len(history) or last_n >= num_runs:
+                return kept
+            last_n *= 2
+
+    def _fit_memories_to_token_budget(self, memories: List[UserMemory]) -> List[UserMemory]:
+        """Keep the most recently updated memories that fit in max_memory_tokens, in their original order."""
+        if self.max_memory_tokens is None:
+            return memories
+        newest_first = sorted(memories, key=lambda m: m.updated_at.timestamp() if m.updated_at else 0, reverse=True)
+        kept_texts = fit_texts_to_token_budget(
+            [str(m.memory) for m in newest_first], self.max_memory_tokens, tokenizer=self._get_tokenizer()
+        )
+        kept_ids = {id(m) for m in newest_first[: len(kept_texts)]}
+        return [m for m in memories if id(m) in kept_ids]
+
     def _convert_documents_to_string(self, docs: List[Union[Dict[str, Any], str]]) -> str:
         if docs is None or len(docs) == 0:
             return ""
 
+        if self.max_knowledge_tokens is not None:
+            import json
+
+            # Documents arrive in ranked order, so keep the best ones that fit in the budget
+            doc_texts = [doc if isinstance(doc, str) else json.dumps(doc, ensure_ascii=False) for doc in docs]
+            num_kept = len(
+                fit_texts_to_token_budget(doc_texts, self.max_knowledge_tokens, tokenizer=self._get_tokenizer())
+            )
+            if num_kept < len(docs):
+                log_debug(f"Keeping {num_kept}/{len(docs)} knowledge references within the token budget")
+            docs = docs[:num_kept]
+
         if self.references_format == "yaml":
             import yaml
 
@@ -6268,7 +6455,7 @@ class Agent:
 
     def _reason(self, run_response: RunOutput, run_messages: RunMessages) -> Iterator[RunOutputEvent]:
         # Yield a reasoning started event
-        if self.stream_intermediate_steps:
+        if self._stream_intermediate_steps:
             yield self._handle_event(create_reasoning_started_event(from_run_response=run_response), run_response)
 
         use_default_reasoning = False
@@ -6356,7 +6543,7 @@ class Agent:
                     reasoning_steps=[ReasoningStep(result=reasoning_message.content)],
                     reasoning_agent_messages=[reasoning_message],
                 )
-                if self.stream_intermediate_steps:
+                if self._stream_intermediate_steps:
                     yield self._handle_event(
                         create_reasoning_completed_event(
                             from_run_response=run_response,
@@ -6439,7 +6626,7 @@ class Agent:
                     reasoning_steps: List[ReasoningStep] = reasoning_agent_response.content.reasoning_steps
                     all_reasoning_steps.extend(reasoning_steps)
                     # Yield reasoning steps
-                    if self.stream_intermediate_steps:
+                    if self._stream_intermediate_steps:
                         for reasoning_step in reasoning_steps:
                             updated_reasoning_content = self._format_reasoning_step_content(
                                 run_response=run_response, reasoning_step=reasoning_step
@@ -6488,7 +6675,7 @@ class Agent:
             )
 
             # Yield the final reasoning completed event
-            if self.stream_intermediate_steps:
+            if self._stream_intermediate_steps:
                 yield self._handle_event(
                     create_reasoning_completed_event(
                         from_run_response=run_response,
@@ -6500,7 +6687,7 @@ class Agent:
 
     async def _areason(self, run_response: RunOutput, run_messages: RunMessages) -> Any:
         # Yield a reasoning started event
-        if self.stream_intermediate_steps:
+        if self._stream_intermediate_steps:
             yield self._handle_event(create_reasoning_started_event(from_run_response=run_response), run_response)
 
         use_default_reasoning = False
@@ -6588,7 +6775,7 @@ class Agent:
                     reasoning_steps=[ReasoningStep(result=reasoning_message.content)],
                     reasoning_agent_messages=[reasoning_message],
                 )
-                if self.stream_intermediate_steps:
+                if self._stream_intermediate_steps:
                     yield self._handle_event(
                         create_reasoning_completed_event(
                             from_run_response=run_response,
@@ -6671,7 +6858,7 @@ class Agent:
                     reasoning_steps: List[ReasoningStep] = reasoning_agent_response.content.reasoning_steps
                     all_reasoning_steps.extend(reasoning_steps)
                     # Yield reasoning steps
-                    if self.stream_intermediate_steps:
+                    if self._stream_intermediate_steps:
                         for reasoning_step in reasoning_steps:
                             updated_reasoning_content = self._format_reasoning_step_content(
                                 run_response=run_response, reasoning_step=reasoning_step
@@ -6720,7 +6907,7 @@ class Agent:
             )
 
             # Yield the final reasoning completed event
-            if self.stream_intermediate_steps:
+            if self._stream_intermediate_steps:
                 yield self._handle_event(
                     create_reasoning_completed_event(
                         from_run_response=run_response,
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from datetime import date
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from agno.db.schemas import UserMemory
@@ -25,6 +25,7 @@ class BaseDb(ABC):
         eval_table: Optional[str] = None,
         knowledge_table: Optional[str] = None,
         id: Optional[str] = None,
+        cache_table: Optional[str] = None,
     ):
         self.id = id or str(uuid4())
         self.session_table_name = session_table or "agno_sessions"
@@ -32,6 +33,7 @@ class BaseDb(ABC):
         self.metrics_table_name = metrics_table or "agno_metrics"
         self.eval_table_name = eval_table or "agno_eval_runs"
         self.knowledge_table_name = knowledge_table or "agno_knowledge"
+        self.cache_table_name = cache_table or "agno_cache"
 
     # --- Sessions ---
     @abstractmethod
@@ -224,6 +226,71 @@ class BaseDb(ABC):
         """
         raise NotImplementedError
 
+    def get_knowledge_metadata_catalog(self, catalog_id: str) -> Optional[Dict[str, Any]]:
+        """Get the persisted metadata catalog for a knowledge base.
+
+        Databases that don't support a persisted catalog raise NotImplementedError, in which case the catalog
+        is built from the knowledge contents and kept in-process.
+
+        Args:
+            catalog_id (str): The ID of the catalog to get.
+
+        Returns:
+            Optional[Dict[str, Any]]: The serialized catalog, or None if it hasn't been stored yet.
+        """
+        raise NotImplementedError
+
+    def upsert_knowledge_metadata_catalog(self, catalog_id: str, catalog: Dict[str, Any]) -> None:
+        """Persist the metadata catalog for a knowledge base.
+
+        Args:
+            catalog_id (str): The ID of the catalog to upsert.
+            catalog (Dict[str, Any]): The serialized catalog.
+        """
+        raise NotImplementedError
+
+    def update_knowledge_metadata_catalog(
+        self, catalog_id: str, update: Callable[[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Apply a change to the persisted metadata catalog of a knowledge base, atomically.
+
+        The catalog is read and written under the database's write lock, so concurrent changes from other threads
+        or processes are never overwritten.
+
+        Args:
+            catalog_id (str): The ID of the catalog to update.
+            update (Callable): Receives the stored catalog, or None if it hasn't been stored yet, and returns the
+                catalog to store, or None to leave it unchanged.
+
+        Returns:
+            Optional[Dict[str, Any]]: The stored catalog after the update, or None if there is none.
+        """
+        raise NotImplementedError
+
+    # --- Cache ---
+    def get_cache_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached value. Expired entries are treated as missing.
+
+        Databases that don't support caching raise NotImplementedError, in which case callers cache in memory.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached value, or None if it doesn't exist or has expired.
+        """
+        raise NotImplementedError
+
+    def set_cache_entry(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store a cached value.
+
+        Args:
+            key (str): The cache key.
+            value (Dict[str, Any]): The value to cache. Must be JSON serializable.
+            ttl (Optional[int]): Seconds after which the entry expires. None means it never expires.
+        """
+        raise NotImplementedError
+
     # --- Evals ---
     @abstractmethod
     def create_eval_run(self, eval_run: EvalRunRecord) -> Optional[EvalRunRecord]:
@@ -1,10 +1,12 @@
 import time
 from copy import deepcopy
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple, Union
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from agno.db.base import BaseDb, SessionType
+from agno.db.in_memory.table import FrozenRow, IndexedTable
 from agno.db.in_memory.utils import (
     apply_sorting,
     calculate_date_metrics,
@@ -17,21 +19,47 @@ from agno.db.schemas.memory import UserMemory
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 
+# Field holding the id of the agent, team or workflow of each type of session
+COMPONENT_ID_FIELDS = {
+    SessionType.AGENT.value: "agent_id",
+    SessionType.TEAM.value: "team_id",
+    SessionType.WORKFLOW.value: "workflow_id",
+}
+
 
 class InMemoryDb(BaseDb):
     def __init__(self):
-        """Interface for in-memory storage."""
+        """Interface for in-memory storage.
+
+        Rows are kept in tables keyed by their id, with secondary indexes on the fields used to filter and sort them,
+        and stored as immutable snapshots: reads return a fresh copy of the row without deep copying it.
+        """
         super().__init__()
 
-        # Initialize in-memory storage dictionaries
-        self._sessions: List[Dict[str, Any]] = []
-        self._memories: List[Dict[str, Any]] = []
+        # Initialize in-memory storage tables
+        # Sessions are keyed by (session_id, session_type, component_id)
+        self._sessions = IndexedTable(
+            indexed_fields=("session_id", "user_id", "session_type", "component_id"),
+            sorted_fields=("created_at", "updated_at"),
+        )
+        self._memories = IndexedTable(indexed_fields=("user_id",), sorted_fields=("updated_at",))
         self._metrics: List[Dict[str, Any]] = []
-        self._eval_runs: List[Dict[str, Any]] = []
-        self._knowledge: List[Dict[str, Any]] = []
+        self._eval_runs = IndexedTable(sorted_fields=("created_at",))
+        self._knowledge = IndexedTable(sorted_fields=("created_at", "updated_at"))
+        self._knowledge_metadata_catalogs: Dict[str, FrozenRow] = {}
+        self._knowledge_metadata_catalogs_lock = Lock()
+        self._cache: Dict[str, Dict[str, Any]] = {}
 
     # -- Session methods --
 
+    def _put_session(self, key: Hashable, session: Dict[str, Any]) -> None:
+        component_id_field = COMPONENT_ID_FIELDS.get(session.get("session_type"))  # type: ignore
+        extras = {
+            "component_id": session.get(component_id_field) if component_id_field else None,
+            "session_name": (session.get("session_data") or {}).get("session_name") or "",
+        }
+        self._sessions.put(key, session, extras=extras)
+
     def delete_session(self, session_id: str) -> bool:
         """Delete a session from in-memory storage.
 
@@ -45,10 +73,12 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            original_count = len(self._sessions)
-            self._sessions = [s for s in self._sessions if s.get("session_id") != session_id]
+            deleted = False
+            with self._sessions.lock:
+                for key in self._sessions.lookup("session_id", session_id):
+                    deleted = self._sessions.delete(key) or deleted
 
-            if len(self._sessions) < original_count:
+            if deleted:
                 log_debug(f"Successfully deleted session with session_id: {session_id}")
                 return True
             else:
@@ -69,7 +99,10 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            self._sessions = [s for s in self._sessions if s.get("session_id") not in session_ids]
+            with self._sessions.lock:
+                for session_id in session_ids:
+                    for key in self._sessions.lookup("session_id", session_id):
+                        self._sessions.delete(key)
             log_debug(f"Successfully deleted sessions with ids: {session_ids}")
 
         except Exception as e:
@@ -100,25 +133,24 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the session.
         """
         try:
-            for session_data in self._sessions:
-                if session_data.get("session_id") == session_id:
-                    if user_id is not None and session_data.get("user_id") != user_id:
-                        continue
-                    session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
-                    if session_data.get("session_type") != session_type_value:
-                        continue
+            session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
+            for _, stored in self._sessions.stored_rows(self._sessions.lookup("session_id", session_id)):
+                if user_id is not None and stored.fields.get("user_id") != user_id:
+                    continue
+                if stored.fields.get("session_type") != session_type_value:
+                    continue
 
-                    session_data_copy = deepcopy(session_data)
+                session_data_copy = stored.row.thaw()
 
-                    if not deserialize:
-                        return session_data_copy
+                if not deserialize:
+                    return session_data_copy
 
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session_data_copy)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session_data_copy)
-                    else:
-                        return WorkflowSession.from_dict(session_data_copy)
+                if session_type == SessionType.AGENT:
+                    return AgentSession.from_dict(session_data_copy)
+                elif session_type == SessionType.TEAM:
+                    return TeamSession.from_dict(session_data_copy)
+                else:
+                    return WorkflowSession.from_dict(session_data_copy)
 
             return None
 
@@ -167,43 +199,46 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the sessions.
         """
         try:
+            session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
+
+            # Start from the smallest index matching the filters
+            if component_id is not None:
+                candidate_keys = self._sessions.lookup("component_id", component_id)
+            elif user_id is not None:
+                candidate_keys = self._sessions.lookup("user_id", user_id)
+            else:
+                candidate_keys = self._sessions.lookup("session_type", session_type_value)
+
             # Apply filters
-            filtered_sessions = []
-            for session_data in self._sessions:
-                if user_id is not None and session_data.get("user_id") != user_id:
+            filtered_keys = []
+            for key, stored in self._sessions.stored_rows(candidate_keys):
+                if user_id is not None and stored.fields.get("user_id") != user_id:
                     continue
-                if component_id is not None:
-                    if session_type == SessionType.AGENT and session_data.get("agent_id") != component_id:
-                        continue
-                    elif session_type == SessionType.TEAM and session_data.get("team_id") != component_id:
-                        continue
-                    elif session_type == SessionType.WORKFLOW and session_data.get("workflow_id") != component_id:
-                        continue
-                if start_timestamp is not None and session_data.get("created_at", 0) < start_timestamp:
+                if component_id is not None and stored.extras["component_id"] != component_id:
                     continue
-                if end_timestamp is not None and session_data.get("created_at", 0) > end_timestamp:
+                created_at = stored.fields.get("created_at", 0)
+                if start_timestamp is not None and created_at < start_timestamp:
                     continue
-                if session_name is not None:
-                    stored_name = session_data.get("session_data", {}).get("session_name", "")
-                    if session_name.lower() not in stored_name.lower():
-                        continue
-                session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
-                if session_data.get("session_type") != session_type_value:
+                if end_timestamp is not None and created_at > end_timestamp:
+                    continue
+                if session_name is not None and session_name.lower() not in stored.extras["session_name"].lower():
+                    continue
+                if stored.fields.get("session_type") != session_type_value:
                     continue
 
-                filtered_sessions.append(deepcopy(session_data))
-
-            total_count = len(filtered_sessions)
+                filtered_keys.append(key)
 
-            # Apply sorting
-            filtered_sessions = apply_sorting(filtered_sessions, sort_by, sort_order)
+            total_count = len(filtered_keys)
 
-            # Apply pagination
-            if limit is not None:
-                start_idx = 0
-                if page is not None:
-                    start_idx = (page - 1) * limit
-                filtered_sessions = filtered_sessions[start_idx : start_idx + limit]
+            # Apply sorting and pagination, copying only the sessions of the page
+            filtered_sessions = self._sessions.select(
+                filtered_keys,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+                sort_rows=lambda sessions: apply_sorting(sessions, sort_by, sort_order),
+            )
 
             if not deserialize:
                 return filtered_sessions, total_count
@@ -225,27 +260,30 @@ class InMemoryDb(BaseDb):
         self, session_id: str, session_type: SessionType, session_name: str, deserialize: Optional[bool] = True
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         try:
-            for i, session in enumerate(self._sessions):
-                if session.get("session_id") == session_id and session.get("session_type") == session_type.value:
+            with self._sessions.lock:
+                for key, stored in self._sessions.stored_rows(self._sessions.lookup("session_id", session_id)):
+                    if stored.fields.get("session_type") != session_type.value:
+                        continue
+
                     # Update session name in session_data
+                    session = stored.row.thaw()
                     if "session_data" not in session:
                         session["session_data"] = {}
                     session["session_data"]["session_name"] = session_name
 
-                    self._sessions[i] = session
+                    self._put_session(key, session)
 
                     log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
 
-                    session_copy = deepcopy(session)
                     if not deserialize:
-                        return session_copy
+                        return session
 
                     if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session_copy)
+                        return AgentSession.from_dict(session)
                     elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session_copy)
+                        return TeamSession.from_dict(session)
                     else:
-                        return WorkflowSession.from_dict(session_copy)
+                        return WorkflowSession.from_dict(session)
 
             return None
 
@@ -267,23 +305,23 @@ class InMemoryDb(BaseDb):
             elif isinstance(session, WorkflowSession):
                 session_dict["session_type"] = SessionType.WORKFLOW.value
 
-            # Find existing session to update
-            session_updated = False
-            for i, existing_session in enumerate(self._sessions):
-                if existing_session.get("session_id") == session_dict.get("session_id") and self._matches_session_key(
-                    existing_session, session
-                ):
-                    session_dict["updated_at"] = int(time.time())
-                    self._sessions[i] = deepcopy(session_dict)
-                    session_updated = True
-                    break
-
-            if not session_updated:
-                session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
-                session_dict["updated_at"] = session_dict.get("created_at")
-                self._sessions.append(deepcopy(session_dict))
+            component_id_field = COMPONENT_ID_FIELDS.get(session_dict.get("session_type"))  # type: ignore
+            key = (
+                session_dict.get("session_id"),
+                session_dict.get("session_type"),
+                session_dict.get(component_id_field) if component_id_field else None,
+            )
 
-            session_dict_copy = deepcopy(session_dict)
+            with self._sessions.lock:
+                existing_session = self._sessions.get_stored(key)
+                if existing_session is not None:
+                    session_dict["updated_at"] = int(time.time())
+                else:
+                    session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
+                    session_dict["updated_at"] = session_dict.get("created_at")
+                self._put_session(key, session_dict)
+                # Return a copy, not sharing any state with the given session
+                session_dict_copy: Dict[str, Any] = self._sessions.get(key)  # type: ignore
             if not deserialize:
                 return session_dict_copy
 
@@ -298,16 +336,6 @@ class InMemoryDb(BaseDb):
             log_error(f"Exception upserting session: {e}")
             raise e
 
-    def _matches_session_key(self, existing_session: Dict[str, Any], session: Session) -> bool:
-        """Check if existing session matches the key for the session type."""
-        if isinstance(session, AgentSession):
-            return existing_session.get("agent_id") == session.agent_id
-        elif isinstance(session, TeamSession):
-            return existing_session.get("team_id") == session.team_id
-        elif isinstance(session, WorkflowSession):
-            return existing_session.get("workflow_id") == session.workflow_id
-        return False
-
     def upsert_sessions(
         self, sessions: List[Session], deserialize: Optional[bool] = True
     ) -> List[Union[Session, Dict[str, Any]]]:
@@ -343,6 +371,14 @@ class InMemoryDb(BaseDb):
             return []
 
     # -- Memory methods --
+    def _put_memory(self, memory: Dict[str, Any]) -> None:
+        topics = memory.get("topics")
+        extras = {
+            "topics": tuple(topics) if isinstance(topics, list) else (),
+            "memory_text": str(memory.get("memory", "")).lower(),
+        }
+        self._memories.put(memory.get("memory_id"), memory, extras=extras)
+
     def delete_user_memory(self, memory_id: str, user_id: Optional[str] = None):
         """Delete a user memory from in-memory storage.
 
@@ -354,17 +390,14 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            original_count = len(self._memories)
-
-            # If user_id is provided, verify ownership before deleting
-            if user_id is not None:
-                self._memories = [
-                    m for m in self._memories if not (m.get("memory_id") == memory_id and m.get("user_id") == user_id)
-                ]
-            else:
-                self._memories = [m for m in self._memories if m.get("memory_id") != memory_id]
-
-            if len(self._memories) < original_count:
+            deleted = False
+            with self._memories.lock:
+                stored = self._memories.get_stored(memory_id)
+                # If user_id is provided, verify ownership before deleting
+                if stored is not None and (user_id is None or stored.fields.get("user_id") == user_id):
+                    deleted = self._memories.delete(memory_id)
+
+            if deleted:
                 log_debug(f"Successfully deleted user memory id: {memory_id}")
             else:
                 log_debug(f"No memory found with id: {memory_id}")
@@ -384,13 +417,11 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            # If user_id is provided, verify ownership before deleting
-            if user_id is not None:
-                self._memories = [
-                    m for m in self._memories if not (m.get("memory_id") in memory_ids and m.get("user_id") == user_id)
-                ]
-            else:
-                self._memories = [m for m in self._memories if m.get("memory_id") not in memory_ids]
+            with self._memories.lock:
+                for memory_id, stored in list(self._memories.stored_rows(memory_ids)):
+                    # If user_id is provided, verify ownership before deleting
+                    if user_id is None or stored.fields.get("user_id") == user_id:
+                        self._memories.delete(memory_id)
             log_debug(f"Successfully deleted {len(memory_ids)} user memories")
 
         except Exception as e:
@@ -408,10 +439,8 @@ class InMemoryDb(BaseDb):
         """
         try:
             topics = set()
-            for memory in self._memories:
-                memory_topics = memory.get("topics", [])
-                if isinstance(memory_topics, list):
-                    topics.update(memory_topics)
+            for _, stored in self._memories.stored_rows():
+                topics.update(stored.extras["topics"])
             return list(topics)
 
         except Exception as e:
@@ -435,18 +464,17 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs while reading the memory.
         """
         try:
-            for memory_data in self._memories:
-                if memory_data.get("memory_id") == memory_id:
-                    # Filter by user_id if provided
-                    if user_id is not None and memory_data.get("user_id") != user_id:
-                        continue
-
-                    memory_data_copy = deepcopy(memory_data)
-                    if not deserialize:
-                        return memory_data_copy
-                    return UserMemory.from_dict(memory_data_copy)
+            stored = self._memories.get_stored(memory_id)
+            if stored is None:
+                return None
+            # Filter by user_id if provided
+            if user_id is not None and stored.fields.get("user_id") != user_id:
+                return None
 
-            return None
+            memory_data_copy = stored.row.thaw()
+            if not deserialize:
+                return memory_data_copy
+            return UserMemory.from_dict(memory_data_copy)
 
         except Exception as e:
             log_error(f"Exception reading from memory storage: {e}")
@@ -466,37 +494,33 @@ class InMemoryDb(BaseDb):
         deserialize: Optional[bool] = True,
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         try:
+            candidate_keys = self._memories.lookup("user_id", user_id) if user_id is not None else None
+
             # Apply filters
-            filtered_memories = []
-            for memory_data in self._memories:
-                if user_id is not None and memory_data.get("user_id") != user_id:
+            filtered_keys = []
+            for key, stored in self._memories.stored_rows(candidate_keys):
+                if agent_id is not None and stored.fields.get("agent_id") != agent_id:
                     continue
-                if agent_id is not None and memory_data.get("agent_id") != agent_id:
+                if team_id is not None and stored.fields.get("team_id") != team_id:
                     continue
-                if team_id is not None and memory_data.get("team_id") != team_id:
+                if topics is not None and not any(topic in stored.extras["topics"] for topic in topics):
+                    continue
+                if search_content is not None and search_content.lower() not in stored.extras["memory_text"]:
                     continue
-                if topics is not None:
-                    memory_topics = memory_data.get("topics", [])
-                    if not any(topic in memory_topics for topic in topics):
-                        continue
-                if search_content is not None:
-                    memory_content = str(memory_data.get("memory", ""))
-                    if search_content.lower() not in memory_content.lower():
-                        continue
-
-                filtered_memories.append(deepcopy(memory_data))
 
-            total_count = len(filtered_memories)
+                filtered_keys.append(key)
 
-            # Apply sorting
-            filtered_memories = apply_sorting(filtered_memories, sort_by, sort_order)
+            total_count = len(filtered_keys)
 
-            # Apply pagination
-            if limit is not None:
-                start_idx = 0
-                if page is not None:
-                    start_idx = (page - 1) * limit
-                filtered_memories = filtered_memories[start_idx : start_idx + limit]
+            # Apply sorting and pagination, copying only the memories of the page
+            filtered_memories = self._memories.select(
+                filtered_keys,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+                sort_rows=lambda memories: apply_sorting(memories, sort_by, sort_order),
+            )
 
             if not deserialize:
                 return filtered_memories, total_count
@@ -525,8 +549,8 @@ class InMemoryDb(BaseDb):
         try:
             user_stats = {}
 
-            for memory in self._memories:
-                memory_user_id = memory.get("user_id")
+            for _, stored in self._memories.stored_rows():
+                memory_user_id = stored.fields.get("user_id")
 
                 if memory_user_id:
                     if memory_user_id not in user_stats:
@@ -536,7 +560,7 @@ class InMemoryDb(BaseDb):
                             "last_memory_updated_at": 0,
                         }
                     user_stats[memory_user_id]["total_memories"] += 1
-                    updated_at = memory.get("updated_at", 0)
+                    updated_at = stored.fields.get("updated_at", 0)
                     if updated_at > user_stats[memory_user_id]["last_memory_updated_at"]:
                         user_stats[memory_user_id]["last_memory_updated_at"] = updated_at
 
@@ -568,18 +592,10 @@ class InMemoryDb(BaseDb):
             memory_dict = memory.to_dict() if hasattr(memory, "to_dict") else memory.__dict__
             memory_dict["updated_at"] = int(time.time())
 
-            # Find existing memory to update
-            memory_updated = False
-            for i, existing_memory in enumerate(self._memories):
-                if existing_memory.get("memory_id") == memory.memory_id:
-                    self._memories[i] = memory_dict
-                    memory_updated = True
-                    break
-
-            if not memory_updated:
-                self._memories.append(memory_dict)
+            with self._memories.lock:
+                self._put_memory(memory_dict)
+                memory_dict_copy: Dict[str, Any] = self._memories.get(memory.memory_id)  # type: ignore
 
-            memory_dict_copy = deepcopy(memory_dict)
             if not deserialize:
                 return memory_dict_copy
 
@@ -611,7 +627,7 @@ class InMemoryDb(BaseDb):
         try:
             log_info(f"In-memory database: processing {len(memories)} memories with individual upsert operations")
             # For in-memory database, individual upserts are actually efficient
-            # since we're just manipulating Python lists and dictionaries
+            # since we're just manipulating Python dictionaries
             results = []
             for memory in memories:
                 if memory is not None:
@@ -716,9 +732,7 @@ class InMemoryDb(BaseDb):
 
         # No metrics records. Return the date of the first recorded session.
         if self._sessions:
-            # Sort by created_at
-            sorted_sessions = sorted(self._sessions, key=lambda x: x.get("created_at", 0))
-            first_session_date = sorted_sessions[0]["created_at"]
+            first_session_date = min(stored.fields.get("created_at", 0) for _, stored in self._sessions.stored_rows())
             return datetime.fromtimestamp(first_session_date, tz=timezone.utc).date()
 
         return None
@@ -729,18 +743,19 @@ class InMemoryDb(BaseDb):
         """Get all sessions for metrics calculation."""
         try:
             filtered_sessions = []
-            for session in self._sessions:
-                created_at = session.get("created_at", 0)
+            for _, stored in self._sessions.stored_rows():
+                created_at = stored.fields.get("created_at", 0)
                 if start_timestamp is not None and created_at < start_timestamp:
                     continue
                 if end_timestamp is not None and created_at >= end_timestamp:
                     continue
 
                 # Only include necessary fields for metrics
+                session = stored.row.thaw()
                 filtered_session = {
                     "user_id": session.get("user_id"),
-                    "session_data": deepcopy(session.get("session_data")),
-                    "runs": deepcopy(session.get("runs")),
+                    "session_data": session.get("session_data"),
+                    "runs": session.get("runs"),
                     "created_at": session.get("created_at"),
                     "session_type": session.get("session_type"),
                 }
@@ -794,7 +809,7 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            self._knowledge = [item for item in self._knowledge if item.get("id") != id]
+            self._knowledge.delete(id)
 
         except Exception as e:
             log_error(f"Error deleting knowledge content: {e}")
@@ -813,11 +828,8 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during retrieval.
         """
         try:
-            for item in self._knowledge:
-                if item.get("id") == id:
-                    return KnowledgeRow.model_validate(item)
-
-            return None
+            item = self._knowledge.get(id)
+            return KnowledgeRow.model_validate(item) if item is not None else None
 
         except Exception as e:
             log_error(f"Error getting knowledge content: {e}")
@@ -845,19 +857,17 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during retrieval.
         """
         try:
-            knowledge_items = [deepcopy(item) for item in self._knowledge]
-
-            total_count = len(knowledge_items)
-
-            # Apply sorting
-            knowledge_items = apply_sorting(knowledge_items, sort_by, sort_order)
-
-            # Apply pagination
-            if limit is not None:
-                start_idx = 0
-                if page is not None:
-                    start_idx = (page - 1) * limit
-                knowledge_items = knowledge_items[start_idx : start_idx + limit]
+            total_count = len(self._knowledge)
+
+            # Apply sorting and pagination, copying only the items of the page
+            knowledge_items = self._knowledge.select(
+                self._knowledge.keys(),
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+                sort_rows=lambda items: apply_sorting(items, sort_by, sort_order),
+            )
 
             return [KnowledgeRow.model_validate(item) for item in knowledge_items], total_count
 
@@ -878,18 +888,7 @@ class InMemoryDb(BaseDb):
             Exception: If an error occurs during upsert.
         """
         try:
-            knowledge_dict = knowledge_row.model_dump()
-
-            # Find existing item to update
-            item_updated = False
-            for i, existing_item in enumerate(self._knowledge):
-                if existing_item.get("id") == knowledge_row.id:
-                    self._knowledge[i] = knowledge_dict
-                    item_updated = True
-                    break
-
-            if not item_updated:
-                self._knowledge.append(knowledge_dict)
+            self._knowledge.put(knowledge_row.id, knowledge_row.model_dump())
 
             return knowledge_row
 
@@ -897,6 +896,80 @@ class InMemoryDb(BaseDb):
             log_error(f"Error upserting knowledge row: {e}")
             raise e
 
+    def get_knowledge_metadata_catalog(self, catalog_id: str) -> Optional[Dict[str, Any]]:
+        """Get the metadata catalog for a knowledge base.
+
+        Args:
+            catalog_id (str): The ID of the catalog to get.
+
+        Returns:
+            Optional[Dict[str, Any]]: The serialized catalog, or None if it doesn't exist.
+        """
+        catalog = self._knowledge_metadata_catalogs.get(catalog_id)
+        return catalog.thaw() if catalog is not None else None
+
+    def upsert_knowledge_metadata_catalog(self, catalog_id: str, catalog: Dict[str, Any]) -> None:
+        """Upsert the metadata catalog for a knowledge base.
+
+        Args:
+            catalog_id (str): The ID of the catalog to upsert.
+            catalog (Dict[str, Any]): The serialized catalog.
+        """
+        with self._knowledge_metadata_catalogs_lock:
+            self._knowledge_metadata_catalogs[catalog_id] = FrozenRow(catalog)
+
+    def update_knowledge_metadata_catalog(
+        self, catalog_id: str, update: Callable[[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Apply a change to the metadata catalog of a knowledge base, atomically.
+
+        Args:
+            catalog_id (str): The ID of the catalog to update.
+            update (Callable): Returns the catalog to store from the stored one, or None to leave it unchanged.
+
+        Returns:
+            Optional[Dict[str, Any]]: The stored catalog after the update, or None if there is none.
+        """
+        with self._knowledge_metadata_catalogs_lock:
+            stored = self._knowledge_metadata_catalogs.get(catalog_id)
+            catalog = update(stored.thaw() if stored is not None else None)
+            if catalog is None:
+                return stored.thaw() if stored is not None else None
+            self._knowledge_metadata_catalogs[catalog_id] = FrozenRow(catalog)
+            return catalog
+
+    # -- Cache methods --
+
+    def get_cache_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached value.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached value, or None if it doesn't exist or has expired.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry["expires_at"] is not None and entry["expires_at"] <= time.time():
+            self._cache.pop(key, None)
+            return None
+        return entry["value"].thaw()
+
+    def set_cache_entry(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store a cached value.
+
+        Args:
+            key (str): The cache key.
+            value (Dict[str, Any]): The value to cache.
+            ttl (Optional[int]): Seconds after which the entry expires. None means it never expires.
+        """
+        self._cache[key] = {
+            "value": FrozenRow(value),
+            "expires_at": time.time() + ttl if ttl is not None else None,
+        }
+
     # -- Eval methods --
 
     def create_eval_run(self, eval_run: EvalRunRecord) -> Optional[EvalRunRecord]:
@@ -907,7 +980,7 @@ class InMemoryDb(BaseDb):
             eval_dict["created_at"] = current_time
             eval_dict["updated_at"] = current_time
 
-            self._eval_runs.append(eval_dict)
+            self._eval_runs.put(eval_dict.get("run_id"), eval_dict)
 
             log_debug(f"Created eval run with id '{eval_run.run_id}'")
 
@@ -920,10 +993,11 @@ class InMemoryDb(BaseDb):
     def delete_eval_runs(self, eval_run_ids: List[str]) -> None:
         """Delete multiple eval runs from in-memory storage."""
         try:
-            original_count = len(self._eval_runs)
-            self._eval_runs = [run for run in self._eval_runs if run.get("run_id") not in eval_run_ids]
+            deleted_count = 0
+            with self._eval_runs.lock:
+                for eval_run_id in eval_run_ids:
+                    deleted_count += self._eval_runs.delete(eval_run_id)
 
-            deleted_count = original_count - len(self._eval_runs)
             if deleted_count > 0:
                 log_debug(f"Deleted {deleted_count} eval runs")
             else:
@@ -938,14 +1012,12 @@ class InMemoryDb(BaseDb):
     ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
         """Get an eval run from in-memory storage."""
         try:
-            for run_data in self._eval_runs:
-                if run_data.get("run_id") == eval_run_id:
-                    run_data_copy = deepcopy(run_data)
-                    if not deserialize:
-                        return run_data_copy
-                    return EvalRunRecord.model_validate(run_data_copy)
-
-            return None
+            run_data_copy = self._eval_runs.get(eval_run_id)
+            if run_data_copy is None:
+                return None
+            if not deserialize:
+                return run_data_copy
+            return EvalRunRecord.model_validate(run_data_copy)
 
         except Exception as e:
             log_error(f"Exception getting eval run {eval_run_id}: {e}")
@@ -968,8 +1040,9 @@ class InMemoryDb(BaseDb):
         """Get all eval runs from in-memory storage with filtering and pagination."""
         try:
             # Apply filters
-            filtered_runs = []
-            for run_data in self._eval_runs:
+            filtered_keys = []
+            for key, stored in self._eval_runs.stored_rows():
+                run_data = stored.fields
                 if agent_id is not None and run_data.get("agent_id") != agent_id:
                     continue
                 if team_id is not None and run_data.get("team_id") != team_id:
@@ -989,22 +1062,19 @@ class InMemoryDb(BaseDb):
                     elif filter_type == EvalFilterType.WORKFLOW and run_data.get("workflow_id") is None:
                         continue
 
-                filtered_runs.append(deepcopy(run_data))
+                filtered_keys.append(key)
 
-            total_count = len(filtered_runs)
+            total_count = len(filtered_keys)
 
-            # Apply sorting (default by created_at desc)
-            if sort_by is None:
-                filtered_runs.sort(key=lambda x: x.get("created_at", 0), reverse=True)
-            else:
-                filtered_runs = apply_sorting(filtered_runs, sort_by, sort_order)
-
-            # Apply pagination
-            if limit is not None:
-                start_idx = 0
-                if page is not None:
-                    start_idx = (page - 1) * limit
-                filtered_runs = filtered_runs[start_idx : start_idx + limit]
+            # Apply sorting (default by created_at desc) and pagination, copying only the runs of the page
+            filtered_runs = self._eval_runs.select(
+                filtered_keys,
+                sort_by=sort_by or "created_at",
+                sort_order=sort_order if sort_by is not None else "desc",
+                limit=limit,
+                page=page,
+                sort_rows=lambda runs: apply_sorting(runs, sort_by, sort_order),
+            )
 
             if not deserialize:
                 return filtered_runs, total_count
@@ -1020,21 +1090,21 @@ class InMemoryDb(BaseDb):
     ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
         """Rename an eval run."""
         try:
-            for i, run_data in enumerate(self._eval_runs):
-                if run_data.get("run_id") == eval_run_id:
-                    run_data["name"] = name
-                    run_data["updated_at"] = int(time.time())
-                    self._eval_runs[i] = run_data
+            with self._eval_runs.lock:
+                run_data = self._eval_runs.get(eval_run_id)
+                if run_data is None:
+                    return None
 
-                    log_debug(f"Renamed eval run with id '{eval_run_id}' to '{name}'")
+                run_data["name"] = name
+                run_data["updated_at"] = int(time.time())
+                self._eval_runs.put(eval_run_id, run_data)
 
-                    run_data_copy = deepcopy(run_data)
-                    if not deserialize:
-                        return run_data_copy
+            log_debug(f"Renamed eval run with id '{eval_run_id}' to '{name}'")
 
-                    return EvalRunRecord.model_validate(run_data_copy)
+            if not deserialize:
+                return run_data
 
-            return None
+            return EvalRunRecord.model_validate(run_data)
 
         except Exception as e:
             log_error(f"Error renaming eval run {eval_run_id}: {e}")
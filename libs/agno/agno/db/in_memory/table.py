@@ -0,0 +1,239 @@
+"""Indexed row storage for the in-memory database class."""
+
+import pickle
+from bisect import bisect_left, insort
+from copy import deepcopy
+from itertools import count
+from threading import RLock
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class FrozenRow:
+    """An immutable snapshot of a stored row.
+
+    The row is pickled once when it is written, and every read unpickles a fresh copy. That is several times faster
+    than a deepcopy, and callers can never mutate what is stored. Rows that can't be pickled are deep copied instead.
+    """
+
+    __slots__ = ("_data", "_pickled")
+
+    def __init__(self, row: Any):
+        self._data: Any
+        try:
+            self._data = pickle.dumps(row, protocol=pickle.HIGHEST_PROTOCOL)
+            self._pickled = True
+        except Exception:
+            self._data = deepcopy(row)
+            self._pickled = False
+
+    def thaw(self) -> Any:
+        return pickle.loads(self._data) if self._pickled else deepcopy(self._data)
+
+
+class StoredRow:
+    __slots__ = ("seq", "row", "fields", "nested", "extras")
+
+    def __init__(
+        self,
+        seq: int,
+        row: Dict[str, Any],
+        extras: Optional[Dict[str, Any]] = None,
+        frozen: Optional[FrozenRow] = None,
+    ):
+        # Position of the row in insertion order, kept when the row is updated
+        self.seq = seq
+        self.row = frozen if frozen is not None else FrozenRow(row)
+        # Scalar values of the row, readable without thawing it
+        self.fields: Dict[str, Any] = {key: value for key, value in row.items() if isinstance(value, SCALAR_TYPES)}
+        # Names of the other keys of the row
+        self.nested = frozenset(key for key in row if key not in self.fields)
+        # Values derived from nested parts of the row, for filters
+        self.extras = extras or {}
+
+
+class SortedIndex:
+    """Keys ordered by the numeric value of a field, then by insertion order"""
+
+    def __init__(self):
+        self._items: List[Tuple[Any, int, Hashable]] = []
+
+    def add(self, value: Any, seq: int, key: Hashable) -> None:
+        insort(self._items, (value, seq, key))
+
+    def remove(self, value: Any, seq: int, key: Hashable) -> None:
+        i = bisect_left(self._items, (value, seq))
+        if i < len(self._items) and self._items[i][1] == seq:
+            del self._items[i]
+
+    def iter_keys(self, reverse: bool = False) -> Iterator[Hashable]:
+        """Keys in order of the value. Keys with equal values stay in insertion order, like a stable sort."""
+        if not reverse:
+            for _, _, key in self._items:
+                yield key
+            return
+        end = len(self._items)
+        while end > 0:
+            start = bisect_left(self._items, (self._items[end - 1][0],), 0, end)
+            for _, _, key in self._items[start:end]:
+                yield key
+            end = start
+
+
+class IndexedTable:
+    """Rows stored by primary key, with secondary indexes on some of their fields.
+
+    Lookups by key or by an indexed field are O(1), and an ordered field is kept in a sorted index, so that a page
+    of rows sorted by it is read without sorting the table. Filters run on the scalar fields kept next to each row,
+    and only the rows returned are thawed.
+    """
+
+    def __init__(self, indexed_fields: Sequence[str] = (), sorted_fields: Sequence[str] = ()):
+        self._rows: Dict[Hashable, StoredRow] = {}
+        self._indexes: Dict[str, Dict[Any, Dict[Hashable, None]]] = {field: {} for field in indexed_fields}
+        self._sorted_indexes: Dict[str, SortedIndex] = {field: SortedIndex() for field in sorted_fields}
+        self._seq = count()
+        # Held by every change of the table. Hold it to read and then write a row atomically
+        self.lock = RLock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    def keys(self) -> List[Hashable]:
+        """All keys, in insertion order"""
+        return list(self._rows)
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """A copy of the row, or None"""
+        stored = self._rows.get(key)
+        return stored.row.thaw() if stored is not None else None
+
+    def get_stored(self, key: Hashable) -> Optional[StoredRow]:
+        return self._rows.get(key)
+
+    def stored_rows(self, keys: Optional[Iterable[Hashable]] = None) -> Iterator[Tuple[Hashable, StoredRow]]:
+        for key in self.keys() if keys is None else keys:
+            stored = self._rows.get(key)
+            if stored is not None:
+                yield key, stored
+
+    def lookup(self, field: str, value: Any) -> List[Hashable]:
+        """Keys of the rows whose indexed field has the value, in insertion order"""
+        with self.lock:
+            keys = self._indexes[field].get(value)
+            if not keys:
+                return []
+            return sorted(keys, key=lambda key: self._rows[key].seq)
+
+    def put(
+        self,
+        key: Hashable,
+        row: Dict[str, Any],
+        extras: Optional[Dict[str, Any]] = None,
+        frozen: Optional[FrozenRow] = None,
+    ) -> None:
+        """Insert or replace the row. A replaced row keeps its position in insertion order.
+
+        `frozen` is the snapshot to store, if the caller already has one for the row.
+        """
+        with self.lock:
+            existing = self._rows.get(key)
+            seq = existing.seq if existing is not None else next(self._seq)
+            stored = StoredRow(seq, row, extras, frozen)
+            if existing is not None:
+                self._unindex(key, existing)
+            self._rows[key] = stored
+            self._index(key, stored)
+
+    def delete(self, key: Hashable) -> bool:
+        with self.lock:
+            stored = self._rows.pop(key, None)
+            if stored is None:
+                return False
+            self._unindex(key, stored)
+            return True
+
+    def clear(self) -> None:
+        with self.lock:
+            self._rows.clear()
+            for index in self._indexes.values():
+                index.clear()
+            for field in self._sorted_indexes:
+                self._sorted_indexes[field] = SortedIndex()
+
+    def _index(self, key: Hashable, stored: StoredRow) -> None:
+        for field, index in self._indexes.items():
+            index.setdefault(self._value(stored, field), {})[key] = None
+        for field, sorted_index in self._sorted_indexes.items():
+            sorted_index.add(self._sort_value(stored, field), stored.seq, key)
+
+    def _unindex(self, key: Hashable, stored: StoredRow) -> None:
+        for field, index in self._indexes.items():
+            value = self._value(stored, field)
+            keys = index.get(value)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del index[value]
+        for field, sorted_index in self._sorted_indexes.items():
+            sorted_index.remove(self._sort_value(stored, field), stored.seq, key)
+
+    @staticmethod
+    def _value(stored: StoredRow, field: str) -> Any:
+        return stored.extras[field] if field in stored.extras else stored.fields.get(field)
+
+    @staticmethod
+    def _sort_value(stored: StoredRow, field: str) -> Any:
+        value = stored.fields.get(field)
+        return value if isinstance(value, (int, float)) else 0
+
+    def select(
+        self,
+        keys: List[Hashable],
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        sort_rows: Optional[Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Sort and paginate the rows with the given keys, and return copies of the rows of the page.
+
+        Like `apply_sorting`, rows are sorted only if the first one has the field, and rows with equal values keep
+        their order. Sorting by a scalar field uses the values kept next to the rows, or the sorted index of the field
+        when only a page is read. Sorting by any other field thaws every row and sorts them with `sort_rows`.
+        """
+        with self.lock:
+            # Skip rows deleted since the keys were selected
+            keys = [key for key in keys if key in self._rows]
+            start = (page - 1) * limit if limit is not None and page is not None else 0
+            end = start + limit if limit is not None else None
+            reverse = sort_order != "asc" if sort_order else True
+
+            if sort_by is not None and keys:
+                first = self._rows[keys[0]]
+                if (
+                    sort_by in self._sorted_indexes
+                    and limit is not None
+                    and isinstance(first.fields.get(sort_by), (int, float))
+                ):
+                    selected = set(keys)
+                    page_keys = []
+                    for key in self._sorted_indexes[sort_by].iter_keys(reverse=reverse):
+                        if key in selected:
+                            page_keys.append(key)
+                            if len(page_keys) == end:
+                                break
+                    keys = page_keys
+                elif sort_by in first.fields:
+                    try:
+                        keys = sorted(keys, key=lambda key: self._rows[key].fields.get(sort_by, 0), reverse=reverse)
+                    except TypeError:
+                        pass
+                elif sort_by in first.nested and sort_rows is not None:
+                    return sort_rows([self._rows[key].row.thaw() for key in keys])[start:end]
+
+            return [self._rows[key].row.thaw() for key in keys[start:end]]
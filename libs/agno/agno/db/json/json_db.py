@@ -1,12 +1,12 @@
-import json
 import os
 import time
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from agno.db.base import BaseDb, SessionType
+from agno.db.json.log_table import JsonLogTable
 from agno.db.json.utils import (
     apply_sorting,
     calculate_date_metrics,
@@ -21,6 +21,37 @@ from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
 
+# Field holding the id of the agent, team or workflow of each type of session
+COMPONENT_ID_FIELDS = {
+    SessionType.AGENT.value: "agent_id",
+    SessionType.TEAM.value: "team_id",
+    SessionType.WORKFLOW.value: "workflow_id",
+}
+
+
+def _get_session_key(session: Dict[str, Any]) -> Hashable:
+    component_id_field = COMPONENT_ID_FIELDS.get(session.get("session_type"))  # type: ignore
+    return (
+        session.get("session_id"),
+        session.get("session_type"),
+        session.get(component_id_field) if component_id_field else None,
+    )
+
+
+def _get_session_extras(session: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "component_id": _get_session_key(session)[2],  # type: ignore
+        "session_name": (session.get("session_data") or {}).get("session_name") or "",
+    }
+
+
+def _get_memory_extras(memory: Dict[str, Any]) -> Dict[str, Any]:
+    topics = memory.get("topics")
+    return {
+        "topics": tuple(topics) if isinstance(topics, list) else (),
+        "memory_text": str(memory.get("memory", "")).lower(),
+    }
+
 
 class JsonDb(BaseDb):
     def __init__(
@@ -32,10 +63,15 @@ class JsonDb(BaseDb):
         eval_table: Optional[str] = None,
         knowledge_table: Optional[str] = None,
         id: Optional[str] = None,
+        cache_table: Optional[str] = None,
     ):
         """
         Interface for interacting with JSON files as database.
 
+        Each table is an append-only log of JSON lines, `{table}.jsonl`, cached in memory. Writes append a line under
+        an advisory file lock, so several processes can share the same directory, and the log is compacted with an
+        atomic rename once it grows. Tables stored as `{table}.json` by previous versions are migrated on first use.
+
         Args:
             db_path (Optional[str]): Path to the directory where JSON files will be stored.
             session_table (Optional[str]): Name of the JSON file to store sessions (without .json extension).
@@ -44,6 +80,7 @@ class JsonDb(BaseDb):
             eval_table (Optional[str]): Name of the JSON file to store evaluation runs.
             knowledge_table (Optional[str]): Name of the JSON file to store knowledge content.
             id (Optional[str]): ID of the database.
+            cache_table (Optional[str]): Name of the JSON file to store cached values.
         """
         if id is None:
             seed = db_path or "agno_json_db"
@@ -56,64 +93,82 @@ class JsonDb(BaseDb):
             metrics_table=metrics_table,
             eval_table=eval_table,
             knowledge_table=knowledge_table,
+            cache_table=cache_table,
         )
 
         # Create the directory where the JSON files will be stored, if it doesn't exist
         self.db_path = Path(db_path or os.path.join(os.getcwd(), "agno_json_db"))
 
-    def _read_json_file(self, filename: str, create_table_if_not_found: Optional[bool] = True) -> List[Dict[str, Any]]:
-        """Read data from a JSON file, creating it if it doesn't exist.
+        self._tables: Dict[str, JsonLogTable] = {}
+
+    def _get_table(self, table_type: str) -> JsonLogTable:
+        """Get the log-backed table of the given type, opening it on first use.
 
         Args:
-            filename (str): The name of the JSON file to read.
+            table_type (str): One of "sessions", "memories", "metrics", "evals", "knowledge", "knowledge_metadata"
+                or "cache".
 
         Returns:
-            List[Dict[str, Any]]: The data from the JSON file.
+            JsonLogTable: The table.
 
         Raises:
-            json.JSONDecodeError: If the JSON file is not valid.
+            ValueError: If the table type is unknown.
         """
-        file_path = self.db_path / f"{filename}.json"
-
-        # Create directory if it doesn't exist
-        self.db_path.mkdir(parents=True, exist_ok=True)
-
-        try:
-            with open(file_path, "r") as f:
-                return json.load(f)
-
-        except FileNotFoundError:
-            if create_table_if_not_found:
-                with open(file_path, "w") as f:
-                    json.dump([], f)
-            return []
-
-        except json.JSONDecodeError as e:
-            log_error(f"Error reading the {file_path} JSON file")
-            raise e
-
-    def _write_json_file(self, filename: str, data: List[Dict[str, Any]]) -> None:
-        """Write data to a JSON file.
-
-        Args:
-            filename (str): The name of the JSON file to write.
-            data (List[Dict[str, Any]]): The data to write to the JSON file.
-
-        Raises:
-            Exception: If an error occurs while writing to the JSON file.
-        """
-        file_path = self.db_path / f"{filename}.json"
-
-        # Create directory if it doesn't exist
-        self.db_path.mkdir(parents=True, exist_ok=True)
-
-        try:
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+        if table_type == "sessions":
+            table_name = self.session_table_name
+        elif table_type == "memories":
+            table_name = self.memory_table_name
+        elif table_type == "metrics":
+            table_name = self.metrics_table_name
+        elif table_type == "evals":
+            table_name = self.eval_table_name
+        elif table_type == "knowledge":
+            table_name = self.knowledge_table_name
+        elif table_type == "knowledge_metadata":
+            table_name = f"{self.knowledge_table_name}_metadata"
+        elif table_type == "cache":
+            table_name = self.cache_table_name
+        else:
+            raise ValueError(f"Unknown table type: {table_type}")
+
+        table = self._tables.get(table_name)
+        if table is not None:
+            return table
+
+        if table_type == "sessions":
+            table = JsonLogTable(
+                self.db_path,
+                table_name,
+                key=_get_session_key,
+                indexed_fields=("session_id", "user_id", "session_type", "component_id"),
+                sorted_fields=("created_at", "updated_at"),
+                extras=_get_session_extras,
+            )
+        elif table_type == "memories":
+            table = JsonLogTable(
+                self.db_path,
+                table_name,
+                key=lambda memory: memory.get("memory_id"),
+                indexed_fields=("user_id",),
+                sorted_fields=("updated_at",),
+                extras=_get_memory_extras,
+            )
+        elif table_type == "metrics":
+            table = JsonLogTable(
+                self.db_path, table_name, key=lambda metric: (metric.get("date"), metric.get("aggregation_period"))
+            )
+        elif table_type == "evals":
+            table = JsonLogTable(
+                self.db_path, table_name, key=lambda run: run.get("run_id"), sorted_fields=("created_at",)
+            )
+        elif table_type == "knowledge":
+            table = JsonLogTable(
+                self.db_path, table_name, key=lambda item: item.get("id"), sorted_fields=("created_at", "updated_at")
+            )
+        else:
+            table = JsonLogTable(self.db_path, table_name, key=lambda entry: entry.get("id"))
 
-        except Exception as e:
-            log_error(f"Error writing to the {file_path} JSON file: {e}")
-            raise e
+        return self._tables.setdefault(table_name, table)
 
     # -- Session methods --
 
@@ -130,12 +185,13 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            sessions = self._read_json_file(self.session_table_name)
-            original_count = len(sessions)
-            sessions = [s for s in sessions if s.get("session_id") != session_id]
+            table = self._get_table("sessions")
+            with table.transaction() as sessions:
+                keys = sessions.lookup("session_id", session_id)
+                for key in keys:
+                    table.delete(key)
 
-            if len(sessions) < original_count:
-                self._write_json_file(self.session_table_name, sessions)
+            if keys:
                 log_debug(f"Successfully deleted session with session_id: {session_id}")
                 return True
 
@@ -157,9 +213,11 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            sessions = self._read_json_file(self.session_table_name)
-            sessions = [s for s in sessions if s.get("session_id") not in session_ids]
-            self._write_json_file(self.session_table_name, sessions)
+            table = self._get_table("sessions")
+            with table.transaction() as sessions:
+                for session_id in session_ids:
+                    for key in sessions.lookup("session_id", session_id):
+                        table.delete(key)
             log_debug(f"Successfully deleted sessions with ids: {session_ids}")
 
         except Exception as e:
@@ -190,29 +248,28 @@ class JsonDb(BaseDb):
             Exception: If an error occurs while reading the session.
         """
         try:
-            sessions = self._read_json_file(self.session_table_name)
+            sessions = self._get_table("sessions").read()
 
-            for session_data in sessions:
-                if session_data.get("session_id") == session_id:
-                    if user_id is not None and session_data.get("user_id") != user_id:
-                        continue
-                    session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
-                    if session_data.get("session_type") != session_type_value:
-                        continue
+            session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
+            for _, stored in sessions.stored_rows(sessions.lookup("session_id", session_id)):
+                if user_id is not None and stored.fields.get("user_id") != user_id:
+                    continue
+                if stored.fields.get("session_type") != session_type_value:
+                    continue
 
-                    session = hydrate_session(session_data)
+                session = hydrate_session(stored.row.thaw())
 
-                    if not deserialize:
-                        return session
+                if not deserialize:
+                    return session
 
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session)
-                    elif session_type == SessionType.WORKFLOW:
-                        return WorkflowSession.from_dict(session)
-                    else:
-                        raise ValueError(f"Invalid session type: {session_type}")
+                if session_type == SessionType.AGENT:
+                    return AgentSession.from_dict(session)
+                elif session_type == SessionType.TEAM:
+                    return TeamSession.from_dict(session)
+                elif session_type == SessionType.WORKFLOW:
+                    return WorkflowSession.from_dict(session)
+                else:
+                    raise ValueError(f"Invalid session type: {session_type}")
 
             return None
 
@@ -259,45 +316,47 @@ class JsonDb(BaseDb):
             Exception: If an error occurs while reading the sessions.
         """
         try:
-            sessions = self._read_json_file(self.session_table_name)
+            sessions = self._get_table("sessions").read()
+            session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
+
+            # Start from the smallest index matching the filters
+            if component_id is not None:
+                candidate_keys = sessions.lookup("component_id", component_id)
+            elif user_id is not None:
+                candidate_keys = sessions.lookup("user_id", user_id)
+            else:
+                candidate_keys = sessions.lookup("session_type", session_type_value)
 
             # Apply filters
-            filtered_sessions = []
-            for session_data in sessions:
-                if user_id is not None and session_data.get("user_id") != user_id:
+            filtered_keys = []
+            for key, stored in sessions.stored_rows(candidate_keys):
+                if user_id is not None and stored.fields.get("user_id") != user_id:
                     continue
-                if component_id is not None:
-                    if session_type == SessionType.AGENT and session_data.get("agent_id") != component_id:
-                        continue
-                    elif session_type == SessionType.TEAM and session_data.get("team_id") != component_id:
-                        continue
-                    elif session_type == SessionType.WORKFLOW and session_data.get("workflow_id") != component_id:
-                        continue
-                if start_timestamp is not None and session_data.get("created_at", 0) < start_timestamp:
+                if component_id is not None and stored.extras["component_id"] != component_id:
                     continue
-                if end_timestamp is not None and session_data.get("created_at", 0) > end_timestamp:
+                created_at = stored.fields.get("created_at", 0)
+                if start_timestamp is not None and created_at < start_timestamp:
                     continue
-                if session_name is not None:
-                    stored_name = session_data.get("session_data", {}).get("session_name", "")
-                    if session_name.lower() not in stored_name.lower():
-                        continue
-                session_type_value = session_type.value if isinstance(session_type, SessionType) else session_type
-                if session_data.get("session_type") != session_type_value:
+                if end_timestamp is not None and created_at > end_timestamp:
+                    continue
+                if session_name is not None and session_name.lower() not in stored.extras["session_name"].lower():
+                    continue
+                if stored.fields.get("session_type") != session_type_value:
                     continue
 
-                filtered_sessions.append(session_data)
-
-            total_count = len(filtered_sessions)
+                filtered_keys.append(key)
 
-            # Apply sorting
-            filtered_sessions = apply_sorting(filtered_sessions, sort_by, sort_order)
+            total_count = len(filtered_keys)
 
-            # Apply pagination
-            if limit is not None:
-                start_idx = 0
-                if page is not None:
-                    start_idx = (page - 1) * limit
-                filtered_sessions = filtered_sessions[start_idx : start_idx + limit]
+            # Apply sorting and pagination, reading only the sessions of the page
+            filtered_sessions = sessions.select(
+                filtered_keys,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+                sort_rows=lambda rows: apply_sorting(rows, sort_by, sort_order),
+            )
 
             if not deserialize:
                 return filtered_sessions, total_count
@@ -320,33 +379,36 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Rename a session in the JSON file."""
         try:
-            sessions = self._read_json_file(self.session_table_name)
-
-            for i, session in enumerate(sessions):
-                if session.get("session_id") == session_id and session.get("session_type") == session_type.value:
-                    # Update session name in session_data
-                    if "session_data" not in session:
-                        session["session_data"] = {}
-                    session["session_data"]["session_name"] = session_name
-
-                    sessions[i] = session
-                    self._write_json_file(self.session_table_name, sessions)
+            table = self._get_table("sessions")
+            session = None
+            with table.transaction() as sessions:
+                for key, stored in sessions.stored_rows(sessions.lookup("session_id", session_id)):
+                    if stored.fields.get("session_type") == session_type.value:
+                        # Update session name in session_data
+                        session = stored.row.thaw()
+                        if session.get("session_data") is None:
+                            session["session_data"] = {}
+                        session["session_data"]["session_name"] = session_name
+
+                        table.put(session, key=key)
+                        break
 
-                    log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
+            if session is None:
+                return None
 
-                    if not deserialize:
-                        return session
+            log_debug(f"Renamed session with id '{session_id}' to '{session_name}'")
 
-                    if session_type == SessionType.AGENT:
-                        return AgentSession.from_dict(session)
-                    elif session_type == SessionType.TEAM:
-                        return TeamSession.from_dict(session)
-                    elif session_type == SessionType.WORKFLOW:
-                        return WorkflowSession.from_dict(session)
-                    else:
-                        raise ValueError(f"Invalid session type: {session_type}")
+            if not deserialize:
+                return session
 
-            return None
+            if session_type == SessionType.AGENT:
+                return AgentSession.from_dict(session)
+            elif session_type == SessionType.TEAM:
+                return TeamSession.from_dict(session)
+            elif session_type == SessionType.WORKFLOW:
+                return WorkflowSession.from_dict(session)
+            else:
+                raise ValueError(f"Invalid session type: {session_type}")
 
         except Exception as e:
             log_error(f"Exception renaming session: {e}")
@@ -357,7 +419,6 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[Session, Dict[str, Any]]]:
         """Insert or update a session in the JSON file."""
         try:
-            sessions = self._read_json_file(self.session_table_name, create_table_if_not_found=True)
             session_dict = session.to_dict()
 
             # Add session_type based on session instance type
@@ -368,25 +429,16 @@ class JsonDb(BaseDb):
             elif isinstance(session, WorkflowSession):
                 session_dict["session_type"] = SessionType.WORKFLOW.value
 
-            # Find existing session to update
-            session_updated = False
-            for i, existing_session in enumerate(sessions):
-                if existing_session.get("session_id") == session_dict.get("session_id") and self._matches_session_key(
-                    existing_session, session
-                ):
+            table = self._get_table("sessions")
+            with table.transaction() as sessions:
+                if _get_session_key(session_dict) in sessions:
                     # Update existing session
                     session_dict["updated_at"] = int(time.time())
-                    sessions[i] = session_dict
-                    session_updated = True
-                    break
-
-            if not session_updated:
-                # Add new session
-                session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
-                session_dict["updated_at"] = session_dict.get("created_at")
-                sessions.append(session_dict)
-
-            self._write_json_file(self.session_table_name, sessions)
+                else:
+                    # Add new session
+                    session_dict["created_at"] = session_dict.get("created_at", int(time.time()))
+                    session_dict["updated_at"] = session_dict.get("created_at")
+                table.put(session_dict)
 
             if not deserialize:
                 return session_dict
@@ -434,16 +486,6 @@ class JsonDb(BaseDb):
             log_error(f"Exception during bulk session upsert: {e}")
             return []
 
-    def _matches_session_key(self, existing_session: Dict[str, Any], session: Session) -> bool:
-        """Check if existing session matches the key for the session type."""
-        if isinstance(session, AgentSession):
-            return existing_session.get("agent_id") == session.agent_id
-        elif isinstance(session, TeamSession):
-            return existing_session.get("team_id") == session.team_id
-        elif isinstance(session, WorkflowSession):
-            return existing_session.get("workflow_id") == session.workflow_id
-        return False
-
     # -- Memory methods --
     def delete_user_memory(self, memory_id: str, user_id: Optional[str] = None):
         """Delete a user memory from the JSON file.
@@ -453,25 +495,19 @@ class JsonDb(BaseDb):
             user_id (Optional[str]): The ID of the user (optional, for filtering).
         """
         try:
-            memories = self._read_json_file(self.memory_table_name)
-            original_count = len(memories)
-
-            # If user_id is provided, verify the memory belongs to the user before deleting
-            if user_id:
-                memory_to_delete = None
-                for m in memories:
-                    if m.get("memory_id") == memory_id:
-                        memory_to_delete = m
-                        break
+            table = self._get_table("memories")
+            with table.transaction() as memories:
+                memory_to_delete = memories.get_stored(memory_id)
 
-                if memory_to_delete and memory_to_delete.get("user_id") != user_id:
+                # If user_id is provided, verify the memory belongs to the user before deleting
+                if user_id and memory_to_delete and memory_to_delete.fields.get("user_id") != user_id:
                     log_debug(f"Memory {memory_id} does not belong to user {user_id}")
                     return
 
-            memories = [m for m in memories if m.get("memory_id") != memory_id]
+                if memory_to_delete is not None:
+                    table.delete(memory_id)
 
-            if len(memories) < original_count:
-                self._write_json_file(self.memory_table_name, memories)
+            if memory_to_delete is not None:
                 log_debug(f"Successfully deleted user memory id: {memory_id}")
             else:
                 log_debug(f"No memory found with id: {memory_id}")
@@ -488,18 +524,20 @@ class JsonDb(BaseDb):
             user_id (Optional[str]): The ID of the user (optional, for filtering).
         """
         try:
-            memories = self._read_json_file(self.memory_table_name)
-
-            # If user_id is provided, filter memory_ids to only those belonging to the user
-            if user_id:
-                filtered_memory_ids: List[str] = []
-                for memory in memories:
-                    if memory.get("memory_id") in memory_ids and memory.get("user_id") == user_id:
-                        filtered_memory_ids.append(memory.get("memory_id"))  # type: ignore
-                memory_ids = filtered_memory_ids
-
-            memories = [m for m in memories if m.get("memory_id") not in memory_ids]
-            self._write_json_file(self.memory_table_name, memories)
+            table = self._get_table("memories")
+            with table.transaction() as memories:
+                # If user_id is provided, filter memory_ids to only those belonging to the user
+                if user_id:
+                    filtered_memory_ids: List[str] = []
+                    for memory_id in memory_ids:
+                        memory = memories.get_stored(memory_id)
+                        if memory is not None and memory.fields.get("user_id") == user_id:
+                            filtered_memory_ids.append(memory_id)
+                    memory_ids = filtered_memory_ids
+
+                for memory_id in memory_ids:
+                    if memory_id in memories:
+                        table.delete(memory_id)
 
             log_debug(f"Successfully deleted {len(memory_ids)} user memories")
 
@@ -514,13 +552,11 @@ class JsonDb(BaseDb):
             List[str]: List of unique memory topics.
         """
         try:
-            memories = self._read_json_file(self.memory_table_name)
+            memories = self._get_table("memories").read()
 
             topics = set()
-            for memory in memories:
-                memory_topics = memory.get("topics", [])
-                if isinstance(memory_topics, list):
-                    topics.update(memory_topics)
+            for _, memory in memories.stored_rows():
+                topics.update(memory.extras["topics"])
             return list(topics)
 
         except Exception as e:
@@ -544,19 +580,18 @@ class JsonDb(BaseDb):
             Optional[Union[UserMemory, Dict[str, Any]]]: The user memory data if found, None otherwise.
         """
         try:
-            memories = self._read_json_file(self.memory_table_name)
-
-            for memory_data in memories:
-                if memory_data.get("memory_id") == memory_id:
-                    # Filter by user_id if provided
-                    if user_id and memory_data.get("user_id") != user_id:
-                        return None
+            stored = self._get_table("memories").read().get_stored(memory_id)
+            if stored is None:
+                return None
 
-                    if not deserialize:
-                        return memory_data
-                    return UserMemory.from_dict(memory_data)
+            # Filter by user_id if provided
+            if user_id and stored.fields.get("user_id") != user_id:
+                return None
 
-            return None
+            memory_data = stored.row.thaw()
+            if not deserialize:
+                return memory_data
+            return UserMemory.from_dict(memory_data)
 
         except Exception as e:
             log_error(f"Exception reading from memory file: {e}")
@@ -577,39 +612,34 @@ class JsonDb(BaseDb):
     ) -> Union[List[UserMemory], Tuple[List[Dict[str, Any]], int]]:
         """Get all memories from the JSON file with filtering and pagination."""
         try:
-            memories = self._read_json_file(self.memory_table_name)
+            memories = self._get_table("memories").read()
+            candidate_keys = memories.lookup("user_id", user_id) if user_id is not None else None
 
             # Apply filters
-            filtered_memories = []
-            for memory_data in memories:
-                if user_id is not None and memory_data.get("user_id") != user_id:
+            filtered_keys = []
+            for key, memory in memories.stored_rows(candidate_keys):
+                if agent_id is not None and memory.fields.get("agent_id") != agent_id:
                     continue
-                if agent_id is not None and memory_data.get("agent_id") != agent_id:
+                if team_id is not None and memory.fields.get("team_id") != team_id:
                     continue
-                if team_id is not None and memory_data.get("team_id") != team_id:
+                if topics is not None and not any(topic in memory.extras["topics"] for topic in topics):
+                    continue
+                if search_content is not None and search_content.lower() not in memory.extras["memory_text"]:
                     continue
-                if topics is not None:
-                    memory_topics = memory_data.get("topics", [])
-                    if not any(topic in memory_topics for topic in topics):
-                        continue
-                if search_content is not None:
-                    memory_content = str(memory_data.get("memory", ""))
-                    if search_content.lower() not in memory_content.lower():
-                        continue
-
-                filtered_memories.append(memory_data)
 
-            total_count = len(filtered_memories)
+                filtered_keys.append(key)
 
-            # Apply sorting
-            filtered_memories = apply_sorting(filtered_memories, sort_by, sort_order)
+            total_count = len(filtered_keys)
 
-            # Apply pagination
-            if limit is not None:
-                start_idx = 0
-                if page is not None:
-                    start_idx = (page - 1) * limit
-                filtered_memories = filtered_memories[start_idx : start_idx + limit]
+            # Apply sorting and pagination, reading only the memories of the page
+            filtered_memories = memories.select(
+                filtered_keys,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+                sort_rows=lambda rows: apply_sorting(rows, sort_by, sort_order),
+            )
 
             if not deserialize:
                 return filtered_memories, total_count
@@ -633,11 +663,11 @@ class JsonDb(BaseDb):
             Tuple[List[Dict[str, Any]], int]: A list of dictionaries containing user stats and total count.
         """
         try:
-            memories = self._read_json_file(self.memory_table_name)
+            memories = self._get_table("memories").read()
             user_stats = {}
 
-            for memory in memories:
-                memory_user_id = memory.get("user_id")
+            for _, memory in memories.stored_rows():
+                memory_user_id = memory.fields.get("user_id")
                 if memory_user_id:
                     if memory_user_id not in user_stats:
                         user_stats[memory_user_id] = {
@@ -646,7 +676,7 @@ class JsonDb(BaseDb):
                             "last_memory_updated_at": 0,
                         }
                     user_stats[memory_user_id]["total_memories"] += 1
-                    updated_at = memory.get("updated_at", 0)
+                    updated_at = memory.fields.get("updated_at", 0)
                     if updated_at > user_stats[memory_user_id]["last_memory_updated_at"]:
                         user_stats[memory_user_id]["last_memory_updated_at"] = updated_at
 
@@ -673,26 +703,15 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[UserMemory, Dict[str, Any]]]:
         """Upsert a user memory in the JSON file."""
         try:
-            memories = self._read_json_file(self.memory_table_name, create_table_if_not_found=True)
-
             if memory.memory_id is None:
                 memory.memory_id = str(uuid4())
 
             memory_dict = memory.to_dict() if hasattr(memory, "to_dict") else memory.__dict__
             memory_dict["updated_at"] = int(time.time())
 
-            # Find existing memory to update
-            memory_updated = False
-            for i, existing_memory in enumerate(memories):
-                if existing_memory.get("memory_id") == memory.memory_id:
-                    memories[i] = memory_dict
-                    memory_updated = True
-                    break
-
-            if not memory_updated:
-                memories.append(memory_dict)
-
-            self._write_json_file(self.memory_table_name, memories)
+            table = self._get_table("memories")
+            with table.transaction():
+                table.put(memory_dict, key=memory.memory_id)
 
             if not deserialize:
                 return memory_dict
@@ -745,8 +764,10 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            # Simply write an empty list to the memory JSON file
-            self._write_json_file(self.memory_table_name, [])
+            table = self._get_table("memories")
+            with table.transaction() as memories:
+                for memory_id in memories.keys():
+                    table.delete(memory_id)
 
         except Exception as e:
             log_warning(f"Exception deleting all memories: {e}")
@@ -756,9 +777,10 @@ class JsonDb(BaseDb):
     def calculate_metrics(self) -> Optional[list[dict]]:
         """Calculate metrics for all dates without complete metrics."""
         try:
-            metrics = self._read_json_file(self.metrics_table_name, create_table_if_not_found=True)
+            table = self._get_table("metrics")
+            metrics = table.read()
 
-            starting_date = self._get_metrics_calculation_starting_date(metrics)
+            starting_date = self._get_metrics_calculation_starting_date(metrics.select(metrics.keys()))
             if starting_date is None:
                 log_info("No session data found. Won't calculate metrics.")
                 return None
@@ -783,35 +805,20 @@ class JsonDb(BaseDb):
 
             results = []
 
-            for date_to_process in dates_to_process:
-                date_key = date_to_process.isoformat()
-                sessions_for_date = all_sessions_data.get(date_key, {})
-
-                # Skip dates with no sessions
-                if not any(len(sessions) > 0 for sessions in sessions_for_date.values()):
-                    continue
-
-                metrics_record = calculate_date_metrics(date_to_process, sessions_for_date)
-
-                # Upsert metrics record
-                existing_record_idx = None
-                for i, existing_metric in enumerate(metrics):
-                    if (
-                        existing_metric.get("date") == str(date_to_process)
-                        and existing_metric.get("aggregation_period") == "daily"
-                    ):
-                        existing_record_idx = i
-                        break
+            with table.transaction():
+                for date_to_process in dates_to_process:
+                    date_key = date_to_process.isoformat()
+                    sessions_for_date = all_sessions_data.get(date_key, {})
 
-                if existing_record_idx is not None:
-                    metrics[existing_record_idx] = metrics_record
-                else:
-                    metrics.append(metrics_record)
+                    # Skip dates with no sessions
+                    if not any(len(sessions) > 0 for sessions in sessions_for_date.values()):
+                        continue
 
-                results.append(metrics_record)
+                    # Upsert metrics record
+                    metrics_record = calculate_date_metrics(date_to_process, sessions_for_date)
+                    table.put(metrics_record)
 
-            if results:
-                self._write_json_file(self.metrics_table_name, metrics)
+                    results.append(metrics_record)
 
             log_debug("Updated metrics calculations")
 
@@ -835,12 +842,9 @@ class JsonDb(BaseDb):
                 return datetime.strptime(latest_metric["date"], "%Y-%m-%d").date()
 
         # No metrics records. Return the date of the first recorded session.
-        # We need to get sessions of all types, so we'll read directly from the file
-        all_sessions = self._read_json_file(self.session_table_name)
+        all_sessions = self._get_table("sessions").read()
         if all_sessions:
-            # Sort by created_at
-            all_sessions.sort(key=lambda x: x.get("created_at", 0))
-            first_session_date = all_sessions[0]["created_at"]
+            first_session_date = min(session.fields.get("created_at", 0) for _, session in all_sessions.stored_rows())
             return datetime.fromtimestamp(first_session_date, tz=timezone.utc).date()
 
         return None
@@ -850,17 +854,18 @@ class JsonDb(BaseDb):
     ) -> List[Dict[str, Any]]:
         """Get all sessions for metrics calculation."""
         try:
-            sessions = self._read_json_file(self.session_table_name)
+            sessions = self._get_table("sessions").read()
 
             filtered_sessions = []
-            for session in sessions:
-                created_at = session.get("created_at", 0)
+            for _, stored in sessions.stored_rows():
+                created_at = stored.fields.get("created_at", 0)
                 if start_timestamp is not None and created_at < start_timestamp:
                     continue
                 if end_timestamp is not None and created_at >= end_timestamp:
                     continue
 
                 # Only include necessary fields for metrics
+                session = stored.row.thaw()
                 filtered_session = {
                     "user_id": session.get("user_id"),
                     "session_data": session.get("session_data"),
@@ -883,22 +888,22 @@ class JsonDb(BaseDb):
     ) -> Tuple[List[dict], Optional[int]]:
         """Get all metrics matching the given date range."""
         try:
-            metrics = self._read_json_file(self.metrics_table_name)
+            metrics = self._get_table("metrics").read()
 
             filtered_metrics = []
             latest_updated_at = None
 
-            for metric in metrics:
-                metric_date = datetime.strptime(metric.get("date", ""), "%Y-%m-%d").date()
+            for _, stored in metrics.stored_rows():
+                metric_date = datetime.strptime(stored.fields.get("date", ""), "%Y-%m-%d").date()
 
                 if starting_date and metric_date < starting_date:
                     continue
                 if ending_date and metric_date > ending_date:
                     continue
 
-                filtered_metrics.append(metric)
+                filtered_metrics.append(stored.row.thaw())
 
-                updated_at = metric.get("updated_at")
+                updated_at = stored.fields.get("updated_at")
                 if updated_at and (latest_updated_at is None or updated_at > latest_updated_at):
                     latest_updated_at = updated_at
 
@@ -920,9 +925,10 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during deletion.
         """
         try:
-            knowledge_items = self._read_json_file(self.knowledge_table_name)
-            knowledge_items = [item for item in knowledge_items if item.get("id") != id]
-            self._write_json_file(self.knowledge_table_name, knowledge_items)
+            table = self._get_table("knowledge")
+            with table.transaction() as knowledge_items:
+                if id in knowledge_items:
+                    table.delete(id)
 
         except Exception as e:
             log_error(f"Error deleting knowledge content: {e}")
@@ -941,13 +947,8 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during retrieval.
         """
         try:
-            knowledge_items = self._read_json_file(self.knowledge_table_name)
-
-            for item in knowledge_items:
-                if item.get("id") == id:
-                    return KnowledgeRow.model_validate(item)
-
-            return None
+            item = self._get_table("knowledge").read().get(id)
+            return KnowledgeRow.model_validate(item) if item is not None else None
 
         except Exception as e:
             log_error(f"Error getting knowledge content: {e}")
@@ -975,19 +976,20 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during retrieval.
         """
         try:
-            knowledge_items = self._read_json_file(self.knowledge_table_name)
-
-            total_count = len(knowledge_items)
-
-            # Apply sorting
-            knowledge_items = apply_sorting(knowledge_items, sort_by, sort_order)
-
-            # Apply pagination
-            if limit is not None:
-                start_idx = 0
-                if page is not None:
-                    start_idx = (page - 1) * limit
-                knowledge_items = knowledge_items[start_idx : start_idx + limit]
+            knowledge = self._get_table("knowledge").read()
+
+            keys = knowledge.keys()
+            total_count = len(keys)
+
+            # Apply sorting and pagination, reading only the items of the page
+            knowledge_items = knowledge.select(
+                keys,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=limit,
+                page=page,
+                sort_rows=lambda rows: apply_sorting(rows, sort_by, sort_order),
+            )
 
             return [KnowledgeRow.model_validate(item) for item in knowledge_items], total_count
 
@@ -1008,26 +1010,122 @@ class JsonDb(BaseDb):
             Exception: If an error occurs during upsert.
         """
         try:
-            knowledge_items = self._read_json_file(self.knowledge_table_name, create_table_if_not_found=True)
-            knowledge_dict = knowledge_row.model_dump()
+            table = self._get_table("knowledge")
+            with table.transaction():
+                table.put(knowledge_row.model_dump(), key=knowledge_row.id)
 
-            # Find existing item to update
-            item_updated = False
-            for i, existing_item in enumerate(knowledge_items):
-                if existing_item.get("id") == knowledge_row.id:
-                    knowledge_items[i] = knowledge_dict
-                    item_updated = True
-                    break
+            return knowledge_row
 
-            if not item_updated:
-                knowledge_items.append(knowledge_dict)
+        except Exception as e:
+            log_error(f"Error upserting knowledge row: {e}")
+            raise e
 
-            self._write_json_file(self.knowledge_table_name, knowledge_items)
+    def get_knowledge_metadata_catalog(self, catalog_id: str) -> Optional[Dict[str, Any]]:
+        """Get the metadata catalog for a knowledge base from the JSON file.
 
-            return knowledge_row
+        Args:
+            catalog_id (str): The ID of the catalog to get.
+
+        Returns:
+            Optional[Dict[str, Any]]: The serialized catalog, or None if it doesn't exist.
+        """
+        try:
+            catalog = self._get_table("knowledge_metadata").read().get(catalog_id)
+            return catalog.get("catalog") if catalog is not None else None
 
         except Exception as e:
-            log_error(f"Error upserting knowledge row: {e}")
+            log_error(f"Error getting knowledge metadata catalog: {e}")
+            return None
+
+    def upsert_knowledge_metadata_catalog(self, catalog_id: str, catalog: Dict[str, Any]) -> None:
+        """Upsert the metadata catalog for a knowledge base in the JSON file.
+
+        Args:
+            catalog_id (str): The ID of the catalog to upsert.
+            catalog (Dict[str, Any]): The serialized catalog.
+        """
+        try:
+            table = self._get_table("knowledge_metadata")
+            with table.transaction():
+                table.put({"id": catalog_id, "catalog": catalog, "updated_at": int(time.time())})
+
+        except Exception as e:
+            log_error(f"Error upserting knowledge metadata catalog: {e}")
+            raise e
+
+    def update_knowledge_metadata_catalog(
+        self, catalog_id: str, update: Callable[[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Apply a change to the metadata catalog of a knowledge base, holding the file lock of the table.
+
+        Args:
+            catalog_id (str): The ID of the catalog to update.
+            update (Callable): Returns the catalog to store from the stored one, or None to leave it unchanged.
+
+        Returns:
+            Optional[Dict[str, Any]]: The stored catalog after the update, or None if there is none.
+        """
+        try:
+            table = self._get_table("knowledge_metadata")
+            with table.transaction() as rows:
+                row = rows.get(catalog_id)
+                stored = row.get("catalog") if row is not None else None
+                catalog = update(stored)
+                if catalog is None:
+                    return stored
+                table.put({"id": catalog_id, "catalog": catalog, "updated_at": int(time.time())})
+                return catalog
+
+        except Exception as e:
+            log_error(f"Error updating knowledge metadata catalog: {e}")
+            raise e
+
+    # -- Cache methods --
+
+    def get_cache_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached value from the JSON file.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached value, or None if it doesn't exist or has expired.
+        """
+        try:
+            entry = self._get_table("cache").read().get_stored(key)
+            if entry is None:
+                return None
+            expires_at = entry.fields.get("expires_at")
+            if expires_at is not None and expires_at <= int(time.time()):
+                return None
+            return entry.row.thaw().get("value")
+
+        except Exception as e:
+            log_error(f"Error getting cache entry: {e}")
+            return None
+
+    def set_cache_entry(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store a cached value in the JSON file. Expired entries are removed on write.
+
+        Args:
+            key (str): The cache key.
+            value (Dict[str, Any]): The value to cache.
+            ttl (Optional[int]): Seconds after which the entry expires. None means it never expires.
+        """
+        try:
+            now = int(time.time())
+            table = self._get_table("cache")
+            with table.transaction() as entries:
+                for entry_key, entry in entries.stored_rows():
+                    expires_at = entry.fields.get("expires_at")
+                    if entry_key != key and expires_at is not None and expires_at <= now:
+                        table.delete(entry_key)
+                table.put(
+                    {"id": key, "value": value, "expires_at": now + ttl if ttl is not None else None, "created_at": now}
+                )
+
+        except Exception as e:
+            log_error(f"Error setting cache entry: {e}")
             raise e
 
     # -- Eval methods --
@@ -1035,15 +1133,14 @@ class JsonDb(BaseDb):
     def create_eval_run(self, eval_run: EvalRunRecord) -> Optional[EvalRunRecord]:
         """Create an EvalRunRecord in the JSON file."""
         try:
-            eval_runs = self._read_json_file(self.eval_table_name, create_table_if_not_found=True)
-
             current_time = int(time.time())
             eval_dict = eval_run.model_dump()
             eval_dict["created_at"] = current_time
             eval_dict["updated_at"] = current_time
 
-            eval_runs.append(eval_dict)
-            self._write_json_file(self.eval_table_name, eval_runs)
+            table = self._get_table("evals")
+            with table.transaction():
+                table.put(eval_dict)
 
             log_debug(f"Created eval run with id '{eval_run.run_id}'")
 
@@ -1056,12 +1153,13 @@ class JsonDb(BaseDb):
     def delete_eval_run(self, eval_run_id: str) -> None:
         """Delete an eval run from the JSON file."""
         try:
-            eval_runs = self._read_json_file(self.eval_table_name)
-            original_count = len(eval_runs)
-            eval_runs = [run for run in eval_runs if run.get("run_id") != eval_run_id]
+            table = self._get_table("evals")
+            with table.transaction() as eval_runs:
+                deleted = eval_run_id in eval_runs
+                if deleted:
+                    table.delete(eval_run_id)
 
-            if len(eval_runs) < original_count:
-                self._write_json_file(self.eval_table_name, eval_runs)
+            if deleted:
                 log_debug(f"Deleted eval run with ID: {eval_run_id}")
             else:
                 log_debug(f"No eval run found with ID: {eval_run_id}")
@@ -1073,13 +1171,14 @@ class JsonDb(BaseDb):
     def delete_eval_runs(self, eval_run_ids: List[str]) -> None:
         """Delete multiple eval runs from the JSON file."""
         try:
-            eval_runs = self._read_json_file(self.eval_table_name)
-            original_count = len(eval_runs)
-            eval_runs = [run for run in eval_runs if run.get("run_id") not in eval_run_ids]
+            table = self._get_table("evals")
+            with table.transaction() as eval_runs:
+                deleted_ids = [eval_run_id for eval_run_id in eval_run_ids if eval_run_id in eval_runs]
+                for eval_run_id in deleted_ids:
+                    table.delete(eval_run_id)
 
-            deleted_count = original_count - len(eval_runs)
+            deleted_count = len(deleted_ids)
             if deleted_count > 0:
-                self._write_json_file(self.eval_table_name, eval_runs)
                 log_debug(f"Deleted {deleted_count} eval runs")
             else:
                 log_debug(f"No eval runs found with IDs: {eval_run_ids}")
@@ -1093,15 +1192,12 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
         """Get an eval run from the JSON file."""
         try:
-            eval_runs = self._read_json_file(self.eval_table_name)
-
-            for run_data in eval_runs:
-                if run_data.get("run_id") == eval_run_id:
-                    if not deserialize:
-                        return run_data
-                    return EvalRunRecord.model_validate(run_data)
-
-            return None
+            run_data = self._get_table("evals").read().get(eval_run_id)
+            if run_data is None:
+                return None
+            if not deserialize:
+                return run_data
+            return EvalRunRecord.model_validate(run_data)
 
         except Exception as e:
             log_error(f"Exception getting eval run {eval_run_id}: {e}")
@@ -1123,11 +1219,12 @@ class JsonDb(BaseDb):
     ) -> Union[List[EvalRunRecord], Tuple[List[Dict[str, Any]], int]]:
         """Get all eval runs from the JSON file with filtering and pagination."""
         try:
-            eval_runs = self._read_json_file(self.eval_table_name)
+            eval_runs = self._get_table("evals").read()
 
             # Apply filters
-            filtered_runs = []
-            for run_data in eval_runs:
+            filtered_keys = []
+            for key, stored in eval_runs.stored_rows():
+                run_data = stored.fields
                 if agent_id is not None and run_data.get("agent_id") != agent_id:
                     continue
                 if team_id is not None and run_data.get("team_id") != team_id:
@@ -1147,22 +1244,19 @@ class JsonDb(BaseDb):
                     elif filter_type == EvalFilterType.WORKFLOW and run_data.get("workflow_id") is None:
                         continue
 
-                filtered_runs.append(run_data)
+                filtered_keys.append(key)
 
-            total_count = len(filtered_runs)
+            total_count = len(filtered_keys)
 
-            # Apply sorting (default by created_at desc)
-            if sort_by is None:
-                filtered_runs.sort(key=lambda x: x.get("created_at", 0), reverse=True)
-            else:
-                filtered_runs = apply_sorting(filtered_runs, sort_by, sort_order)
-
-            # Apply pagination
-            if limit is not None:
-                start_idx = 0
-                if page is not None:
-                    start_idx = (page - 1) * limit
-                filtered_runs = filtered_runs[start_idx : start_idx + limit]
+            # Apply sorting (default by created_at desc) and pagination, reading only the runs of the page
+            filtered_runs = eval_runs.select(
+                filtered_keys,
+                sort_by=sort_by or "created_at",
+                sort_order=sort_order if sort_by is not None else "desc",
+                limit=limit,
+                page=page,
+                sort_rows=lambda rows: apply_sorting(rows, sort_by, sort_order),
+            )
 
             if not deserialize:
                 return filtered_runs, total_count
@@ -1178,23 +1272,22 @@ class JsonDb(BaseDb):
     ) -> Optional[Union[EvalRunRecord, Dict[str, Any]]]:
         """Rename an eval run in the JSON file."""
         try:
-            eval_runs = self._read_json_file(self.eval_table_name)
-
-            for i, run_data in enumerate(eval_runs):
-                if run_data.get("run_id") == eval_run_id:
-                    run_data["name"] = name
-                    run_data["updated_at"] = int(time.time())
-                    eval_runs[i] = run_data
-                    self._write_json_file(self.eval_table_name, eval_runs)
+            table = self._get_table("evals")
+            with table.transaction() as eval_runs:
+                run_data = eval_runs.get(eval_run_id)
+                if run_data is None:
+                    return None
 
-                    log_debug(f"Renamed eval run with id '{eval_run_id}' to '{name}'")
+                run_data["name"] = name
+                run_data["updated_at"] = int(time.time())
+                table.put(run_data, key=eval_run_id)
 
-                    if not deserialize:
-                        return run_data
+            log_debug(f"Renamed eval run with id '{eval_run_id}' to '{name}'")
 
-                    return EvalRunRecord.model_validate(run_data)
+            if not deserialize:
+                return run_data
 
-            return None
+            return EvalRunRecord.model_validate(run_data)
 
         except Exception as e:
             log_error(f"Error renaming eval run {eval_run_id}: {e}")
@@ -0,0 +1,299 @@
+"""Append-only, file-backed tables for the JSON database class."""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from threading import RLock
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from agno.db.in_memory.table import FrozenRow, IndexedTable
+from agno.utils.log import log_debug, log_info, log_warning
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None  # type: ignore
+
+
+class JsonRow(FrozenRow):
+    """A stored row kept as its JSON text, so that every process reads the same values"""
+
+    __slots__ = ()
+
+    def __init__(self, text: str):
+        self._data = text
+        self._pickled = False
+
+    @property
+    def text(self) -> str:
+        return self._data
+
+    def thaw(self) -> Any:
+        return json.loads(self._data)
+
+
+def _decode_key(key: Any) -> Hashable:
+    # JSON has no tuples: composite keys are written as lists
+    return tuple(key) if isinstance(key, list) else key
+
+
+class JsonLogTable:
+    """A table stored as an append-only log of JSON lines, with an in-process cache of its rows.
+
+    Each write appends a line to `{name}.jsonl`, and each read first applies the lines appended since the previous
+    read, by this or another process. The cost of an operation therefore doesn't depend on the size of the table.
+    Writers hold an advisory lock on `{name}.jsonl.lock`, and a line is only applied once it is complete. When most of
+    the log is made of stale versions of rows, the live rows are written to a new log that atomically replaces it.
+
+    Tables written by previous versions, as a single `{name}.json` array, are migrated to a log on first use.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        name: str,
+        key: Callable[[Dict[str, Any]], Hashable],
+        indexed_fields: Sequence[str] = (),
+        sorted_fields: Sequence[str] = (),
+        extras: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        compaction_ratio: float = 2.0,
+        min_compaction_bytes: int = 1024 * 1024,
+    ):
+        self.db_path = db_path
+        self.path = db_path / f"{name}.jsonl"
+        self.lock_path = db_path / f"{name}.jsonl.lock"
+        self.legacy_path = db_path / f"{name}.json"
+        # Primary key of a row, used to migrate legacy tables
+        self.key = key
+        # Values derived from nested parts of a row, for filters
+        self.extras = extras
+        # Compact the log once it is this many times larger than the live rows
+        self.compaction_ratio = compaction_ratio
+        self.min_compaction_bytes = min_compaction_bytes
+
+        self.rows = IndexedTable(indexed_fields=indexed_fields, sorted_fields=sorted_fields)
+        self._lock = RLock()
+        self._file_lock_depth = 0
+        # Header of the log file the cache was read from, and how much of it was applied
+        self._header: Optional[bytes] = None
+        self._offset = 0
+        self._live_bytes = 0
+        self._pending: List[Tuple[Hashable, Optional[Dict[str, Any]]]] = []
+
+    # -- Reads --
+
+    def read(self) -> IndexedTable:
+        """The rows of the table, including the writes of other processes"""
+        with self._lock:
+            self._refresh()
+        return self.rows
+
+    # -- Writes --
+
+    @contextmanager
+    def transaction(self) -> Iterator[IndexedTable]:
+        """Lock the table against other writers and yield its up to date rows.
+
+        The rows put or deleted in the transaction are appended to the log in a single write when it ends, and are
+        discarded if it raises.
+        """
+        with self._lock, self._file_lock():
+            self._refresh(repair=True)
+            self._pending = []
+            try:
+                yield self.rows
+                self._commit()
+            finally:
+                self._pending = []
+
+    def put(self, row: Dict[str, Any], key: Optional[Hashable] = None) -> None:
+        """Insert or replace a row, in a transaction"""
+        self._pending.append((key if key is not None else self.key(row), row))
+
+    def delete(self, key: Hashable) -> None:
+        """Delete a row, in a transaction"""
+        self._pending.append((key, None))
+
+    def _commit(self) -> None:
+        if not self._pending:
+            return
+
+        lines = []
+        changes: List[Tuple[Hashable, Optional[Dict[str, Any]], Optional[JsonRow]]] = []
+        for key, row in self._pending:
+            key_text = json.dumps(key)
+            if row is None:
+                lines.append(f'{{"k": {key_text}, "deleted": true}}\n')
+                changes.append((key, None, None))
+            else:
+                text = json.dumps(row, default=str)
+                lines.append(f'{{"k": {key_text}, "v": {text}}}\n')
+                changes.append((key, row, JsonRow(text)))
+
+        if self._header is None:
+            self._write_log([])
+        data = "".join(lines).encode("utf-8")
+        with open(self.path, "ab") as f:
+            f.write(data)
+        self._offset += len(data)
+
+        for key, row, frozen in changes:
+            if frozen is None:
+                self._delete_row(key)
+            else:
+                self._put_row(key, row, frozen)  # type: ignore
+
+        if self._offset > max(self.min_compaction_bytes, self.compaction_ratio * self._live_bytes):
+            self._compact()
+
+    # -- Cache --
+
+    def _put_row(self, key: Hashable, row: Dict[str, Any], frozen: JsonRow) -> None:
+        existing = self.rows.get_stored(key)
+        if existing is not None:
+            self._live_bytes -= len(existing.row.text)  # type: ignore
+        self.rows.put(key, row, extras=self.extras(row) if self.extras else None, frozen=frozen)
+        self._live_bytes += len(frozen.text)
+
+    def _delete_row(self, key: Hashable) -> None:
+        existing = self.rows.get_stored(key)
+        if existing is not None:
+            self._live_bytes -= len(existing.row.text)  # type: ignore
+            self.rows.delete(key)
+
+    def _reset(self, header: Optional[bytes]) -> None:
+        self.rows.clear()
+        self._header = header
+        self._offset = len(header) if header else 0
+        self._live_bytes = 0
+
+    def _apply(self, line: bytes) -> None:
+        try:
+            record = json.loads(line)
+            key = _decode_key(record["k"])
+        except Exception as e:
+            log_warning(f"Skipping invalid line in {self.path}: {e}")
+            return
+        if record.get("deleted"):
+            self._delete_row(key)
+        else:
+            row = record.get("v") or {}
+            self._put_row(key, row, JsonRow(json.dumps(row)))
+
+    def _refresh(self, repair: bool = False) -> None:
+        """Apply the lines appended to the log since the last refresh, or reload it if it was replaced"""
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            if self._header is not None:
+                self._reset(None)
+            if self.legacy_path.exists():
+                self._migrate_legacy_table()
+            return
+
+        with f:
+            header = f.readline()
+            if not header.endswith(b"\n"):
+                # A log being created by another process
+                return
+            if header != self._header:
+                self._reset(header)
+            f.seek(self._offset)
+            data = f.read()
+
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            self._apply(line)
+        self._offset += end
+
+        if repair and end < len(data):
+            # Holding the lock, an incomplete line is left by a writer that crashed
+            log_warning(f"Removing an incomplete write at the end of {self.path}")
+            os.truncate(self.path, self._offset)
+
+    # -- Files --
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold the advisory lock of the table, shared with other processes"""
+        if self._file_lock_depth > 0:
+            self._file_lock_depth += 1
+            try:
+                yield
+            finally:
+                self._file_lock_depth -= 1
+            return
+
+        self.db_path.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            elif msvcrt is not None:
+                f.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)  # type: ignore
+                        break
+                    except OSError:
+                        time.sleep(0.01)
+            self._file_lock_depth = 1
+            try:
+                yield
+            finally:
+                self._file_lock_depth = 0
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                elif msvcrt is not None:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore
+
+    def _write_log(self, lines: List[str]) -> None:
+        """Atomically replace the log with a new one holding the given lines"""
+        self.db_path.mkdir(parents=True, exist_ok=True)
+        header = (json.dumps({"log": uuid4().hex}) + "\n").encode("utf-8")
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write("".join(lines).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            size = f.tell()
+        os.replace(tmp_path, self.path)
+        self._header = header
+        self._offset = size
+
+    def _compact(self) -> None:
+        """Rewrite the log with only the live version of each row"""
+        with self._file_lock():
+            lines = [
+                f'{{"k": {json.dumps(key)}, "v": {stored.row.text}}}\n'  # type: ignore
+                for key, stored in self.rows.stored_rows()
+            ]
+            self._write_log(lines)
+        log_debug(f"Compacted {self.path} to {self._offset} bytes")
+
+    def _migrate_legacy_table(self) -> None:
+        with self._file_lock():
+            if self.path.exists():
+                self._refresh()
+                return
+            try:
+                with open(self.legacy_path, "r") as f:
+                    legacy_rows = json.load(f)
+            except json.JSONDecodeError as e:
+                log_warning(f"Error reading the {self.legacy_path} JSON file: {e}")
+                raise e
+
+            self._reset(None)
+            for row in legacy_rows:
+                self._put_row(self.key(row), row, JsonRow(json.dumps(row, default=str)))
+            self._compact()
+        log_info(f"Migrated {self.legacy_path} to {self.path}. The old file is no longer used.")
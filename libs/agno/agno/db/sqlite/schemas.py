@@ -69,6 +69,19 @@ KNOWLEDGE_TABLE_SCHEMA = {
     "external_id": {"type": String, "nullable": True},
 }
 
+KNOWLEDGE_METADATA_TABLE_SCHEMA = {
+    "id": {"type": String, "primary_key": True, "nullable": False},
+    "catalog": {"type": JSON, "nullable": False},
+    "updated_at": {"type": BigInteger, "nullable": True},
+}
+
+CACHE_TABLE_SCHEMA = {
+    "id": {"type": String, "primary_key": True, "nullable": False},
+    "value": {"type": JSON, "nullable": False},
+    "expires_at": {"type": BigInteger, "nullable": True, "index": True},
+    "created_at": {"type": BigInteger, "nullable": False},
+}
+
 METRICS_TABLE_SCHEMA = {
     "id": {"type": String, "primary_key": True, "nullable": False},
     "agent_runs_count": {"type": BigInteger, "nullable": False, "default": 0},
@@ -110,6 +123,8 @@ def get_table_schema_definition(table_type: str) -> dict[str, Any]:
         "metrics": METRICS_TABLE_SCHEMA,
         "memories": USER_MEMORY_TABLE_SCHEMA,
         "knowledge": KNOWLEDGE_TABLE_SCHEMA,
+        "knowledge_metadata": KNOWLEDGE_METADATA_TABLE_SCHEMA,
+        "cache": CACHE_TABLE_SCHEMA,
     }
     schema = schemas.get(table_type, {})
 
@@ -1,7 +1,9 @@
 import time
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
+from threading import RLock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union, cast
 from uuid import uuid4
 
 from agno.db.base import BaseDb, SessionType
@@ -18,6 +20,7 @@ from agno.db.sqlite.utils import (
     is_table_available,
     is_valid_table,
 )
+from agno.db.sqlite.writer import DEFAULT_PRAGMAS, SqliteWriter, create_writer_engine, set_pragmas
 from agno.db.utils import deserialize_session_json_fields, serialize_session_json_fields
 from agno.session import AgentSession, Session, TeamSession, WorkflowSession
 from agno.utils.log import log_debug, log_error, log_info, log_warning
@@ -45,6 +48,11 @@ class SqliteDb(BaseDb):
         eval_table: Optional[str] = None,
         knowledge_table: Optional[str] = None,
         id: Optional[str] = None,
+        cache_table: Optional[str] = None,
+        concurrent: bool = False,
+        read_pool_size: int = 8,
+        max_write_batch_size: int = 256,
+        pragmas: Optional[Dict[str, Any]] = None,
     ):
         """
         Interface for interacting with a SQLite database.
@@ -65,9 +73,17 @@ class SqliteDb(BaseDb):
             eval_table (Optional[str]): Name of the table to store evaluation runs data.
             knowledge_table (Optional[str]): Name of the table to store knowledge documents data.
             id (Optional[str]): ID of the database.
+            cache_table (Optional[str]): Name of the table to store cached values.
+            concurrent (bool): Tune the database for many concurrent requests. Connections use WAL journaling and
+                wait for locks instead of failing, reads use a pool of connections, and writes are run by a single
+                writer thread that commits them in batches.
+            read_pool_size (int): Number of read connections kept open in concurrent mode.
+            max_write_batch_size (int): Most writes committed together in concurrent mode.
+            pragmas (Optional[Dict[str, Any]]): Pragmas set on each connection in concurrent mode, overriding the
+                defaults.
 
         Raises:
-            ValueError: If none of the tables are provided.
+            ValueError: If none of the tables are provided, or if concurrent mode is used with an in-memory database.
         """
         if id is None:
             seed = db_url or db_file or str(db_engine.url) if db_engine else "sqlite:///agno.db"
@@ -80,6 +96,7 @@ class SqliteDb(BaseDb):
             metrics_table=metrics_table,
             eval_table=eval_table,
             knowledge_table=knowledge_table,
+            cache_table=cache_table,
         )
 
         _engine: Optional[Engine] = db_engine
@@ -102,10 +119,43 @@ class SqliteDb(BaseDb):
         self.db_url: Optional[str] = db_url
         self.db_file: Optional[str] = db_file
         self.metadata: MetaData = MetaData()
+        # Tables loaded or created, by name. Loading and creating them is serialized, as concurrent reflections clash
+        self._tables: Dict[str, Table] = {}
+        self._tables_lock = RLock()
 
         # Initialize database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
 
+        self.writer: Optional[SqliteWriter] = None
+        if concurrent:
+            url = self.db_engine.url
+            if url.database in (None, "", ":memory:"):
+                raise ValueError("Concurrent mode requires a database file")
+            _pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+            set_pragmas(self.db_engine, _pragmas)
+            self.writer = SqliteWriter(create_writer_engine(url, _pragmas), max_batch_size=max_write_batch_size)
+            # Reads don't block each other or the writer with WAL, so they use their own pool of connections
+            self.read_engine: Engine = create_engine(url, pool_size=read_pool_size)
+            set_pragmas(self.read_engine, _pragmas)
+            self.Session = scoped_session(sessionmaker(bind=self.read_engine))
+
+    @contextmanager
+    def _write_session(self) -> Iterator[Any]:
+        """A session to write in, committed when the block ends. In concurrent mode, it is lent by the writer."""
+        if self.writer is None:
+            with self.Session() as sess, sess.begin():
+                yield sess
+        else:
+            with self.writer.session() as sess:
+                yield sess
+
+    def close(self) -> None:
+        """Commit the queued writes and close the connections of the database."""
+        if self.writer is not None:
+            self.writer.close()
+            self.read_engine.dispose()
+        self.db_engine.dispose()
+
     # -- DB methods --
 
     def _create_table(self, table_name: str, table_type: str) -> Table:
@@ -229,6 +279,22 @@ class SqliteDb(BaseDb):
             )
             return self.knowledge_table
 
+        elif table_type == "knowledge_metadata":
+            self.knowledge_metadata_table = self._get_or_create_table(
+                table_name=f"{self.knowledge_table_name}_metadata",
+                table_type="knowledge_metadata",
+                create_table_if_not_found=create_table_if_not_found,
+            )
+            return self.knowledge_metadata_table
+
+        elif table_type == "cache":
+            self.cache_table = self._get_or_create_table(
+                table_name=self.cache_table_name,
+                table_type="cache",
+                create_table_if_not_found=create_table_if_not_found,
+            )
+            return self.cache_table
+
         else:
             raise ValueError(f"Unknown table type: '{table_type}'")
 
@@ -245,26 +311,42 @@ class SqliteDb(BaseDb):
         Returns:
             Table: SQLAlchemy Table object
         """
+        # In concurrent mode, tables are only looked up once instead of on every call
+        if self.writer is not None:
+            cached_table = self._tables.get(table_name)
+            if cached_table is not None:
+                return cached_table
+
         with self.Session() as sess, sess.begin():
             table_is_available = is_table_available(session=sess, table_name=table_name)
+        if not table_is_available and not create_table_if_not_found:
+            return None
 
-        if not table_is_available:
-            if not create_table_if_not_found:
-                return None
-            return self._create_table(table_name=table_name, table_type=table_type)
+        # Only creating and loading tables is serialized, as concurrent reflections can clash
+        with self._tables_lock:
+            if not table_is_available:
+                # Another thread may have created the table since it was checked
+                with self.Session() as sess, sess.begin():
+                    table_is_available = is_table_available(session=sess, table_name=table_name)
 
-        # SQLite version of table validation (no schema)
-        if not is_valid_table(db_engine=self.db_engine, table_name=table_name, table_type=table_type):
-            raise ValueError(f"Table {table_name} has an invalid schema")
+            if not table_is_available:
+                table = self._create_table(table_name=table_name, table_type=table_type)
+                self._tables[table_name] = table
+                return table
 
-        try:
-            table = Table(table_name, self.metadata, autoload_with=self.db_engine)
-            log_debug(f"Loaded existing table {table_name}")
-            return table
+            # SQLite version of table validation (no schema)
+            if not is_valid_table(db_engine=self.db_engine, table_name=table_name, table_type=table_type):
+                raise ValueError(f"Table {table_name} has an invalid schema")
 
-        except Exception as e:
-            log_error(f"Error loading existing table {table_name}: {e}")
-            raise e
+            try:
+                table = Table(table_name, self.metadata, autoload_with=self.db_engine)
+                log_debug(f"Loaded existing table {table_name}")
+                self._tables[table_name] = table
+                return table
+
+            except Exception as e:
+                log_error(f"Error loading existing table {table_name}: {e}")
+                raise e
 
     # -- Session methods --
 
@@ -283,7 +365,7 @@ class SqliteDb(BaseDb):
             if table is None:
                 return False
 
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 delete_stmt = table.delete().where(table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
                 if result.rowcount == 0:
@@ -312,7 +394,7 @@ class SqliteDb(BaseDb):
             if table is None:
                 return
 
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 delete_stmt = table.delete().where(table.c.session_id.in_(session_ids))
                 result = sess.execute(delete_stmt)
 
@@ -548,7 +630,7 @@ class SqliteDb(BaseDb):
             serialized_session = serialize_session_json_fields(session.to_dict())
 
             if isinstance(session, AgentSession):
-                with self.Session() as sess, sess.begin():
+                with self._write_session() as sess:
                     stmt = sqlite.insert(table).values(
                         session_id=serialized_session.get("session_id"),
                         session_type=SessionType.AGENT.value,
@@ -585,7 +667,7 @@ class SqliteDb(BaseDb):
                     return AgentSession.from_dict(session_raw)
 
             elif isinstance(session, TeamSession):
-                with self.Session() as sess, sess.begin():
+                with self._write_session() as sess:
                     stmt = sqlite.insert(table).values(
                         session_id=serialized_session.get("session_id"),
                         session_type=SessionType.TEAM.value,
@@ -623,7 +705,7 @@ class SqliteDb(BaseDb):
                     return TeamSession.from_dict(session_raw)
 
             else:
-                with self.Session() as sess, sess.begin():
+                with self._write_session() as sess:
                     stmt = sqlite.insert(table).values(
                         session_id=serialized_session.get("session_id"),
                         session_type=SessionType.WORKFLOW.value,
@@ -709,7 +791,7 @@ class SqliteDb(BaseDb):
 
             results: List[Union[Session, Dict[str, Any]]] = []
 
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 # Bulk upsert agent sessions
                 if agent_sessions:
                     agent_data = []
@@ -902,7 +984,7 @@ class SqliteDb(BaseDb):
             if table is None:
                 return
 
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 delete_stmt = table.delete().where(table.c.memory_id == memory_id)
                 if user_id is not None:
                     delete_stmt = delete_stmt.where(table.c.user_id == user_id)
@@ -933,7 +1015,7 @@ class SqliteDb(BaseDb):
             if table is None:
                 return
 
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 delete_stmt = table.delete().where(table.c.memory_id.in_(memory_ids))
                 if user_id is not None:
                     delete_stmt = delete_stmt.where(table.c.user_id == user_id)
@@ -1186,7 +1268,7 @@ class SqliteDb(BaseDb):
             if memory.memory_id is None:
                 memory.memory_id = str(uuid4())
 
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 stmt = sqlite.insert(table).values(
                     user_id=memory.user_id,
                     agent_id=memory.agent_id,
@@ -1273,7 +1355,7 @@ class SqliteDb(BaseDb):
 
             results: List[Union[UserMemory, Dict[str, Any]]] = []
 
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 # Bulk upsert memories using SQLite ON CONFLICT DO UPDATE
                 stmt = sqlite.insert(table)
                 stmt = stmt.on_conflict_do_update(
@@ -1326,7 +1408,7 @@ class SqliteDb(BaseDb):
             if table is None:
                 return
 
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 sess.execute(table.delete())
 
         except Exception as e:
@@ -1471,7 +1553,7 @@ class SqliteDb(BaseDb):
                 metrics_records.append(metrics_record)
 
             if metrics_records:
-                with self.Session() as sess, sess.begin():
+                with self._write_session() as sess:
                     results = bulk_upsert_metrics(session=sess, table=table, metrics_records=metrics_records)
 
             log_debug("Updated metrics calculations")
@@ -1540,7 +1622,7 @@ class SqliteDb(BaseDb):
             return
 
         try:
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 stmt = table.delete().where(table.c.id == id)
                 sess.execute(stmt)
 
@@ -1641,7 +1723,7 @@ class SqliteDb(BaseDb):
             if table is None:
                 return None
 
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 update_fields = {
                     k: v
                     for k, v in {
@@ -1675,6 +1757,151 @@ class SqliteDb(BaseDb):
             log_error(f"Error upserting knowledge content: {e}")
             raise e
 
+    def get_knowledge_metadata_catalog(self, catalog_id: str) -> Optional[Dict[str, Any]]:
+        """Get the metadata catalog for a knowledge base.
+
+        Args:
+            catalog_id (str): The ID of the catalog to get.
+
+        Returns:
+            Optional[Dict[str, Any]]: The serialized catalog, or None if it doesn't exist.
+        """
+        try:
+            table = self._get_table(table_type="knowledge_metadata")
+            if table is None:
+                return None
+
+            with self.Session() as sess, sess.begin():
+                result = sess.execute(select(table.c.catalog).where(table.c.id == catalog_id)).fetchone()
+                return result[0] if result is not None else None
+
+        except Exception as e:
+            log_error(f"Error getting knowledge metadata catalog: {e}")
+            return None
+
+    def upsert_knowledge_metadata_catalog(self, catalog_id: str, catalog: Dict[str, Any]) -> None:
+        """Upsert the metadata catalog for a knowledge base.
+
+        Args:
+            catalog_id (str): The ID of the catalog to upsert.
+            catalog (Dict[str, Any]): The serialized catalog.
+        """
+        try:
+            table = self._get_table(table_type="knowledge_metadata", create_table_if_not_found=True)
+            if table is None:
+                return
+
+            with self._write_session() as sess:
+                updated_at = int(time.time())
+                stmt = (
+                    sqlite.insert(table)
+                    .values(id=catalog_id, catalog=catalog, updated_at=updated_at)
+                    .on_conflict_do_update(index_elements=["id"], set_=dict(catalog=catalog, updated_at=updated_at))
+                )
+                sess.execute(stmt)
+
+        except Exception as e:
+            log_error(f"Error upserting knowledge metadata catalog: {e}")
+            raise e
+
+    def update_knowledge_metadata_catalog(
+        self, catalog_id: str, update: Callable[[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]
+    ) -> Optional[Dict[str, Any]]:
+        """Apply a change to the metadata catalog of a knowledge base, reading and writing it in one transaction.
+
+        The transaction takes the write lock of the database before reading the catalog, so concurrent updates wait
+        for each other instead of overwriting each other.
+
+        Args:
+            catalog_id (str): The ID of the catalog to update.
+            update (Callable): Returns the catalog to store from the stored one, or None to leave it unchanged.
+
+        Returns:
+            Optional[Dict[str, Any]]: The stored catalog after the update, or None if there is none.
+        """
+        try:
+            table = self._get_table(table_type="knowledge_metadata", create_table_if_not_found=True)
+            if table is None:
+                return None
+
+            with self._write_session() as sess:
+                # A write that changes nothing, to take the write lock before the read
+                sess.execute(table.update().where(table.c.id == catalog_id).values(updated_at=table.c.updated_at))
+                result = sess.execute(select(table.c.catalog).where(table.c.id == catalog_id)).fetchone()
+                stored = result[0] if result is not None else None
+                catalog = update(stored)
+                if catalog is None:
+                    return stored
+                updated_at = int(time.time())
+                stmt = (
+                    sqlite.insert(table)
+                    .values(id=catalog_id, catalog=catalog, updated_at=updated_at)
+                    .on_conflict_do_update(index_elements=["id"], set_=dict(catalog=catalog, updated_at=updated_at))
+                )
+                sess.execute(stmt)
+                return catalog
+
+        except Exception as e:
+            log_error(f"Error updating knowledge metadata catalog: {e}")
+            raise e
+
+    # -- Cache methods --
+
+    def get_cache_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached value.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached value, or None if it doesn't exist or has expired.
+        """
+        try:
+            table = self._get_table(table_type="cache")
+            if table is None:
+                return None
+
+            with self.Session() as sess, sess.begin():
+                stmt = select(table.c.value).where(
+                    table.c.id == key, (table.c.expires_at.is_(None)) | (table.c.expires_at > int(time.time()))
+                )
+                result = sess.execute(stmt).fetchone()
+                return result[0] if result is not None else None
+
+        except Exception as e:
+            log_error(f"Error getting cache entry: {e}")
+            return None
+
+    def set_cache_entry(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store a cached value. Expired entries are removed on write.
+
+        Args:
+            key (str): The cache key.
+            value (Dict[str, Any]): The value to cache.
+            ttl (Optional[int]): Seconds after which the entry expires. None means it never expires.
+        """
+        try:
+            table = self._get_table(table_type="cache", create_table_if_not_found=True)
+            if table is None:
+                return
+
+            with self._write_session() as sess:
+                now = int(time.time())
+                expires_at = now + ttl if ttl is not None else None
+                sess.execute(table.delete().where(table.c.expires_at <= now))
+                stmt = (
+                    sqlite.insert(table)
+                    .values(id=key, value=value, expires_at=expires_at, created_at=now)
+                    .on_conflict_do_update(
+                        index_elements=["id"], set_=dict(value=value, expires_at=expires_at, created_at=now)
+                    )
+                )
+                sess.execute(stmt)
+
+        except Exception as e:
+            log_error(f"Error setting cache entry: {e}")
+            raise e
+
     # -- Eval methods --
 
     def create_eval_run(self, eval_run: EvalRunRecord) -> Optional[EvalRunRecord]:
@@ -1694,13 +1921,12 @@ class SqliteDb(BaseDb):
             if table is None:
                 return None
 
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 current_time = int(time.time())
                 stmt = sqlite.insert(table).values(
                     {"created_at": current_time, "updated_at": current_time, **eval_run.model_dump()}
                 )
                 sess.execute(stmt)
-                sess.commit()
 
             log_debug(f"Created eval run with id '{eval_run.run_id}'")
 
@@ -1721,7 +1947,7 @@ class SqliteDb(BaseDb):
             if table is None:
                 return
 
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 stmt = table.delete().where(table.c.run_id == eval_run_id)
                 result = sess.execute(stmt)
                 if result.rowcount == 0:
@@ -1744,7 +1970,7 @@ class SqliteDb(BaseDb):
             if table is None:
                 return
 
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 stmt = table.delete().where(table.c.run_id.in_(eval_run_ids))
                 result = sess.execute(stmt)
                 if result.rowcount == 0:
@@ -1911,7 +2137,7 @@ class SqliteDb(BaseDb):
             if table is None:
                 return None
 
-            with self.Session() as sess, sess.begin():
+            with self._write_session() as sess:
                 stmt = (
                     table.update().where(table.c.run_id == eval_run_id).values(name=name, updated_at=int(time.time()))
                 )
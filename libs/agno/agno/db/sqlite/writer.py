@@ -0,0 +1,199 @@
+"""Single writer thread for SQLite databases, committing queued writes in batches."""
+
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from agno.utils.log import log_error
+
+try:
+    from sqlalchemy import event
+    from sqlalchemy.engine import URL, Engine, create_engine
+    from sqlalchemy.orm import Session, sessionmaker
+except ImportError:
+    raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
+
+# Pragmas set on every connection in concurrent mode
+DEFAULT_PRAGMAS: Dict[str, Any] = {
+    # Readers don't block the writer, and the writer doesn't block readers
+    "journal_mode": "WAL",
+    # With WAL, only a power loss can lose the last commits, and the database stays consistent
+    "synchronous": "NORMAL",
+    # Milliseconds to wait for a lock, instead of failing with `database is locked`
+    "busy_timeout": 5000,
+    # 64MiB page cache
+    "cache_size": -64000,
+    "temp_store": "MEMORY",
+}
+
+WriteFunction = Callable[[Session], Any]
+
+
+def set_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """Set the pragmas on each new connection of the engine"""
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def create_writer_engine(url: URL, pragmas: Dict[str, Any]) -> Engine:
+    """An engine with a single connection, whose transactions take the write lock when they begin.
+
+    pysqlite only begins a transaction before the first write statement, which breaks savepoints. The engine lets
+    SQLAlchemy emit BEGIN itself, as recommended by its SQLite documentation.
+    """
+    engine = create_engine(url, pool_size=1, max_overflow=0, connect_args={"check_same_thread": False})
+    set_pragmas(engine, pragmas)
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin_immediate(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+
+class SqliteWriter:
+    """Runs the writes to a SQLite database from a single thread, and commits them in batches.
+
+    Writes are queued with `submit`. The writer takes every write queued while it was busy, runs each of them in a
+    savepoint of a single transaction, and commits them together. A write that raises is rolled back without
+    affecting the others. The future of a write is resolved once it is committed, so that its caller only returns
+    once the write is durable, but the cost of a commit is shared by all the writes of the batch.
+    """
+
+    def __init__(self, engine: Engine, max_batch_size: int = 256):
+        self.engine = engine
+        # Most writes committed together
+        self.max_batch_size = max_batch_size
+
+        self._sessionmaker = sessionmaker(bind=engine)
+        self._queue: "queue.SimpleQueue[Optional[Tuple[WriteFunction, Future]]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        # Session lent to the current thread by `session`, for nested writes
+        self._local = threading.local()
+
+    def submit(self, fn: WriteFunction) -> Future:
+        """Queue a write. Its future is resolved with the result of `fn` once the write is committed."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The SQLite writer is closed")
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="agno-sqlite-writer", daemon=True)
+                self._thread.start()
+            self._queue.put((fn, future))
+        return future
+
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        """Borrow the session of the writer thread, and wait for the writes made with it to be committed.
+
+        The writer waits for the block to end before it runs the next write, and rolls back the writes of the block
+        if it raises. Writes nested in the block use the same session.
+        """
+        current = getattr(self._local, "session", None)
+        if current is not None:
+            yield current
+            return
+
+        lent: Future = Future()
+        done = threading.Event()
+        failure: List[BaseException] = []
+
+        def _lend(sess: Session) -> None:
+            lent.set_result(sess)
+            done.wait()
+            if failure:
+                raise failure[0]
+
+        committed = self.submit(_lend)
+        wait([lent, committed], return_when=FIRST_COMPLETED)
+        if not lent.done():
+            # The batch failed before the write started
+            committed.result()
+
+        self._local.session = lent.result()
+        try:
+            yield self._local.session
+        except BaseException as e:
+            failure.append(e)
+            raise
+        finally:
+            self._local.session = None
+            done.set()
+        committed.result()
+
+    def close(self) -> None:
+        """Commit the queued writes and stop the writer thread"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join()
+        self.engine.dispose()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < self.max_batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._commit(batch)
+            if stop:
+                return
+
+    def _commit(self, batch: List[Tuple[WriteFunction, Future]]) -> None:
+        results: List[Tuple[Future, Any, Optional[BaseException]]] = []
+        try:
+            with self._sessionmaker() as sess, sess.begin():
+                for fn, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    # Writes made by `fn` through `session` use the batch's session
+                    self._local.session = sess
+                    try:
+                        with sess.begin_nested():
+                            results.append((future, fn(sess), None))
+                    except BaseException as e:
+                        results.append((future, None, e))
+                    finally:
+                        self._local.session = None
+        except Exception as e:
+            log_error(f"Error committing a batch of {len(batch)} writes: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result, error in results:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
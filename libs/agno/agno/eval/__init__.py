@@ -1,5 +1,6 @@
 from agno.eval.accuracy import AccuracyAgentResponse, AccuracyEval, AccuracyEvaluation, AccuracyResult
-from agno.eval.performance import PerformanceEval, PerformanceResult
+from agno.eval.batch import BatchEval, BatchEvalCaseResult, BatchEvalResult
+from agno.eval.performance import LoadTestResult, PerformanceEval, PerformanceResult
 from agno.eval.reliability import ReliabilityEval, ReliabilityResult
 
 __all__ = [
@@ -7,6 +8,10 @@ __all__ = [
     "AccuracyEvaluation",
     "AccuracyResult",
     "AccuracyEval",
+    "BatchEval",
+    "BatchEvalCaseResult",
+    "BatchEvalResult",
+    "LoadTestResult",
     "PerformanceEval",
     "PerformanceResult",
     "ReliabilityEval",
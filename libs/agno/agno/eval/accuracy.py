@@ -9,7 +9,7 @@ from pydantic import BaseModel, Field
 from agno.agent import Agent
 from agno.db.base import BaseDb
 from agno.db.schemas.evals import EvalType
-from agno.eval.utils import async_log_eval, log_eval_run, store_result_in_file
+from agno.eval.utils import async_log_eval, is_rate_limit_error, log_eval_run, store_result_in_file
 from exceptions import EvalError
 from agno.models.base import Model
 from agno.team.team import Team
@@ -279,10 +279,11 @@ Remember: You must only compare the agent_output to the expected_output. The exp
         evaluation_input: str,
         evaluator_expected_output: str,
         agent_output: str,
+        session_id: Optional[str] = None,
     ) -> Optional[AccuracyEvaluation]:
-        """Orchestrate the evaluation process."""
+        """Orchestrate the evaluation process. Rate limit errors are raised, so that the caller can retry."""
         try:
-            accuracy_agent_response = evaluator_agent.run(evaluation_input).content
+            accuracy_agent_response = evaluator_agent.run(evaluation_input, session_id=session_id).content
             if accuracy_agent_response is None or not isinstance(accuracy_agent_response, AccuracyAgentResponse):
                 raise EvalError(f"Evaluator Agent returned an invalid response: {accuracy_agent_response}")
             return AccuracyEvaluation(
@@ -293,6 +294,8 @@ Remember: You must only compare the agent_output to the expected_output. The exp
                 reason=accuracy_agent_response.accuracy_reason,
             )
         except Exception as e:
+            if is_rate_limit_error(e):
+                raise
             logger.exception(f"Failed to evaluate accuracy: {e}")
             return None
 
@@ -303,10 +306,12 @@ Remember: You must only compare the agent_output to the expected_output. The exp
         evaluation_input: str,
         evaluator_expected_output: str,
         agent_output: str,
+        session_id: Optional[str] = None,
     ) -> Optional[AccuracyEvaluation]:
-        """Orchestrate the evaluation process asynchronously."""
+        """Orchestrate the evaluation process asynchronously. Rate limit errors are raised, so that the caller can
+        retry."""
         try:
-            response = await evaluator_agent.arun(evaluation_input)
+            response = await evaluator_agent.arun(evaluation_input, session_id=session_id)
             accuracy_agent_response = response.content
             if accuracy_agent_response is None or not isinstance(accuracy_agent_response, AccuracyAgentResponse):
                 raise EvalError(f"Evaluator Agent returned an invalid response: {accuracy_agent_response}")
@@ -318,9 +323,119 @@ Remember: You must only compare the agent_output to the expected_output. The exp
                 reason=accuracy_agent_response.accuracy_reason,
             )
         except Exception as e:
+            if is_rate_limit_error(e):
+                raise
             logger.exception(f"Failed to evaluate accuracy asynchronously: {e}")
             return None
 
+    def _get_evaluation_input(self, eval_input: str, eval_expected_output: str, output: str) -> str:
+        return dedent(f"""\
+            <agent_input>
+            {eval_input}
+            </agent_input>
+
+            <expected_output>
+            {eval_expected_output}
+            </expected_output>
+
+            <agent_output>
+            {output}
+            </agent_output>\
+            """)
+
+    def _run_iteration(
+        self,
+        iteration: int,
+        evaluator_agent: Agent,
+        eval_input: str,
+        eval_expected_output: str,
+        session_id: Optional[str] = None,
+        evaluator_session_id: Optional[str] = None,
+    ) -> Optional[AccuracyEvaluation]:
+        """Generate an answer with the Agent or Team and evaluate it. Errors of the Agent or Team are raised.
+
+        The Agent or Team and the evaluator run in their own sessions if `session_id` and `evaluator_session_id` are
+        given, so that iterations running concurrently don't share their history.
+        """
+        if self.agent is not None:
+            output = self.agent.run(input=eval_input, session_id=session_id).content
+        elif self.team is not None:
+            output = self.team.run(input=eval_input, session_id=session_id).content
+
+        if not output:
+            logger.error(f"Failed to generate a valid answer on iteration {iteration + 1}: {output}")
+            return None
+
+        logger.debug(f"Agent output #{iteration + 1}: {output}")
+        result = self.evaluate_answer(
+            input=eval_input,
+            evaluator_agent=evaluator_agent,
+            evaluation_input=self._get_evaluation_input(eval_input, eval_expected_output, output),
+            evaluator_expected_output=eval_expected_output,
+            agent_output=output,
+            session_id=evaluator_session_id,
+        )
+        if result is None:
+            logger.error(f"Failed to evaluate accuracy on iteration {iteration + 1}")
+        return result
+
+    async def _arun_iteration(
+        self,
+        iteration: int,
+        evaluator_agent: Agent,
+        eval_input: str,
+        eval_expected_output: str,
+        session_id: Optional[str] = None,
+        evaluator_session_id: Optional[str] = None,
+    ) -> Optional[AccuracyEvaluation]:
+        """Generate an answer with the Agent or Team and evaluate it asynchronously"""
+        if self.agent is not None:
+            response = await self.agent.arun(input=eval_input, session_id=session_id)
+            output = response.content
+        elif self.team is not None:
+            response = await self.team.arun(input=eval_input, session_id=session_id)  # type: ignore
+            output = response.content
+
+        if not output:
+            logger.error(f"Failed to generate a valid answer on iteration {iteration + 1}: {output}")
+            return None
+
+        logger.debug(f"Agent output #{iteration + 1}: {output}")
+        result = await self.aevaluate_answer(
+            input=eval_input,
+            evaluator_agent=evaluator_agent,
+            evaluation_input=self._get_evaluation_input(eval_input, eval_expected_output, output),
+            evaluator_expected_output=eval_expected_output,
+            agent_output=output,
+            session_id=evaluator_session_id,
+        )
+        if result is None:
+            logger.error(f"Failed to evaluate accuracy on iteration {iteration + 1}")
+        return result
+
+    def _get_log_eval_kwargs(self) -> Dict[str, Any]:
+        """Arguments to log the result of the evaluation in the database"""
+        component = self.agent if self.agent is not None else self.team
+        model = component.model if component is not None else None
+        return {
+            "run_id": self.eval_id,
+            "run_data": asdict(self.result) if self.result is not None else {},
+            "eval_type": EvalType.ACCURACY,
+            "agent_id": self.agent.id if self.agent is not None else None,
+            "team_id": self.team.id if self.team is not None else None,
+            "model_id": model.id if model is not None else None,
+            "model_provider": model.provider if model is not None else None,
+            "name": self.name,
+            "evaluated_component_name": component.name if component is not None else None,
+            "eval_input": {
+                "additional_guidelines": self.additional_guidelines,
+                "additional_context": self.additional_context,
+                "num_iterations": self.num_iterations,
+                "expected_output": self.expected_output,
+                "input": self.input,
+            },
+        }
+
     def run(
         self,
         *,
@@ -356,38 +471,8 @@ Remember: You must only compare the agent_output to the expected_output. The exp
                 status = Status(f"Running evaluation {i + 1}...", spinner="dots", speed=1.0, refresh_per_second=10)
                 live_log.update(status)
 
-                if self.agent is not None:
-                    output = self.agent.run(input=eval_input).content
-                elif self.team is not None:
-                    output = self.team.run(input=eval_input).content
-
-                if not output:
-                    logger.error(f"Failed to generate a valid answer on iteration {i + 1}: {output}")
-                    continue
-
-                evaluation_input = dedent(f"""\
-                    <agent_input>
-                    {eval_input}
-                    </agent_input>
-
-                    <expected_output>
-                    {eval_expected_output}
-                    </expected_output>
-
-                    <agent_output>
-                    {output}
-                    </agent_output>\
-                    """)
-                logger.debug(f"Agent output #{i + 1}: {output}")
-                result = self.evaluate_answer(
-                    input=eval_input,
-                    evaluator_agent=evaluator_agent,
-                    evaluation_input=evaluation_input,
-                    evaluator_expected_output=eval_expected_output,
-                    agent_output=output,
-                )
+                result = self._run_iteration(i, evaluator_agent, eval_input, eval_expected_output)
                 if result is None:
-                    logger.error(f"Failed to evaluate accuracy on iteration {i + 1}")
                     continue
 
                 self.result.results.append(result)
@@ -497,40 +582,8 @@ Remember: You must only compare the agent_output to the expected_output. The exp
                 status = Status(f"Running evaluation {i + 1}...", spinner="dots", speed=1.0, refresh_per_second=10)
                 live_log.update(status)
 
-                if self.agent is not None:
-                    response = await self.agent.arun(input=eval_input)
-                    output = response.content
-                elif self.team is not None:
-                    response = await self.team.arun(input=eval_input)  # type: ignore
-                    output = response.content
-
-                if not output:
-                    logger.error(f"Failed to generate a valid answer on iteration {i + 1}: {output}")
-                    continue
-
-                evaluation_input = dedent(f"""\
-                    <agent_input>
-                    {eval_input}
-                    </agent_input>
-
-                    <expected_output>
-                    {eval_expected_output}
-                    </expected_output>
-
-                    <agent_output>
-                    {output}
-                    </agent_output>\
-                    """)
-                logger.debug(f"Agent output #{i + 1}: {output}")
-                result = await self.aevaluate_answer(
-                    input=eval_input,
-                    evaluator_agent=evaluator_agent,
-                    evaluation_input=evaluation_input,
-                    evaluator_expected_output=eval_expected_output,
-                    agent_output=output,
-                )
+                result = await self._arun_iteration(i, evaluator_agent, eval_input, eval_expected_output)
                 if result is None:
-                    logger.error(f"Failed to evaluate accuracy on iteration {i + 1}")
                     continue
 
                 self.result.results.append(result)
@@ -0,0 +1,447 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import partial
+from os import getenv
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+from uuid import uuid4
+
+from agno.db.base import BaseDb
+from agno.db.schemas.evals import EvalType
+from agno.eval.accuracy import AccuracyEval, AccuracyEvaluation, AccuracyResult
+from agno.eval.reliability import ReliabilityEval, ReliabilityResult
+from agno.eval.utils import async_log_eval, is_rate_limit_error, log_eval_run, store_result_in_file
+from agno.utils.log import log_debug, log_warning, logger, set_log_level_to_debug, set_log_level_to_info
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+T = TypeVar("T")
+
+
+class EvalRateLimiter:
+    """Paces the iterations of a batch of evaluations.
+
+    Iterations are spaced to stay under `iterations_per_minute`, and every worker waits out the cooldown after a
+    provider returns a rate limit error, so that the batch backs off as a whole instead of each worker retrying on its
+    own.
+    """
+
+    def __init__(self, iterations_per_minute: Optional[int] = None):
+        self.interval = 60.0 / iterations_per_minute if iterations_per_minute else 0.0
+        self._next_start = 0.0
+        self._paused_until = 0.0
+        self._lock = Lock()
+
+    def _reserve(self) -> float:
+        """Reserve the next slot and return how long to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start, self._paused_until)
+            self._next_start = start + self.interval
+            return start - now
+
+    def wait(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_wait(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back new calls for the given number of seconds"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+@dataclass
+class BatchEvalCaseResult:
+    case_id: str
+    eval_type: EvalType
+    # One of "completed", "failed" or "resumed"
+    status: str
+    name: Optional[str] = None
+    result: Optional[Union[AccuracyResult, ReliabilityResult]] = None
+    errors: List[str] = field(default_factory=list)
+
+
+@dataclass
+class BatchEvalResult:
+    batch_id: str
+    cases: List[BatchEvalCaseResult] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def completed(self) -> List[BatchEvalCaseResult]:
+        return [case for case in self.cases if case.status == "completed"]
+
+    @property
+    def failed(self) -> List[BatchEvalCaseResult]:
+        return [case for case in self.cases if case.status == "failed"]
+
+    @property
+    def resumed(self) -> List[BatchEvalCaseResult]:
+        return [case for case in self.cases if case.status == "resumed"]
+
+    def print_summary(self, console: Optional["Console"] = None):
+        from rich.box import ROUNDED
+        from rich.console import Console
+        from rich.table import Table
+
+        if console is None:
+            console = Console()
+
+        summary_table = Table(
+            box=ROUNDED,
+            border_style="blue",
+            title=f"[ Batch Evaluation {self.batch_id} ]",
+            title_style="bold sky_blue1",
+            title_justify="center",
+        )
+        summary_table.add_column("Case")
+        summary_table.add_column("Type")
+        summary_table.add_column("Status")
+        summary_table.add_column("Result")
+        for case in self.cases:
+            if isinstance(case.result, AccuracyResult) and case.result.results:
+                result = f"{case.result.avg_score:.2f}/10"
+            elif isinstance(case.result, ReliabilityResult):
+                result = case.result.eval_status
+            else:
+                result = "; ".join(case.errors)
+            summary_table.add_row(case.name or case.case_id, case.eval_type.value, case.status, result)
+        console.print(summary_table)
+        console.print(
+            f"{len(self.completed)} completed, {len(self.failed)} failed, {len(self.resumed)} resumed "
+            f"in {self.duration:.2f}s"
+        )
+
+
+@dataclass
+class _Case:
+    """Progress of one evaluation in the batch"""
+
+    case_id: str
+    eval: Union[AccuracyEval, ReliabilityEval]
+    pending: int = 1
+    evaluations: List[Tuple[int, Optional[AccuracyEvaluation]]] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    result: Optional[BatchEvalCaseResult] = None
+
+
+@dataclass
+class BatchEval:
+    """Run a batch of accuracy and reliability evaluations concurrently.
+
+    Every iteration of every evaluation is a unit of work, and at most `max_concurrency` of them run at once. Each
+    evaluation is stored in the database as soon as all its iterations finish, with the id `{batch_id}_{index}`, which
+    replaces the `eval_id` of the evaluation. Running a batch again with the same `batch_id` skips the evaluations
+    that are already stored, so an interrupted batch resumes where it stopped.
+    """
+
+    evals: List[Union[AccuracyEval, ReliabilityEval]] = field(default_factory=list)
+
+    # Batch UUID. Reuse it to resume a batch
+    batch_id: str = field(default_factory=lambda: str(uuid4()))
+    # Batch name
+    name: Optional[str] = None
+    # Maximum number of iterations running at the same time
+    max_concurrency: int = 8
+    # If set, iterations are spaced to stay under this rate. Each iteration makes at least two model calls: one to
+    # answer and one to evaluate the answer, plus one per tool call round of the agent or team.
+    iterations_per_minute: Optional[int] = None
+    # Number of times an iteration is retried after a rate limit error
+    max_rate_limit_retries: int = 5
+    # Seconds to pause the batch after the first rate limit error, doubled on each retry of the same iteration
+    rate_limit_backoff: float = 2.0
+    # Skip the evaluations of the batch that are already stored in the database
+    resume: bool = True
+    # Result of the batch
+    result: Optional[BatchEvalResult] = None
+
+    # Print summary of results
+    print_summary: bool = False
+    # Enable debug logs
+    debug_mode: bool = getenv("AGNO_DEBUG", "false").lower() == "true"
+    # The database to store Evaluation results, used for the evaluations without their own database
+    db: Optional[BaseDb] = None
+
+    # Telemetry settings
+    # telemetry=True logs minimal telemetry for analytics
+    # This helps us improve our Evals and provide better support
+    telemetry: bool = True
+
+    def __post_init__(self):
+        self.max_concurrency = max(1, self.max_concurrency)
+
+    def _get_db(self, eval: Union[AccuracyEval, ReliabilityEval]) -> Optional[BaseDb]:
+        return eval.db if eval.db is not None else self.db
+
+    def _get_stored_result(self, case: _Case) -> Optional[Union[AccuracyResult, ReliabilityResult]]:
+        """Result of the case stored by a previous run of the batch"""
+        db = self._get_db(case.eval)
+        if not self.resume or db is None:
+            return None
+        try:
+            eval_run = db.get_eval_run(case.case_id, deserialize=False)
+        except NotImplementedError:
+            return None
+        except Exception as e:
+            log_warning(f"Could not check for a stored result of {case.case_id}: {e}")
+            return None
+        if not eval_run:
+            return None
+
+        eval_data: Dict[str, Any] = eval_run.get("eval_data") or {}  # type: ignore
+        if isinstance(case.eval, AccuracyEval):
+            return AccuracyResult(results=[AccuracyEvaluation(**r) for r in eval_data.get("results", [])])
+        return ReliabilityResult(
+            eval_status=eval_data.get("eval_status", "FAILED"),
+            failed_tool_calls=eval_data.get("failed_tool_calls", []),
+            passed_tool_calls=eval_data.get("passed_tool_calls", []),
+        )
+
+    def _prepare_cases(self) -> List[_Case]:
+        cases: List[_Case] = []
+        for index, eval in enumerate(self.evals):
+            case = _Case(case_id=f"{self.batch_id}_{index}", eval=eval)
+            eval.eval_id = case.case_id
+            if isinstance(eval, AccuracyEval):
+                case.pending = eval.num_iterations
+
+            stored_result = self._get_stored_result(case)
+            if stored_result is not None:
+                eval.result = stored_result  # type: ignore
+                case.result = self._case_result(case, "resumed")
+                case.pending = 0
+            cases.append(case)
+        return cases
+
+    def _case_result(self, case: _Case, status: str) -> BatchEvalCaseResult:
+        return BatchEvalCaseResult(
+            case_id=case.case_id,
+            eval_type=EvalType.ACCURACY if isinstance(case.eval, AccuracyEval) else EvalType.RELIABILITY,
+            status=status,
+            name=case.eval.name,
+            result=case.eval.result,
+            errors=case.errors,
+        )
+
+    def _complete_case(self, case: _Case) -> bool:
+        """Set the result of a case whose iterations all finished. Returns whether the result should be stored."""
+        eval = case.eval
+        if isinstance(eval, AccuracyEval):
+            evaluations = [evaluation for _, evaluation in sorted(case.evaluations, key=lambda e: e[0]) if evaluation]
+            eval.result = AccuracyResult(results=evaluations)
+            completed = len(evaluations) > 0
+            if not completed and not case.errors:
+                case.errors.append("No iteration produced an evaluation")
+        else:
+            completed = eval.result is not None
+
+        case.result = self._case_result(case, "completed" if completed else "failed")
+        if completed and eval.file_path_to_save_results is not None:
+            store_result_in_file(
+                file_path=eval.file_path_to_save_results,
+                name=eval.name,
+                eval_id=eval.eval_id,
+                result=eval.result,  # type: ignore
+            )
+        log_debug(f"Batch evaluation case {case.case_id} {case.result.status}")
+        return completed
+
+    def _get_log_eval_kwargs(self, case: _Case) -> Dict[str, Any]:
+        kwargs = case.eval._get_log_eval_kwargs()
+        kwargs["eval_input"]["batch_id"] = self.batch_id
+        return kwargs
+
+    def _create_telemetry(self, case: _Case) -> None:
+        from agno.api.evals import EvalRunCreate, create_eval_run_telemetry
+
+        create_eval_run_telemetry(
+            eval_run=EvalRunCreate(
+                run_id=case.case_id,
+                eval_type=case.result.eval_type,  # type: ignore
+                data=case.eval._get_telemetry_data(),
+            ),
+        )
+
+    async def _acreate_telemetry(self, case: _Case) -> None:
+        from agno.api.evals import EvalRunCreate, async_create_eval_run_telemetry
+
+        await async_create_eval_run_telemetry(
+            eval_run=EvalRunCreate(
+                run_id=case.case_id,
+                eval_type=case.result.eval_type,  # type: ignore
+                data=case.eval._get_telemetry_data(),
+            ),
+        )
+
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """Seconds to back off before retrying after the error, or None if it shouldn't be retried"""
+        if not is_rate_limit_error(error) or attempt >= self.max_rate_limit_retries:
+            return None
+        delay = self.rate_limit_backoff * 2**attempt
+        log_warning(f"Rate limited, pausing the batch for {delay:.2f}s (retry {attempt + 1})")
+        return delay
+
+    def _call(self, limiter: EvalRateLimiter, fn: Callable[[], T]) -> T:
+        attempt = 0
+        while True:
+            limiter.wait()
+            try:
+                return fn()
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                limiter.pause(delay)
+                attempt += 1
+
+    async def _acall(self, limiter: EvalRateLimiter, fn: Callable[[], Awaitable[Any]]) -> Any:
+        attempt = 0
+        while True:
+            await limiter.async_wait()
+            try:
+                return await fn()
+            except Exception as e:
+                delay = self._retry_delay(e, attempt)
+                if delay is None:
+                    raise
+                limiter.pause(delay)
+                attempt += 1
+
+    def _get_units(self, case: _Case) -> List[Tuple[Optional[int], Callable[..., Any], Tuple[Any, ...]]]:
+        """Iterations of the case, as (iteration, method, args). Raises if the evaluation can't be set up."""
+        eval = case.eval
+        if isinstance(eval, ReliabilityEval):
+            if (eval.agent_response is None) == (eval.team_response is None):
+                raise ValueError("You need to provide only one of 'agent_response' or 'team_response'.")
+            return [(None, eval._evaluate, ())]
+
+        if (eval.agent is None) == (eval.team is None):
+            raise ValueError("You need to provide only one of 'agent' or 'team' to run the evaluation.")
+        evaluator_agent = eval.get_evaluator_agent()
+        eval_input = eval.get_eval_input()
+        eval_expected_output = eval.get_eval_expected_output()
+        # Iterations run concurrently, so each one runs in sessions of its own instead of sharing their history
+        return [
+            (i, eval._run_iteration, (i, evaluator_agent, eval_input, eval_expected_output, str(uuid4()), str(uuid4())))
+            for i in range(case.pending)
+        ]
+
+    def _record(self, case: _Case, iteration: Optional[int], value: Any = None, error: Optional[Exception] = None):
+        """Record a finished iteration of the case. Returns True once the whole case finished."""
+        case.pending -= 1
+        if error is not None:
+            label = f"iteration {iteration + 1}" if iteration is not None else "evaluation"
+            logger.error(f"Batch evaluation case {case.case_id} failed on {label}: {error}")
+            case.errors.append(str(error))
+        elif iteration is not None:
+            case.evaluations.append((iteration, value))
+        else:
+            case.eval.result = value
+        return case.pending == 0
+
+    def _start(self) -> List[_Case]:
+        set_log_level_to_debug() if self.debug_mode else set_log_level_to_info()
+        logger.debug(f"************ Batch Evaluation Start: {self.batch_id} ************")
+        return self._prepare_cases()
+
+    def _finish(self, cases: List[_Case], started_at: float, print_summary: bool) -> BatchEvalResult:
+        self.result = BatchEvalResult(
+            batch_id=self.batch_id,
+            cases=[case.result for case in cases if case.result is not None],
+            duration=time.perf_counter() - started_at,
+        )
+        if self.print_summary or print_summary:
+            self.result.print_summary()
+        logger.debug(f"*********** Batch Evaluation End: {self.batch_id} ***********")
+        return self.result
+
+    def run(self, *, print_summary: bool = False) -> BatchEvalResult:
+        started_at = time.perf_counter()
+        cases = self._start()
+        limiter = EvalRateLimiter(self.iterations_per_minute)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            futures = {}
+            for case in cases:
+                if case.pending == 0:
+                    continue
+                try:
+                    units = self._get_units(case)
+                except Exception as e:
+                    case.errors.append(str(e))
+                    self._complete_case(case)
+                    continue
+                for iteration, method, args in units:
+                    future = executor.submit(self._call, limiter, lambda m=method, a=args: m(*a))
+                    futures[future] = (case, iteration)
+
+            for future in as_completed(futures):
+                case, iteration = futures[future]
+                error = future.exception()
+                if not self._record(case, iteration, None if error else future.result(), error):  # type: ignore
+                    continue
+                if not self._complete_case(case):
+                    continue
+                # Store each evaluation as soon as it finishes, so that the batch can be resumed
+                db = self._get_db(case.eval)
+                if db is not None:
+                    log_eval_run(db=db, **self._get_log_eval_kwargs(case))
+                if self.telemetry and case.eval.telemetry:
+                    self._create_telemetry(case)
+
+        return self._finish(cases, started_at, print_summary)
+
+    async def arun(self, *, print_summary: bool = False) -> BatchEvalResult:
+        started_at = time.perf_counter()
+        cases = self._start()
+        limiter = EvalRateLimiter(self.iterations_per_minute)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_unit(case: _Case, iteration: Optional[int], fn: Callable[[], Awaitable[Any]]):
+            async with semaphore:
+                try:
+                    return case, iteration, await self._acall(limiter, fn), None
+                except Exception as e:
+                    return case, iteration, None, e
+
+        tasks = []
+        for case in cases:
+            if case.pending == 0:
+                continue
+            try:
+                units = self._get_units(case)
+            except Exception as e:
+                case.errors.append(str(e))
+                self._complete_case(case)
+                continue
+            eval = case.eval
+            for iteration, method, args in units:
+                fn: Callable[[], Awaitable[Any]]
+                if isinstance(eval, AccuracyEval):
+                    fn = partial(eval._arun_iteration, *args)
+                else:
+                    fn = partial(asyncio.to_thread, method, *args)
+                tasks.append(asyncio.ensure_future(run_unit(case, iteration, fn)))
+
+        for next_done in asyncio.as_completed(tasks):
+            case, iteration, value, error = await next_done
+            if not self._record(case, iteration, value, error):
+                continue
+            if not self._complete_case(case):
+                continue
+            db = self._get_db(case.eval)
+            if db is not None:
+                await async_log_eval(db=db, **self._get_log_eval_kwargs(case))
+            if self.telemetry and case.eval.telemetry:
+                await self._acreate_telemetry(case)
+
+        return self._finish(cases, started_at, print_summary)
@@ -0,0 +1,350 @@
+"""Offline benchmarks of agno's own per-run overhead.
+
+Every benchmark uses MockModel, so no provider key or network is needed and the measured time is agno's work alone.
+Compare a run against a stored baseline to catch regressions, e.g. in CI:
+
+    python -m agno.eval.benchmarks --save baseline.json
+    python -m agno.eval.benchmarks --baseline baseline.json --tolerance 0.25
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
+from uuid import uuid4
+
+from agno.db.base import BaseDb
+from agno.eval.performance import PerformanceEval
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+def get_current_time(city: str) -> str:
+    """Get the current time in a city.
+
+    Args:
+        city (str): Name of the city.
+    """
+    return f"It is 12:00 in {city}."
+
+
+ANSWER = "Paris is the capital of France and has been for most of its history."
+LONG_ANSWER = " ".join([ANSWER] * 10)
+
+
+@dataclass
+class Benchmark:
+    name: str
+    description: str
+    # Function to measure, built once per benchmark so that setup isn't measured
+    setup: Callable[[], Callable]
+
+
+def _agent_instantiation() -> Callable:
+    from agno.agent import Agent
+    from agno.models.mock import MockModel
+
+    def instantiate_agent():
+        return Agent(model=MockModel(), tools=[get_current_time], telemetry=False)
+
+    return instantiate_agent
+
+
+def _agent_run() -> Callable:
+    from agno.agent import Agent
+    from agno.models.mock import MockModel
+
+    agent = Agent(model=MockModel(default_response=ANSWER), telemetry=False)
+
+    def run_agent():
+        return agent.run("What is the capital of France?")
+
+    return run_agent
+
+
+def _agent_run_with_tools() -> Callable:
+    from agno.agent import Agent
+    from agno.models.mock import MockModel, MockResponse
+
+    model = MockModel(
+        responses=[MockResponse(tool_calls=[{"name": "get_current_time", "arguments": {"city": "Paris"}}]), ANSWER],
+        cycle=True,
+    )
+    agent = Agent(model=model, tools=[get_current_time], telemetry=False)
+
+    def run_agent_with_tools():
+        return agent.run("What time is it in Paris?")
+
+    return run_agent_with_tools
+
+
+def _agent_streaming() -> Callable:
+    from agno.agent import Agent
+    from agno.models.mock import MockModel
+
+    agent = Agent(model=MockModel(default_response=LONG_ANSWER), telemetry=False)
+
+    def stream_agent():
+        for _ in agent.run("Tell me about Paris.", stream=True):
+            pass
+
+    return stream_agent
+
+
+def _agent_arun() -> Callable:
+    from agno.agent import Agent
+    from agno.models.mock import MockModel
+
+    agent = Agent(model=MockModel(default_response=ANSWER), telemetry=False)
+
+    async def arun_agent():
+        return await agent.arun("What is the capital of France?")
+
+    return arun_agent
+
+
+def _team_delegation() -> Callable:
+    from agno.agent import Agent
+    from agno.models.mock import MockModel, MockResponse
+    from agno.team import Team
+
+    member = Agent(
+        id="researcher",
+        name="Researcher",
+        model=MockModel(default_response=ANSWER),
+        telemetry=False,
+    )
+    leader = MockModel(
+        responses=[
+            MockResponse(
+                tool_calls=[
+                    {
+                        "name": "delegate_task_to_member",
+                        "arguments": {"member_id": "researcher", "task_description": "Find the capital of France"},
+                    }
+                ]
+            ),
+            ANSWER,
+        ],
+        cycle=True,
+    )
+    team = Team(members=[member], model=leader, telemetry=False)
+
+    def run_team():
+        return team.run("What is the capital of France?")
+
+    return run_team
+
+
+def _workflow() -> Callable:
+    from agno.agent import Agent
+    from agno.models.mock import MockModel
+    from agno.workflow import Step, Workflow
+
+    def agent(name: str) -> Agent:
+        return Agent(name=name, model=MockModel(default_response=ANSWER), telemetry=False)
+
+    workflow = Workflow(
+        name="Benchmark Workflow",
+        steps=[Step(name="research", agent=agent("Researcher")), Step(name="write", agent=agent("Writer"))],
+        telemetry=False,
+    )
+
+    def run_workflow():
+        return workflow.run("What is the capital of France?")
+
+    return run_workflow
+
+
+def _storage_round_trip() -> Callable:
+    from agno.agent import Agent
+    from agno.db.in_memory import InMemoryDb
+    from agno.models.mock import MockModel
+
+    agent = Agent(
+        model=MockModel(default_response=ANSWER),
+        db=InMemoryDb(),
+        add_history_to_context=True,
+        telemetry=False,
+    )
+
+    def run_with_storage():
+        session_id = str(uuid4())
+        agent.run("What is the capital of France?", session_id=session_id)
+        agent.run("And of Italy?", session_id=session_id)
+        return agent.get_session(session_id=session_id)
+
+    return run_with_storage
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    benchmark.name: benchmark
+    for benchmark in [
+        Benchmark("agent_instantiation", "Create an Agent with a tool", _agent_instantiation),
+        Benchmark("agent_run", "Run an Agent", _agent_run),
+        Benchmark("agent_run_with_tools", "Run an Agent that calls a tool", _agent_run_with_tools),
+        Benchmark("agent_streaming", "Stream a 130 token answer", _agent_streaming),
+        Benchmark("agent_arun", "Run an Agent asynchronously", _agent_arun),
+        Benchmark("team_delegation", "Run a Team that delegates to a member", _team_delegation),
+        Benchmark("workflow", "Run a Workflow of two agent steps", _workflow),
+        Benchmark("storage_round_trip", "Run an Agent twice in a stored session and read it back", _storage_round_trip),
+    ]
+}
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    # Run time in seconds
+    median_run_time: float
+    p95_run_time: float
+    # Peak memory in MiB, 0 unless memory was measured
+    avg_memory_usage: float = 0.0
+    baseline_median_run_time: Optional[float] = None
+
+    def regressed(self, tolerance: float) -> bool:
+        if not self.baseline_median_run_time:
+            return False
+        return self.median_run_time > self.baseline_median_run_time * (1 + tolerance)
+
+
+@dataclass
+class BenchmarkReport:
+    results: List[BenchmarkResult] = field(default_factory=list)
+    # Allowed slowdown against the baseline, as a fraction of the baseline run time
+    tolerance: float = 0.25
+
+    @property
+    def regressions(self) -> List[BenchmarkResult]:
+        return [result for result in self.results if result.regressed(self.tolerance)]
+
+    @property
+    def passed(self) -> bool:
+        return not self.regressions
+
+    def to_baseline(self) -> Dict[str, Dict[str, float]]:
+        return {
+            result.name: {"median_run_time": result.median_run_time, "avg_memory_usage": result.avg_memory_usage}
+            for result in self.results
+        }
+
+    def save_baseline(self, path: Union[str, Path]) -> None:
+        Path(path).write_text(json.dumps(self.to_baseline(), indent=4))
+
+    def print_summary(self, console: Optional["Console"] = None):
+        from rich.console import Console
+        from rich.table import Table
+
+        if console is None:
+            console = Console()
+
+        table = Table(title="Benchmark Summary", show_header=True, header_style="bold magenta")
+        table.add_column("Benchmark", style="cyan")
+        table.add_column("Median (ms)", style="green")
+        table.add_column("95th %ile (ms)", style="green")
+        table.add_column("Memory (MiB)", style="yellow")
+        table.add_column("Baseline (ms)")
+        table.add_column("Change")
+        for result in self.results:
+            baseline = result.baseline_median_run_time
+            change = f"{(result.median_run_time / baseline - 1) * 100:+.1f}%" if baseline else "-"
+            if result.regressed(self.tolerance):
+                change = f"[red]{change}[/red]"
+            table.add_row(
+                result.name,
+                f"{result.median_run_time * 1000:.3f}",
+                f"{result.p95_run_time * 1000:.3f}",
+                f"{result.avg_memory_usage:.3f}",
+                f"{baseline * 1000:.3f}" if baseline else "-",
+                change,
+            )
+        console.print(table)
+
+
+def _load_baseline(baseline: Union[str, Path, Dict[str, Dict[str, float]]]) -> Dict[str, Dict[str, float]]:
+    if isinstance(baseline, dict):
+        return baseline
+    return json.loads(Path(baseline).read_text())
+
+
+def run_benchmarks(
+    names: Optional[List[str]] = None,
+    num_iterations: int = 20,
+    warmup_runs: int = 5,
+    measure_memory: bool = False,
+    baseline: Optional[Union[str, Path, Dict[str, Dict[str, float]]]] = None,
+    tolerance: float = 0.25,
+    db: Optional[BaseDb] = None,
+) -> BenchmarkReport:
+    """Run the benchmarks, all of them by default, and compare their median run time with the baseline"""
+    unknown = [name for name in names or [] if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}. Available: {', '.join(BENCHMARKS)}")
+
+    baseline_data = _load_baseline(baseline) if baseline is not None else {}
+    report = BenchmarkReport(tolerance=tolerance)
+    for name in names or list(BENCHMARKS):
+        benchmark = BENCHMARKS[name]
+        log_debug(f"Running benchmark {name}")
+        performance_eval = PerformanceEval(
+            func=benchmark.setup(),
+            name=f"benchmark:{name}",
+            num_iterations=num_iterations,
+            warmup_runs=warmup_runs,
+            measure_memory=measure_memory,
+            db=db,
+            telemetry=False,
+        )
+        if asyncio.iscoroutinefunction(performance_eval.func):
+            result = asyncio.run(performance_eval.arun())
+        else:
+            result = performance_eval.run()
+
+        benchmark_result = BenchmarkResult(
+            name=name,
+            median_run_time=result.median_run_time,
+            p95_run_time=result.p95_run_time,
+            avg_memory_usage=result.avg_memory_usage,
+            baseline_median_run_time=baseline_data.get(name, {}).get("median_run_time"),
+        )
+        if benchmark_result.regressed(tolerance):
+            log_warning(
+                f"Benchmark {name} regressed: {benchmark_result.median_run_time:.6f}s against "
+                f"{benchmark_result.baseline_median_run_time:.6f}s in the baseline"
+            )
+        report.results.append(benchmark_result)
+    return report
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark agno's per-run overhead with an offline mock model")
+    parser.add_argument("benchmarks", nargs="*", help=f"Benchmarks to run. Available: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--iterations", type=int, default=20, help="Measured runs of each benchmark")
+    parser.add_argument("--warmup", type=int, default=5, help="Warm-up runs of each benchmark")
+    parser.add_argument("--memory", action="store_true", help="Also measure peak memory")
+    parser.add_argument("--baseline", help="JSON file of a previous run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown against the baseline")
+    parser.add_argument("--save", help="Save the results as a baseline in this JSON file")
+    parsed = parser.parse_args(args)
+
+    report = run_benchmarks(
+        names=parsed.benchmarks or None,
+        num_iterations=parsed.iterations,
+        warmup_runs=parsed.warmup,
+        measure_memory=parsed.memory,
+        baseline=parsed.baseline,
+        tolerance=parsed.tolerance,
+    )
+    report.print_summary()
+    if parsed.save:
+        report.save_baseline(parsed.save)
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,14 @@
 import asyncio
 import gc
+import os
+import sys
+import threading
 import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from os import getenv
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
 from uuid import uuid4
 
 from agno.db.base import BaseDb
@@ -176,6 +181,134 @@ class PerformanceResult:
         console.print(results_table)
 
 
+def _get_rss_mib() -> float:
+    """Resident set size of the current process in MiB, or 0 if it can't be read"""
+    # os.sysconf doesn't exist on Windows
+    if hasattr(os, "sysconf"):
+        try:
+            with open("/proc/self/statm") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+        except (OSError, ValueError):
+            pass
+    try:
+        import resource
+
+        # Peak instead of current RSS, in bytes on macOS and KiB elsewhere
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss / 1024 / 1024 if sys.platform == "darwin" else max_rss / 1024
+    except Exception:
+        return 0.0
+
+
+class _RssSampler:
+    """Samples the RSS of the process in a background thread and keeps the peak"""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak_rss_mib = _get_rss_mib()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak_rss_mib = max(self.peak_rss_mib, _get_rss_mib())
+
+    def __enter__(self) -> "_RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        self._thread.join()
+        self.peak_rss_mib = max(self.peak_rss_mib, _get_rss_mib())
+
+
+@dataclass
+class LoadTestResult:
+    """
+    Holds the statistics of a load test, where the function is called by concurrent workers or at a target rate.
+    Latencies are in seconds. At a target rate they are measured from the time each call was due, so that calls
+    queued behind busy workers count the time they waited.
+    """
+
+    latencies: List[float] = field(default_factory=list)
+    # Wall time of the load test in seconds
+    duration: float = 0.0
+    # Number of workers
+    concurrency: int = 1
+    # Calls per second requested, None when the workers call the function back to back
+    target_rps: Optional[float] = None
+    # Number of calls that raised an exception
+    errors: int = 0
+    # Delays of the event loop in waking up a timer, only measured for async functions
+    event_loop_lags: List[float] = field(default_factory=list)
+    # Peak resident set size of the process during the test in MiB
+    peak_rss_mib: float = 0.0
+
+    total_requests: int = field(init=False)
+    throughput: float = field(init=False)
+    avg_latency: float = field(init=False)
+    p50_latency: float = field(init=False)
+    p95_latency: float = field(init=False)
+    p99_latency: float = field(init=False)
+    max_latency: float = field(init=False)
+    avg_event_loop_lag: float = field(init=False)
+    max_event_loop_lag: float = field(init=False)
+
+    def __post_init__(self):
+        self.compute_stats()
+
+    def compute_stats(self):
+        import statistics
+
+        self.total_requests = len(self.latencies) + self.errors
+        self.throughput = len(self.latencies) / self.duration if self.duration > 0 else 0
+
+        if len(self.latencies) > 1:
+            percentiles = statistics.quantiles(self.latencies, n=100, method="inclusive")
+            self.p50_latency, self.p95_latency, self.p99_latency = percentiles[49], percentiles[94], percentiles[98]
+        else:
+            self.p50_latency = self.p95_latency = self.p99_latency = self.latencies[0] if self.latencies else 0
+        self.avg_latency = statistics.mean(self.latencies) if self.latencies else 0
+        self.max_latency = max(self.latencies) if self.latencies else 0
+
+        self.avg_event_loop_lag = statistics.mean(self.event_loop_lags) if self.event_loop_lags else 0
+        self.max_event_loop_lag = max(self.event_loop_lags) if self.event_loop_lags else 0
+
+    def print_summary(self, console: Optional["Console"] = None):
+        """
+        Prints a summary table of the load test.
+        """
+        from rich.console import Console
+        from rich.table import Table
+
+        if console is None:
+            console = Console()
+
+        load_table = Table(title="Load Test Summary", show_header=True, header_style="bold magenta")
+        load_table.add_column("Metric", style="cyan")
+        load_table.add_column("Value", style="green")
+
+        load_table.add_row("Concurrency", str(self.concurrency))
+        if self.target_rps is not None:
+            load_table.add_row("Target rate (calls/s)", f"{self.target_rps:.2f}")
+        load_table.add_row("Calls", str(self.total_requests))
+        load_table.add_row("Errors", str(self.errors))
+        load_table.add_row("Duration (seconds)", f"{self.duration:.3f}")
+        load_table.add_row("Throughput (calls/s)", f"{self.throughput:.2f}")
+        load_table.add_row("Average latency (seconds)", f"{self.avg_latency:.6f}")
+        load_table.add_row("p50 latency (seconds)", f"{self.p50_latency:.6f}")
+        load_table.add_row("p95 latency (seconds)", f"{self.p95_latency:.6f}")
+        load_table.add_row("p99 latency (seconds)", f"{self.p99_latency:.6f}")
+        load_table.add_row("Max latency (seconds)", f"{self.max_latency:.6f}")
+        if self.event_loop_lags:
+            load_table.add_row("Average event loop lag (seconds)", f"{self.avg_event_loop_lag:.6f}")
+            load_table.add_row("Max event loop lag (seconds)", f"{self.max_event_loop_lag:.6f}")
+        load_table.add_row("Peak RSS (MiB)", f"{self.peak_rss_mib:.2f}")
+
+        console.print(load_table)
+
+
 @dataclass
 class PerformanceEval:
     """
@@ -211,6 +344,16 @@ class PerformanceEval:
     # Number of memory allocations to track
     top_n_memory_allocations: int = 5
 
+    # Load mode, used by run_load() and arun_load()
+    # Number of concurrent workers (threads, or asyncio tasks for async functions)
+    concurrency: int = 10
+    # If set, calls are started at this rate (calls per second) instead of back to back by each worker
+    target_rps: Optional[float] = None
+    # If set, the load test runs for this many seconds instead of num_iterations calls
+    load_duration: Optional[float] = None
+    # Result of the load test
+    load_result: Optional[LoadTestResult] = None
+
     # Agent and Team information
     agent_id: Optional[str] = None
     team_id: Optional[str] = None
@@ -758,6 +901,289 @@ class PerformanceEval:
         log_debug(f"*********** Evaluation End: {self.eval_id} ***********")
         return self.result
 
+    def _validate_load_settings(self) -> None:
+        if self.target_rps is not None and self.target_rps <= 0:
+            raise ValueError(f"target_rps must be greater than 0, got {self.target_rps}")
+        if self.concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {self.concurrency}")
+
+    def _get_load_schedule(self, start: float) -> Iterator[float]:
+        """Times at which the calls of a load test at the target rate are due"""
+        i = 0
+        while self.load_duration is not None or i < self.num_iterations:
+            due = start + i / self.target_rps  # type: ignore
+            if self.load_duration is not None and due >= start + self.load_duration:
+                return
+            yield due
+            i += 1
+
+    def _parse_load_run_data(self) -> dict:
+        """Parse the load test result into a dictionary with the data we want for monitoring."""
+        if self.load_result is None:
+            return {}
+
+        return {
+            "load": {
+                "concurrency": self.load_result.concurrency,
+                "target_rps": self.load_result.target_rps,
+                "duration": self.load_result.duration,
+                "total_requests": self.load_result.total_requests,
+                "errors": self.load_result.errors,
+                "throughput": self.load_result.throughput,
+                "avg_latency": self.load_result.avg_latency,
+                "p50_latency": self.load_result.p50_latency,
+                "p95_latency": self.load_result.p95_latency,
+                "p99_latency": self.load_result.p99_latency,
+                "max_latency": self.load_result.max_latency,
+                "avg_event_loop_lag": self.load_result.avg_event_loop_lag,
+                "max_event_loop_lag": self.load_result.max_event_loop_lag,
+                "peak_rss_mib": self.load_result.peak_rss_mib,
+            }
+        }
+
+    def _get_load_eval_input(self) -> Dict[str, Any]:
+        return {
+            "mode": "load",
+            "concurrency": self.concurrency,
+            "target_rps": self.target_rps,
+            "load_duration": self.load_duration,
+            "num_iterations": self.num_iterations,
+            "warmup_runs": self.warmup_runs,
+        }
+
+    def run_load(self, *, print_summary: bool = False) -> LoadTestResult:
+        """
+        Run the function under load: `concurrency` threads call it back to back, or start calls at `target_rps`.
+        The test makes `num_iterations` calls, or runs for `load_duration` seconds if it is set.
+        Unlike run(), this reveals lock contention and thread pool saturation, at the cost of per-call memory stats.
+        """
+        self._validate_load_settings()
+
+        from rich.console import Console
+        from rich.live import Live
+        from rich.status import Status
+
+        self._set_log_level()
+        log_debug(f"************ Load Test Start: {self.eval_id} ************")
+
+        latencies: List[float] = []
+        errors = 0
+        lock = threading.Lock()
+
+        def call(since: Optional[float] = None):
+            nonlocal errors
+            started_at = perf_counter() if since is None else since
+            try:
+                self.func()
+            except Exception as e:
+                log_debug(f"Call failed during load test: {e}")
+                with lock:
+                    errors += 1
+                return
+            latency = perf_counter() - started_at
+            with lock:
+                latencies.append(latency)
+
+        console = Console()
+        with Live(console=console, transient=True) as live_log:
+            live_log.update(Status("Running load test...", spinner="dots", speed=1.0, refresh_per_second=10))
+            for _ in range(self.warmup_runs or 0):
+                self.func()
+
+            with _RssSampler() as rss_sampler:
+                start = perf_counter()
+                if self.target_rps is not None:
+                    with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                        for due in self._get_load_schedule(start):
+                            delay = due - perf_counter()
+                            if delay > 0:
+                                sleep(delay)
+                            executor.submit(call, due)
+                else:
+                    issued = 0
+
+                    def worker():
+                        nonlocal issued
+                        while True:
+                            with lock:
+                                if self.load_duration is None and issued >= self.num_iterations:
+                                    return
+                                issued += 1
+                            if self.load_duration is not None and perf_counter() - start >= self.load_duration:
+                                return
+                            call()
+
+                    workers = [threading.Thread(target=worker, daemon=True) for _ in range(self.concurrency)]
+                    for thread in workers:
+                        thread.start()
+                    for thread in workers:
+                        thread.join()
+                duration = perf_counter() - start
+        self._set_log_level()  # Set log level incase function changed it
+
+        self.load_result = LoadTestResult(
+            latencies=latencies,
+            duration=duration,
+            concurrency=self.concurrency,
+            target_rps=self.target_rps,
+            errors=errors,
+            peak_rss_mib=rss_sampler.peak_rss_mib,
+        )
+        self._report_load_result(console, print_summary)
+
+        if self.db:
+            log_eval_run(
+                db=self.db,
+                run_id=self.eval_id,  # type: ignore
+                run_data=self._parse_load_run_data(),
+                eval_type=EvalType.PERFORMANCE,
+                name=self.name if self.name is not None else None,
+                evaluated_component_name=self.func.__name__,
+                agent_id=self.agent_id,
+                team_id=self.team_id,
+                model_id=self.model_id,
+                model_provider=self.model_provider,
+                eval_input=self._get_load_eval_input(),
+            )
+
+        if self.telemetry:
+            from agno.api.evals import EvalRunCreate, create_eval_run_telemetry
+
+            create_eval_run_telemetry(
+                eval_run=EvalRunCreate(
+                    run_id=self.eval_id, eval_type=EvalType.PERFORMANCE, data=self._get_telemetry_data()
+                ),
+            )
+
+        log_debug(f"*********** Load Test End: {self.eval_id} ***********")
+        return self.load_result
+
+    async def arun_load(self, *, print_summary: bool = False, lag_interval: float = 0.01) -> LoadTestResult:
+        """
+        Run the async function under load: `concurrency` tasks await it back to back, or start calls at
+        `target_rps`. A timer on the same event loop measures how late it wakes up every `lag_interval` seconds,
+        which shows how long the calls block the loop.
+        """
+        if not asyncio.iscoroutinefunction(self.func):
+            raise ValueError(
+                f"The provided function ({self.func.__name__}) is not async. "
+                "Use the run_load() method for sync functions."
+            )
+        self._validate_load_settings()
+
+        self._set_log_level()
+        log_debug(f"************ Load Test Start: {self.eval_id} ************")
+
+        latencies: List[float] = []
+        event_loop_lags: List[float] = []
+        errors = 0
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def call(since: Optional[float] = None):
+            nonlocal errors
+            started_at = perf_counter() if since is None else since
+            try:
+                await self.func()
+            except Exception as e:
+                log_debug(f"Call failed during load test: {e}")
+                errors += 1
+                return
+            latencies.append(perf_counter() - started_at)
+
+        async def call_when_free(due: float):
+            async with semaphore:
+                await call(due)
+
+        load_finished = asyncio.Event()
+
+        async def monitor_lag():
+            while not load_finished.is_set():
+                scheduled = perf_counter() + lag_interval
+                await asyncio.sleep(lag_interval)
+                event_loop_lags.append(max(0.0, perf_counter() - scheduled))
+
+        for _ in range(self.warmup_runs or 0):
+            await self.func()
+
+        with _RssSampler() as rss_sampler:
+            monitor = asyncio.create_task(monitor_lag())
+            start = perf_counter()
+            if self.target_rps is not None:
+                tasks = []
+                for due in self._get_load_schedule(start):
+                    delay = due - perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    tasks.append(asyncio.create_task(call_when_free(due)))
+                await asyncio.gather(*tasks)
+            else:
+                issued = 0
+
+                async def worker():
+                    nonlocal issued
+                    while self.load_duration is not None or issued < self.num_iterations:
+                        if self.load_duration is not None and perf_counter() - start >= self.load_duration:
+                            return
+                        issued += 1
+                        await call()
+
+                await asyncio.gather(*[worker() for _ in range(self.concurrency)])
+            duration = perf_counter() - start
+            # Let the monitor record how late its last timer fired
+            load_finished.set()
+            await monitor
+        self._set_log_level()  # Set log level incase function changed it
+
+        self.load_result = LoadTestResult(
+            latencies=latencies,
+            duration=duration,
+            concurrency=self.concurrency,
+            target_rps=self.target_rps,
+            errors=errors,
+            event_loop_lags=event_loop_lags,
+            peak_rss_mib=rss_sampler.peak_rss_mib,
+        )
+        self._report_load_result(None, print_summary)
+
+        if self.db:
+            await async_log_eval(
+                db=self.db,
+                run_id=self.eval_id,  # type: ignore
+                run_data=self._parse_load_run_data(),
+                eval_type=EvalType.PERFORMANCE,
+                name=self.name if self.name is not None else None,
+                evaluated_component_name=self.func.__name__,
+                agent_id=self.agent_id,
+                team_id=self.team_id,
+                model_id=self.model_id,
+                model_provider=self.model_provider,
+                eval_input=self._get_load_eval_input(),
+            )
+
+        if self.telemetry:
+            from agno.api.evals import EvalRunCreate, async_create_eval_run_telemetry
+
+            await async_create_eval_run_telemetry(
+                eval_run=EvalRunCreate(
+                    run_id=self.eval_id, eval_type=EvalType.PERFORMANCE, data=self._get_telemetry_data()
+                ),
+            )
+
+        log_debug(f"*********** Load Test End: {self.eval_id} ***********")
+        return self.load_result
+
+    def _report_load_result(self, console: Optional["Console"], print_summary: bool):
+        """Save and print the load test result as requested"""
+        if self.file_path_to_save_results is not None and self.load_result is not None:
+            store_result_in_file(
+                file_path=self.file_path_to_save_results,
+                name=self.name,
+                eval_id=self.eval_id,
+                result=self.load_result,
+            )
+        if (self.print_summary or print_summary) and self.load_result is not None:
+            self.load_result.print_summary(console)
+
     def _get_telemetry_data(self) -> Dict[str, Any]:
         """Get the telemetry data for the evaluation"""
         return {
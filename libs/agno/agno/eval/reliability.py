@@ -70,6 +70,60 @@ class ReliabilityEval:
     # This helps us improve our Evals and provide better support
     telemetry: bool = True
 
+    def _evaluate(self) -> ReliabilityResult:
+        """Compare the tool calls in the response with the expected tool calls"""
+        actual_tool_calls = None
+        if self.agent_response is not None:
+            messages = self.agent_response.messages
+        elif self.team_response is not None:
+            messages = self.team_response.messages or []
+            for member_response in self.team_response.member_responses:
+                if member_response.messages is not None:
+                    messages += member_response.messages
+
+        for message in reversed(messages):  # type: ignore
+            if message.tool_calls:
+                if actual_tool_calls is None:
+                    actual_tool_calls = message.tool_calls
+                else:
+                    actual_tool_calls.append(message.tool_calls[0])  # type: ignore
+
+        failed_tool_calls = []
+        passed_tool_calls = []
+        if not actual_tool_calls:
+            failed_tool_calls = self.expected_tool_calls or []
+        else:
+            for tool_call in actual_tool_calls:  # type: ignore
+                tool_name = tool_call.get("function", {}).get("name")
+                if not tool_name:
+                    continue
+                else:
+                    if tool_name not in self.expected_tool_calls:  # type: ignore
+                        failed_tool_calls.append(tool_call.get("function", {}).get("name"))
+                    else:
+                        passed_tool_calls.append(tool_call.get("function", {}).get("name"))
+
+        return ReliabilityResult(
+            eval_status="PASSED" if len(failed_tool_calls) == 0 else "FAILED",
+            failed_tool_calls=failed_tool_calls,
+            passed_tool_calls=passed_tool_calls,
+        )
+
+    def _get_log_eval_kwargs(self) -> Dict[str, Any]:
+        """Arguments to log the result of the evaluation in the database"""
+        response = self.agent_response if self.agent_response is not None else self.team_response
+        return {
+            "run_id": self.eval_id,
+            "run_data": asdict(self.result) if self.result is not None else {},
+            "eval_type": EvalType.RELIABILITY,
+            "name": self.name,
+            "agent_id": self.agent_response.agent_id if self.agent_response is not None else None,
+            "team_id": self.team_response.team_id if self.team_response is not None else None,
+            "model_id": response.model if response is not None else None,
+            "model_provider": response.model_provider if response is not None else None,
+            "eval_input": {"expected_tool_calls": self.expected_tool_calls},
+        }
+
     def run(self, *, print_results: bool = False) -> Optional[ReliabilityResult]:
         if self.agent_response is None and self.team_response is None:
             raise ValueError("You need to provide 'agent_response' or 'team_response' to run the evaluation.")
@@ -89,42 +143,7 @@ class ReliabilityEval:
             status = Status("Running evaluation...", spinner="dots", speed=1.0, refresh_per_second=10)
             live_log.update(status)
 
-            actual_tool_calls = None
-            if self.agent_response is not None:
-                messages = self.agent_response.messages
-            elif self.team_response is not None:
-                messages = self.team_response.messages or []
-                for member_response in self.team_response.member_responses:
-                    if member_response.messages is not None:
-                        messages += member_response.messages
-
-            for message in reversed(messages):  # type: ignore
-                if message.tool_calls:
-                    if actual_tool_calls is None:
-                        actual_tool_calls = message.tool_calls
-                    else:
-                        actual_tool_calls.append(message.tool_calls[0])  # type: ignore
-
-            failed_tool_calls = []
-            passed_tool_calls = []
-            if not actual_tool_calls:
-                failed_tool_calls = self.expected_tool_calls or []
-            else:
-                for tool_call in actual_tool_calls:  # type: ignore
-                    tool_name = tool_call.get("function", {}).get("name")
-                    if not tool_name:
-                        continue
-                    else:
-                        if tool_name not in self.expected_tool_calls:  # type: ignore
-                            failed_tool_calls.append(tool_call.get("function", {}).get("name"))
-                        else:
-                            passed_tool_calls.append(tool_call.get("function", {}).get("name"))
-
-            self.result = ReliabilityResult(
-                eval_status="PASSED" if len(failed_tool_calls) == 0 else "FAILED",
-                failed_tool_calls=failed_tool_calls,
-                passed_tool_calls=passed_tool_calls,
-            )
+            self.result = self._evaluate()
 
         # Save result to file if requested
         if self.file_path_to_save_results is not None and self.result is not None:
@@ -202,39 +221,7 @@ class ReliabilityEval:
             status = Status("Running evaluation...", spinner="dots", speed=1.0, refresh_per_second=10)
             live_log.update(status)
 
-            actual_tool_calls = None
-            if self.agent_response is not None:
-                messages = self.agent_response.messages
-            elif self.team_response is not None:
-                messages = self.team_response.messages or []
-                for member_response in self.team_response.member_responses:
-                    if member_response.messages is not None:
-                        messages += member_response.messages
-
-            for message in reversed(messages):  # type: ignore
-                if message.tool_calls:
-                    if actual_tool_calls is None:
-                        actual_tool_calls = message.tool_calls
-                    else:
-                        actual_tool_calls.append(message.tool_calls[0])  # type: ignore
-
-            failed_tool_calls = []
-            passed_tool_calls = []
-            for tool_call in actual_tool_calls:  # type: ignore
-                tool_name = tool_call.get("function", {}).get("name")
-                if not tool_name:
-                    continue
-                else:
-                    if tool_name not in self.expected_tool_calls:  # type: ignore
-                        failed_tool_calls.append(tool_call.get("function", {}).get("name"))
-                    else:
-                        passed_tool_calls.append(tool_call.get("function", {}).get("name"))
-
-            self.result = ReliabilityResult(
-                eval_status="PASSED" if len(failed_tool_calls) == 0 else "FAILED",
-                failed_tool_calls=failed_tool_calls,
-                passed_tool_calls=passed_tool_calls,
-            )
+            self.result = self._evaluate()
 
         # Save result to file if requested
         if self.file_path_to_save_results is not None and self.result is not None:
@@ -4,14 +4,22 @@ from typing import TYPE_CHECKING, Optional, Union
 
 from agno.db.base import BaseDb
 from agno.db.schemas.evals import EvalRunRecord, EvalType
+from agno.exceptions import ModelProviderError
 from agno.utils.log import log_debug, logger
 
 if TYPE_CHECKING:
     from agno.eval.accuracy import AccuracyResult
-    from agno.eval.performance import PerformanceResult
+    from agno.eval.performance import LoadTestResult, PerformanceResult
     from agno.eval.reliability import ReliabilityResult
 
 
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether the error is a provider telling us to slow down"""
+    if isinstance(error, ModelProviderError):
+        return error.status_code == 429
+    return getattr(error, "status_code", None) == 429
+
+
 def log_eval_run(
     db: BaseDb,
     run_id: str,
@@ -86,7 +94,7 @@ async def async_log_eval(
 
 def store_result_in_file(
     file_path: str,
-    result: Union["AccuracyResult", "PerformanceResult", "ReliabilityResult"],
+    result: Union["AccuracyResult", "LoadTestResult", "PerformanceResult", "ReliabilityResult"],
     eval_id: Optional[str] = None,
     name: Optional[str] = None,
 ):
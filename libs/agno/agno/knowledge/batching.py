@@ -0,0 +1,139 @@
+import time
+from concurrent.futures import Future
+from queue import Empty, Queue
+from threading import Lock, Thread
+from typing import Any, Callable, List, Optional, Tuple
+
+from agno.utils.log import log_debug
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT_MS = 5.0
+
+BatchRequest = Tuple[List[Any], "Future[List[Any]]"]
+
+
+class MicroBatcher:
+    """Coalesce concurrent requests to a local model into a single batched call.
+
+    Each request submits a list of inputs and gets a future for the list of outputs. A dedicated worker thread
+    waits up to `max_wait_ms` after the first pending request for others to arrive, concatenates their inputs
+    (up to `max_batch_size`), calls `batch_fn` once and splits the outputs back to the requests.
+    `batch_fn` must return one output per input, in order.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        name: str = "agno-micro-batcher",
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self.name = name
+
+        self._queue: "Queue[Optional[BatchRequest]]" = Queue()
+        self._worker: Optional[Thread] = None
+        self._lock = Lock()
+        # A request that didn't fit in the previous batch, carried over to the next one
+        self._carry: Optional[BatchRequest] = None
+
+        self.batches: int = 0
+        self.requests: int = 0
+        self.inputs: int = 0
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = Thread(target=self._run, name=self.name, daemon=True)
+                self._worker.start()
+
+    def submit(self, inputs: List[Any]) -> "Future[List[Any]]":
+        """Queue a request and return a future resolving to its outputs."""
+        future: "Future[List[Any]]" = Future()
+        if not inputs:
+            future.set_result([])
+            return future
+        self._ensure_worker()
+        self._queue.put((list(inputs), future))
+        return future
+
+    def __call__(self, inputs: List[Any]) -> List[Any]:
+        return self.submit(inputs).result()
+
+    def _next_batch(self) -> Optional[List[BatchRequest]]:
+        first = self._carry
+        self._carry = None
+        if first is None:
+            first = self._queue.get()
+            if first is None:
+                return None
+
+        batch = [first]
+        size = len(first[0])
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while size < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except Empty:
+                break
+            if request is None:
+                # Flush what we have, then stop
+                self._queue.put(None)
+                break
+            if size + len(request[0]) > self.max_batch_size:
+                self._carry = request
+                break
+            batch.append(request)
+            size += len(request[0])
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+
+            # Skip requests whose callers have given up
+            batch = [(inputs, future) for inputs, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            flat_inputs = [item for inputs, _ in batch for item in inputs]
+            try:
+                outputs = list(self.batch_fn(flat_inputs))
+                if len(outputs) != len(flat_inputs):
+                    raise ValueError(f"Batch function returned {len(outputs)} outputs for {len(flat_inputs)} inputs")
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.requests += len(batch)
+            self.inputs += len(flat_inputs)
+            log_debug(f"{self.name}: ran batch of {len(flat_inputs)} inputs from {len(batch)} requests")
+
+            offset = 0
+            for inputs, future in batch:
+                future.set_result(outputs[offset : offset + len(inputs)])
+                offset += len(inputs)
+
+    def close(self) -> None:
+        """Stop the worker thread after the pending requests are processed."""
+        with self._lock:
+            worker = self._worker
+            self._worker = None
+        if worker is not None and worker.is_alive():
+            self._queue.put(None)
+            worker.join()
+
+    def get_stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "inputs": self.inputs,
+            "avg_batch_size": self.inputs / self.batches if self.batches else 0.0,
+        }
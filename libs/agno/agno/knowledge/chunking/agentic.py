@@ -1,16 +1,38 @@
-from typing import List, Optional
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
+from typing import List, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 from agno.knowledge.chunking.strategy import ChunkingStrategy
 from agno.knowledge.document.base import Document
 from agno.models.base import Model
 from agno.models.defaults import DEFAULT_OPENAI_MODEL_ID
 from agno.models.message import Message
+from agno.utils.log import log_debug, log_warning
 
 
 class AgenticChunking(ChunkingStrategy):
-    """Chunking strategy that uses an LLM to determine natural breakpoints in the text"""
+    """Chunking strategy that uses an LLM to determine natural breakpoints in the text
 
-    def __init__(self, model: Optional[Model] = None, max_chunk_size: int = 5000):
+    By default the model is asked for one breakpoint at a time, each one after the previous chunk. With
+    `parallel=True` the text is split into overlapping windows of `max_chunk_size` characters up front, and the model
+    is asked for all breakpoints of every window concurrently. A breakpoint in the overlap of two windows is taken
+    from the window that saw more text around it.
+
+    At most `max_concurrency` model requests are in flight across all the documents being chunked, e.g. when a reader
+    chunks a batch of documents concurrently.
+    """
+
+    def __init__(
+        self,
+        model: Optional[Model] = None,
+        max_chunk_size: int = 5000,
+        parallel: bool = False,
+        window_overlap: int = 500,
+        max_concurrency: int = 8,
+    ):
         if model is None:
             try:
                 from agno.models.openai import OpenAIChat
@@ -19,38 +41,116 @@ class AgenticChunking(ChunkingStrategy):
             model = OpenAIChat(DEFAULT_OPENAI_MODEL_ID)
         self.max_chunk_size = max_chunk_size
         self.model = model
+        self.parallel = parallel
+        # The overlap can't be more than half a window, so that a window only overlaps its neighbours
+        self.window_overlap = max(0, min(window_overlap, max_chunk_size // 2))
+        self.max_concurrency = max(1, max_concurrency)
+        # Limits the model requests of all the documents chunked at the same time, in threads or in each event loop
+        self._thread_semaphore = BoundedSemaphore(self.max_concurrency)
+        self._loop_semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = WeakKeyDictionary()
 
-    def chunk(self, document: Document) -> List[Document]:
-        """Split text into chunks using LLM to determine natural breakpoints based on context"""
-        if len(document.content) <= self.max_chunk_size:
-            return [document]
+    def _get_loop_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._loop_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._loop_semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
 
-        chunks: List[Document] = []
-        remaining_text = self.clean_text(document.content)
-        chunk_meta_data = document.meta_data
-        chunk_number = 1
+    def _get_response(self, prompt: str) -> Optional[str]:
+        with self._thread_semaphore:
+            response = self.model.response([Message(role="user", content=prompt)])
+        return response.content if response else None
 
-        while remaining_text:
-            # Ask model to find a good breakpoint within max_chunk_size
-            prompt = f"""Analyze this text and determine a natural breakpoint within the first {self.max_chunk_size} characters.
+    async def _aget_response(self, prompt: str) -> Optional[str]:
+        async with self._get_loop_semaphore():
+            response = await self.model.aresponse([Message(role="user", content=prompt)])
+        return response.content if response else None
+
+    def _get_breakpoint_prompt(self, text: str) -> str:
+        return f"""Analyze this text and determine a natural breakpoint within the first {self.max_chunk_size} characters.
             Consider semantic completeness, paragraph boundaries, and topic transitions.
             Return only the character position number of where to break the text:
 
-            {remaining_text[: self.max_chunk_size]}"""
+            {text}"""
 
-            try:
-                response = self.model.response([Message(role="user", content=prompt)])
-                if response and response.content:
-                    break_point = min(int(response.content.strip()), self.max_chunk_size)
-                else:
-                    break_point = self.max_chunk_size
-            except Exception:
-                # Fallback to max size if model fails
-                break_point = self.max_chunk_size
+    def _get_window_breakpoints_prompt(self, text: str) -> str:
+        return f"""Analyze this text and determine its natural breakpoints.
+            Consider semantic completeness, paragraph boundaries, and topic transitions.
+            Return only the character position numbers of where to break the text, separated by commas:
+
+            {text}"""
+
+    def _parse_breakpoint(self, content: Optional[str]) -> int:
+        """Break point returned by the model, falling back to the max chunk size"""
+        if not content:
+            return self.max_chunk_size
+        try:
+            break_point = min(int(content.strip()), self.max_chunk_size)
+        except ValueError:
+            return self.max_chunk_size
+        # A break point at the start of the text would never advance
+        return break_point if break_point > 0 else self.max_chunk_size
+
+    def _parse_breakpoints(self, content: Optional[str], window_length: int) -> List[int]:
+        """Break points returned by the model for a window, in order and inside the window"""
+        if not content:
+            return []
+        return sorted({int(n) for n in re.findall(r"\d+", content) if 0 < int(n) < window_length})
+
+    @staticmethod
+    def _skip_whitespace(text: str, offset: int) -> int:
+        while offset < len(text) and text[offset].isspace():
+            offset += 1
+        return offset
+
+    def _get_windows(self, text: str) -> List[Tuple[int, int]]:
+        """Start and end offsets of the overlapping windows that cover the text"""
+        stride = self.max_chunk_size - self.window_overlap
+        windows: List[Tuple[int, int]] = []
+        start = 0
+        while True:
+            end = min(start + self.max_chunk_size, len(text))
+            windows.append((start, end))
+            if end >= len(text):
+                return windows
+            start += stride
+
+    def _reconcile_breakpoints(self, windows: List[Tuple[int, int]], window_breakpoints: List[List[int]]) -> List[int]:
+        """Merge the break points of all windows into offsets in the text.
 
-            # Extract chunk and update remaining text
-            chunk = remaining_text[:break_point].strip()
-            meta_data = chunk_meta_data.copy()
+        Each window owns the text from the middle of its overlap with the previous window to the middle of its
+        overlap with the next one, and only its break points in that range are used.
+        """
+        half_overlap = self.window_overlap // 2
+        text_length = windows[-1][1]
+        breakpoints: List[int] = []
+        for i, ((start, _), positions) in enumerate(zip(windows, window_breakpoints)):
+            owned_start = start + half_overlap if i > 0 else 0
+            owned_end = windows[i + 1][0] + half_overlap if i + 1 < len(windows) else text_length
+            breakpoints.extend(start + p for p in positions if owned_start <= start + p < owned_end)
+        return breakpoints
+
+    def _get_spans(self, text: str, breakpoints: List[int]) -> List[Tuple[int, int]]:
+        """Chunk offsets for the break points, adding break points where a chunk would exceed the max size"""
+        spans: List[Tuple[int, int]] = []
+        start = 0
+        for end in [*breakpoints, len(text)]:
+            while end - start > self.max_chunk_size:
+                spans.append((start, start + self.max_chunk_size))
+                start += self.max_chunk_size
+            if end > start:
+                spans.append((start, end))
+                start = end
+        return spans
+
+    def _create_chunks(self, document: Document, text: str, spans: List[Tuple[int, int]]) -> List[Document]:
+        chunks: List[Document] = []
+        for start, end in spans:
+            chunk = text[start:end].strip()
+            if not chunk:
+                continue
+            chunk_number = len(chunks) + 1
+            meta_data = document.meta_data.copy()
             meta_data["chunk"] = chunk_number
             chunk_id = None
             if document.id:
@@ -66,11 +166,86 @@ class AgenticChunking(ChunkingStrategy):
                     content=chunk,
                 )
             )
-            chunk_number += 1
+        return chunks
 
-            remaining_text = remaining_text[break_point:].strip()
+    def _get_window_breakpoints(self, text: str, window: Tuple[int, int]) -> List[int]:
+        start, end = window
+        try:
+            content = self._get_response(self._get_window_breakpoints_prompt(text[start:end]))
+            return self._parse_breakpoints(content, end - start)
+        except Exception as e:
+            # Fallback to max size chunks for the window if model fails
+            log_warning(f"Failed to get breakpoints for window at {start}: {e}")
+            return []
 
-            if not remaining_text:
-                break
+    async def _aget_window_breakpoints(self, text: str, window: Tuple[int, int]) -> List[int]:
+        start, end = window
+        try:
+            content = await self._aget_response(self._get_window_breakpoints_prompt(text[start:end]))
+            return self._parse_breakpoints(content, end - start)
+        except Exception as e:
+            log_warning(f"Failed to get breakpoints for window at {start}: {e}")
+            return []
 
-        return chunks
+    def chunk(self, document: Document) -> List[Document]:
+        """Split text into chunks using LLM to determine natural breakpoints based on context"""
+        if len(document.content) <= self.max_chunk_size:
+            return [document]
+
+        text = self.clean_text(document.content)
+        if self.parallel:
+            windows = self._get_windows(text)
+            log_debug(f"Finding breakpoints in {len(windows)} windows")
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(windows))) as executor:
+                window_breakpoints = list(executor.map(lambda w: self._get_window_breakpoints(text, w), windows))
+            return self._create_chunks(
+                document, text, self._get_spans(text, self._reconcile_breakpoints(windows, window_breakpoints))
+            )
+
+        spans: List[Tuple[int, int]] = []
+        start = self._skip_whitespace(text, 0)
+        while start < len(text):
+            # Ask model to find a good breakpoint within max_chunk_size
+            prompt = self._get_breakpoint_prompt(text[start : start + self.max_chunk_size])
+            try:
+                break_point = self._parse_breakpoint(self._get_response(prompt))
+            except Exception:
+                # Fallback to max size if model fails
+                break_point = self.max_chunk_size
+
+            end = min(start + break_point, len(text))
+            spans.append((start, end))
+            start = self._skip_whitespace(text, end)
+
+        return self._create_chunks(document, text, spans)
+
+    async def async_chunk(self, document: Document) -> List[Document]:
+        """Split text into chunks, asking the model for breakpoints asynchronously"""
+        if len(document.content) <= self.max_chunk_size:
+            return [document]
+
+        text = self.clean_text(document.content)
+        if self.parallel:
+            windows = self._get_windows(text)
+            log_debug(f"Finding breakpoints in {len(windows)} windows")
+            window_breakpoints = await asyncio.gather(
+                *[self._aget_window_breakpoints(text, window) for window in windows]
+            )
+            return self._create_chunks(
+                document, text, self._get_spans(text, self._reconcile_breakpoints(windows, list(window_breakpoints)))
+            )
+
+        spans: List[Tuple[int, int]] = []
+        start = self._skip_whitespace(text, 0)
+        while start < len(text):
+            prompt = self._get_breakpoint_prompt(text[start : start + self.max_chunk_size])
+            try:
+                break_point = self._parse_breakpoint(await self._aget_response(prompt))
+            except Exception:
+                break_point = self.max_chunk_size
+
+            end = min(start + break_point, len(text))
+            spans.append((start, end))
+            start = self._skip_whitespace(text, end)
+
+        return self._create_chunks(document, text, spans)
@@ -1,33 +1,52 @@
-from typing import List
+from typing import List, Optional, Union
 
-from agno.knowledge.chunking.strategy import ChunkingStrategy
+from agno.knowledge.chunking.strategy import ChunkingStrategy, resolve_tokenizer
 from agno.knowledge.document.base import Document
+from agno.utils.tokens import Tokenizer
 
 
 class DocumentChunking(ChunkingStrategy):
-    """A chunking strategy that splits text based on document structure like paragraphs and sections"""
+    """A chunking strategy that splits text based on document structure like paragraphs and sections
 
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    With a `tokenizer` (a `Tokenizer`, a tiktoken encoding name or a Hugging Face model name), `chunk_size` and
+    `overlap` are measured in tokens instead of characters.
+    """
+
+    def __init__(self, chunk_size: int = 5000, overlap: int = 0, tokenizer: Optional[Union[str, Tokenizer]] = None):
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.tokenizer = resolve_tokenizer(tokenizer)
+
+    def _get_overlap(self, text: str) -> str:
+        """The last `overlap` characters or tokens of a chunk"""
+        if self.tokenizer is None:
+            return text[-self.overlap :]
+        _, offsets = self.tokenizer.encode_with_offsets(text)
+        return text[offsets[-self.overlap] :] if len(offsets) > self.overlap else text
 
     def chunk(self, document: Document) -> List[Document]:
         """Split document into chunks based on document structure"""
-        if len(document.content) <= self.chunk_size:
+        if self.tokenizer is not None:
+            document_size = self.tokenizer.count(document.content)
+        else:
+            document_size = len(document.content)
+        if document_size <= self.chunk_size:
             return [document]
 
         # Split on double newlines first (paragraphs)
-        paragraphs = self.clean_text(document.content).split("\n\n")
+        paragraphs = [para.strip() for para in self.clean_text(document.content).split("\n\n")]
+        if self.tokenizer is not None:
+            # Paragraphs that aren't cached are tokenized in one batch
+            paragraph_sizes = self.tokenizer.count_batch(paragraphs)
+        else:
+            paragraph_sizes = [len(para) for para in paragraphs]
         chunks: List[Document] = []
         current_chunk = []
         current_size = 0
         chunk_meta_data = document.meta_data
         chunk_number = 1
 
-        for para in paragraphs:
-            para = para.strip()
-            para_size = len(para)
-
+        for para, para_size in zip(paragraphs, paragraph_sizes):
             if current_size + para_size <= self.chunk_size:
                 current_chunk.append(para)
                 current_size += para_size
@@ -68,7 +87,7 @@ class DocumentChunking(ChunkingStrategy):
             for i in range(len(chunks)):
                 if i > 0:
                     # Add overlap from previous chunk
-                    prev_text = chunks[i - 1].content[-self.overlap :]
+                    prev_text = self._get_overlap(chunks[i - 1].content)
                     meta_data = chunk_meta_data.copy()
                     meta_data["chunk"] = chunk_number
                     chunk_id = None
@@ -1,29 +1,51 @@
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Union
 
-from agno.knowledge.chunking.strategy import ChunkingStrategy
+from agno.knowledge.chunking.strategy import ChunkingStrategy, TextBuffer, resolve_tokenizer
 from agno.knowledge.document.base import Document
+from agno.utils.tokens import Tokenizer
 
 
 class FixedSizeChunking(ChunkingStrategy):
-    """Chunking strategy that splits text into fixed-size chunks with optional overlap"""
+    """Chunking strategy that splits text into fixed-size chunks with optional overlap
 
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    With a `tokenizer` (a `Tokenizer`, a tiktoken encoding name or a Hugging Face model name), `chunk_size` and
+    `overlap` are measured in tokens instead of characters.
+    """
+
+    def __init__(self, chunk_size: int = 5000, overlap: int = 0, tokenizer: Optional[Union[str, Tokenizer]] = None):
         # overlap must be less than chunk size
         if overlap >= chunk_size:
             raise ValueError(f"Invalid parameters: overlap ({overlap}) must be less than chunk size ({chunk_size}).")
 
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.tokenizer = resolve_tokenizer(tokenizer)
 
     def chunk(self, document: Document) -> List[Document]:
         """Split document into fixed-size chunks with optional overlap"""
-        content = self.clean_text(document.content)
-        content_length = len(content)
-        chunked_documents: List[Document] = []
+        return list(self.iter_chunks(document))
+
+    def iter_chunks(self, document: Document, texts: Optional[Iterable[str]] = None) -> Iterator[Document]:
+        """Yield fixed-size chunks with optional overlap, reading about one chunk of the text at a time"""
+        if self.tokenizer is not None:
+            # Token offsets are computed over the whole text
+            yield from self._iter_token_chunks(
+                document, "".join(self.clean_text_stream([document.content] if texts is None else texts))
+            )
+            return
+
+        buffer = TextBuffer(self.clean_text_stream([document.content] if texts is None else texts))
         chunk_number = 1
         chunk_meta_data = document.meta_data
         start = 0
-        while start + self.overlap < content_length:
+        while True:
+            # Read a full chunk and the character after it, which tells whether the chunk ends in a word
+            start = buffer.fill(start, self.chunk_size + 1)
+            content = buffer.text
+            content_length = len(content)
+            if start + self.overlap >= content_length:
+                break
+
             end = min(start + self.chunk_size, content_length)
 
             # Ensure we're not splitting a word in half
@@ -44,14 +66,48 @@ class FixedSizeChunking(ChunkingStrategy):
             elif document.name:
                 chunk_id = f"{document.name}_{chunk_number}"
             meta_data["chunk_size"] = len(chunk)
-            chunked_documents.append(
-                Document(
-                    id=chunk_id,
-                    name=document.name,
-                    meta_data=meta_data,
-                    content=chunk,
-                )
+            yield Document(
+                id=chunk_id,
+                name=document.name,
+                meta_data=meta_data,
+                content=chunk,
             )
             chunk_number += 1
             start = end - self.overlap
-        return chunked_documents
+
+    def _iter_token_chunks(self, document: Document, content: str) -> Iterator[Document]:
+        tokens, offsets = self.tokenizer.encode_with_offsets(content)  # type: ignore
+        num_tokens = len(tokens)
+        chunk_number = 1
+        chunk_meta_data = document.meta_data
+        start = 0
+        while start + self.overlap < num_tokens:
+            end = min(start + self.chunk_size, num_tokens)
+
+            # Ensure we're not splitting a word in half: end before a token that starts a word
+            if end < num_tokens:
+                while end > start and not (content[offsets[end]].isspace() or content[offsets[end] - 1].isspace()):
+                    end -= 1
+
+            # If the entire chunk is a word, then just split it at chunk_size
+            if end == start:
+                end = min(start + self.chunk_size, num_tokens)
+
+            chunk = content[offsets[start] : offsets[end] if end < num_tokens else len(content)]
+            meta_data = chunk_meta_data.copy()
+            meta_data["chunk"] = chunk_number
+            chunk_id = None
+            if document.id:
+                chunk_id = f"{document.id}_{chunk_number}"
+            elif document.name:
+                chunk_id = f"{document.name}_{chunk_number}"
+            meta_data["chunk_size"] = len(chunk)
+            meta_data["chunk_tokens"] = end - start
+            yield Document(
+                id=chunk_id,
+                name=document.name,
+                meta_data=meta_data,
+                content=chunk,
+            )
+            chunk_number += 1
+            start = max(end - self.overlap, start + 1)
@@ -1,14 +1,20 @@
 import warnings
-from typing import List
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Optional, Union
 
-from agno.knowledge.chunking.strategy import ChunkingStrategy
+from agno.knowledge.chunking.strategy import ChunkingStrategy, TextBuffer, resolve_tokenizer
 from agno.knowledge.document.base import Document
+from agno.utils.tokens import Tokenizer
 
 
 class RecursiveChunking(ChunkingStrategy):
-    """Chunking strategy that recursively splits text into chunks by finding natural break points"""
+    """Chunking strategy that recursively splits text into chunks by finding natural break points
 
-    def __init__(self, chunk_size: int = 5000, overlap: int = 0):
+    With a `tokenizer` (a `Tokenizer`, a tiktoken encoding name or a Hugging Face model name), `chunk_size` and
+    `overlap` are measured in tokens instead of characters.
+    """
+
+    def __init__(self, chunk_size: int = 5000, overlap: int = 0, tokenizer: Optional[Union[str, Tokenizer]] = None):
         # overlap must be less than chunk size
         if overlap >= chunk_size:
             raise ValueError(f"Invalid parameters: overlap ({overlap}) must be less than chunk size ({chunk_size}).")
@@ -21,26 +27,47 @@ class RecursiveChunking(ChunkingStrategy):
 
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.tokenizer = resolve_tokenizer(tokenizer)
 
     def chunk(self, document: Document) -> List[Document]:
         """Recursively chunk text by finding natural break points"""
-        if len(document.content) <= self.chunk_size:
-            return [document]
+        return list(self.iter_chunks(document))
+
+    def iter_chunks(self, document: Document, texts: Optional[Iterable[str]] = None) -> Iterator[Document]:
+        """Yield chunks split at natural break points, reading about one chunk of the text at a time"""
+        if self.tokenizer is not None:
+            if texts is None and self.tokenizer.count(document.content) <= self.chunk_size:
+                yield document
+                return
+            # Token offsets are computed over the whole text
+            yield from self._iter_token_chunks(
+                document, "".join(self.clean_text_stream([document.content] if texts is None else texts))
+            )
+            return
 
-        chunks: List[Document] = []
+        if texts is None and len(document.content) <= self.chunk_size:
+            yield document
+            return
+
+        buffer = TextBuffer(self.clean_text_stream([document.content] if texts is None else texts))
         start = 0
         chunk_meta_data = document.meta_data
         chunk_number = 1
-        content = self.clean_text(document.content)
 
-        while start < len(content):
+        while True:
+            # Read a full chunk and the character after it, which tells whether the chunk ends the text
+            start = buffer.fill(start, self.chunk_size + 1)
+            content = buffer.text
+            if start >= len(content):
+                break
+
             end = min(start + self.chunk_size, len(content))
 
             if end < len(content):
                 for sep in ["\n", "."]:
-                    last_sep = content[start:end].rfind(sep)
+                    last_sep = content.rfind(sep, start, end)
                     if last_sep != -1:
-                        end = start + last_sep + 1
+                        end = last_sep + 1
                         break
 
             chunk = content[start:end]
@@ -51,7 +78,7 @@ class RecursiveChunking(ChunkingStrategy):
                 chunk_id = f"{document.id}_{chunk_number}"
             chunk_number += 1
             meta_data["chunk_size"] = len(chunk)
-            chunks.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk))
+            yield Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk)
 
             new_start = end - self.overlap
             if new_start <= start:  # Prevent infinite loop
@@ -60,4 +87,37 @@ class RecursiveChunking(ChunkingStrategy):
                 )  # Move forward by at least 10% of chunk size
             start = new_start
 
-        return chunks
+    def _iter_token_chunks(self, document: Document, content: str) -> Iterator[Document]:
+        tokens, offsets = self.tokenizer.encode_with_offsets(content)  # type: ignore
+        num_tokens = len(tokens)
+        start = 0
+        chunk_meta_data = document.meta_data
+        chunk_number = 1
+
+        while start < num_tokens:
+            end = min(start + self.chunk_size, num_tokens)
+
+            if end < num_tokens:
+                for sep in ["\n", "."]:
+                    last_sep = content.rfind(sep, offsets[start], offsets[end])
+                    # End after the token that contains the separator
+                    sep_end = bisect_left(offsets, last_sep + 1, start, end) if last_sep != -1 else start
+                    if sep_end > start:
+                        end = sep_end
+                        break
+
+            chunk = content[offsets[start] : offsets[end] if end < num_tokens else len(content)]
+            meta_data = chunk_meta_data.copy()
+            meta_data["chunk"] = chunk_number
+            chunk_id = None
+            if document.id:
+                chunk_id = f"{document.id}_{chunk_number}"
+            chunk_number += 1
+            meta_data["chunk_size"] = len(chunk)
+            meta_data["chunk_tokens"] = end - start
+            yield Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk)
+
+            new_start = end - self.overlap
+            if new_start <= start:  # Prevent infinite loop
+                new_start = min(num_tokens, start + max(1, self.chunk_size // 10))
+            start = new_start
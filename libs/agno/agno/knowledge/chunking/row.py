@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 
 from agno.knowledge.chunking.strategy import ChunkingStrategy
 from agno.knowledge.document.base import Document
@@ -16,15 +16,46 @@ class RowChunking(ChunkingStrategy):
         if not isinstance(document.content, str):
             raise ValueError("Document content must be a string")
 
-        rows = document.content.splitlines()
+        return list(self.iter_chunks(document))
 
-        if self.skip_header and rows:
-            rows = rows[1:]
+    @staticmethod
+    def _iter_rows(texts: Iterable[str]) -> Iterator[str]:
+        """Split text pieces into lines like `str.splitlines`, including lines that span pieces"""
+        # Pieces of the line continuing in the next text. Only new text is split, so long lines are read in linear time.
+        partial: List[str] = []
+        for text in texts:
+            if partial and partial[-1].endswith("\r"):
+                # The line ended with a "\r", which is a "\r\n" if the text starts with "\n"
+                yield "".join(partial)[:-1]
+                partial = []
+                if text.startswith("\n"):
+                    text = text[1:]
+
+            lines = text.splitlines(keepends=True)
+            for i, line in enumerate(lines):
+                partial.append(line)
+                # The last line continues in the next piece if it has no line break, or a "\r" that may start a "\r\n"
+                if i == len(lines) - 1 and (line.endswith("\r") or line.splitlines()[0] == line):
+                    break
+                yield "".join(partial).splitlines()[0]
+                partial = []
+        if partial:
+            yield "".join(partial).splitlines()[0]
+
+    def iter_chunks(self, document: Document, texts: Optional[Iterable[str]] = None) -> Iterator[Document]:
+        """Yield a chunk for each row, reading one row of the text at a time"""
+        if texts is None:
+            if not document or not document.content:
+                return
+            texts = [document.content]
+
+        rows = self._iter_rows(texts)
+        if self.skip_header:
+            next(rows, None)
             start_index = 2
         else:
             start_index = 1
 
-        chunks = []
         for i, row in enumerate(rows):
             if self.clean_rows:
                 chunk_content = " ".join(row.split())  # Normalize internal whitespace
@@ -35,5 +66,4 @@ class RowChunking(ChunkingStrategy):
                 meta_data = document.meta_data.copy()
                 meta_data["row_number"] = start_index + i  # Preserve logical row numbering
                 chunk_id = f"{document.id}_row_{start_index + i}" if document.id else None
-                chunks.append(Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk_content))
-        return chunks
+                yield Document(id=chunk_id, name=document.name, meta_data=meta_data, content=chunk_content)
@@ -1,8 +1,13 @@
+import re
 from abc import ABC, abstractmethod
+from dataclasses import replace
 from enum import Enum
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Union
 
 from agno.knowledge.document.base import Document
+from agno.utils.tokens import Tokenizer, get_tokenizer
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
 
 
 class ChunkingStrategy(ABC):
@@ -12,24 +17,75 @@ class ChunkingStrategy(ABC):
     def chunk(self, document: Document) -> List[Document]:
         raise NotImplementedError
 
+    async def async_chunk(self, document: Document) -> List[Document]:
+        """Chunk a document without blocking the event loop. Runs `chunk` in a thread unless overridden."""
+        import asyncio
+
+        return await asyncio.to_thread(self.chunk, document)
+
+    def iter_chunks(self, document: Document, texts: Optional[Iterable[str]] = None) -> Iterator[Document]:
+        """Yield the chunks of a document as they are produced.
+
+        The text is read from `texts` when given, e.g. the blocks of a file being read, instead of `document.content`.
+        Strategies that can chunk a stream hold only about one chunk of text in memory. The others read the whole
+        text and chunk it with `chunk`.
+        """
+        if texts is not None:
+            document = replace(document, content="".join(texts))
+        yield from self.chunk(document)
+
     def clean_text(self, text: str) -> str:
-        """Clean the text by replacing multiple newlines with a single newline"""
-        import re
-
-        # Replace multiple newlines with a single newline
-        cleaned_text = re.sub(r"\n+", "\n", text)
-        # Replace multiple spaces with a single space
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
-        # Replace multiple tabs with a single tab
-        cleaned_text = re.sub(r"\t+", "\t", cleaned_text)
-        # Replace multiple carriage returns with a single carriage return
-        cleaned_text = re.sub(r"\r+", "\r", cleaned_text)
-        # Replace multiple form feeds with a single form feed
-        cleaned_text = re.sub(r"\f+", "\f", cleaned_text)
-        # Replace multiple vertical tabs with a single vertical tab
-        cleaned_text = re.sub(r"\v+", "\v", cleaned_text)
-
-        return cleaned_text
+        """Clean the text by replacing whitespace runs, including newlines, with a single space"""
+        return WHITESPACE_PATTERN.sub(" ", text)
+
+    def clean_text_stream(self, texts: Iterable[str]) -> Iterator[str]:
+        """Clean text pieces like `clean_text`, including whitespace runs that span pieces"""
+        after_whitespace = False
+        for text in texts:
+            cleaned = WHITESPACE_PATTERN.sub(" ", text)
+            if after_whitespace and cleaned.startswith(" "):
+                cleaned = cleaned[1:]
+            if cleaned:
+                after_whitespace = cleaned.endswith(" ")
+                yield cleaned
+
+
+def resolve_tokenizer(tokenizer: Optional[Union[str, Tokenizer]]) -> Optional[Tokenizer]:
+    """The tokenizer a strategy measures chunks with, looking up tokenizers given by name"""
+    if isinstance(tokenizer, str):
+        return get_tokenizer(tokenizer)
+    return tokenizer
+
+
+class TextBuffer:
+    """The part of a stream of text that is still being chunked.
+
+    Offsets are relative to the start of the buffer, which moves forward as the text before it is dropped.
+    """
+
+    def __init__(self, texts: Iterable[str]):
+        self.text = ""
+        self.exhausted = False
+        self._texts = iter(texts)
+
+    def fill(self, start: int, size: int) -> int:
+        """Drop the text before `start` and read until `size` characters follow it, or the stream ends.
+
+        Returns the new offset of `start`.
+        """
+        if len(self.text) - start >= size or self.exhausted:
+            return start
+        pieces = [self.text[start:]]
+        available = len(pieces[0])
+        while available < size:
+            piece = next(self._texts, None)
+            if piece is None:
+                self.exhausted = True
+                break
+            pieces.append(piece)
+            available += len(piece)
+        self.text = "".join(pieces)
+        return 0
 
 
 class ChunkingStrategyType(str, Enum):
@@ -1,6 +1,7 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
+from agno.knowledge.batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS, MicroBatcher
 from agno.knowledge.embedder.base import Embedder
 from agno.utils.log import logger
 
@@ -24,11 +25,37 @@ class FastEmbedEmbedder(Embedder):
 
     id: str = "BAAI/bge-small-en-v1.5"
     dimensions: int = 384
+    # Coalesce concurrent get_embedding calls into a single embed call on a worker thread
+    micro_batching: bool = False
+    micro_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+    micro_batch_wait_ms: float = DEFAULT_MAX_WAIT_MS
+    _model: Optional[TextEmbedding] = field(default=None, init=False, repr=False)
+    _batcher: Optional[MicroBatcher] = field(default=None, init=False, repr=False)
+
+    def _get_model(self) -> TextEmbedding:
+        if self._model is None:
+            self._model = TextEmbedding(model_name=self.id)
+        return self._model
+
+    def _embed_batch(self, texts: List[str]) -> List[Any]:
+        return list(self._get_model().embed(texts, batch_size=len(texts)))
+
+    def _get_batcher(self) -> MicroBatcher:
+        if self._batcher is None:
+            self._batcher = MicroBatcher(
+                self._embed_batch,
+                max_batch_size=self.micro_batch_size,
+                max_wait_ms=self.micro_batch_wait_ms,
+                name=f"fastembed-{self.id}",
+            )
+        return self._batcher
 
     def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.id)
-        embeddings = model.embed(text)
-        embedding_list = list(embeddings)[0]
+        if self.micro_batching:
+            embedding_list = self._get_batcher()([text])[0]
+        else:
+            embeddings = self._get_model().embed(text)
+            embedding_list = list(embeddings)[0]
         if isinstance(embedding_list, np.ndarray):
             return embedding_list.tolist()
 
@@ -49,12 +76,21 @@ class FastEmbedEmbedder(Embedder):
         """Async version using thread executor for CPU-bound operations."""
         import asyncio
 
+        if self.micro_batching:
+            # Wait on the batch worker directly instead of tying up an executor thread
+            embedding_list = (await asyncio.wrap_future(self._get_batcher().submit([text])))[0]
+            return embedding_list.tolist() if isinstance(embedding_list, np.ndarray) else list(embedding_list)
+
         loop = asyncio.get_event_loop()
         # Run the CPU-bound operation in a thread executor
         return await loop.run_in_executor(None, self.get_embedding, text)
 
     async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         """Async version using thread executor for CPU-bound operations."""
+        if self.micro_batching:
+            # Currently, FastEmbed does not provide usage information
+            return await self.async_get_embedding(text), None
+
         import asyncio
 
         loop = asyncio.get_event_loop()
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from typing_extensions import Literal
 
 from agno.knowledge.embedder.base import Embedder
+from agno.utils.http import get_async_http_client, get_http_client
 from agno.utils.log import logger
 
 try:
@@ -45,6 +46,7 @@ class OpenAIEmbedder(Embedder):
         _client_params = {k: v for k, v in _client_params.items() if v is not None}
         if self.client_params:
             _client_params.update(self.client_params)
+        _client_params.setdefault("http_client", get_http_client(base_url=self.base_url, scope="OpenAI"))
         self.openai_client = OpenAIClient(**_client_params)
         return self.openai_client
 
@@ -60,6 +62,7 @@ class OpenAIEmbedder(Embedder):
         filtered_params: Dict[str, Any] = {k: v for k, v in params.items() if v is not None}
         if self.client_params:
             filtered_params.update(self.client_params)
+        filtered_params.setdefault("http_client", get_async_http_client(base_url=self.base_url, scope="OpenAI"))
         self.async_client = AsyncOpenAI(**filtered_params)
         return self.async_client
 
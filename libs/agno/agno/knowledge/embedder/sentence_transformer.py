@@ -1,6 +1,7 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from agno.knowledge.batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS, MicroBatcher
 from agno.knowledge.embedder.base import Embedder
 from agno.utils.log import logger
 
@@ -24,13 +25,39 @@ class SentenceTransformerEmbedder(Embedder):
     sentence_transformer_client: Optional[SentenceTransformer] = None
     prompt: Optional[str] = None
     normalize_embeddings: bool = False
+    # Coalesce concurrent get_embedding calls into a single encode call on a worker thread
+    micro_batching: bool = False
+    micro_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+    micro_batch_wait_ms: float = DEFAULT_MAX_WAIT_MS
+    _batcher: Optional[MicroBatcher] = field(default=None, init=False, repr=False)
 
-    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+    def _get_client(self) -> SentenceTransformer:
         if not self.sentence_transformer_client:
             self.sentence_transformer_client = SentenceTransformer(model_name_or_path=self.id)
+        return self.sentence_transformer_client
+
+    def _encode(self, text: Union[str, List[str]]) -> Any:
+        return self._get_client().encode(text, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings)
+
+    def _encode_batch(self, texts: List[str]) -> List[Any]:
+        return list(self._encode(texts))
+
+    def _get_batcher(self) -> MicroBatcher:
+        if self._batcher is None:
+            self._batcher = MicroBatcher(
+                self._encode_batch,
+                max_batch_size=self.micro_batch_size,
+                max_wait_ms=self.micro_batch_wait_ms,
+                name=f"sentence-transformer-{self.id}",
+            )
+        return self._batcher
 
-        model = self.sentence_transformer_client
-        embedding = model.encode(text, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings)
+    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+        if self.micro_batching:
+            embeddings = self._get_batcher()([text] if isinstance(text, str) else text)
+            embedding = embeddings[0] if isinstance(text, str) else np.asarray(embeddings)
+        else:
+            embedding = self._encode(text)
         try:
             if isinstance(embedding, np.ndarray):
                 return embedding.tolist()
@@ -47,12 +74,23 @@ class SentenceTransformerEmbedder(Embedder):
         """Async version using thread executor for CPU-bound operations."""
         import asyncio
 
+        if self.micro_batching:
+            # Wait on the batch worker directly instead of tying up an executor thread
+            embeddings = await asyncio.wrap_future(
+                self._get_batcher().submit([text] if isinstance(text, str) else text)
+            )
+            embedding = embeddings[0] if isinstance(text, str) else np.asarray(embeddings)
+            return embedding.tolist() if isinstance(embedding, np.ndarray) else embedding
+
         loop = asyncio.get_event_loop()
         # Run the CPU-bound operation in a thread executor
         return await loop.run_in_executor(None, self.get_embedding, text)
 
     async def async_get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         """Async version using thread executor for CPU-bound operations."""
+        if self.micro_batching:
+            return await self.async_get_embedding(text), None
+
         import asyncio
 
         loop = asyncio.get_event_loop()
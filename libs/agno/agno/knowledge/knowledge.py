@@ -1,24 +1,24 @@
 import asyncio
 import hashlib
 import io
+import threading
 import time
 from dataclasses import dataclass
 from enum import Enum
-from functools import cached_property
 from io import BytesIO
 from os.path import basename
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast, overload
-
-from httpx import AsyncClient
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union, cast, overload
 
 from agno.db.base import BaseDb
 from agno.db.schemas.knowledge import KnowledgeRow
 from agno.knowledge.content import Content, ContentAuth, ContentStatus, FileData
 from agno.knowledge.document import Document
+from agno.knowledge.metadata_catalog import MetadataCatalog
 from agno.knowledge.reader import Reader, ReaderFactory
 from agno.knowledge.remote_content.remote_content import GCSContent, RemoteContent, S3Content
-from agno.utils.http import async_fetch_with_retry
+from agno.knowledge.search_cache import SearchCache, SearchCacheKey
+from agno.utils.http import async_fetch_with_retry, get_async_http_client
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.string import generate_id
 
@@ -42,6 +42,16 @@ class Knowledge:
     contents_db: Optional[BaseDb] = None
     max_results: int = 10
     readers: Optional[Dict[str, Reader]] = None
+    # Seconds after which the metadata catalog is reloaded from the contents db to pick up changes from other processes
+    metadata_catalog_refresh_interval: int = 60
+    # If True, cache search results until the knowledge base changes or the results expire
+    cache_search_results: bool = False
+    # Seconds after which cached search results expire. None means they only expire when the knowledge base changes.
+    search_cache_ttl: Optional[int] = 300
+    # Maximum number of cached searches
+    search_cache_size: int = 1024
+    # Number of chunks inserted at a time when a file is streamed by its reader
+    stream_batch_size: int = 500
 
     def __post_init__(self):
         from agno.vectordb import VectorDb
@@ -52,6 +62,15 @@ class Knowledge:
 
         self.construct_readers()
         self.valid_metadata_filters = set()
+        self._metadata_catalog: Optional[MetadataCatalog] = None
+        self._metadata_catalog_loaded_at: float = 0.0
+        self._metadata_catalog_persisted: bool = False
+        self._metadata_catalog_lock = threading.Lock()
+        self._search_cache: Optional[SearchCache] = (
+            SearchCache(max_entries=self.search_cache_size, ttl=self.search_cache_ttl)
+            if self.cache_search_results
+            else None
+        )
 
     # --- SDK Specific Methods ---
 
@@ -406,31 +425,25 @@ class Knowledge:
                     return
 
                 if content.reader:
+                    reader = content.reader
+                else:
+                    reader = ReaderFactory.get_reader_for_extension(path.suffix)
+                    log_info(f"Using Reader: {reader.__class__.__name__}")
+                read_documents: Iterable[Document] = []
+                if reader:
                     # TODO: We will refactor this to eventually pass authorization to all readers
                     import inspect
 
-                    read_signature = inspect.signature(content.reader.read)
+                    read_signature = inspect.signature(reader.read)
                     if "password" in read_signature.parameters and content.auth and content.auth.password:
-                        read_documents = content.reader.read(
+                        read_documents = reader.read(
                             path, name=content.name or path.name, password=content.auth.password
                         )
+                    elif hasattr(reader, "iter_read"):
+                        # Stream the file, so that its chunks are inserted in batches while the rest is still read
+                        read_documents = reader.iter_read(path, name=content.name or path.name)
                     else:
-                        read_documents = content.reader.read(path, name=content.name or path.name)
-
-                else:
-                    reader = ReaderFactory.get_reader_for_extension(path.suffix)
-                    log_info(f"Using Reader: {reader.__class__.__name__}")
-                    if reader:
-                        # TODO: We will refactor this to eventually pass authorization to all readers
-                        import inspect
-
-                        read_signature = inspect.signature(reader.read)
-                        if "password" in read_signature.parameters and content.auth and content.auth.password:
-                            read_documents = reader.read(
-                                path, name=content.name or path.name, password=content.auth.password
-                            )
-                        else:
-                            read_documents = reader.read(path, name=content.name or path.name)
+                        read_documents = reader.read(path, name=content.name or path.name)
 
                 if not content.file_type:
                     content.file_type = path.suffix
@@ -444,8 +457,9 @@ class Knowledge:
                         log_warning(f"Could not get file size for {path}: {e}")
                         content.size = 0
 
-                for read_document in read_documents:
-                    read_document.content_id = content.id
+                if isinstance(read_documents, list):
+                    for read_document in read_documents:
+                        read_document.content_id = content.id
 
                 await self._handle_vector_db_insert(content, read_documents, upsert)
 
@@ -527,8 +541,7 @@ class Knowledge:
 
         bytes_content = None
         if file_extension:
-            async with AsyncClient() as client:
-                response = await async_fetch_with_retry(content.url, client=client)
+            response = await async_fetch_with_retry(content.url, client=get_async_http_client(follow_redirects=False))
             bytes_content = BytesIO(response.content)
 
         # 4. Select reader
@@ -928,7 +941,23 @@ class Knowledge:
                 read_document.content_id = content.id
             await self._handle_vector_db_insert(content_entry, read_documents, upsert)
 
-    async def _handle_vector_db_insert(self, content: Content, read_documents, upsert):
+    def _iter_document_batches(
+        self, documents: Iterable[Document], content_id: Optional[str]
+    ) -> Iterator[List[Document]]:
+        batch: List[Document] = []
+        num_batches = 0
+        for document in documents:
+            document.content_id = content_id
+            batch.append(document)
+            if len(batch) >= self.stream_batch_size:
+                yield batch
+                num_batches += 1
+                batch = []
+        # Content without documents still yields an empty batch, so that an upsert removes its old documents
+        if batch or num_batches == 0:
+            yield batch
+
+    async def _handle_vector_db_insert(self, content: Content, read_documents: Iterable[Document], upsert: bool):
         from agno.vectordb import VectorDb
 
         self.vector_db = cast(VectorDb, self.vector_db)
@@ -940,29 +969,47 @@ class Knowledge:
             self._update_content(content)
             return
 
-        if self.vector_db.upsert_available() and upsert:
-            try:
-                await self.vector_db.async_upsert(content.content_hash, read_documents, content.metadata)  # type: ignore[arg-type]
-            except Exception as e:
-                log_error(f"Error upserting document: {e}")
-                content.status = ContentStatus.FAILED
-                content.status_message = "Could not upsert embedding"
-                self._update_content(content)
-                return
+        if isinstance(read_documents, list):
+            batches: Iterable[List[Document]] = [read_documents]
         else:
-            try:
-                await self.vector_db.async_insert(
-                    content.content_hash,  # type: ignore[arg-type]
-                    documents=read_documents,
-                    filters=content.metadata,  # type: ignore[arg-type]
-                )
-            except Exception as e:
-                log_error(f"Error inserting document: {e}")
-                content.status = ContentStatus.FAILED
-                content.status_message = "Could not insert embedding"
-                self._update_content(content)
-                return
+            # Streamed documents are inserted in batches, so that only one batch is held in memory
+            batches = self._iter_document_batches(read_documents, content.id)
+
+        try:
+            for i, batch in enumerate(batches):
+                # An upsert first deletes the documents of the content, so the batches after the first are inserted
+                if self.vector_db.upsert_available() and upsert and i == 0:
+                    try:
+                        await self.vector_db.async_upsert(content.content_hash, batch, content.metadata)  # type: ignore[arg-type]
+                    except Exception as e:
+                        log_error(f"Error upserting document: {e}")
+                        content.status = ContentStatus.FAILED
+                        content.status_message = "Could not upsert embedding"
+                        self._update_content(content)
+                        return
+                else:
+                    try:
+                        await self.vector_db.async_insert(
+                            content.content_hash,  # type: ignore[arg-type]
+                            documents=batch,
+                            filters=content.metadata,  # type: ignore[arg-type]
+                        )
+                    except Exception as e:
+                        log_error(f"Error inserting document: {e}")
+                        content.status = ContentStatus.FAILED
+                        content.status_message = "Could not insert embedding"
+                        self._update_content(content)
+                        return
+        except Exception as e:
+            # Streamed documents are read while they are inserted, so a failed read leaves the content partly inserted
+            log_error(f"Error reading content: {e}")
+            self.invalidate_search_cache()
+            content.status = ContentStatus.FAILED
+            content.status_message = "Could not read content"
+            self._update_content(content)
+            return
 
+        self.invalidate_search_cache()
         content.status = ContentStatus.COMPLETED
         self._update_content(content)
 
@@ -1102,7 +1149,9 @@ class Knowledge:
                 created_at=created_at,
                 updated_at=updated_at,
             )
+            existing_row = self.contents_db.get_knowledge_content(content.id) if content.id else None
             self.contents_db.upsert_knowledge_content(knowledge_row=content_row)
+            self._update_metadata_catalog(existing_row.metadata if existing_row else None, content.metadata)
 
     def _update_content(self, content: Content) -> Optional[Dict[str, Any]]:
         from agno.vectordb import VectorDb
@@ -1126,6 +1175,7 @@ class Knowledge:
                 content_row.description = self._ensure_string_field(
                     content.description, "content.description", default=""
                 )
+            previous_metadata = content_row.metadata
             if content.metadata is not None:
                 content_row.metadata = content.metadata
             if content.status is not None:
@@ -1140,6 +1190,8 @@ class Knowledge:
                 )
             content_row.updated_at = int(time.time())
             self.contents_db.upsert_knowledge_content(knowledge_row=content_row)
+            self._update_metadata_catalog(previous_metadata, content_row.metadata)
+            self.invalidate_search_cache()
 
             if self.vector_db and content.metadata:
                 self.vector_db.update_metadata(content_id=content.id, metadata=content.metadata)
@@ -1327,8 +1379,18 @@ class Knowledge:
                 return []
 
             _max_results = max_results or self.max_results
+            cache_key = self._get_search_cache_key(query, _max_results, filters)
+            if cache_key is not None:
+                cached_documents = self._search_cache.get(cache_key)  # type: ignore
+                if cached_documents is not None:
+                    log_debug(f"Using cached search results for query: {query}")
+                    return cached_documents
+
             log_debug(f"Getting {_max_results} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_max_results, filters=filters)
+            documents = self.vector_db.search(query=query, limit=_max_results, filters=filters)
+            if cache_key is not None:
+                self._search_cache.set(cache_key, documents)  # type: ignore
+            return documents
         except Exception as e:
             log_error(f"Error searching for documents: {e}")
             return []
@@ -1347,26 +1409,54 @@ class Knowledge:
                 return []
 
             _max_results = max_results or self.max_results
+            cache_key = self._get_search_cache_key(query, _max_results, filters)
+            if cache_key is not None:
+                cached_documents = self._search_cache.get(cache_key)  # type: ignore
+                if cached_documents is not None:
+                    log_debug(f"Using cached search results for query: {query}")
+                    return cached_documents
+
             log_debug(f"Getting {_max_results} relevant documents for query: {query}")
             try:
-                return await self.vector_db.async_search(query=query, limit=_max_results, filters=filters)
+                documents = await self.vector_db.async_search(query=query, limit=_max_results, filters=filters)
             except NotImplementedError:
                 log_info("Vector db does not support async search")
-                return self.search(query=query, max_results=_max_results, filters=filters)
+                documents = self.vector_db.search(query=query, limit=_max_results, filters=filters)
+            if cache_key is not None:
+                self._search_cache.set(cache_key, documents)  # type: ignore
+            return documents
         except Exception as e:
             log_error(f"Error searching for documents: {e}")
             return []
 
+    def _get_search_cache_key(
+        self, query: str, limit: int, filters: Optional[Dict[str, Any]]
+    ) -> Optional[SearchCacheKey]:
+        if self._search_cache is None:
+            return None
+        return self._search_cache.get_key(query=query, limit=limit, filters=filters)
+
+    def invalidate_search_cache(self) -> None:
+        """Drop cached search results. Called whenever content is added, updated or removed."""
+        if self._search_cache is not None:
+            self._search_cache.invalidate()
+
+    def get_search_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Return hit/miss metrics for the search cache, or None if search results aren't cached."""
+        if self._search_cache is None:
+            return None
+        return self._search_cache.get_stats()
+
     def get_valid_filters(self) -> Set[str]:
         if self.valid_metadata_filters is None:
             self.valid_metadata_filters = set()
-        self.valid_metadata_filters.update(self._get_filters_from_db)
+        self.valid_metadata_filters.update(self._get_filters_from_catalog())
         return self.valid_metadata_filters
 
     def validate_filters(self, filters: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[str]]:
         if self.valid_metadata_filters is None:
             self.valid_metadata_filters = set()
-        self.valid_metadata_filters.update(self._get_filters_from_db)
+        self.valid_metadata_filters.update(self._get_filters_from_catalog())
 
         if not filters:
             return {}, []
@@ -1399,16 +1489,118 @@ class Knowledge:
             for key in metadata.keys():
                 self.valid_metadata_filters.add(key)
 
-    @cached_property
-    def _get_filters_from_db(self) -> Set[str]:
+    # --- Metadata Catalog ---
+
+    def _load_metadata_catalog(self) -> Optional[MetadataCatalog]:
+        """Load the persisted catalog. Returns None if it hasn't been stored yet or the db can't persist it."""
         if self.contents_db is None:
-            return set()
+            return None
+        try:
+            catalog_data = self.contents_db.get_knowledge_metadata_catalog(self.contents_db.knowledge_table_name)
+            self._metadata_catalog_persisted = True
+        except NotImplementedError:
+            self._metadata_catalog_persisted = False
+            return None
+        if not isinstance(catalog_data, dict):
+            return None
+        return MetadataCatalog.from_dict(catalog_data)
+
+    def _save_metadata_catalog(self, catalog: MetadataCatalog) -> None:
+        if self.contents_db is None or not self._metadata_catalog_persisted:
+            return
+        try:
+            self.contents_db.upsert_knowledge_metadata_catalog(self.contents_db.knowledge_table_name, catalog.to_dict())
+        except NotImplementedError:
+            self._metadata_catalog_persisted = False
+        except Exception as e:
+            log_warning(f"Error saving knowledge metadata catalog: {e}")
+
+    def rebuild_metadata_catalog(self) -> Optional[MetadataCatalog]:
+        """Rebuild the metadata catalog by scanning all content rows, and persist it if the contents db supports it."""
+        if self.contents_db is None:
+            return None
+        log_debug("Building knowledge metadata catalog from contents db")
         contents, _ = self.get_content()
-        valid_filters: Set[str] = set()
-        for content in contents:
-            if content.metadata:
-                valid_filters.update(content.metadata.keys())
-        return valid_filters
+        catalog = MetadataCatalog.build(content.metadata for content in contents)
+        # Saving detects whether the contents db can persist the catalog
+        self._metadata_catalog_persisted = True
+        self._save_metadata_catalog(catalog)
+        self._metadata_catalog = catalog
+        self._metadata_catalog_loaded_at = time.time()
+        return catalog
+
+    def get_metadata_catalog(self) -> Optional[MetadataCatalog]:
+        """Return the catalog of metadata keys used in the contents db.
+
+        The catalog is stored alongside the contents and updated incrementally, so only the first call for a
+        new contents db scans the content rows.
+        """
+        if self.contents_db is None:
+            return None
+
+        catalog_expired = time.time() - self._metadata_catalog_loaded_at > self.metadata_catalog_refresh_interval
+        if self._metadata_catalog is not None and not (self._metadata_catalog_persisted and catalog_expired):
+            return self._metadata_catalog
+
+        try:
+            catalog = self._load_metadata_catalog()
+        except Exception as e:
+            log_warning(f"Error loading knowledge metadata catalog: {e}")
+            catalog = None
+        if catalog is None:
+            return self.rebuild_metadata_catalog()
+
+        self._metadata_catalog = catalog
+        self._metadata_catalog_loaded_at = time.time()
+        return catalog
+
+    def _update_metadata_catalog(
+        self, old_metadata: Optional[Dict[str, Any]], new_metadata: Optional[Dict[str, Any]]
+    ) -> None:
+        """Apply the metadata change of a single content row to the catalog.
+
+        The persisted catalog is changed atomically by the contents db, so concurrent changes from other threads or
+        processes aren't overwritten. The in-memory catalog of a db that can't persist it is changed under a lock.
+        """
+        if self.contents_db is None or (old_metadata or {}) == (new_metadata or {}):
+            return
+
+        def apply(catalog_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+            if catalog_data is None:
+                return None
+            catalog = MetadataCatalog.from_dict(catalog_data)
+            return catalog.to_dict() if catalog.replace(old_metadata, new_metadata) else None
+
+        try:
+            try:
+                catalog_data = self.contents_db.update_knowledge_metadata_catalog(
+                    self.contents_db.knowledge_table_name, apply
+                )
+                self._metadata_catalog_persisted = True
+            except NotImplementedError:
+                self._metadata_catalog_persisted = False
+                with self._metadata_catalog_lock:
+                    if self._metadata_catalog is not None:
+                        self._metadata_catalog.replace(old_metadata, new_metadata)
+                        return
+                catalog_data = None
+
+            if catalog_data is None:
+                # The contents db already includes this change, so a freshly built catalog is up to date
+                self.rebuild_metadata_catalog()
+                return
+            self._metadata_catalog = MetadataCatalog.from_dict(catalog_data)
+            self._metadata_catalog_loaded_at = time.time()
+        except Exception as e:
+            log_warning(f"Error updating knowledge metadata catalog: {e}")
+
+    def _get_filters_from_catalog(self) -> Set[str]:
+        try:
+            catalog = self.get_metadata_catalog()
+        except Exception as e:
+            log_warning(f"Error getting knowledge metadata catalog: {e}")
+            return set()
+        return catalog.keys() if catalog is not None else set()
 
     def remove_vector_by_id(self, id: str) -> bool:
         from agno.vectordb import VectorDb
@@ -1417,6 +1609,7 @@ class Knowledge:
         if self.vector_db is None:
             log_warning("No vector DB provided")
             return False
+        self.invalidate_search_cache()
         return self.vector_db.delete_by_id(id)
 
     def remove_vectors_by_name(self, name: str) -> bool:
@@ -1426,6 +1619,7 @@ class Knowledge:
         if self.vector_db is None:
             log_warning("No vector DB provided")
             return False
+        self.invalidate_search_cache()
         return self.vector_db.delete_by_name(name)
 
     def remove_vectors_by_metadata(self, metadata: Dict[str, Any]) -> bool:
@@ -1435,6 +1629,7 @@ class Knowledge:
         if self.vector_db is None:
             log_warning("No vector DB provided")
             return False
+        self.invalidate_search_cache()
         return self.vector_db.delete_by_metadata(metadata)
 
     # --- API Only Methods ---
@@ -1531,9 +1726,13 @@ class Knowledge:
                     log_warning(f"No external_id found for content {content_id}, cannot delete from LightRAG")
             else:
                 self.vector_db.delete_by_content_id(content_id)
+            self.invalidate_search_cache()
 
         if self.contents_db is not None:
+            content_row = self.contents_db.get_knowledge_content(content_id)
             self.contents_db.delete_knowledge_content(content_id)
+            if content_row is not None:
+                self._update_metadata_catalog(content_row.metadata, None)
 
     def remove_all_content(self):
         contents, _ = self.get_content()
@@ -0,0 +1,103 @@
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Set
+
+# Stop tracking individual values for a key once it has this many distinct values
+DEFAULT_MAX_TRACKED_VALUES = 100
+
+
+@dataclass
+class MetadataCatalog:
+    """Catalog of the metadata keys (and value cardinalities) used across a knowledge base.
+
+    The catalog is maintained incrementally as content is added, updated and removed, so the valid filter keys
+    can be looked up without scanning every content row.
+    """
+
+    # Number of content rows using each metadata key
+    key_counts: Dict[str, int] = field(default_factory=dict)
+    # Number of content rows using each value of a key. None once a key exceeds max_tracked_values.
+    value_counts: Dict[str, Optional[Dict[str, int]]] = field(default_factory=dict)
+    max_tracked_values: int = DEFAULT_MAX_TRACKED_VALUES
+    updated_at: Optional[int] = None
+
+    @staticmethod
+    def _value_key(value: Any) -> str:
+        if isinstance(value, str):
+            return value
+        return json.dumps(value, sort_keys=True, default=str)
+
+    def add(self, metadata: Optional[Dict[str, Any]]) -> None:
+        for key, value in (metadata or {}).items():
+            self.key_counts[key] = self.key_counts.get(key, 0) + 1
+
+            values = self.value_counts.setdefault(key, {})
+            if values is None:
+                continue
+            value_key = self._value_key(value)
+            values[value_key] = values.get(value_key, 0) + 1
+            if len(values) > self.max_tracked_values:
+                self.value_counts[key] = None
+        self.updated_at = int(time.time())
+
+    def remove(self, metadata: Optional[Dict[str, Any]]) -> None:
+        for key, value in (metadata or {}).items():
+            count = self.key_counts.get(key, 0) - 1
+            if count <= 0:
+                self.key_counts.pop(key, None)
+                self.value_counts.pop(key, None)
+                continue
+            self.key_counts[key] = count
+
+            values = self.value_counts.get(key)
+            if values is None:
+                continue
+            value_key = self._value_key(value)
+            value_count = values.get(value_key, 0) - 1
+            if value_count <= 0:
+                values.pop(value_key, None)
+            else:
+                values[value_key] = value_count
+        self.updated_at = int(time.time())
+
+    def replace(self, old_metadata: Optional[Dict[str, Any]], new_metadata: Optional[Dict[str, Any]]) -> bool:
+        """Swap the metadata of one content row. Returns True if the catalog changed."""
+        if (old_metadata or {}) == (new_metadata or {}):
+            return False
+        self.remove(old_metadata)
+        self.add(new_metadata)
+        return True
+
+    def keys(self) -> Set[str]:
+        return set(self.key_counts.keys())
+
+    def get_value_cardinality(self, key: str) -> Optional[int]:
+        """Number of distinct values seen for `key`, or None if the key is unknown or has too many to track."""
+        values = self.value_counts.get(key)
+        return len(values) if values is not None else None
+
+    @classmethod
+    def build(cls, metadatas: Iterable[Optional[Dict[str, Any]]], **kwargs) -> "MetadataCatalog":
+        catalog = cls(**kwargs)
+        for metadata in metadatas:
+            catalog.add(metadata)
+        catalog.updated_at = int(time.time())
+        return catalog
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "key_counts": self.key_counts,
+            "value_counts": self.value_counts,
+            "max_tracked_values": self.max_tracked_values,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MetadataCatalog":
+        return cls(
+            key_counts=dict(data.get("key_counts") or {}),
+            value_counts=dict(data.get("value_counts") or {}),
+            max_tracked_values=data.get("max_tracked_values", DEFAULT_MAX_TRACKED_VALUES),
+            updated_at=data.get("updated_at"),
+        )
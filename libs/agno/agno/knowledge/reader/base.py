@@ -1,6 +1,6 @@
 import asyncio
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, Iterable, Iterator, List, Optional
 
 from agno.knowledge.chunking.fixed import FixedSizeChunking
 from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyFactory, ChunkingStrategyType
@@ -71,9 +71,23 @@ class Reader:
             self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
         return self.chunking_strategy.chunk(document)  # type: ignore
 
+    def iter_chunk_document(self, document: Document, texts: Optional[Iterable[str]] = None) -> Iterator[Document]:
+        """Yield the chunks of a document as they are produced, reading its text from `texts` when given."""
+        if self.chunking_strategy is None:
+            self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
+        return self.chunking_strategy.iter_chunks(document, texts)
+
+    async def async_chunk_document(self, document: Document) -> List[Document]:
+        """Chunk a document with the strategy's own `async_chunk`, or else with `chunk_document` in a thread."""
+        if self.chunking_strategy is None:
+            self.chunking_strategy = FixedSizeChunking(chunk_size=self.chunk_size)
+        if type(self.chunking_strategy).async_chunk is not ChunkingStrategy.async_chunk:
+            return await self.chunking_strategy.async_chunk(document)
+        return await asyncio.to_thread(self.chunk_document, document)
+
     async def chunk_documents_async(self, documents: List[Document]) -> List[Document]:
         """
-        Asynchronously chunk a list of documents using the instance's chunk_document method.
+        Asynchronously chunk a list of documents using the instance's async_chunk_document method.
 
         Args:
             documents: List of documents to be chunked.
@@ -82,10 +96,7 @@ class Reader:
             A flattened list of chunked documents.
         """
 
-        async def _chunk_document_async(doc: Document) -> List[Document]:
-            return await asyncio.to_thread(self.chunk_document, doc)
-
         # Process chunking in parallel for all documents
-        chunked_lists = await asyncio.gather(*[_chunk_document_async(doc) for doc in documents])
+        chunked_lists = await asyncio.gather(*[self.async_chunk_document(doc) for doc in documents])
         # Flatten the result
         return [chunk for sublist in chunked_lists for chunk in sublist]
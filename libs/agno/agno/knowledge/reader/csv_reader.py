@@ -2,7 +2,7 @@ import asyncio
 import csv
 import io
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, Iterator, List, Optional, Union
 from uuid import uuid4
 
 try:
@@ -81,6 +81,49 @@ class CSVReader(Reader):
             logger.error(f"Error reading: {getattr(file, 'name', str(file)) if isinstance(file, IO) else file}: {e}")
             return []
 
+    def iter_read(
+        self, file: Union[Path, IO[Any]], delimiter: str = ",", quotechar: str = '"', name: Optional[str] = None
+    ) -> Iterator[Document]:
+        """Read a CSV file row by row and yield its chunks as they are produced.
+
+        Unlike `read`, the file is never held in memory as a whole when chunking, so chunks of very large files can
+        be embedded while the rest of the file is still being read.
+        """
+        try:
+            if isinstance(file, Path):
+                if not file.exists():
+                    raise FileNotFoundError(f"Could not find file: {file}")
+                logger.info(f"Reading: {file}")
+                file_content = file.open(newline="", mode="r", encoding=self.encoding or "utf-8")
+            else:
+                logger.info(f"Reading retrieved file: {name or file.name}")
+                file.seek(0)
+                file_content = io.TextIOWrapper(file, encoding="utf-8", newline="")  # type: ignore
+
+            csv_name = name or (
+                Path(file.name).stem
+                if isinstance(file, Path)
+                else (getattr(file, "name", "csv_file").split(".")[0] if hasattr(file, "name") else "csv_file")
+            )
+            document = Document(name=csv_name, id=str(uuid4()), content="")
+            try:
+                rows = (
+                    ", ".join(row) + "\n" for row in csv.reader(file_content, delimiter=delimiter, quotechar=quotechar)
+                )
+                if self.chunk:
+                    yield from self.iter_chunk_document(document, rows)
+                else:
+                    document.content = "".join(rows)
+                    yield document
+            finally:
+                # Leave an uploaded file open for the caller
+                if isinstance(file, Path):
+                    file_content.close()
+                else:
+                    file_content.detach()  # type: ignore
+        except Exception as e:
+            logger.error(f"Error reading: {getattr(file, 'name', str(file)) if isinstance(file, IO) else file}: {e}")
+
     async def async_read(
         self,
         file: Union[Path, IO[Any]],
@@ -128,7 +128,7 @@ class MarkdownReader(Reader):
         async def process_chunk(chunk_doc: Document) -> Document:
             return chunk_doc
 
-        chunked_documents = self.chunk_document(document)
+        chunked_documents = await self.async_chunk_document(document)
 
         if not chunked_documents:
             return [document]
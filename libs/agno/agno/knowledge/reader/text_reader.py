@@ -1,7 +1,8 @@
 import asyncio
+import codecs
 import uuid
 from pathlib import Path
-from typing import IO, Any, List, Optional, Union
+from typing import IO, Any, Iterator, List, Optional, Union
 
 from agno.knowledge.chunking.fixed import FixedSizeChunking
 from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyType
@@ -63,6 +64,42 @@ class TextReader(Reader):
             logger.error(f"Error reading: {file}: {e}")
             return []
 
+    def _iter_text(self, file: Union[Path, IO[Any]], block_size: int) -> Iterator[str]:
+        if isinstance(file, Path):
+            with file.open("r", encoding=self.encoding or "utf-8") as f:
+                yield from iter(lambda: f.read(block_size), "")
+        else:
+            file.seek(0)
+            decoder = codecs.getincrementaldecoder(self.encoding or "utf-8")()
+            for block in iter(lambda: file.read(block_size), b""):
+                yield decoder.decode(block)
+            yield decoder.decode(b"", final=True)
+
+    def iter_read(
+        self, file: Union[Path, IO[Any]], name: Optional[str] = None, block_size: int = 1024 * 1024
+    ) -> Iterator[Document]:
+        """Read a file in blocks of `block_size` characters and yield its chunks as they are produced.
+
+        Unlike `read`, the file is never held in memory as a whole when chunking, so chunks of very large files can
+        be embedded while the rest of the file is still being read. Errors are raised rather than logged, as the
+        chunks yielded before the error may already have been stored.
+        """
+        if isinstance(file, Path):
+            if not file.exists():
+                raise FileNotFoundError(f"Could not find file: {file}")
+            log_info(f"Reading: {file}")
+            file_name = name or file.stem
+        else:
+            file_name = name or file.name.split(".")[0]
+            log_info(f"Reading uploaded file: {file_name}")
+
+        document = Document(name=file_name, id=str(uuid.uuid4()), content="")
+        if self.chunk:
+            yield from self.iter_chunk_document(document, self._iter_text(file, block_size))
+        else:
+            document.content = "".join(self._iter_text(file, block_size))
+            yield document
+
     async def async_read(self, file: Union[Path, IO[Any]], name: Optional[str] = None) -> List[Document]:
         try:
             if isinstance(file, Path):
@@ -106,7 +143,7 @@ class TextReader(Reader):
         async def process_chunk(chunk_doc: Document) -> Document:
             return chunk_doc
 
-        chunked_documents = self.chunk_document(document)
+        chunked_documents = await self.async_chunk_document(document)
 
         if not chunked_documents:
             return [document]
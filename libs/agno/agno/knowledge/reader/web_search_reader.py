@@ -5,13 +5,12 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Literal, Optional, Set
 from urllib.parse import urlparse
 
-import httpx
-
 from agno.knowledge.chunking.semantic import SemanticChunking
 from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyType
 from agno.knowledge.document.base import Document
 from agno.knowledge.reader.base import Reader
 from agno.knowledge.types import ContentType
+from agno.utils.http import get_async_http_client, get_http_client
 from agno.utils.log import log_debug, logger
 
 try:
@@ -213,7 +212,7 @@ class WebSearchReader(Reader):
 
         for attempt in range(self.max_retries):
             try:
-                response = httpx.get(url, headers=headers, timeout=self.request_timeout, follow_redirects=True)
+                response = get_http_client().get(url, headers=headers, timeout=self.request_timeout)
                 response.raise_for_status()
 
                 # Check if it's HTML content
@@ -329,18 +328,17 @@ class WebSearchReader(Reader):
 
             try:
                 headers = {"User-Agent": self.user_agent}
-                async with httpx.AsyncClient(timeout=self.request_timeout) as client:
-                    response = await client.get(url, headers=headers, follow_redirects=True)
-                    response.raise_for_status()
-
-                    content_type = response.headers.get("content-type", "").lower()
-                    if "text/html" in content_type:
-                        content = self._extract_text_from_html(response.text, url)
-                    else:
-                        content = response.text
-
-                    document = self._create_document_from_url(url, content, result)
-                    return document
+                response = await get_async_http_client().get(url, headers=headers, timeout=self.request_timeout)
+                response.raise_for_status()
+
+                content_type = response.headers.get("content-type", "").lower()
+                if "text/html" in content_type:
+                    content = self._extract_text_from_html(response.text, url)
+                else:
+                    content = response.text
+
+                document = self._create_document_from_url(url, content, result)
+                return document
 
             except Exception as e:
                 logger.warning(f"Error fetching {url}: {e}")
@@ -12,6 +12,7 @@ from agno.knowledge.chunking.strategy import ChunkingStrategy, ChunkingStrategyT
 from agno.knowledge.document.base import Document
 from agno.knowledge.reader.base import Reader
 from agno.knowledge.types import ContentType
+from agno.utils.http import get_async_http_client, get_http_client
 from agno.utils.log import log_debug, logger
 
 try:
@@ -188,11 +189,7 @@ class WebsiteReader(Reader):
             try:
                 log_debug(f"Crawling: {current_url}")
 
-                response = (
-                    httpx.get(current_url, timeout=self.timeout, proxy=self.proxy, follow_redirects=True)
-                    if self.proxy
-                    else httpx.get(current_url, timeout=self.timeout, follow_redirects=True)
-                )
+                response = get_http_client(proxy=self.proxy or None).get(current_url, timeout=self.timeout)
                 response.raise_for_status()
 
                 soup = BeautifulSoup(response.content, "html.parser")
@@ -279,78 +276,77 @@ class WebsiteReader(Reader):
         self._visited = set()
         self._urls_to_crawl = [(url, starting_depth)]
 
-        client_args = {"proxy": self.proxy} if self.proxy else {}
-        async with httpx.AsyncClient(**client_args) as client:  # type: ignore
-            while self._urls_to_crawl and num_links < self.max_links:
-                current_url, current_depth = self._urls_to_crawl.pop(0)
-
-                if (
-                    current_url in self._visited
-                    or not urlparse(current_url).netloc.endswith(primary_domain)
-                    or current_depth > self.max_depth
-                    or num_links >= self.max_links
-                ):
-                    continue
-
-                self._visited.add(current_url)
-                await self.async_delay()
-
-                try:
-                    log_debug(f"Crawling asynchronously: {current_url}")
-                    response = await client.get(current_url, timeout=self.timeout, follow_redirects=True)
-                    response.raise_for_status()
-
-                    soup = BeautifulSoup(response.content, "html.parser")
-
-                    # Extract main content
-                    main_content = self._extract_main_content(soup)
-                    if main_content:
-                        crawler_result[current_url] = main_content
-                        num_links += 1
-
-                    # Add found URLs to the list, with incremented depth
-                    for link in soup.find_all("a", href=True):
-                        if not isinstance(link, Tag):
-                            continue
-
-                        href_str = str(link["href"])
-                        full_url = urljoin(current_url, href_str)
-
-                        if not isinstance(full_url, str):
-                            continue
-
-                        parsed_url = urlparse(full_url)
-                        if parsed_url.netloc.endswith(primary_domain) and not any(
-                            parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
+        client = get_async_http_client(proxy=self.proxy or None)
+        while self._urls_to_crawl and num_links < self.max_links:
+            current_url, current_depth = self._urls_to_crawl.pop(0)
+
+            if (
+                current_url in self._visited
+                or not urlparse(current_url).netloc.endswith(primary_domain)
+                or current_depth > self.max_depth
+                or num_links >= self.max_links
+            ):
+                continue
+
+            self._visited.add(current_url)
+            await self.async_delay()
+
+            try:
+                log_debug(f"Crawling asynchronously: {current_url}")
+                response = await client.get(current_url, timeout=self.timeout)
+                response.raise_for_status()
+
+                soup = BeautifulSoup(response.content, "html.parser")
+
+                # Extract main content
+                main_content = self._extract_main_content(soup)
+                if main_content:
+                    crawler_result[current_url] = main_content
+                    num_links += 1
+
+                # Add found URLs to the list, with incremented depth
+                for link in soup.find_all("a", href=True):
+                    if not isinstance(link, Tag):
+                        continue
+
+                    href_str = str(link["href"])
+                    full_url = urljoin(current_url, href_str)
+
+                    if not isinstance(full_url, str):
+                        continue
+
+                    parsed_url = urlparse(full_url)
+                    if parsed_url.netloc.endswith(primary_domain) and not any(
+                        parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
+                    ):
+                        full_url_str = str(full_url)
+                        if (
+                            full_url_str not in self._visited
+                            and (full_url_str, current_depth + 1) not in self._urls_to_crawl
                         ):
-                            full_url_str = str(full_url)
-                            if (
-                                full_url_str not in self._visited
-                                and (full_url_str, current_depth + 1) not in self._urls_to_crawl
-                            ):
-                                self._urls_to_crawl.append((full_url_str, current_depth + 1))
-
-                except httpx.HTTPStatusError as e:
-                    # Log HTTP status errors but continue crawling other pages
-                    logger.warning(f"HTTP status error while crawling asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        raise
-                except httpx.RequestError as e:
-                    # Log request errors but continue crawling other pages
-                    logger.warning(f"Request error while crawling asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        raise
-                except Exception as e:
-                    # Log other exceptions but continue crawling other pages
-                    logger.warning(f"Failed to crawl asynchronously {current_url}: {e}")
-                    # For the initial URL, we should raise the error
-                    if current_url == url and not crawler_result:
-                        # Wrap non-HTTP exceptions in a RequestError
-                        raise httpx.RequestError(
-                            f"Failed to crawl starting URL {url} asynchronously: {str(e)}", request=None
-                        ) from e
+                            self._urls_to_crawl.append((full_url_str, current_depth + 1))
+
+            except httpx.HTTPStatusError as e:
+                # Log HTTP status errors but continue crawling other pages
+                logger.warning(f"HTTP status error while crawling asynchronously {current_url}: {e}")
+                # For the initial URL, we should raise the error
+                if current_url == url and not crawler_result:
+                    raise
+            except httpx.RequestError as e:
+                # Log request errors but continue crawling other pages
+                logger.warning(f"Request error while crawling asynchronously {current_url}: {e}")
+                # For the initial URL, we should raise the error
+                if current_url == url and not crawler_result:
+                    raise
+            except Exception as e:
+                # Log other exceptions but continue crawling other pages
+                logger.warning(f"Failed to crawl asynchronously {current_url}: {e}")
+                # For the initial URL, we should raise the error
+                if current_url == url and not crawler_result:
+                    # Wrap non-HTTP exceptions in a RequestError
+                    raise httpx.RequestError(
+                        f"Failed to crawl starting URL {url} asynchronously: {str(e)}", request=None
+                    ) from e
 
         # If we couldn't crawl any pages, raise an error
         if not crawler_result:
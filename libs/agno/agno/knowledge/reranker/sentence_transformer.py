@@ -1,5 +1,6 @@
 from typing import Any, Dict, List, Optional
 
+from agno.knowledge.batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT_MS, MicroBatcher
 from agno.knowledge.document import Document
 from agno.knowledge.reranker.base import Reranker
 from agno.utils.log import logger
@@ -14,13 +15,37 @@ class SentenceTransformerReranker(Reranker):
     model: str = "BAAI/bge-reranker-v2-m3"
     model_kwargs: Optional[Dict[str, Any]] = None
     top_n: Optional[int] = None
+    # Coalesce the candidate pairs of concurrent rerank calls into a single predict call on a worker thread
+    micro_batching: bool = False
+    micro_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+    micro_batch_wait_ms: float = DEFAULT_MAX_WAIT_MS
+
+    _client: Optional[CrossEncoder] = None
+    _batcher: Optional[MicroBatcher] = None
+
+    @property
+    def client(self) -> CrossEncoder:
+        if self._client is None:
+            self._client = CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
+        return self._client
+
+    def _predict(self, sentence_pairs: List[List[str]]) -> List[float]:
+        return self.client.predict(sentence_pairs).tolist()
+
+    def _get_batcher(self) -> MicroBatcher:
+        if self._batcher is None:
+            self._batcher = MicroBatcher(
+                self._predict,
+                max_batch_size=self.micro_batch_size,
+                max_wait_ms=self.micro_batch_wait_ms,
+                name=f"cross-encoder-{self.model}",
+            )
+        return self._batcher
 
     def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
         if not documents:
             return []
 
-        sentence_transformer_client = CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
-
         top_n = self.top_n
         if top_n and not (0 < top_n):
             logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
@@ -30,7 +55,7 @@ class SentenceTransformerReranker(Reranker):
 
         sentence_pairs = [[query, doc.content] for doc in documents]
 
-        scores = sentence_transformer_client.predict(sentence_pairs).tolist()
+        scores = self._get_batcher()(sentence_pairs) if self.micro_batching else self._predict(sentence_pairs)
         for index, score in enumerate(scores):
             doc = documents[index]
             doc.reranking_score = score
@@ -0,0 +1,87 @@
+import json
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from agno.knowledge.document import Document
+
+SearchCacheKey = Tuple[int, str, str, int]
+
+
+class SearchCache:
+    """LRU cache of knowledge search results with a TTL.
+
+    Keys include the knowledge version, which is bumped whenever content is added, updated or removed. A search
+    that started before an invalidation stores its results under the old version, so stale results are never
+    served after the knowledge base changes.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self.version: int = 0
+        self._entries: "OrderedDict[SearchCacheKey, Tuple[float, List[Document]]]" = OrderedDict()
+        self._lock = Lock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.invalidations: int = 0
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return " ".join(query.split()).casefold()
+
+    def get_key(self, query: str, limit: int, filters: Optional[Any] = None) -> SearchCacheKey:
+        filters_key = json.dumps(filters, sort_keys=True, default=str) if filters else ""
+        return (self.version, self.normalize_query(query), filters_key, limit)
+
+    def get(self, key: SearchCacheKey) -> Optional[List[Document]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            created_at, documents = entry
+            if self.ttl is not None and time.time() - created_at > self.ttl:
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            # Return a new list so callers can't reorder or extend the cached results
+            return list(documents)
+
+    def set(self, key: SearchCacheKey, documents: List[Document]) -> None:
+        with self._lock:
+            # Results computed before the last invalidation can never be served, so don't store them
+            if key[0] != self.version:
+                return
+            self._entries[key] = (time.time(), list(documents))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Bump the version and drop all cached results."""
+        with self._lock:
+            self.version += 1
+            self.invalidations += 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "version": self.version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
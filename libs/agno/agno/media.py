@@ -1,17 +1,91 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from uuid import uuid4
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, SerializerFunctionWrapHandler, field_validator, model_serializer, model_validator
 
+from agno.utils.blob_store import get_blob_store, is_offloading_media
+from agno.utils.log import log_warning
+from agno.utils.media_cache import get_media_cache
 
-class Image(BaseModel):
+
+def _load_content_ref(content_ref: str) -> Optional[bytes]:
+    """Read media content stored as a `content_ref` from the blob store, or None if it isn't there."""
+    blob_store = get_blob_store()
+    content = blob_store.get(content_ref) if blob_store is not None else None
+    if content is None:
+        log_warning(f"Could not load media content for {content_ref}: blob not found or no blob store configured")
+    return content
+
+
+def _content_to_dict(media: "_BlobContent", to_base64: Callable[[], Optional[str]]) -> Dict[str, Any]:
+    """Serialize media content inline as base64, or as a blob store reference while sessions are being saved."""
+    blob_store = get_blob_store()
+    offloading = blob_store is not None and is_offloading_media()
+    if offloading and media.content_ref is not None and media.content is None:
+        # Already in the blob store, no need to load it
+        return {"content_ref": media.content_ref}
+
+    content = media.get_content()
+    if not content:
+        # Keep the reference to content that couldn't be loaded
+        return {"content_ref": media.content_ref} if media.content_ref is not None else {}
+    if offloading:
+        try:
+            return {"content_ref": blob_store.put(content)}  # type: ignore
+        except Exception as e:
+            log_warning(f"Failed to offload media to blob store, storing inline: {e}")
+    return {"content": to_base64()}
+
+
+class _BlobContent:
+    """Media whose content may be stored in the blob store, as a `content_ref`.
+
+    The content isn't read when the media is loaded, but by `get_content()` once it is needed. If the blob can't be
+    found, `content` stays None and the reference is kept, so saving the media again doesn't lose it.
+    """
+
+    content: Optional[bytes]
+    content_ref: Optional[str]
+
+    def get_content(self) -> Optional[bytes]:
+        """Return the content, loading it from the blob store if it is only stored as a reference."""
+        if self.content is None and self.content_ref is not None:
+            self.content = _load_content_ref(self.content_ref)
+        return self.content
+
+    @model_serializer(mode="wrap")
+    def _serialize_with_content(self, handler: SerializerFunctionWrapHandler) -> Any:
+        # Dumps include the content itself, not just its reference
+        self.get_content()
+        return handler(self)
+
+
+def _fetch_url_bytes(url: str) -> bytes:
+    from agno.utils.http import get_http_client
+
+    response = get_http_client(follow_redirects=False).get(url)
+    # Raise on error responses, so that their body isn't cached as the media
+    response.raise_for_status()
+    return response.content
+
+
+def _fetch_url_content(url: str) -> Tuple[bytes, str]:
+    from agno.utils.http import get_http_client
+
+    response = get_http_client(follow_redirects=False).get(url)
+    response.raise_for_status()
+    return response.content, response.headers.get("Content-Type", "").split(";")[0]
+
+
+class Image(_BlobContent, BaseModel):
     """Unified Image class for all use cases (input, output, artifacts)"""
 
     # Core content fields (exactly one required)
     url: Optional[str] = None  # Remote location
     filepath: Optional[Union[Path, str]] = None  # Local file path
     content: Optional[bytes] = None  # Raw image bytes (standardized to bytes)
+    content_ref: Optional[str] = None  # Blob store reference, the content is loaded by get_content()
 
     # Metadata fields
     id: Optional[str] = None  # For tracking/referencing
@@ -34,7 +108,8 @@ class Image(BaseModel):
         if isinstance(data, dict):
             url = data.get("url")
             filepath = data.get("filepath")
-            content = data.get("content")
+            # Content stored in the blob store is only loaded once it is needed
+            content = data.get("content") if data.get("content") is not None else data.get("content_ref")
 
             # Count non-None sources
             sources = [x for x in [url, filepath, content] if x is not None]
@@ -51,24 +126,20 @@ class Image(BaseModel):
 
     def get_content_bytes(self) -> Optional[bytes]:
         """Get image content as raw bytes, loading from URL/file if needed"""
-        if self.content:
-            return self.content
+        content = self.get_content()
+        if content:
+            return content
         elif self.url:
-            import httpx
-
-            return httpx.get(self.url).content
+            return get_media_cache().get_url_bytes(self.url, _fetch_url_bytes)
         elif self.filepath:
-            with open(self.filepath, "rb") as f:
-                return f.read()
+            return get_media_cache().get_file_bytes(self.filepath)
         return None
 
     def to_base64(self) -> Optional[str]:
         """Convert content to base64 string for transmission/storage"""
         content_bytes = self.get_content_bytes()
         if content_bytes:
-            import base64
-
-            return base64.b64encode(content_bytes).decode("utf-8")
+            return get_media_cache().b64encode(content_bytes)
         return None
 
     @classmethod
@@ -104,19 +175,20 @@ class Image(BaseModel):
             "alt_text": self.alt_text,
         }
 
-        if include_base64_content and self.content:
-            result["content"] = self.to_base64()
+        if include_base64_content:
+            result.update(_content_to_dict(self, self.to_base64))
 
         return {k: v for k, v in result.items() if v is not None}
 
 
-class Audio(BaseModel):
+class Audio(_BlobContent, BaseModel):
     """Unified Audio class for all use cases (input, output, artifacts)"""
 
     # Core content fields (exactly one required)
     url: Optional[str] = None
     filepath: Optional[Union[Path, str]] = None
     content: Optional[bytes] = None  # Raw audio bytes (standardized to bytes)
+    content_ref: Optional[str] = None  # Blob store reference, the content is loaded by get_content()
 
     # Metadata fields
     id: Optional[str] = None
@@ -138,7 +210,8 @@ class Audio(BaseModel):
         if isinstance(data, dict):
             url = data.get("url")
             filepath = data.get("filepath")
-            content = data.get("content")
+            # Content stored in the blob store is only loaded once it is needed
+            content = data.get("content") if data.get("content") is not None else data.get("content_ref")
 
             sources = [x for x in [url, filepath, content] if x is not None]
             if len(sources) == 0:
@@ -153,24 +226,20 @@ class Audio(BaseModel):
 
     def get_content_bytes(self) -> Optional[bytes]:
         """Get audio content as raw bytes"""
-        if self.content:
-            return self.content
+        content = self.get_content()
+        if content:
+            return content
         elif self.url:
-            import httpx
-
-            return httpx.get(self.url).content
+            return get_media_cache().get_url_bytes(self.url, _fetch_url_bytes)
         elif self.filepath:
-            with open(self.filepath, "rb") as f:
-                return f.read()
+            return get_media_cache().get_file_bytes(self.filepath)
         return None
 
     def to_base64(self) -> Optional[str]:
         """Convert content to base64 string"""
         content_bytes = self.get_content_bytes()
         if content_bytes:
-            import base64
-
-            return base64.b64encode(content_bytes).decode("utf-8")
+            return get_media_cache().b64encode(content_bytes)
         return None
 
     @classmethod
@@ -220,19 +289,20 @@ class Audio(BaseModel):
             "expires_at": self.expires_at,
         }
 
-        if include_base64_content and self.content:
-            result["content"] = self.to_base64()
+        if include_base64_content:
+            result.update(_content_to_dict(self, self.to_base64))
 
         return {k: v for k, v in result.items() if v is not None}
 
 
-class Video(BaseModel):
+class Video(_BlobContent, BaseModel):
     """Unified Video class for all use cases (input, output, artifacts)"""
 
     # Core content fields (exactly one required)
     url: Optional[str] = None
     filepath: Optional[Union[Path, str]] = None
     content: Optional[bytes] = None  # Raw video bytes (standardized to bytes)
+    content_ref: Optional[str] = None  # Blob store reference, the content is loaded by get_content()
 
     # Metadata fields
     id: Optional[str] = None
@@ -256,7 +326,8 @@ class Video(BaseModel):
         if isinstance(data, dict):
             url = data.get("url")
             filepath = data.get("filepath")
-            content = data.get("content")
+            # Content stored in the blob store is only loaded once it is needed
+            content = data.get("content") if data.get("content") is not None else data.get("content_ref")
 
             sources = [x for x in [url, filepath, content] if x is not None]
             if len(sources) == 0:
@@ -271,24 +342,20 @@ class Video(BaseModel):
 
     def get_content_bytes(self) -> Optional[bytes]:
         """Get video content as raw bytes"""
-        if self.content:
-            return self.content
+        content = self.get_content()
+        if content:
+            return content
         elif self.url:
-            import httpx
-
-            return httpx.get(self.url).content
+            return get_media_cache().get_url_bytes(self.url, _fetch_url_bytes)
         elif self.filepath:
-            with open(self.filepath, "rb") as f:
-                return f.read()
+            return get_media_cache().get_file_bytes(self.filepath)
         return None
 
     def to_base64(self) -> Optional[str]:
         """Convert content to base64 string"""
         content_bytes = self.get_content_bytes()
         if content_bytes:
-            import base64
-
-            return base64.b64encode(content_bytes).decode("utf-8")
+            return get_media_cache().b64encode(content_bytes)
         return None
 
     @classmethod
@@ -327,8 +394,8 @@ class Video(BaseModel):
             "revised_prompt": self.revised_prompt,
         }
 
-        if include_base64_content and self.content:
-            result["content"] = self.to_base64()
+        if include_base64_content:
+            result.update(_content_to_dict(self, self.to_base64))
 
         return {k: v for k, v in result.items() if v is not None}
 
@@ -410,13 +477,12 @@ class File(BaseModel):
 
     @property
     def file_url_content(self) -> Optional[Tuple[bytes, str]]:
-        import httpx
-
         if self.url:
-            response = httpx.get(self.url)
-            content = response.content
-            mime_type = response.headers.get("Content-Type", "").split(";")[0]
-            return content, mime_type
+            result = get_media_cache().get_url_content(self.url, _fetch_url_content)
+            if result is None:
+                return None
+            content, mime_type = result
+            return content, mime_type or ""
         else:
             return None
 
@@ -2,9 +2,8 @@ from dataclasses import dataclass
 from os import getenv
 from typing import Any, Dict, Optional
 
-import httpx
-
 from agno.models.openai.like import OpenAILike
+from agno.utils.http import get_async_http_client, get_http_client
 
 try:
     from openai import AsyncAzureOpenAI as AsyncAzureOpenAIClient
@@ -94,6 +93,10 @@ class AzureOpenAI(OpenAILike):
             return self.client
 
         _client_params: Dict[str, Any] = self._get_client_params()
+        if self.http_client is None:
+            _client_params["http_client"] = get_http_client(
+                base_url=self.base_url or self.azure_endpoint, scope=self.provider
+            )
 
         # -*- Create client
         self.client = AzureOpenAIClient(**_client_params)
@@ -114,9 +117,9 @@ class AzureOpenAI(OpenAILike):
         if self.http_client:
             _client_params["http_client"] = self.http_client
         else:
-            # Create a new async HTTP client with custom limits
-            _client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+            # Use the shared async HTTP client for the provider
+            _client_params["http_client"] = get_async_http_client(
+                base_url=self.base_url or self.azure_endpoint, scope=self.provider
             )
 
         self.async_client = AsyncAzureOpenAIClient(**_client_params)
@@ -22,6 +22,7 @@ from pydantic import BaseModel
 
 from exceptions import AgentRunException
 from agno.media import Audio, File, Image, Video
+from agno.models.cache import ResponseCache, get_response_cache, get_response_cache_key, get_response_context_key
 from agno.models.message import Citations, Message
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
@@ -133,6 +134,11 @@ class Model(ABC):
     # The role of the assistant message.
     assistant_message_role: str = "assistant"
 
+    # If True, responses are cached and identical calls are answered from the cache instead of the provider.
+    cache_response: bool = False
+    # The cache to use. Defaults to the process-wide in-memory cache.
+    response_cache: Optional[ResponseCache] = None
+
     def __post_init__(self):
         if self.provider is None and self.name is not None:
             self.provider = f"{self.name} ({self.id})"
@@ -187,6 +193,195 @@ class Model(ABC):
         """
         pass
 
+    def _get_response_cache(self) -> Optional[ResponseCache]:
+        if not self.cache_response:
+            return None
+        return self.response_cache or get_response_cache()
+
+    def _get_response_cache_keys(
+        self,
+        response_cache: ResponseCache,
+        messages: List[Message],
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        stream: bool = False,
+    ) -> Tuple[str, Optional[str]]:
+        """Exact cache key of a call, and its context key when similar prompts can be matched."""
+        key = get_response_cache_key(self, messages, response_format, tools, tool_choice, stream=stream)
+        context_key = None
+        if response_cache.embedder is not None:
+            context_key = get_response_context_key(self, messages, response_format, tools, tool_choice, stream=stream)
+        return key, context_key
+
+    def _invoke_with_cache(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> ModelResponse:
+        """Call invoke(), unless the response is cached."""
+        response_cache = self._get_response_cache()
+        if response_cache is None:
+            return self.invoke(
+                assistant_message=assistant_message,
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice,
+                run_response=run_response,
+            )
+
+        key, context_key = self._get_response_cache_keys(response_cache, messages, response_format, tools, tool_choice)
+        cached_responses = response_cache.get(key, messages, context_key)
+        if cached_responses:
+            log_debug(f"Using cached response for {self.id}")
+            return cached_responses[0]
+
+        provider_response = self.invoke(
+            assistant_message=assistant_message,
+            messages=messages,
+            response_format=response_format,
+            tools=tools,
+            tool_choice=tool_choice,
+            run_response=run_response,
+        )
+        response_cache.set(key, [provider_response], messages, context_key)
+        return provider_response
+
+    async def _ainvoke_with_cache(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> ModelResponse:
+        """Call ainvoke(), unless the response is cached."""
+        response_cache = self._get_response_cache()
+        if response_cache is None:
+            return await self.ainvoke(
+                messages=messages,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice,
+                assistant_message=assistant_message,
+                run_response=run_response,
+            )
+
+        key, context_key = self._get_response_cache_keys(response_cache, messages, response_format, tools, tool_choice)
+        cached_responses = await response_cache.aget(key, messages, context_key)
+        if cached_responses:
+            log_debug(f"Using cached response for {self.id}")
+            return cached_responses[0]
+
+        provider_response = await self.ainvoke(
+            messages=messages,
+            response_format=response_format,
+            tools=tools,
+            tool_choice=tool_choice,
+            assistant_message=assistant_message,
+            run_response=run_response,
+        )
+        await response_cache.aset(key, [provider_response], messages, context_key)
+        return provider_response
+
+    def _invoke_stream_with_cache(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> Iterator[ModelResponse]:
+        """Call invoke_stream(), or replay the cached deltas of an identical call."""
+        response_cache = self._get_response_cache()
+        if response_cache is None:
+            yield from self.invoke_stream(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice,
+                run_response=run_response,
+            )
+            return
+
+        key, context_key = self._get_response_cache_keys(
+            response_cache, messages, response_format, tools, tool_choice, stream=True
+        )
+        cached_responses = response_cache.get(key, messages, context_key)
+        if cached_responses is not None:
+            log_debug(f"Replaying cached response stream for {self.id}")
+            yield from cached_responses
+            return
+
+        # Only a stream that was consumed to the end is cached
+        response_deltas: List[ModelResponse] = []
+        for response_delta in self.invoke_stream(
+            messages=messages,
+            assistant_message=assistant_message,
+            response_format=response_format,
+            tools=tools,
+            tool_choice=tool_choice,
+            run_response=run_response,
+        ):
+            response_deltas.append(response_delta)
+            yield response_delta
+        response_cache.set(key, response_deltas, messages, context_key)
+
+    async def _ainvoke_stream_with_cache(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> AsyncIterator[ModelResponse]:
+        """Call ainvoke_stream(), or replay the cached deltas of an identical call."""
+        response_cache = self._get_response_cache()
+        if response_cache is None:
+            async for response_delta in self.ainvoke_stream(
+                messages=messages,
+                assistant_message=assistant_message,
+                response_format=response_format,
+                tools=tools,
+                tool_choice=tool_choice,
+                run_response=run_response,
+            ):  # type: ignore
+                yield response_delta
+            return
+
+        key, context_key = self._get_response_cache_keys(
+            response_cache, messages, response_format, tools, tool_choice, stream=True
+        )
+        cached_responses = await response_cache.aget(key, messages, context_key)
+        if cached_responses is not None:
+            log_debug(f"Replaying cached response stream for {self.id}")
+            for response_delta in cached_responses:
+                yield response_delta
+            return
+
+        # Only a stream that was consumed to the end is cached
+        response_deltas: List[ModelResponse] = []
+        async for response_delta in self.ainvoke_stream(
+            messages=messages,
+            assistant_message=assistant_message,
+            response_format=response_format,
+            tools=tools,
+            tool_choice=tool_choice,
+            run_response=run_response,
+        ):  # type: ignore
+            response_deltas.append(response_delta)
+            yield response_delta
+        await response_cache.aset(key, response_deltas, messages, context_key)
+
     def response(
         self,
         messages: List[Message],
@@ -498,7 +693,7 @@ class Model(ABC):
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
         # Generate response
-        provider_response = self.invoke(
+        provider_response = self._invoke_with_cache(
             assistant_message=assistant_message,
             messages=messages,
             response_format=response_format,
@@ -551,7 +746,7 @@ class Model(ABC):
             Tuple[Message, bool]: (assistant_message, should_continue)
         """
         # Generate response
-        provider_response = await self.ainvoke(
+        provider_response = await self._ainvoke_with_cache(
             messages=messages,
             response_format=response_format,
             tools=tools,
@@ -684,7 +879,7 @@ class Model(ABC):
         response_delta = None
 
         try:
-            for response_delta in self.invoke_stream(
+            for response_delta in self._invoke_stream_with_cache(
                 messages=messages,
                 assistant_message=assistant_message,
                 response_format=response_format,
@@ -874,7 +1069,7 @@ class Model(ABC):
         """
         Process a streaming response from the model.
         """
-        async for response_delta in self.ainvoke_stream(
+        async for response_delta in self._ainvoke_stream_with_cache(
             messages=messages,
             assistant_message=assistant_message,
             response_format=response_format,
@@ -1189,9 +1384,13 @@ class Model(ABC):
             videos = function_execution_result.videos
             audios = function_execution_result.audios
 
+        content = output if success else function_call.error
+        if isinstance(content, str) and function_call.function._truncate_result is not None:
+            content = function_call.function._truncate_result(content)
+
         return Message(
             role=self.tool_message_role,
-            content=output if success else function_call.error,
+            content=content,
             tool_call_id=function_call.call_id,
             tool_name=function_call.function.name,
             tool_args=function_call.arguments,
@@ -1935,6 +2134,10 @@ class Model(ABC):
         for k, v in self.__dict__.items():
             if k in {"response_format", "_tools", "_functions"}:
                 continue
+            # The response cache is shared with the copy
+            if k == "response_cache":
+                setattr(new_model, k, v)
+                continue
             try:
                 setattr(new_model, k, deepcopy(v, memo))
             except Exception:
@@ -0,0 +1,422 @@
+import hashlib
+import json
+import math
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import fields, is_dataclass
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from agno.models.message import Citations, Message
+from agno.models.response import ModelResponse
+from agno.utils.log import log_debug, log_warning
+
+if TYPE_CHECKING:
+    from agno.db.base import BaseDb
+    from agno.knowledge.embedder.base import Embedder
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+# Number of prompt embeddings kept, so a miss and the following store embed the prompt once
+EMBEDDING_CACHE_SIZE = 256
+
+# Model fields that configure the client or the cache, which don't change what the model answers
+NON_REQUEST_FIELDS = {
+    "name",
+    "provider",
+    "cache_response",
+    "response_cache",
+    "timeout",
+    "max_retries",
+    "supports_native_structured_outputs",
+    "supports_json_schema_outputs",
+    "tool_message_role",
+    "assistant_message_role",
+}
+
+# Message fields that don't reach the provider
+NON_REQUEST_MESSAGE_FIELDS = {"created_at", "metrics", "from_history", "references"}
+
+
+def _is_json_value(value: Any) -> bool:
+    try:
+        json.dumps(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def get_model_params(model: Any) -> Dict[str, Any]:
+    """The model's request parameters (sampling params, request_params etc.) that can affect its response."""
+    params: Dict[str, Any] = {"class": model.__class__.__name__}
+    if not is_dataclass(model):
+        return params
+    for model_field in fields(model):
+        name = model_field.name
+        if name.startswith("_") or name in NON_REQUEST_FIELDS or "api_key" in name:
+            continue
+        value = getattr(model, name, None)
+        if value is None or isinstance(value, (str, int, float, bool)):
+            params[name] = value
+        elif isinstance(value, (list, tuple, dict)) and _is_json_value(value):
+            params[name] = value
+    return params
+
+
+def _message_payload(message: Message, include_content: bool = True) -> Dict[str, Any]:
+    payload = {k: v for k, v in message.to_dict().items() if k not in NON_REQUEST_MESSAGE_FIELDS}
+    if not include_content:
+        payload.pop("content", None)
+    return payload
+
+
+def _response_format_payload(response_format: Optional[Union[Dict, Type[BaseModel]]]) -> Any:
+    if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+        return response_format.model_json_schema()
+    return response_format
+
+
+def _hash(payload: Any) -> str:
+    serialized = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def get_response_cache_key(
+    model: Any,
+    messages: List[Message],
+    response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+    stream: bool = False,
+) -> str:
+    """Canonical hash of everything a model call depends on.
+
+    Streamed and non-streamed responses are cached separately, since providers return different deltas for them.
+    """
+    payload = {
+        "model": model.id,
+        "params": get_model_params(model),
+        "messages": [_message_payload(message) for message in messages],
+        "response_format": _response_format_payload(response_format),
+        "tools": tools,
+        "tool_choice": tool_choice,
+        "stream": stream,
+    }
+    return f"model:{_hash(payload)}"
+
+
+def get_response_context_key(
+    model: Any,
+    messages: List[Message],
+    response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+    stream: bool = False,
+) -> str:
+    """Hash of a model call without the content of its last message, used to match similar prompts."""
+    payload = {
+        "model": model.id,
+        "params": get_model_params(model),
+        "messages": [_message_payload(message) for message in messages[:-1]]
+        + [_message_payload(message, include_content=False) for message in messages[-1:]],
+        "response_format": _response_format_payload(response_format),
+        "tools": tools,
+        "tool_choice": tool_choice,
+        "stream": stream,
+    }
+    return _hash(payload)
+
+
+def response_to_dict(response: ModelResponse) -> Optional[Dict[str, Any]]:
+    """Serialize a response for storage in a db, or return None if it holds data that can't be serialized."""
+    if response.parsed is not None or response.audio is not None:
+        return None
+    if response.images or response.videos or response.audios or response.files:
+        return None
+    data = {
+        "role": response.role,
+        "content": response.content,
+        "tool_calls": response.tool_calls,
+        "event": response.event,
+        "provider_data": response.provider_data,
+        "reasoning_content": response.reasoning_content,
+        "redacted_reasoning_content": response.redacted_reasoning_content,
+        "citations": response.citations.model_dump() if response.citations is not None else None,
+        "extra": response.extra,
+    }
+    return data if _is_json_value(data) else None
+
+
+def response_from_dict(data: Dict[str, Any]) -> ModelResponse:
+    return ModelResponse(
+        role=data.get("role"),
+        content=data.get("content"),
+        tool_calls=data.get("tool_calls") or [],
+        event=data.get("event") or ModelResponse().event,
+        provider_data=data.get("provider_data"),
+        reasoning_content=data.get("reasoning_content"),
+        redacted_reasoning_content=data.get("redacted_reasoning_content"),
+        citations=Citations(**data["citations"]) if data.get("citations") else None,
+        extra=data.get("extra"),
+    )
+
+
+def _cosine_similarity(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class ResponseCache:
+    """Cache of model responses.
+
+    A response is stored as the list of responses the provider returned for one call: a single response for
+    `invoke`, or every delta for `invoke_stream`, which are replayed in order on a hit. Responses are stored in the
+    given db when it supports caching, and otherwise in an in-process LRU. Replayed responses have no usage
+    metrics, since no tokens were spent on them.
+
+    With an embedder, a call that misses the exact cache is matched against earlier calls that only differ in the
+    content of their last message, and served from the most similar one if its similarity is at least
+    `similarity_threshold`.
+    """
+
+    def __init__(
+        self,
+        db: Optional["BaseDb"] = None,
+        ttl: Optional[int] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        embedder: Optional["Embedder"] = None,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ):
+        self.db = db
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+
+        self._entries: "OrderedDict[str, Tuple[Optional[float], List[ModelResponse]]]" = OrderedDict()
+        # Embeddings of the last message of cached calls, by the context they were made in
+        self._semantic_index: "OrderedDict[str, List[Tuple[List[float], str]]]" = OrderedDict()
+        self._embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = Lock()
+
+        self.hits: int = 0
+        self.semantic_hits: int = 0
+        self.misses: int = 0
+
+    def _record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @staticmethod
+    def _replay(responses: List[ModelResponse]) -> List[ModelResponse]:
+        replayed = deepcopy(responses)
+        for response in replayed:
+            response.response_usage = None
+        return replayed
+
+    def _get_entry(self, key: str) -> Optional[List[ModelResponse]]:
+        if self.db is not None:
+            try:
+                data = self.db.get_cache_entry(key)
+                if data is None:
+                    return None
+                return [response_from_dict(response) for response in data.get("responses", [])]
+            except NotImplementedError:
+                pass
+            except Exception as e:
+                log_warning(f"Error reading cached model response: {e}")
+                return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= time.time():
+                self._entries.pop(key)
+                entry = None
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def _set_entry(self, key: str, responses: List[ModelResponse]) -> None:
+        if self.db is not None:
+            serialized = [response_to_dict(response) for response in responses]
+            if all(data is not None for data in serialized):
+                try:
+                    self.db.set_cache_entry(key, {"responses": serialized}, ttl=self.ttl)
+                    return
+                except NotImplementedError:
+                    log_debug("Db does not support caching, caching model response in memory")
+                except Exception as e:
+                    log_warning(f"Error caching model response: {e}")
+                    return
+            else:
+                log_debug("Model response can't be serialized, caching it in memory")
+
+        with self._lock:
+            expires_at = time.time() + self.ttl if self.ttl is not None else None
+            self._entries[key] = (expires_at, deepcopy(responses))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _find_similar(self, context_key: str, embedding: List[float]) -> Optional[str]:
+        with self._lock:
+            candidates = list(self._semantic_index.get(context_key, []))
+        best_key, best_similarity = None, self.similarity_threshold
+        for candidate_embedding, key in candidates:
+            similarity = _cosine_similarity(embedding, candidate_embedding)
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+        return best_key
+
+    def _index(self, context_key: str, embedding: List[float], key: str) -> None:
+        with self._lock:
+            entries = self._semantic_index.setdefault(context_key, [])
+            entries.append((embedding, key))
+            del entries[: -self.max_entries]
+            self._semantic_index.move_to_end(context_key)
+            while len(self._semantic_index) > self.max_entries:
+                self._semantic_index.popitem(last=False)
+
+    def _get_semantic(self, context_key: str, embedding: Optional[List[float]]) -> Optional[List[ModelResponse]]:
+        if not embedding:
+            return None
+        similar_key = self._find_similar(context_key, embedding)
+        if similar_key is None:
+            return None
+        responses = self._get_entry(similar_key)
+        if responses is not None:
+            with self._lock:
+                self.semantic_hits += 1
+        return responses
+
+    @staticmethod
+    def _get_prompt(messages: List[Message]) -> Optional[str]:
+        if not messages:
+            return None
+        return messages[-1].get_content_string() or None
+
+    def _get_cached_embedding(self, prompt: str) -> Optional[List[float]]:
+        with self._lock:
+            embedding = self._embeddings.get(prompt)
+            if embedding is not None:
+                self._embeddings.move_to_end(prompt)
+            return embedding
+
+    def _cache_embedding(self, prompt: str, embedding: List[float]) -> None:
+        with self._lock:
+            self._embeddings[prompt] = embedding
+            self._embeddings.move_to_end(prompt)
+            while len(self._embeddings) > EMBEDDING_CACHE_SIZE:
+                self._embeddings.popitem(last=False)
+
+    def _get_embedding(self, messages: List[Message]) -> Optional[List[float]]:
+        prompt = self._get_prompt(messages)
+        if self.embedder is None or prompt is None:
+            return None
+        embedding = self._get_cached_embedding(prompt)
+        if embedding is not None:
+            return embedding
+        try:
+            embedding = self.embedder.get_embedding(prompt)
+        except Exception as e:
+            log_warning(f"Error embedding prompt for the model response cache: {e}")
+            return None
+        if embedding:
+            self._cache_embedding(prompt, embedding)
+        return embedding
+
+    async def _aget_embedding(self, messages: List[Message]) -> Optional[List[float]]:
+        prompt = self._get_prompt(messages)
+        if self.embedder is None or prompt is None:
+            return None
+        embedding = self._get_cached_embedding(prompt)
+        if embedding is not None:
+            return embedding
+        try:
+            embedding = await self.embedder.async_get_embedding(prompt)
+        except Exception as e:
+            log_warning(f"Error embedding prompt for the model response cache: {e}")
+            return None
+        if embedding:
+            self._cache_embedding(prompt, embedding)
+        return embedding
+
+    def get(
+        self, key: str, messages: List[Message], context_key: Optional[str] = None
+    ) -> Optional[List[ModelResponse]]:
+        """Return the cached responses for a call, or None on a miss."""
+        responses = self._get_entry(key)
+        if responses is None and self.embedder is not None and context_key is not None:
+            responses = self._get_semantic(context_key, self._get_embedding(messages))
+        self._record(responses is not None)
+        return self._replay(responses) if responses is not None else None
+
+    async def aget(
+        self, key: str, messages: List[Message], context_key: Optional[str] = None
+    ) -> Optional[List[ModelResponse]]:
+        responses = self._get_entry(key)
+        if responses is None and self.embedder is not None and context_key is not None:
+            responses = self._get_semantic(context_key, await self._aget_embedding(messages))
+        self._record(responses is not None)
+        return self._replay(responses) if responses is not None else None
+
+    def set(
+        self,
+        key: str,
+        responses: List[ModelResponse],
+        messages: List[Message],
+        context_key: Optional[str] = None,
+    ) -> None:
+        """Cache the responses of a call."""
+        self._set_entry(key, responses)
+        if self.embedder is not None and context_key is not None:
+            embedding = self._get_embedding(messages)
+            if embedding:
+                self._index(context_key, embedding, key)
+
+    async def aset(
+        self,
+        key: str,
+        responses: List[ModelResponse],
+        messages: List[Message],
+        context_key: Optional[str] = None,
+    ) -> None:
+        self._set_entry(key, responses)
+        if self.embedder is not None and context_key is not None:
+            embedding = await self._aget_embedding(messages)
+            if embedding:
+                self._index(context_key, embedding, key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._semantic_index.clear()
+            self._embeddings.clear()
+            self.hits = 0
+            self.semantic_hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+            }
+
+
+_response_cache = ResponseCache()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide model response cache."""
+    return _response_cache
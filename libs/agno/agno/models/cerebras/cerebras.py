@@ -12,6 +12,7 @@ from agno.models.message import Message
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse
 from agno.run.agent import RunOutput
+from agno.utils.http import get_async_http_client, get_http_client
 from agno.utils.log import log_debug, log_error, log_warning
 
 try:
@@ -108,6 +109,8 @@ class Cerebras(Model):
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client is not None:
             client_params["http_client"] = self.http_client
+        else:
+            client_params["http_client"] = get_http_client(base_url=self.base_url, scope=self.provider)
         self.client = CerebrasClient(**client_params)
         return self.client
 
@@ -125,10 +128,8 @@ class Cerebras(Model):
         if self.http_client:
             client_params["http_client"] = self.http_client
         else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
+            # Use the shared async HTTP client for the provider
+            client_params["http_client"] = get_async_http_client(base_url=self.base_url, scope=self.provider)
         self.async_client = AsyncCerebrasClient(**client_params)
         return self.async_client
 
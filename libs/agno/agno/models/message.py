@@ -120,6 +120,14 @@ class Message(BaseModel):
                 return json.dumps(self.content)
         return ""
 
+    def load_media_content(self) -> None:
+        """Load the content of media stored in the blob store, so that the message can be sent to a model again."""
+        for media in [*(self.images or []), *(self.audio or []), *(self.videos or [])]:
+            media.get_content()
+        for output in (self.audio_output, self.image_output, self.video_output):
+            if output is not None:
+                output.get_content()
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Message":
         # Handle image reconstruction properly
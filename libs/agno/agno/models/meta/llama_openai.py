@@ -2,8 +2,6 @@ from dataclasses import dataclass, field
 from os import getenv
 from typing import Any, Dict, Optional
 
-import httpx
-
 try:
     from openai import AsyncOpenAI as AsyncOpenAIClient
 except ImportError:
@@ -11,6 +9,7 @@ except ImportError:
 
 from agno.models.meta.llama import Message
 from agno.models.openai.like import OpenAILike
+from agno.utils.http import get_async_http_client
 from agno.utils.models.llama import format_message
 
 
@@ -65,10 +64,8 @@ class LlamaOpenAI(OpenAILike):
         client_params = self._get_client_params()
 
         # Llama gives a 307 redirect error, so we need to set up a custom client to allow redirects
-        client_params["http_client"] = httpx.AsyncClient(
-            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
-            follow_redirects=True,
-            timeout=httpx.Timeout(30.0),
+        client_params["http_client"] = get_async_http_client(
+            base_url=self.base_url, follow_redirects=True, scope=self.provider
         )
 
         return AsyncOpenAIClient(**client_params)
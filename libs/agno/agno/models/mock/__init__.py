@@ -0,0 +1,6 @@
+from agno.models.mock.chat import MockModel, MockResponse
+
+__all__ = [
+    "MockModel",
+    "MockResponse",
+]
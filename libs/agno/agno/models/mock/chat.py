@@ -0,0 +1,297 @@
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ModelResponse
+from agno.run.agent import RunOutput
+
+TOKEN_PATTERN = re.compile(r"\s*\S+")
+
+
+@dataclass
+class MockResponse:
+    """A scripted turn of the MockModel"""
+
+    # Text of the answer. Dicts and Pydantic models are sent as JSON, for agents with an output schema
+    content: Optional[Union[str, Dict[str, Any], BaseModel]] = None
+    # Tool calls, as {"name": ..., "arguments": {...}}. The agent runs them and calls the model again
+    tool_calls: List[Dict[str, Any]] = field(default_factory=list)
+    reasoning_content: Optional[str] = None
+    # Overrides the latency of the model for this turn
+    latency: Optional[float] = None
+    # Raised instead of answering, to script provider failures
+    error: Optional[Exception] = None
+
+
+MockScriptItem = Union[str, MockResponse, Callable[[List[Message]], Union[str, MockResponse]]]
+
+
+def _count_tokens(text: Optional[str]) -> int:
+    return len(TOKEN_PATTERN.findall(text)) if text else 0
+
+
+@dataclass
+class MockModel(Model):
+    """
+    An offline, deterministic model that replays scripted responses.
+
+    Each call to the model answers with the next item of `responses`: a string, a MockResponse with tool calls,
+    or a callable that receives the messages and returns either. Once the script is exhausted the model answers
+    with `default_response`, or starts over if `cycle` is set. Answers start after `latency` seconds and, if
+    `tokens_per_second` is set, stream at that rate, so that benchmarks measure agno's own overhead with a stable
+    and configurable model time. Tokens are whitespace separated words.
+    """
+
+    id: str = "mock"
+    name: str = "Mock"
+    provider: str = "Mock"
+
+    # Scripted responses, in order
+    responses: List[MockScriptItem] = field(default_factory=list)
+    # Answer once the script is exhausted
+    default_response: str = "This is a mock response."
+    # Start the script over once it is exhausted
+    cycle: bool = False
+    # Seconds before the first token
+    latency: float = 0.0
+    # Output rate. None sends the whole answer at once
+    tokens_per_second: Optional[float] = None
+    # Number of tokens in each streamed chunk
+    tokens_per_chunk: int = 1
+
+    # Record the messages received by each call in `calls`, most recent last. Off by default, as the list grows
+    # with every call
+    record_calls: bool = False
+    calls: List[List[Message]] = field(default_factory=list)
+
+    _script_lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+    _position: int = 0
+    _tool_call_count: int = 0
+
+    def __deepcopy__(self, memo):
+        new_model = super().__deepcopy__(memo)
+        # Locks can't be copied, give the copy its own
+        new_model._script_lock = Lock()
+        return new_model
+
+    def reset(self) -> None:
+        """Rewind the script and forget the recorded calls"""
+        with self._script_lock:
+            self._position = 0
+            self._tool_call_count = 0
+            self.calls = []
+
+    def _next_response(self, messages: List[Message]) -> MockResponse:
+        with self._script_lock:
+            if self.record_calls:
+                self.calls.append(list(messages))
+            if self.cycle and self.responses:
+                item: Optional[MockScriptItem] = self.responses[self._position % len(self.responses)]
+            else:
+                item = self.responses[self._position] if self._position < len(self.responses) else None
+            self._position += 1
+
+        if callable(item):
+            item = item(messages)
+        if item is None:
+            item = self.default_response
+        if isinstance(item, str):
+            item = MockResponse(content=item)
+        if item.error is not None:
+            raise item.error
+        return item
+
+    def _get_tool_calls(self, response: MockResponse) -> List[Dict[str, Any]]:
+        tool_calls = []
+        for tool_call in response.tool_calls:
+            with self._script_lock:
+                self._tool_call_count += 1
+                tool_call_id = tool_call.get("id") or f"call_{self._tool_call_count}"
+            arguments = tool_call.get("arguments") or {}
+            tool_calls.append(
+                {
+                    "id": tool_call_id,
+                    "type": "function",
+                    "function": {
+                        "name": tool_call["name"],
+                        "arguments": arguments if isinstance(arguments, str) else json.dumps(arguments),
+                    },
+                }
+            )
+        return tool_calls
+
+    @staticmethod
+    def _get_content(response: MockResponse) -> Optional[str]:
+        if isinstance(response.content, BaseModel):
+            return response.content.model_dump_json()
+        if isinstance(response.content, dict):
+            return json.dumps(response.content)
+        return response.content
+
+    def _get_chunks(self, content: Optional[str]) -> List[str]:
+        if not content:
+            return []
+        tokens = TOKEN_PATTERN.findall(content)
+        # Keep trailing whitespace, so that the chunks add up to the content
+        tokens[-1] += content[len("".join(tokens)) :]
+        size = max(1, self.tokens_per_chunk)
+        return ["".join(tokens[i : i + size]) for i in range(0, len(tokens), size)]
+
+    def _get_latency(self, response: MockResponse) -> float:
+        return response.latency if response.latency is not None else self.latency
+
+    def _get_generation_time(self, num_tokens: int) -> float:
+        return num_tokens / self.tokens_per_second if self.tokens_per_second else 0.0
+
+    def _get_metrics(self, messages: List[Message], content: Optional[str]) -> Metrics:
+        input_tokens = sum(_count_tokens(m.get_content_string()) for m in messages)
+        output_tokens = _count_tokens(content)
+        return Metrics(
+            input_tokens=input_tokens, output_tokens=output_tokens, total_tokens=input_tokens + output_tokens
+        )
+
+    def invoke(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> ModelResponse:
+        """
+        Answer with the next scripted response.
+        """
+        if run_response and run_response.metrics:
+            run_response.metrics.set_time_to_first_token()
+
+        assistant_message.metrics.start_timer()
+        response = self._next_response(messages)
+        content = self._get_content(response)
+        delay = self._get_latency(response) + self._get_generation_time(_count_tokens(content))
+        if delay > 0:
+            time.sleep(delay)
+        assistant_message.metrics.stop_timer()
+
+        return self._parse_provider_response(response, messages=messages)
+
+    async def ainvoke(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> ModelResponse:
+        """
+        Answer with the next scripted response asynchronously.
+        """
+        if run_response and run_response.metrics:
+            run_response.metrics.set_time_to_first_token()
+
+        assistant_message.metrics.start_timer()
+        response = self._next_response(messages)
+        content = self._get_content(response)
+        delay = self._get_latency(response) + self._get_generation_time(_count_tokens(content))
+        if delay > 0:
+            await asyncio.sleep(delay)
+        assistant_message.metrics.stop_timer()
+
+        return self._parse_provider_response(response, messages=messages)
+
+    def _get_deltas(self, response: MockResponse, messages: List[Message]) -> Iterator[Dict[str, Any]]:
+        """Chunks of the streamed response, the last one with the tool calls and usage"""
+        content = self._get_content(response)
+        if response.reasoning_content:
+            yield {"reasoning_content": response.reasoning_content}
+        for chunk in self._get_chunks(content):
+            yield {"content": chunk, "tokens": _count_tokens(chunk)}
+        yield {"tool_calls": self._get_tool_calls(response), "usage": self._get_metrics(messages, content)}
+
+    def invoke_stream(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> Iterator[ModelResponse]:
+        """
+        Stream the next scripted response, chunk by chunk at the configured token rate.
+        """
+        if run_response and run_response.metrics:
+            run_response.metrics.set_time_to_first_token()
+
+        assistant_message.metrics.start_timer()
+        response = self._next_response(messages)
+        if self._get_latency(response) > 0:
+            time.sleep(self._get_latency(response))
+        for delta in self._get_deltas(response, messages):
+            if self.tokens_per_second:
+                time.sleep(self._get_generation_time(delta.get("tokens", 0)))
+            yield self._parse_provider_response_delta(delta)
+
+        assistant_message.metrics.stop_timer()
+
+    async def ainvoke_stream(
+        self,
+        messages: List[Message],
+        assistant_message: Message,
+        response_format: Optional[Union[Dict, Type[BaseModel]]] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
+        run_response: Optional[RunOutput] = None,
+    ) -> AsyncIterator[ModelResponse]:
+        """
+        Stream the next scripted response asynchronously.
+        """
+        if run_response and run_response.metrics:
+            run_response.metrics.set_time_to_first_token()
+
+        assistant_message.metrics.start_timer()
+        response = self._next_response(messages)
+        if self._get_latency(response) > 0:
+            await asyncio.sleep(self._get_latency(response))
+        for delta in self._get_deltas(response, messages):
+            if self.tokens_per_second:
+                await asyncio.sleep(self._get_generation_time(delta.get("tokens", 0)))
+            yield self._parse_provider_response_delta(delta)
+
+        assistant_message.metrics.stop_timer()
+
+    def _parse_provider_response(self, response: MockResponse, **kwargs) -> ModelResponse:
+        """
+        Parse a scripted response.
+        """
+        model_response = ModelResponse(role=self.assistant_message_role)
+        model_response.content = self._get_content(response)
+        model_response.reasoning_content = response.reasoning_content
+        model_response.tool_calls = self._get_tool_calls(response)
+        model_response.response_usage = self._get_metrics(kwargs.get("messages") or [], model_response.content)
+        return model_response
+
+    def _parse_provider_response_delta(self, response: Dict[str, Any]) -> ModelResponse:
+        """
+        Parse a chunk of a streamed scripted response.
+        """
+        model_response = ModelResponse()
+        if response.get("content"):
+            model_response.content = response["content"]
+        if response.get("reasoning_content"):
+            model_response.reasoning_content = response["reasoning_content"]
+        if response.get("tool_calls"):
+            model_response.tool_calls = response["tool_calls"]
+        if response.get("usage") is not None:
+            model_response.response_usage = response["usage"]
+        return model_response
@@ -14,6 +14,7 @@ from agno.models.message import Message
 from agno.models.metrics import Metrics
 from agno.models.response import ModelResponse
 from agno.run.agent import RunOutput
+from agno.utils.http import get_async_http_client, get_http_client
 from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.openai import _format_file_for_message, audio_to_message, images_to_message
 from agno.utils.reasoning import extract_thinking_content
@@ -129,6 +130,8 @@ class OpenAIChat(Model):
                 client_params["http_client"] = self.http_client
             else:
                 log_warning("http_client is not an instance of httpx.Client.")
+        else:
+            client_params["http_client"] = get_http_client(base_url=self.base_url, scope=self.provider)
         return OpenAIClient(**client_params)
 
     def get_async_client(self) -> AsyncOpenAIClient:
@@ -144,15 +147,11 @@ class OpenAIChat(Model):
                 client_params["http_client"] = self.http_client
             else:
                 log_warning("http_client is not an instance of httpx.AsyncClient. Using default httpx.AsyncClient.")
-                # Create a new async HTTP client with custom limits
-                client_params["http_client"] = httpx.AsyncClient(
-                    limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-                )
+                # Use the shared async HTTP client for the provider
+                client_params["http_client"] = get_async_http_client(base_url=self.base_url, scope=self.provider)
         else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
+            # Use the shared async HTTP client for the provider
+            client_params["http_client"] = get_async_http_client(base_url=self.base_url, scope=self.provider)
         return AsyncOpenAIClient(**client_params)
 
     def get_request_params(
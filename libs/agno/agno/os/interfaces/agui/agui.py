@@ -21,6 +21,8 @@ class AGUI(BaseInterface):
         team: Optional[Team] = None,
         prefix: str = "",
         tags: Optional[List[str]] = None,
+        forward_new_messages_only: bool = True,
+        send_messages_snapshot: bool = False,
     ):
         """
         Initialize the AGUI interface.
@@ -30,11 +32,17 @@ class AGUI(BaseInterface):
             team: The team to expose via AG-UI
             prefix: Custom prefix for the router (e.g., "/agui/v1", "/chat/public")
             tags: Custom tags for the router (e.g., ["AGUI", "Chat"], defaults to ["AGUI"])
+            forward_new_messages_only: When the agent or team adds history to its context, only run it with the
+                messages of the thread that are not stored in its session yet
+            send_messages_snapshot: Send the transcript of the thread, read from the session, in a
+                MESSAGES_SNAPSHOT event when a run starts. Clients can then send only their new messages
         """
         self.agent = agent
         self.team = team
         self.prefix = prefix
         self.tags = tags or ["AGUI"]
+        self.forward_new_messages_only = forward_new_messages_only
+        self.send_messages_snapshot = send_messages_snapshot
 
         if not (self.agent or self.team):
             raise ValueError("AGUI requires an agent or a team")
@@ -42,6 +50,12 @@ class AGUI(BaseInterface):
     def get_router(self) -> APIRouter:
         self.router = APIRouter(prefix=self.prefix, tags=self.tags)  # type: ignore
 
-        self.router = attach_routes(router=self.router, agent=self.agent, team=self.team)
+        self.router = attach_routes(
+            router=self.router,
+            agent=self.agent,
+            team=self.team,
+            forward_new_messages_only=self.forward_new_messages_only,
+            send_messages_snapshot=self.send_messages_snapshot,
+        )
 
         return self.router
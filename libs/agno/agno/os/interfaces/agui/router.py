@@ -2,11 +2,12 @@
 
 import logging
 import uuid
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, List, Optional, Tuple, Union
 
 from ag_ui.core import (
     BaseEvent,
     EventType,
+    MessagesSnapshotEvent,
     RunAgentInput,
     RunErrorEvent,
     RunStartedEvent,
@@ -16,23 +17,92 @@ from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
 
 from agno.agent.agent import Agent
+from agno.models.message import Message
 from agno.os.interfaces.agui.utils import (
     async_stream_agno_response_as_agui_events,
+    convert_agno_messages_to_agui_messages,
     convert_agui_messages_to_agno_messages,
+    get_new_agui_messages,
 )
+from agno.session import AgentSession, TeamSession
 from agno.team.team import Team
 
 logger = logging.getLogger(__name__)
 
 
-async def run_agent(agent: Agent, run_input: RunAgentInput) -> AsyncIterator[BaseEvent]:
+def get_session_messages(
+    entity: Union[Agent, Team], session: Union[AgentSession, TeamSession], last_n: Optional[int] = None
+) -> List[Message]:
+    """Messages of the last_n runs of the session, as the Agent or Team reads them into its history."""
+    if isinstance(entity, Agent):
+        return session.get_messages_from_last_n_runs(
+            last_n=last_n, agent_id=entity.id if entity.team_id is not None else None
+        )
+    return session.get_messages_from_last_n_runs(
+        last_n=last_n, team_id=entity.id if entity.parent_team_id is not None else None
+    )
+
+
+def prepare_input_messages(
+    entity: Union[Agent, Team],
+    run_input: RunAgentInput,
+    forward_new_messages_only: bool = True,
+    send_messages_snapshot: bool = False,
+) -> Tuple[List[Message], Optional[MessagesSnapshotEvent]]:
+    """Select the messages to run the Agent or Team with, and build the snapshot of the thread to send back.
+
+    AG-UI clients send the whole transcript of the thread on every request. When the Agent or Team adds the history
+    of the thread to its context, the messages already stored in its session are not forwarded again.
+    """
+    messages = run_input.messages or []
+    use_history = forward_new_messages_only and entity.add_history_to_context
+    if not (use_history or send_messages_snapshot) or entity.db is None:
+        return convert_agui_messages_to_agno_messages(messages), None
+
+    session = entity.get_session(session_id=run_input.thread_id)
+    if session is None:
+        return convert_agui_messages_to_agno_messages(messages), None
+
+    snapshot = None
+    if send_messages_snapshot:
+        # The transcript is served from the session, followed by the new messages of the request
+        transcript = get_session_messages(entity, session)
+        snapshot = MessagesSnapshotEvent(
+            type=EventType.MESSAGES_SNAPSHOT,
+            messages=convert_agno_messages_to_agui_messages(transcript, id_prefix=run_input.thread_id)
+            + get_new_agui_messages(messages, transcript),
+        )
+
+    if use_history:
+        # Only the messages after the history read by the Agent or Team are new to it
+        last_n: Optional[int] = entity.num_history_runs
+        if isinstance(entity, Agent) and entity.max_history_tokens is not None:
+            last_n = None
+        messages = get_new_agui_messages(messages, get_session_messages(entity, session, last_n=last_n))
+
+    return convert_agui_messages_to_agno_messages(messages), snapshot
+
+
+async def run_agent(
+    agent: Agent,
+    run_input: RunAgentInput,
+    forward_new_messages_only: bool = True,
+    send_messages_snapshot: bool = False,
+) -> AsyncIterator[BaseEvent]:
     """Run the contextual Agent, mapping AG-UI input messages to Agno format, and streaming the response in AG-UI format."""
     run_id = run_input.run_id or str(uuid.uuid4())
 
     try:
         # Preparing the input for the Agent and emitting the run started event
-        messages = convert_agui_messages_to_agno_messages(run_input.messages or [])
+        messages, snapshot = prepare_input_messages(
+            agent,
+            run_input,
+            forward_new_messages_only=forward_new_messages_only,
+            send_messages_snapshot=send_messages_snapshot,
+        )
         yield RunStartedEvent(type=EventType.RUN_STARTED, thread_id=run_input.thread_id, run_id=run_id)
+        if snapshot is not None:
+            yield snapshot
 
         # Look for user_id in run_input.forwarded_props
         user_id = None
@@ -62,13 +132,25 @@ async def run_agent(agent: Agent, run_input: RunAgentInput) -> AsyncIterator[Bas
         yield RunErrorEvent(type=EventType.RUN_ERROR, message=str(e))
 
 
-async def run_team(team: Team, input: RunAgentInput) -> AsyncIterator[BaseEvent]:
+async def run_team(
+    team: Team,
+    input: RunAgentInput,
+    forward_new_messages_only: bool = True,
+    send_messages_snapshot: bool = False,
+) -> AsyncIterator[BaseEvent]:
     """Run the contextual Team, mapping AG-UI input messages to Agno format, and streaming the response in AG-UI format."""
     run_id = input.run_id or str(uuid.uuid4())
     try:
-        # Extract the last user message for team execution
-        messages = convert_agui_messages_to_agno_messages(input.messages or [])
+        # Extract the new messages for team execution
+        messages, snapshot = prepare_input_messages(
+            team,
+            input,
+            forward_new_messages_only=forward_new_messages_only,
+            send_messages_snapshot=send_messages_snapshot,
+        )
         yield RunStartedEvent(type=EventType.RUN_STARTED, thread_id=input.thread_id, run_id=run_id)
+        if snapshot is not None:
+            yield snapshot
 
         # Look for user_id in input.forwarded_props
         user_id = None
@@ -95,7 +177,13 @@ async def run_team(team: Team, input: RunAgentInput) -> AsyncIterator[BaseEvent]
         yield RunErrorEvent(type=EventType.RUN_ERROR, message=str(e))
 
 
-def attach_routes(router: APIRouter, agent: Optional[Agent] = None, team: Optional[Team] = None) -> APIRouter:
+def attach_routes(
+    router: APIRouter,
+    agent: Optional[Agent] = None,
+    team: Optional[Team] = None,
+    forward_new_messages_only: bool = True,
+    send_messages_snapshot: bool = False,
+) -> APIRouter:
     if agent is None and team is None:
         raise ValueError("Either agent or team must be provided.")
 
@@ -105,11 +193,21 @@ def attach_routes(router: APIRouter, agent: Optional[Agent] = None, team: Option
     async def run_agent_agui(run_input: RunAgentInput):
         async def event_generator():
             if agent:
-                async for event in run_agent(agent, run_input):
+                async for event in run_agent(
+                    agent,
+                    run_input,
+                    forward_new_messages_only=forward_new_messages_only,
+                    send_messages_snapshot=send_messages_snapshot,
+                ):
                     encoded_event = encoder.encode(event)
                     yield encoded_event
             elif team:
-                async for event in run_team(team, run_input):
+                async for event in run_team(
+                    team,
+                    run_input,
+                    forward_new_messages_only=forward_new_messages_only,
+                    send_messages_snapshot=send_messages_snapshot,
+                ):
                     encoded_event = encoder.encode(event)
                     yield encoded_event
 
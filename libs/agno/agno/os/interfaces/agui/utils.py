@@ -4,21 +4,26 @@ import json
 import uuid
 from collections.abc import Iterator
 from dataclasses import dataclass
-from typing import AsyncIterator, List, Set, Tuple, Union
+from typing import Any, AsyncIterator, List, Optional, Set, Tuple, Union
 
 from ag_ui.core import (
+    AssistantMessage,
     BaseEvent,
     EventType,
+    FunctionCall,
     RunFinishedEvent,
     StepFinishedEvent,
     StepStartedEvent,
     TextMessageContentEvent,
     TextMessageEndEvent,
     TextMessageStartEvent,
+    ToolCall,
     ToolCallArgsEvent,
     ToolCallEndEvent,
     ToolCallResultEvent,
     ToolCallStartEvent,
+    ToolMessage,
+    UserMessage,
 )
 from ag_ui.core.types import Message as AGUIMessage
 
@@ -101,6 +106,94 @@ def convert_agui_messages_to_agno_messages(messages: List[AGUIMessage]) -> List[
     return result
 
 
+def convert_agno_messages_to_agui_messages(messages: List[Message], id_prefix: str) -> List[AGUIMessage]:
+    """Convert stored Agno messages to AG-UI messages, skipping system messages.
+
+    Stored messages have no ID, so each one is identified by its position: `{id_prefix}-{position}`.
+    """
+    result: List[AGUIMessage] = []
+    for i, msg in enumerate(messages):
+        message_id = f"{id_prefix}-{i}"
+        if msg.role == "user":
+            result.append(UserMessage(id=message_id, role="user", content=msg.get_content_string()))
+        elif msg.role == "assistant":
+            tool_calls = None
+            if msg.tool_calls:
+                tool_calls = []
+                for call in msg.tool_calls:
+                    function = call.get("function") or {}
+                    arguments = function.get("arguments") or ""
+                    tool_calls.append(
+                        ToolCall(
+                            id=call.get("id") or "",
+                            type="function",
+                            function=FunctionCall(
+                                name=function.get("name") or "",
+                                arguments=arguments if isinstance(arguments, str) else json.dumps(arguments),
+                            ),
+                        )
+                    )
+            result.append(
+                AssistantMessage(
+                    id=message_id,
+                    role="assistant",
+                    content=msg.get_content_string() or None,
+                    tool_calls=tool_calls,
+                )
+            )
+        elif msg.role == "tool":
+            result.append(
+                ToolMessage(
+                    id=message_id,
+                    role="tool",
+                    content=msg.get_content_string(),
+                    tool_call_id=msg.tool_call_id or "",
+                )
+            )
+    return result
+
+
+def _get_input_key(role: str, content: Any, tool_call_id: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Identify an input message (a user message or a tool result) in both the AG-UI transcript and the session."""
+    if role == "tool" and tool_call_id:
+        return ("tool", tool_call_id)
+    if role == "user" and isinstance(content, str):
+        return ("user", content)
+    return None
+
+
+def get_new_agui_messages(messages: List[AGUIMessage], stored_messages: List[Message]) -> List[AGUIMessage]:
+    """Select the messages of an AG-UI transcript that are not stored in the session of the thread yet.
+
+    The input messages of the transcript (user messages and tool results) are matched, in order, to the stored ones.
+    The new messages are the ones after the last match, without the assistant messages among them, which echo
+    responses already stored. When nothing matches, the whole transcript is new.
+    """
+    stored_keys = [_get_input_key(msg.role, msg.content, msg.tool_call_id) for msg in stored_messages]
+    position = 0
+    last_stored = -1
+    for i, msg in enumerate(messages):
+        key = _get_input_key(msg.role, getattr(msg, "content", None), getattr(msg, "tool_call_id", None))
+        if key is None:
+            continue
+        try:
+            position = stored_keys.index(key, position) + 1
+        except ValueError:
+            continue
+        last_stored = i
+
+    if last_stored < 0:
+        return messages
+
+    new_messages = messages[last_stored + 1 :]
+    for i in range(len(new_messages) - 1, -1, -1):
+        if new_messages[i].role == "assistant":
+            new_messages = new_messages[i + 1 :]
+            break
+    # Without new input, e.g. to regenerate a response, the last message is sent again
+    return new_messages or messages[-1:]
+
+
 def extract_team_response_chunk_content(response: TeamRunContentEvent) -> str:
     """Given a response stream chunk, find and extract the content."""
 
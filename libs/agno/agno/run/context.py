@@ -0,0 +1,128 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Dict, Generic, Iterator, List, Mapping, Optional, TypeVar, overload
+
+from agno.utils.log import log_warning
+
+T = TypeVar("T")
+
+
+@dataclass
+class RunContext:
+    """State an Agent or Team builds for a single run.
+
+    The agent definition is shared by every run of the agent, so anything a run prepares for the model (the tools
+    and the per-run copies of their functions) and the options resolved for the run live here instead, in the
+    context of the run that created it.
+    """
+
+    run_id: Optional[str] = None
+    stream: bool = False
+    stream_intermediate_steps: bool = False
+    tools_for_model: Optional[List[Dict[str, Any]]] = None
+    functions_for_model: Optional[Dict[str, Any]] = None
+    tool_instructions: Optional[List[str]] = None
+    rebuild_tools: bool = True
+
+
+# The active run context of each agent or team, keyed by the id of the agent or team
+_active_run_contexts: ContextVar[Mapping[int, RunContext]] = ContextVar("agno_run_contexts", default={})
+
+
+def get_run_context(owner: Any) -> RunContext:
+    """Return the context of the owner's current run, or its default context when called outside a run."""
+    run_context = _active_run_contexts.get().get(id(owner))
+    if run_context is not None:
+        return run_context
+
+    default_context = owner.__dict__.get("_default_run_context")
+    if default_context is None:
+        default_context = RunContext()
+        owner.__dict__["_default_run_context"] = default_context
+    return default_context
+
+
+@contextmanager
+def use_run_context(owner: Any, run_context: RunContext) -> Iterator[RunContext]:
+    """Make run_context the owner's current run context for the duration of the block."""
+    token = _active_run_contexts.set({**_active_run_contexts.get(), id(owner): run_context})
+    try:
+        yield run_context
+    finally:
+        try:
+            _active_run_contexts.reset(token)
+        except ValueError:
+            # The block was exited from a different context than it was entered in
+            log_warning("Run context was exited from a different context")
+
+
+async def await_with_run_context(owner: Any, run_context: RunContext, awaitable: Awaitable[T]) -> T:
+    """Await, with run_context as the owner's current run context."""
+    with use_run_context(owner, run_context):
+        return await awaitable
+
+
+def iterate_with_run_context(owner: Any, run_context: RunContext, iterator: Iterator[T]) -> Iterator[T]:
+    """Iterate, activating the run context only while the iterator is advanced.
+
+    Streams are consumed after run() has returned, possibly interleaved with other runs in the same thread, so the
+    context can't be held open across yields.
+    """
+    try:
+        while True:
+            with use_run_context(owner, run_context):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            with use_run_context(owner, run_context):
+                close()
+
+
+async def aiterate_with_run_context(
+    owner: Any, run_context: RunContext, iterator: AsyncIterator[T]
+) -> AsyncIterator[T]:
+    """Async version of iterate_with_run_context."""
+    try:
+        while True:
+            with use_run_context(owner, run_context):
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            with use_run_context(owner, run_context):
+                await aclose()
+
+
+class RunScopedAttribute(Generic[T]):
+    """Descriptor for an Agent or Team attribute that belongs to the current run.
+
+    Reads and writes go to the run context of the run in progress, so concurrent runs of the same instance don't
+    see each other's values.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.field = name.lstrip("_")
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> "RunScopedAttribute[T]": ...
+
+    @overload
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> T: ...
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        return getattr(get_run_context(instance), self.field)
+
+    def __set__(self, instance: Any, value: T) -> None:
+        setattr(get_run_context(instance), self.field, value)
@@ -179,6 +179,10 @@ class TeamSession:
                 else:
                     messages_from_history.append(message)
 
+        # Media offloaded to the blob store is only loaded for the messages that are sent to the model again
+        for message in messages_from_history:
+            message.load_media_content()
+
         log_debug(f"Getting messages from previous runs: {len(messages_from_history)}")
         return messages_from_history
 
@@ -57,11 +57,20 @@ from agno.run.cancel import (
     raise_if_cancelled,
     register_run,
 )
+from agno.run.context import (
+    RunContext,
+    RunScopedAttribute,
+    aiterate_with_run_context,
+    await_with_run_context,
+    iterate_with_run_context,
+    use_run_context,
+)
 from agno.run.messages import RunMessages
 from agno.run.team import TeamRunEvent, TeamRunInput, TeamRunOutput, TeamRunOutputEvent
 from agno.session import SessionSummaryManager, TeamSession
 from agno.tools import Toolkit
 from agno.tools.function import Function
+from agno.utils.blob_store import offload_media
 from agno.utils.common import is_typed_dict, validate_typed_dict
 from agno.utils.events import (
     create_team_memory_update_completed_event,
@@ -371,6 +380,15 @@ class Team:
     # This helps us improve the Teams implementation and provide better support
     telemetry: bool = True
 
+    # --- Run-scoped state ---
+    # Built by each run in its RunContext, so concurrent runs of the same Team don't share them
+    _tool_instructions = RunScopedAttribute[Optional[List[str]]]()
+    _tools_for_model = RunScopedAttribute[Optional[List[Dict[str, Any]]]]()
+    _functions_for_model = RunScopedAttribute[Optional[Dict[str, Function]]]()
+    _rebuild_tools = RunScopedAttribute[bool]()
+    _stream = RunScopedAttribute[bool]()
+    _stream_intermediate_steps = RunScopedAttribute[bool]()
+
     def __init__(
         self,
         members: List[Union[Agent, "Team"]],
@@ -599,9 +617,9 @@ class Team:
         # Team session
         self._team_session: Optional[TeamSession] = None
 
-        self._tool_instructions: Optional[List[str]] = None
-        self._functions_for_model: Optional[Dict[str, Function]] = None
-        self._tools_for_model: Optional[List[Dict[str, Any]]] = None
+        self._tool_instructions = None
+        self._functions_for_model = None
+        self._tools_for_model = None
 
         # True if we should parse a member response model
         self._member_response_model: Optional[Type[BaseModel]] = None
@@ -1607,9 +1625,6 @@ class Team:
         if stream is False:
             stream_intermediate_steps = False
 
-        self.stream = self.stream or stream
-        self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
-
         # Configure the model for runs
         response_format: Optional[Union[Dict, Type[BaseModel]]] = (
             self._get_response_format() if self.parser_model is None else None
@@ -1643,6 +1658,8 @@ class Team:
         retries = retries if retries is not None else self.retries
 
         # Run the team
+        run_context = RunContext(run_id=run_id, stream=stream, stream_intermediate_steps=stream_intermediate_steps)
+
         last_exception = None
         num_attempts = retries + 1
 
@@ -1652,42 +1669,47 @@ class Team:
             # Run the team
             try:
                 if stream:
-                    response_iterator = self._run_stream(
-                        run_response=run_response,
-                        session=team_session,
-                        session_state=session_state,
-                        user_id=user_id,
-                        knowledge_filters=effective_filters,
-                        add_history_to_context=add_history,
-                        add_dependencies_to_context=add_dependencies,
-                        add_session_state_to_context=add_session_state,
-                        metadata=metadata,
-                        dependencies=run_dependencies,
-                        response_format=response_format,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        workflow_context=workflow_context,
-                        yield_run_response=yield_run_response,
-                        debug_mode=debug_mode,
-                        **kwargs,
+                    response_iterator = iterate_with_run_context(
+                        self,
+                        run_context,
+                        self._run_stream(
+                            run_response=run_response,
+                            session=team_session,
+                            session_state=session_state,
+                            user_id=user_id,
+                            knowledge_filters=effective_filters,
+                            add_history_to_context=add_history,
+                            add_dependencies_to_context=add_dependencies,
+                            add_session_state_to_context=add_session_state,
+                            metadata=metadata,
+                            dependencies=run_dependencies,
+                            response_format=response_format,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                            workflow_context=workflow_context,
+                            yield_run_response=yield_run_response,
+                            debug_mode=debug_mode,
+                            **kwargs,
+                        ),
                     )
 
                     return response_iterator  # type: ignore
                 else:
-                    return self._run(
-                        run_response=run_response,
-                        session=team_session,
-                        session_state=session_state,
-                        user_id=user_id,
-                        knowledge_filters=effective_filters,
-                        add_history_to_context=add_history,
-                        add_dependencies_to_context=add_dependencies,
-                        add_session_state_to_context=add_session_state,
-                        metadata=metadata,
-                        dependencies=run_dependencies,
-                        response_format=response_format,
-                        debug_mode=debug_mode,
-                        **kwargs,
-                    )
+                    with use_run_context(self, run_context):
+                        return self._run(
+                            run_response=run_response,
+                            session=team_session,
+                            session_state=session_state,
+                            user_id=user_id,
+                            knowledge_filters=effective_filters,
+                            add_history_to_context=add_history,
+                            add_dependencies_to_context=add_dependencies,
+                            add_session_state_to_context=add_session_state,
+                            metadata=metadata,
+                            dependencies=run_dependencies,
+                            response_format=response_format,
+                            debug_mode=debug_mode,
+                            **kwargs,
+                        )
 
             except (InputCheckError, OutputCheckError) as e:
                 log_error(f"Validation failed: {str(e)} | Check: {e.check_trigger}")
@@ -2310,9 +2332,6 @@ class Team:
         if stream is False:
             stream_intermediate_steps = False
 
-        self.stream = self.stream or stream
-        self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
-
         # Configure the model for runs
         response_format: Optional[Union[Dict, Type[BaseModel]]] = (
             self._get_response_format() if self.parser_model is None else None
@@ -2347,6 +2366,8 @@ class Team:
         retries = retries if retries is not None else self.retries
 
         # Run the team
+        run_context = RunContext(run_id=run_id, stream=stream, stream_intermediate_steps=stream_intermediate_steps)
+
         last_exception = None
         num_attempts = retries + 1
 
@@ -2354,41 +2375,49 @@ class Team:
             # Run the team
             try:
                 if stream:
-                    response_iterator = self._arun_stream(
-                        run_response=run_response,
-                        session=team_session,  # type: ignore
-                        session_state=session_state,
-                        user_id=user_id,
-                        knowledge_filters=effective_filters,
-                        add_history_to_context=add_history,
-                        add_dependencies_to_context=add_dependencies,
-                        add_session_state_to_context=add_session_state,
-                        metadata=metadata,
-                        response_format=response_format,
-                        dependencies=run_dependencies,
-                        stream_intermediate_steps=stream_intermediate_steps,
-                        workflow_context=workflow_context,
-                        yield_run_response=yield_run_response,
-                        debug_mode=debug_mode,
-                        **kwargs,
+                    response_iterator = aiterate_with_run_context(
+                        self,
+                        run_context,
+                        self._arun_stream(
+                            run_response=run_response,
+                            session=team_session,  # type: ignore
+                            session_state=session_state,
+                            user_id=user_id,
+                            knowledge_filters=effective_filters,
+                            add_history_to_context=add_history,
+                            add_dependencies_to_context=add_dependencies,
+                            add_session_state_to_context=add_session_state,
+                            metadata=metadata,
+                            response_format=response_format,
+                            dependencies=run_dependencies,
+                            stream_intermediate_steps=stream_intermediate_steps,
+                            workflow_context=workflow_context,
+                            yield_run_response=yield_run_response,
+                            debug_mode=debug_mode,
+                            **kwargs,
+                        ),
                     )
                     return response_iterator  # type: ignore
                 else:
-                    return self._arun(  # type: ignore
-                        run_response=run_response,
-                        session=team_session,  # type: ignore
-                        user_id=user_id,
-                        session_state=session_state,
-                        knowledge_filters=effective_filters,
-                        add_history_to_context=add_history,
-                        add_dependencies_to_context=add_dependencies,
-                        add_session_state_to_context=add_session_state,
-                        metadata=metadata,
-                        response_format=response_format,
-                        dependencies=run_dependencies,
-                        workflow_context=workflow_context,
-                        debug_mode=debug_mode,
-                        **kwargs,
+                    return await_with_run_context(
+                        self,
+                        run_context,
+                        self._arun(  # type: ignore
+                            run_response=run_response,
+                            session=team_session,  # type: ignore
+                            user_id=user_id,
+                            session_state=session_state,
+                            knowledge_filters=effective_filters,
+                            add_history_to_context=add_history,
+                            add_dependencies_to_context=add_dependencies,
+                            add_session_state_to_context=add_session_state,
+                            metadata=metadata,
+                            response_format=response_format,
+                            dependencies=run_dependencies,
+                            workflow_context=workflow_context,
+                            debug_mode=debug_mode,
+                            **kwargs,
+                        ),
                     )
 
             except (InputCheckError, OutputCheckError) as e:
@@ -3021,7 +3050,7 @@ class Team:
                 )
 
             if futures:
-                if self.stream_intermediate_steps:
+                if self._stream_intermediate_steps:
                     yield self._handle_event(
                         create_team_memory_update_started_event(from_run_response=run_response), run_response
                     )
@@ -3033,7 +3062,7 @@ class Team:
                     except Exception as e:
                         log_warning(f"Error in memory/summary operation: {str(e)}")
 
-                if self.stream_intermediate_steps:
+                if self._stream_intermediate_steps:
                     yield self._handle_event(
                         create_team_memory_update_completed_event(from_run_response=run_response),
                         run_response,
@@ -3058,7 +3087,7 @@ class Team:
             tasks.append(self.session_summary_manager.acreate_session_summary(session=session))
 
         if tasks:
-            if self.stream_intermediate_steps:
+            if self._stream_intermediate_steps:
                 yield self._handle_event(
                     create_team_memory_update_started_event(from_run_response=run_response), run_response
                 )
@@ -3069,7 +3098,7 @@ class Team:
             except Exception as e:
                 log_warning(f"Error in memory/summary operation: {str(e)}")
 
-            if self.stream_intermediate_steps:
+            if self._stream_intermediate_steps:
                 yield self._handle_event(
                     create_team_memory_update_completed_event(from_run_response=run_response), run_response
                 )
@@ -3877,7 +3906,7 @@ class Team:
         run_response: TeamRunOutput,
         run_messages: RunMessages,
     ) -> Iterator[TeamRunOutputEvent]:
-        if self.stream_intermediate_steps:
+        if self._stream_intermediate_steps:
             yield self._handle_event(create_team_reasoning_started_event(from_run_response=run_response), run_response)
 
         use_default_reasoning = False
@@ -3963,7 +3992,7 @@ class Team:
                     reasoning_steps=[ReasoningStep(result=reasoning_message.content)],
                     reasoning_agent_messages=[reasoning_message],
                 )
-                if self.stream_intermediate_steps:
+                if self._stream_intermediate_steps:
                     yield self._handle_event(
                         create_team_reasoning_completed_event(
                             from_run_response=run_response,
@@ -4048,7 +4077,7 @@ class Team:
                     reasoning_steps: List[ReasoningStep] = reasoning_agent_response.content.reasoning_steps
                     all_reasoning_steps.extend(reasoning_steps)
                     # Yield reasoning steps
-                    if self.stream_intermediate_steps:
+                    if self._stream_intermediate_steps:
                         for reasoning_step in reasoning_steps:
                             updated_reasoning_content = self._format_reasoning_step_content(
                                 run_response, reasoning_step
@@ -4096,7 +4125,7 @@ class Team:
             )
 
             # Yield the final reasoning completed event
-            if self.stream_intermediate_steps:
+            if self._stream_intermediate_steps:
                 yield self._handle_event(
                     create_team_reasoning_completed_event(
                         from_run_response=run_response,
@@ -4111,7 +4140,7 @@ class Team:
         run_response: TeamRunOutput,
         run_messages: RunMessages,
     ) -> AsyncIterator[TeamRunOutputEvent]:
-        if self.stream_intermediate_steps:
+        if self._stream_intermediate_steps:
             yield self._handle_event(create_team_reasoning_started_event(from_run_response=run_response), run_response)
 
         use_default_reasoning = False
@@ -4196,7 +4225,7 @@ class Team:
                     reasoning_steps=[ReasoningStep(result=reasoning_message.content)],
                     reasoning_agent_messages=[reasoning_message],
                 )
-                if self.stream_intermediate_steps:
+                if self._stream_intermediate_steps:
                     yield self._handle_event(
                         create_team_reasoning_completed_event(
                             from_run_response=run_response,
@@ -4280,7 +4309,7 @@ class Team:
                     reasoning_steps: List[ReasoningStep] = reasoning_agent_response.content.reasoning_steps
                     all_reasoning_steps.extend(reasoning_steps)
                     # Yield reasoning steps
-                    if self.stream_intermediate_steps:
+                    if self._stream_intermediate_steps:
                         for reasoning_step in reasoning_steps:
                             updated_reasoning_content = self._format_reasoning_step_content(
                                 run_response, reasoning_step
@@ -4328,7 +4357,7 @@ class Team:
             )
 
             # Yield the final reasoning completed event
-            if self.stream_intermediate_steps:
+            if self._stream_intermediate_steps:
                 yield self._handle_event(
                     create_team_reasoning_completed_event(
                         from_run_response=run_response,
@@ -4614,8 +4643,8 @@ class Team:
                 team_run_context=team_run_context,
                 input=user_message,
                 user_id=user_id,
-                stream=self.stream or False,
-                stream_intermediate_steps=self.stream_intermediate_steps,
+                stream=self._stream,
+                stream_intermediate_steps=self._stream_intermediate_steps,
                 async_mode=async_mode,
                 images=images,  # type: ignore
                 videos=videos,  # type: ignore
@@ -4660,6 +4689,7 @@ class Team:
                 for name, func in tool.functions.items():
                     # If the function does not exist in self.functions
                     if name not in self._functions_for_model:
+                        func = func.copy_for_run()
                         func._team = self
                         func._session_state = session_state
                         func._dependencies = dependencies
@@ -4680,6 +4710,7 @@ class Team:
 
             elif isinstance(tool, Function):
                 if tool.name not in self._functions_for_model:
+                    tool = tool.copy_for_run()
                     tool._team = self
                     tool._session_state = session_state
                     tool._dependencies = dependencies
@@ -4716,11 +4747,15 @@ class Team:
                     log_warning(f"Could not add tool {tool}: {e}")
 
         if self._functions_for_model:
-            from inspect import signature
+            from agno.tools.schema_cache import get_schema_cache
+
+            schema_cache = get_schema_cache()
 
             # Check if any functions need media before collecting
             needs_media = any(
-                any(param in signature(func.entrypoint).parameters for param in ["images", "videos", "audios", "files"])
+                not schema_cache.get_parameter_names(func.entrypoint).isdisjoint(
+                    ["images", "videos", "audios", "files"]
+                )
                 for func in self._functions_for_model.values()
                 if func.entrypoint is not None
             )
@@ -6523,7 +6558,8 @@ class Team:
         try:
             if not self.db:
                 raise ValueError("Db not initialized")
-            return self.db.upsert_session(session=session)  # type: ignore
+            with offload_media():
+                return self.db.upsert_session(session=session)  # type: ignore
         except Exception as e:
             log_warning(f"Error upserting session into db: {e}")
         return None
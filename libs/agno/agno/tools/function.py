@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from functools import partial
 from importlib.metadata import version
+from types import MethodType
 from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Type, TypeVar, get_type_hints
 
 from docstring_parser import parse
@@ -9,6 +10,7 @@ from pydantic import BaseModel, Field, validate_call
 
 from exceptions import AgentRunException
 from agno.media import Audio, File, Image, Video
+from agno.tools.schema_cache import CompiledFunction, bind_entrypoint, get_entrypoint_function, get_schema_cache
 from agno.utils.log import log_debug, log_error, log_exception, log_warning
 
 T = TypeVar("T")
@@ -126,6 +128,8 @@ class Function(BaseModel):
     _session_state: Optional[Dict[str, Any]] = None
     # The dependencies that the function is associated with
     _dependencies: Optional[Dict[str, Any]] = None
+    # Truncates string results before they are sent to the model
+    _truncate_result: Optional[Callable[[str], str]] = None
 
     # Media context that the function is associated with
     _images: Optional[Sequence[Image]] = None
@@ -139,6 +143,14 @@ class Function(BaseModel):
             include={"name", "description", "parameters", "strict", "requires_confirmation", "external_execution"},
         )
 
+    def copy_for_run(self) -> "Function":
+        """Copy the function to hold the state of a single run, so concurrent runs don't share it.
+
+        Processing the entrypoint only replaces the top-level keys of the parameters, so they are copied one level
+        deep.
+        """
+        return self.model_copy(update={"parameters": dict(self.parameters)})
+
     @classmethod
     def from_callable(cls, c: Callable, name: Optional[str] = None, strict: bool = False) -> "Function":
         from inspect import getdoc, signature
@@ -146,6 +158,18 @@ class Function(BaseModel):
         from agno.utils.json_schema import get_json_schema
 
         function_name = name or c.__name__
+
+        schema_cache = get_schema_cache()
+        cache_key = schema_cache.get_key(c, "from_callable", strict)
+        compiled = schema_cache.get(cache_key)
+        if compiled is not None and compiled.entrypoint is not None:
+            return cls(
+                name=function_name,
+                description=compiled.description,
+                parameters=compiled.parameters,
+                entrypoint=bind_entrypoint(compiled.entrypoint, c),
+            )
+
         parameters = {"type": "object", "properties": {}, "required": []}
         try:
             sig = signature(c)
@@ -244,25 +268,71 @@ class Function(BaseModel):
             log_warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
 
         entrypoint = cls._wrap_callable(c)
+        description = get_entrypoint_docstring(entrypoint=c)
+        schema_cache.set(
+            cache_key,
+            CompiledFunction(
+                parameters=parameters, entrypoint=cls._get_cached_entrypoint(c, entrypoint), description=description
+            ),
+        )
 
         return cls(
             name=function_name,
-            description=get_entrypoint_docstring(entrypoint=c),
+            description=description,
             parameters=parameters,
             entrypoint=entrypoint,
         )
 
     def process_entrypoint(self, strict: bool = False):
-        """Process the entrypoint and make it ready for use by an agent."""
-        from inspect import getdoc, signature
-
-        from agno.utils.json_schema import get_json_schema
+        """Process the entrypoint and make it ready for use by an agent.
 
+        The result is cached per process, so processing the same entrypoint again (e.g. when an agent rebuilds its
+        tools on every run) is a lookup.
+        """
         if self.skip_entrypoint_processing:
             if strict:
                 self.process_schema_for_strict()
             return
 
+        if self.entrypoint is None:
+            return
+
+        # Everything the processing depends on besides the entrypoint is part of the key
+        schema_cache = get_schema_cache()
+        cache_key = schema_cache.get_key(
+            self.entrypoint,
+            strict,
+            self.requires_user_input,
+            tuple(self.user_input_fields) if self.user_input_fields is not None else None,
+            bool(self.description),
+            self.parameters,
+        )
+        compiled = schema_cache.get(cache_key)
+        if compiled is not None and compiled.entrypoint is not None:
+            self.parameters = compiled.parameters
+            self.description = self.description or compiled.description
+            if self.requires_user_input:
+                self.user_input_schema = compiled.user_input_schema
+            self.entrypoint = bind_entrypoint(compiled.entrypoint, self.entrypoint)
+            return
+
+        entrypoint = self.entrypoint
+        self._process_entrypoint(strict=strict)
+        schema_cache.set(
+            cache_key,
+            CompiledFunction(
+                parameters=self.parameters,
+                entrypoint=self._get_cached_entrypoint(entrypoint, self.entrypoint),
+                description=self.description,
+                user_input_schema=self.user_input_schema,
+            ),
+        )
+
+    def _process_entrypoint(self, strict: bool = False):
+        from inspect import getdoc, signature
+
+        from agno.utils.json_schema import get_json_schema
+
         if self.entrypoint is None:
             return
 
@@ -397,6 +467,16 @@ class Function(BaseModel):
         except Exception as e:
             log_warning(f"Failed to add validate decorator to entrypoint: {e}")
 
+    @classmethod
+    def _get_cached_entrypoint(cls, entrypoint: Callable, wrapped: Callable) -> Optional[Callable]:
+        """The processed entrypoint to cache. Bound methods are cached as their wrapped function, without the instance."""
+        if not isinstance(entrypoint, MethodType):
+            return wrapped
+        try:
+            return cls._wrap_callable(entrypoint.__func__)
+        except Exception:
+            return get_entrypoint_function(entrypoint)
+
     @staticmethod
     def _wrap_callable(func: Callable) -> Callable:
         """Wrap a callable with Pydantic's validate_call decorator, if relevant"""
@@ -10,6 +10,7 @@ from agno.tools import Toolkit
 from agno.tools.function import Function
 from agno.utils.log import log_debug, log_error, log_info, log_warning
 from agno.utils.mcp import get_entrypoint_for_tool
+from agno.utils.mcp_pool import MCPSessionPool
 
 try:
     from mcp import ClientSession, StdioServerParameters
@@ -151,6 +152,10 @@ class MCPTools(Toolkit):
         client=None,
         include_tools: Optional[list[str]] = None,
         exclude_tools: Optional[list[str]] = None,
+        pool_size: int = 1,
+        tool_call_timeout: Optional[float] = None,
+        health_check_interval: Optional[float] = 30,
+        max_reconnect_attempts: int = 3,
         **kwargs,
     ):
         """
@@ -167,6 +172,11 @@ class MCPTools(Toolkit):
             include_tools: Optional list of tool names to include (if None, includes all)
             exclude_tools: Optional list of tool names to exclude (if None, excludes none)
             transport: The transport protocol to use, either "stdio" or "sse" or "streamable-http"
+            pool_size: Number of sessions to open to the server, so that many tool calls can run concurrently.
+                With the stdio transport, each session runs its own server process.
+            tool_call_timeout: Timeout in seconds for a single tool call
+            health_check_interval: Ping sessions idle for longer than this many seconds before using them
+            max_reconnect_attempts: Number of attempts to reopen a broken session, with exponential backoff
         """
         super().__init__(name="MCPTools", **kwargs)
 
@@ -231,9 +241,13 @@ class MCPTools(Toolkit):
             arguments = parts[1:] if len(parts) > 1 else []
             self.server_params = StdioServerParameters(command=cmd, args=arguments, env=env)
 
+        self.pool_size = pool_size
+        self.tool_call_timeout = tool_call_timeout
+        self.health_check_interval = health_check_interval
+        self.max_reconnect_attempts = max_reconnect_attempts
+
         self._client = client
-        self._context = None
-        self._session_context = None
+        self._pool: Optional[MCPSessionPool] = None
         self._initialized = False
         self._connection_task = None
 
@@ -266,15 +280,29 @@ class MCPTools(Toolkit):
             await self.initialize()
             return
 
-        if not hasattr(self, "_active_contexts"):
-            self._active_contexts: list[Any] = []
+        self._pool = MCPSessionPool(
+            connect=self._open_session,
+            size=self.pool_size,
+            call_timeout=self.tool_call_timeout,
+            health_check_interval=self.health_check_interval,
+            max_reconnect_attempts=self.max_reconnect_attempts,
+            name=self.name,
+        )
+        self._pool.on_tools_changed(self._refresh_tools)
+        await self._pool.start()
+        self.session = self._pool.sessions[0]
 
+        # Initialize with the new sessions
+        await self.initialize()
+
+    async def _open_session(self, exit_stack: AsyncExitStack) -> ClientSession:
+        """Open and initialize a session to the MCP server, entering its contexts on the given exit stack"""
         # Create a new studio session
         if self.transport == "sse":
             sse_params = asdict(self.server_params) if self.server_params is not None else {}  # type: ignore
             if "url" not in sse_params:
                 sse_params["url"] = self.url
-            self._context = sse_client(**sse_params)  # type: ignore
+            context = sse_client(**sse_params)  # type: ignore
             client_timeout = min(self.timeout_seconds, sse_params.get("timeout", self.timeout_seconds))
 
         # Create a new streamable HTTP session
@@ -282,7 +310,7 @@ class MCPTools(Toolkit):
             streamable_http_params = asdict(self.server_params) if self.server_params is not None else {}  # type: ignore
             if "url" not in streamable_http_params:
                 streamable_http_params["url"] = self.url
-            self._context = streamablehttp_client(**streamable_http_params)  # type: ignore
+            context = streamablehttp_client(**streamable_http_params)  # type: ignore
             params_timeout = streamable_http_params.get("timeout", self.timeout_seconds)
             if isinstance(params_timeout, timedelta):
                 params_timeout = int(params_timeout.total_seconds())
@@ -291,49 +319,50 @@ class MCPTools(Toolkit):
         else:
             if self.server_params is None:
                 raise ValueError("server_params must be provided when using stdio transport.")
-            self._context = stdio_client(self.server_params)  # type: ignore
+            context = stdio_client(self.server_params)  # type: ignore
             client_timeout = self.timeout_seconds
 
-        session_params = await self._context.__aenter__()  # type: ignore
-        self._active_contexts.append(self._context)
+        session_params = await exit_stack.enter_async_context(context)  # type: ignore
         read, write = session_params[0:2]
 
-        self._session_context = ClientSession(read, write, read_timeout_seconds=timedelta(seconds=client_timeout))  # type: ignore
-        self.session = await self._session_context.__aenter__()  # type: ignore
-        self._active_contexts.append(self._session_context)
+        session = await exit_stack.enter_async_context(
+            ClientSession(
+                read,
+                write,
+                read_timeout_seconds=timedelta(seconds=client_timeout),
+                message_handler=self._pool.handle_message if self._pool is not None else None,
+            )
+        )
+        await session.initialize()
+        return session
 
-        # Initialize with the new session
+    async def _refresh_tools(self) -> None:
+        """Re-register the tools after the MCP server reports its tool list changed"""
+        if not self._initialized:
+            return
+        self._initialized = False
+        self.functions = {}
         await self.initialize()
 
-    async def close(self) -> None:
-        """Close the MCP connection and clean up resources"""
-        if self._session_context is not None:
-            await self._session_context.__aexit__(None, None, None)
+    async def _close_sessions(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
             self.session = None
-            self._session_context = None
-
-        if self._context is not None:
-            await self._context.__aexit__(None, None, None)
-            self._context = None
 
         self._initialized = False
 
+    async def close(self) -> None:
+        """Close the MCP connection and clean up resources"""
+        await self._close_sessions()
+
     async def __aenter__(self) -> "MCPTools":
         await self._connect()
         return self
 
     async def __aexit__(self, _exc_type, _exc_val, _exc_tb):
         """Exit the async context manager."""
-        if self._session_context is not None:
-            await self._session_context.__aexit__(_exc_type, _exc_val, _exc_tb)
-            self.session = None
-            self._session_context = None
-
-        if self._context is not None:
-            await self._context.__aexit__(_exc_type, _exc_val, _exc_tb)
-            self._context = None
-
-        self._initialized = False
+        await self._close_sessions()
 
     async def initialize(self) -> None:
         """Initialize the MCP toolkit by getting available tools from the MCP server"""
@@ -344,11 +373,15 @@ class MCPTools(Toolkit):
             if self.session is None:
                 raise ValueError("Failed to establish session connection")
 
-            # Initialize the session if not already initialized
-            await self.session.initialize()
+            if self._pool is not None:
+                # Pooled sessions are initialized when opened, and the tool list is cached by the pool
+                available_tools = await self._pool.list_tools()
+            else:
+                # Initialize the session if not already initialized
+                await self.session.initialize()
 
-            # Get the list of tools from the MCP server
-            available_tools = await self.session.list_tools()
+                # Get the list of tools from the MCP server
+                available_tools = await self.session.list_tools()
 
             self._check_tools_filters(
                 available_tools=[tool.name for tool in available_tools.tools],
@@ -368,7 +401,7 @@ class MCPTools(Toolkit):
             for tool in filtered_tools:
                 try:
                     # Get an entrypoint for the tool
-                    entrypoint = get_entrypoint_for_tool(tool, self.session)
+                    entrypoint = get_entrypoint_for_tool(tool, self._pool or self.session)
                     # Create a Function for the tool
                     f = Function(
                         name=tool.name,
@@ -419,6 +452,10 @@ class MultiMCPTools(Toolkit):
         include_tools: Optional[list[str]] = None,
         exclude_tools: Optional[list[str]] = None,
         allow_partial_failure: bool = False,
+        pool_size: int = 1,
+        tool_call_timeout: Optional[float] = None,
+        health_check_interval: Optional[float] = 30,
+        max_reconnect_attempts: int = 3,
         **kwargs,
     ):
         """
@@ -435,6 +472,10 @@ class MultiMCPTools(Toolkit):
             include_tools: Optional list of tool names to include (if None, includes all).
             exclude_tools: Optional list of tool names to exclude (if None, excludes none).
             allow_partial_failure: If True, allows toolkit to initialize even if some MCP servers fail to connect. If False, any failure will raise an exception.
+            pool_size: Number of sessions to open to each server, so that many tool calls can run concurrently.
+            tool_call_timeout: Timeout in seconds for a single tool call.
+            health_check_interval: Ping sessions idle for longer than this many seconds before using them.
+            max_reconnect_attempts: Number of attempts to reopen a broken session, with exponential backoff.
         """
         super().__init__(name="MultiMCPTools", **kwargs)
 
@@ -492,7 +533,14 @@ class MultiMCPTools(Toolkit):
                 for url in urls:
                     self.server_params_list.append(StreamableHTTPClientParams(url=url))
 
-        self._async_exit_stack = AsyncExitStack()
+        self.pool_size = pool_size
+        self.tool_call_timeout = tool_call_timeout
+        self.health_check_interval = health_check_interval
+        self.max_reconnect_attempts = max_reconnect_attempts
+
+        self._pools: List[MCPSessionPool] = []
+        # Names of the functions registered from each server, keyed by the id of its pool or session
+        self._server_functions: Dict[int, List[str]] = {}
         self._successful_connections = 0
 
         self._initialized = False
@@ -567,35 +615,11 @@ class MultiMCPTools(Toolkit):
 
         for server_params in self.server_params_list:
             try:
-                # Handle stdio connections
-                if isinstance(server_params, StdioServerParameters):
-                    stdio_transport = await self._async_exit_stack.enter_async_context(stdio_client(server_params))
-                    read, write = stdio_transport
-                    session = await self._async_exit_stack.enter_async_context(
-                        ClientSession(read, write, read_timeout_seconds=timedelta(seconds=self.timeout_seconds))
-                    )
-                    await self.initialize(session)
-                    self._successful_connections += 1
-
-                # Handle SSE connections
-                elif isinstance(server_params, SSEClientParams):
-                    client_connection = await self._async_exit_stack.enter_async_context(
-                        sse_client(**asdict(server_params))
-                    )
-                    read, write = client_connection
-                    session = await self._async_exit_stack.enter_async_context(ClientSession(read, write))
-                    await self.initialize(session)
-                    self._successful_connections += 1
-
-                # Handle Streamable HTTP connections
-                elif isinstance(server_params, StreamableHTTPClientParams):
-                    client_connection = await self._async_exit_stack.enter_async_context(
-                        streamablehttp_client(**asdict(server_params))
-                    )
-                    read, write = client_connection[0:2]
-                    session = await self._async_exit_stack.enter_async_context(ClientSession(read, write))
-                    await self.initialize(session)
-                    self._successful_connections += 1
+                pool = self._create_pool(server_params)
+                await pool.start()
+                self._pools.append(pool)
+                await self.initialize(pool)
+                self._successful_connections += 1
 
             except Exception as e:
                 if not self.allow_partial_failure:
@@ -611,10 +635,61 @@ class MultiMCPTools(Toolkit):
         if not self._initialized and self._successful_connections > 0:
             self._initialized = True
 
+    def _create_pool(
+        self, server_params: Union[SSEClientParams, StdioServerParameters, StreamableHTTPClientParams]
+    ) -> MCPSessionPool:
+        """Create the session pool for one MCP server"""
+
+        async def open_session(exit_stack: AsyncExitStack) -> ClientSession:
+            # Handle stdio connections
+            if isinstance(server_params, StdioServerParameters):
+                read, write = await exit_stack.enter_async_context(stdio_client(server_params))
+                read_timeout: Optional[timedelta] = timedelta(seconds=self.timeout_seconds)
+
+            # Handle SSE connections
+            elif isinstance(server_params, SSEClientParams):
+                read, write = await exit_stack.enter_async_context(sse_client(**asdict(server_params)))
+                read_timeout = None
+
+            # Handle Streamable HTTP connections
+            else:
+                client_connection = await exit_stack.enter_async_context(streamablehttp_client(**asdict(server_params)))
+                read, write = client_connection[0:2]
+                read_timeout = None
+
+            session = await exit_stack.enter_async_context(
+                ClientSession(read, write, read_timeout_seconds=read_timeout, message_handler=pool.handle_message)
+            )
+            await session.initialize()
+            return session
+
+        pool = MCPSessionPool(
+            connect=open_session,
+            size=self.pool_size,
+            call_timeout=self.tool_call_timeout,
+            health_check_interval=self.health_check_interval,
+            max_reconnect_attempts=self.max_reconnect_attempts,
+            name=self.name,
+        )
+        pool.on_tools_changed(lambda: self._refresh_tools(pool))
+        return pool
+
+    async def _refresh_tools(self, pool: MCPSessionPool) -> None:
+        """Re-register the tools of a server after it reports its tool list changed"""
+        for name in self._server_functions.pop(id(pool), []):
+            self.functions.pop(name, None)
+        await self.initialize(pool)
+
+    async def _close_sessions(self) -> None:
+        for pool in self._pools:
+            await pool.close()
+        self._pools = []
+        self._server_functions = {}
+        self._initialized = False
+
     async def close(self) -> None:
         """Close the MCP connections and clean up resources"""
-        await self._async_exit_stack.aclose()
-        self._initialized = False
+        await self._close_sessions()
 
     async def __aenter__(self) -> "MultiMCPTools":
         """Enter the async context manager."""
@@ -628,19 +703,22 @@ class MultiMCPTools(Toolkit):
         exc_tb: Union[TracebackType, None],
     ):
         """Exit the async context manager."""
-        await self._async_exit_stack.aclose()
-        self._initialized = False
+        await self._close_sessions()
         self._successful_connections = 0
 
-    async def initialize(self, session: ClientSession) -> None:
+    async def initialize(self, session: Union[ClientSession, MCPSessionPool]) -> None:
         """Initialize the MCP toolkit by getting available tools from the MCP server"""
 
         try:
-            # Initialize the session if not already initialized
-            await session.initialize()
+            if isinstance(session, MCPSessionPool):
+                # Pooled sessions are initialized when opened, and the tool list is cached by the pool
+                available_tools = await session.list_tools()
+            else:
+                # Initialize the session if not already initialized
+                await session.initialize()
 
-            # Get the list of tools from the MCP server
-            available_tools = await session.list_tools()
+                # Get the list of tools from the MCP server
+                available_tools = await session.list_tools()
 
             # Filter tools based on include/exclude lists
             filtered_tools = []
@@ -668,6 +746,7 @@ class MultiMCPTools(Toolkit):
 
                     # Register the Function with the toolkit
                     self.functions[f.name] = f
+                    self._server_functions.setdefault(id(session), []).append(f.name)
                     log_debug(f"Function: {f.name} registered with {self.name}")
                 except Exception as e:
                     log_error(f"Failed to register tool {tool.name}: {e}")
@@ -0,0 +1,152 @@
+import json
+from collections import OrderedDict
+from copy import copy, deepcopy
+from dataclasses import dataclass
+from inspect import signature
+from threading import Lock
+from types import FunctionType, MethodType
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional
+
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def get_entrypoint_function(entrypoint: Callable) -> Optional[FunctionType]:
+    """The function behind an entrypoint: the function itself, or the `__func__` of a bound method."""
+    if isinstance(entrypoint, MethodType):
+        entrypoint = entrypoint.__func__
+    return entrypoint if isinstance(entrypoint, FunctionType) else None
+
+
+def bind_entrypoint(function: Callable, entrypoint: Callable) -> Callable:
+    """Bind a cached function to the instance of the entrypoint it was looked up for, if it is a bound method."""
+    if isinstance(entrypoint, MethodType):
+        return MethodType(function, entrypoint.__self__)
+    return function
+
+
+@dataclass
+class CompiledFunction:
+    """The result of processing a tool entrypoint: its JSON schema and the metadata derived from its signature.
+
+    The entrypoint is stored unbound, so that entries don't keep the instances of methods alive.
+    """
+
+    parameters: Dict[str, Any]
+    entrypoint: Optional[Callable] = None
+    description: Optional[str] = None
+    user_input_schema: Optional[List[Any]] = None
+
+
+class SchemaCache:
+    """Process-wide LRU cache of compiled tool schemas.
+
+    Processing an entrypoint inspects its signature, type hints and docstring and generates its JSON schema, which
+    is costly for agents with many tools that are rebuilt on every run. The result only depends on the entrypoint
+    and the options it was processed with, so it is computed once per process. Methods are keyed on their function,
+    so the instances of a toolkit share entries. Entries are copied on the way in and out, since functions mutate
+    their schemas after processing.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CompiledFunction]" = OrderedDict()
+        self._parameter_names: "OrderedDict[Hashable, FrozenSet[str]]" = OrderedDict()
+        self._lock = Lock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def get_key(entrypoint: Callable, *options: Any) -> Optional[Hashable]:
+        """Key for an entrypoint processed with the given options, or None if it can't be cached.
+
+        Closures aren't cached: they are usually built once per run and capture the run's state, so entries for them
+        would never be hit again and would keep that state alive.
+        """
+        function = get_entrypoint_function(entrypoint)
+        if function is None or function.__closure__ is not None or "<locals>" in function.__qualname__:
+            return None
+        try:
+            key = (
+                function,
+                # The signature of a bound method doesn't include self
+                isinstance(entrypoint, MethodType),
+                *(json.dumps(o, sort_keys=True, default=str) if isinstance(o, dict) else o for o in options),
+            )
+            hash(key)
+            return key
+        except TypeError:
+            return None
+
+    def get(self, key: Optional[Hashable]) -> Optional[CompiledFunction]:
+        if key is None:
+            return None
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return self._copy(compiled)
+
+    def set(self, key: Optional[Hashable], compiled: CompiledFunction) -> None:
+        if key is None:
+            return
+        compiled = self._copy(compiled)
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _copy(compiled: CompiledFunction) -> CompiledFunction:
+        return CompiledFunction(
+            parameters=deepcopy(compiled.parameters),
+            entrypoint=compiled.entrypoint,
+            description=compiled.description,
+            user_input_schema=[copy(field) for field in compiled.user_input_schema]
+            if compiled.user_input_schema is not None
+            else None,
+        )
+
+    def get_parameter_names(self, entrypoint: Callable) -> FrozenSet[str]:
+        """Names of the parameters an entrypoint accepts, cached per entrypoint."""
+        key = self.get_key(entrypoint)
+        if key is not None:
+            with self._lock:
+                names = self._parameter_names.get(key)
+            if names is not None:
+                return names
+
+        try:
+            names = frozenset(signature(entrypoint).parameters)
+        except (TypeError, ValueError):
+            names = frozenset()
+
+        if key is not None:
+            with self._lock:
+                self._parameter_names[key] = names
+                while len(self._parameter_names) > self.max_entries:
+                    self._parameter_names.popitem(last=False)
+        return names
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._parameter_names.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_schema_cache = SchemaCache()
+
+
+def get_schema_cache() -> SchemaCache:
+    """Return the process-wide compiled tool schema cache."""
+    return _schema_cache
@@ -0,0 +1,44 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from agno.utils.blob_store.base import BLOB_REF_PREFIX, BlobStore
+from agno.utils.blob_store.local import LocalBlobStore
+
+__all__ = [
+    "BLOB_REF_PREFIX",
+    "BlobStore",
+    "LocalBlobStore",
+    "get_blob_store",
+    "set_blob_store",
+    "offload_media",
+    "is_offloading_media",
+]
+
+_blob_store: Optional[BlobStore] = None
+_offload_media: ContextVar[bool] = ContextVar("agno_offload_media", default=False)
+
+
+def get_blob_store() -> Optional[BlobStore]:
+    """Return the process-wide blob store used to offload media from stored sessions, if one is configured."""
+    return _blob_store
+
+
+def set_blob_store(blob_store: Optional[BlobStore]) -> None:
+    """Configure the blob store media is offloaded to when sessions are saved. Pass None to store media inline."""
+    global _blob_store
+    _blob_store = blob_store
+
+
+@contextmanager
+def offload_media() -> Iterator[None]:
+    """While active, media serialized with `to_dict()` is written to the blob store and replaced by a reference."""
+    token = _offload_media.set(True)
+    try:
+        yield
+    finally:
+        _offload_media.reset(token)
+
+
+def is_offloading_media() -> bool:
+    return _blob_store is not None and _offload_media.get()
@@ -0,0 +1,69 @@
+import hashlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Tuple
+
+BLOB_REF_PREFIX = "sha256:"
+
+
+class BlobStore(ABC):
+    """Content-addressed storage for media payloads.
+
+    Blobs are written once under the sha256 of their content, so the same image stored in many runs or
+    sessions only takes space once. Sessions keep the returned reference instead of inline base64 content.
+    """
+
+    def __init__(self, digest_cache_size: int = 1024):
+        # Maps (len, hash(content)) -> (content, ref) so repeated serialization of the same bytes object
+        # doesn't re-hash or re-upload it
+        self._digests: "OrderedDict[Tuple[int, int], Tuple[bytes, str]]" = OrderedDict()
+        self._digest_cache_size = digest_cache_size
+        self._lock = Lock()
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def read(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def write(self, key: str, content: bytes) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def put(self, content: bytes) -> str:
+        """Store `content` if it isn't stored yet and return its reference."""
+        memo_key = (len(content), hash(content))
+        with self._lock:
+            memo = self._digests.get(memo_key)
+            if memo is not None and (memo[0] is content or memo[0] == content):
+                self._digests.move_to_end(memo_key)
+                return memo[1]
+
+        key = hashlib.sha256(content).hexdigest()
+        if not self.exists(key):
+            self.write(key, content)
+
+        ref = f"{BLOB_REF_PREFIX}{key}"
+        with self._lock:
+            self._digests[memo_key] = (content, ref)
+            while len(self._digests) > self._digest_cache_size:
+                self._digests.popitem(last=False)
+        return ref
+
+    def get(self, ref: str) -> Optional[bytes]:
+        """Return the content for a reference returned by `put`."""
+        if not ref.startswith(BLOB_REF_PREFIX):
+            raise ValueError(f"Invalid blob reference: {ref}")
+        return self.read(ref[len(BLOB_REF_PREFIX) :])
+
+    def remove(self, ref: str) -> None:
+        if not ref.startswith(BLOB_REF_PREFIX):
+            raise ValueError(f"Invalid blob reference: {ref}")
+        self.delete(ref[len(BLOB_REF_PREFIX) :])
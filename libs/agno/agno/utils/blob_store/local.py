@@ -0,0 +1,37 @@
+import os
+from pathlib import Path
+from tempfile import gettempdir
+from typing import Optional, Union
+
+from agno.utils.blob_store.base import BlobStore
+
+
+class LocalBlobStore(BlobStore):
+    """Store media blobs as files on the local filesystem, fanned out by the first two hex digits of the key."""
+
+    def __init__(self, base_dir: Optional[Union[str, Path]] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.base_dir = Path(base_dir) if base_dir else Path(gettempdir()) / "agno_blobs"
+
+    def _path(self, key: str) -> Path:
+        return self.base_dir / key[:2] / key
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def read(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        if not path.is_file():
+            return None
+        return path.read_bytes()
+
+    def write(self, key: str, content: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename, so readers never see a partially written blob
+        tmp_path = path.with_name(f"{key}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
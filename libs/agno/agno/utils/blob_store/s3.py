@@ -0,0 +1,54 @@
+from typing import Any, Optional
+
+from agno.utils.blob_store.base import BlobStore
+
+try:
+    import boto3  # type: ignore
+    from botocore.exceptions import ClientError  # type: ignore
+except ImportError:
+    raise ImportError("`boto3` not installed. Please install using `pip install boto3`")
+
+
+class S3BlobStore(BlobStore):
+    """Store media blobs in an S3 bucket.
+
+    Any S3-compatible service works (MinIO, R2, or GCS through its XML API interoperability endpoint) by
+    setting `endpoint_url`.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "agno/blobs",
+        endpoint_url: Optional[str] = None,
+        region_name: Optional[str] = None,
+        client: Optional[Any] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.client = client or boto3.client("s3", endpoint_url=endpoint_url, region_name=region_name)
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+            return True
+        except ClientError:
+            return False
+
+    def read(self, key: str) -> Optional[bytes]:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self._object_key(key))
+            return response["Body"].read()
+        except ClientError:
+            return None
+
+    def write(self, key: str, content: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=self._object_key(key), Body=content)
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._object_key(key))
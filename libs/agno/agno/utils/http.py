@@ -1,7 +1,10 @@
 import asyncio
 import logging
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from threading import Lock
 from time import sleep
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
 
 import httpx
 
@@ -21,7 +24,7 @@ def fetch_with_retry(
 
     for attempt in range(max_retries):
         try:
-            response = httpx.get(url, proxy=proxy) if proxy else httpx.get(url)
+            response = get_http_client(proxy=proxy or None, follow_redirects=False).get(url)
             response.raise_for_status()
             return response
         except httpx.RequestError as e:
@@ -49,9 +52,7 @@ async def async_fetch_with_retry(
 
     async def _fetch():
         if client is None:
-            client_args = {"proxy": proxy} if proxy else {}
-            async with httpx.AsyncClient(**client_args) as local_client:  # type: ignore
-                return await local_client.get(url)
+            return await get_async_http_client(proxy=proxy or None, follow_redirects=False).get(url)
         else:
             return await client.get(url)
 
@@ -72,3 +73,308 @@ async def async_fetch_with_retry(
             raise
 
     raise httpx.RequestError(f"Failed to fetch {url} after {max_retries} attempts")
+
+
+DEFAULT_MAX_CONNECTIONS = 1000
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 100
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+# Client key: (scope, origin, proxy, follow_redirects)
+HttpClientKey = Tuple[Optional[str], str, Optional[str], bool]
+
+
+class _RejectAllCookiesPolicy(DefaultCookiePolicy):
+    """Cookie policy that neither stores nor sends cookies"""
+
+    def set_ok(self, cookie, request):
+        return False
+
+    def return_ok(self, cookie, request):
+        return False
+
+
+class SharedHttpClient(httpx.Client):
+    """A client shared through the registry. `close()` is a no-op, so an SDK closing its client doesn't close the
+    connection pool of every other component using it. The registry closes it with `close_shared()`."""
+
+    def close(self) -> None:
+        pass
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def close_shared(self) -> None:
+        super().close()
+
+
+class SharedAsyncHttpClient(httpx.AsyncClient):
+    """An async client shared through the registry. `aclose()` is a no-op, the registry closes it with
+    `aclose_shared()`."""
+
+    async def aclose(self) -> None:
+        pass
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def aclose_shared(self) -> None:
+        await super().aclose()
+
+
+def _get_origin(base_url: Optional[Union[str, httpx.URL]]) -> str:
+    if base_url is None:
+        return ""
+    try:
+        url = httpx.URL(str(base_url))
+    except Exception:
+        return str(base_url)
+    if not url.host:
+        return str(base_url)
+    return f"{url.scheme}://{url.host}" + (f":{url.port}" if url.port else "")
+
+
+def _get_pool_name(key: HttpClientKey) -> str:
+    scope, origin, proxy, _ = key
+    name = origin or "default"
+    if scope is not None:
+        name = f"{scope} {name}"
+    if proxy is not None:
+        name = f"{name} via {proxy}"
+    return name
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _get_pool_stats(client: Union[httpx.Client, httpx.AsyncClient]) -> Dict[str, int]:
+    """Connection counts of a client's connection pools, read from httpcore."""
+    connections = idle = queued = 0
+    transports = [getattr(client, "_transport", None), *getattr(client, "_mounts", {}).values()]
+    for transport in transports:
+        pool = getattr(transport, "_pool", None)
+        if pool is None:
+            continue
+        try:
+            pool_connections = list(pool.connections)
+            connections += len(pool_connections)
+            idle += sum(1 for connection in pool_connections if connection.is_idle())
+            queued += sum(1 for request in getattr(pool, "_requests", []) if request.connection is None)
+        except Exception:
+            continue
+    return {"connections": connections, "idle_connections": idle, "queued_requests": queued}
+
+
+def _close_client(client: httpx.Client) -> None:
+    if isinstance(client, SharedHttpClient):
+        client.close_shared()
+    else:
+        client.close()
+
+
+class HttpClientRegistry:
+    """Process-wide registry of shared httpx clients.
+
+    Model providers, embedders, readers and media helpers get their HTTP clients from here instead of creating
+    their own, so every component talking to the same host shares one connection pool and reuses its keep-alive
+    connections and TLS sessions. Clients are keyed by the origin of the base URL, the proxy and whether redirects
+    are followed. Async clients are also keyed by event loop, since their connections can't be used from another
+    loop. HTTP/2 is used when the `h2` package is installed.
+
+    Components can pass a `scope`, like the name of a model provider, to get clients of their own. Shared clients
+    don't store cookies, so that cookies set by one site or for one API key are never sent on behalf of another
+    component, and ignore `close()`.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = True,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2
+
+        self._clients: Dict[HttpClientKey, httpx.Client] = {}
+        self._async_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[HttpClientKey, httpx.AsyncClient]]" = (
+            WeakKeyDictionary()
+        )
+        self._lock = Lock()
+
+        self.requests: int = 0
+        self.clients_created: int = 0
+
+    def configure(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ) -> None:
+        """Change the pool settings. Only clients created afterwards use them."""
+        if max_connections is not None:
+            self.max_connections = max_connections
+        if max_keepalive_connections is not None:
+            self.max_keepalive_connections = max_keepalive_connections
+        if keepalive_expiry is not None:
+            self.keepalive_expiry = keepalive_expiry
+        if http2 is not None:
+            self.http2 = http2
+
+    def _get_client_kwargs(self, proxy: Optional[str], follow_redirects: bool) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "http2": self.http2 and _http2_available(),
+            "follow_redirects": follow_redirects,
+            "cookies": CookieJar(policy=_RejectAllCookiesPolicy()),
+        }
+        if proxy is not None:
+            kwargs["proxy"] = proxy
+        return kwargs
+
+    def _count_request(self, request: httpx.Request) -> None:
+        with self._lock:
+            self.requests += 1
+
+    async def _acount_request(self, request: httpx.Request) -> None:
+        self._count_request(request)
+
+    def get_client(
+        self,
+        base_url: Optional[Union[str, httpx.URL]] = None,
+        proxy: Optional[str] = None,
+        follow_redirects: bool = True,
+        scope: Optional[str] = None,
+    ) -> httpx.Client:
+        """Return the shared sync client for a scope, base URL and proxy."""
+        key = (scope, _get_origin(base_url), proxy, follow_redirects)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = SharedHttpClient(
+                    **self._get_client_kwargs(proxy, follow_redirects),
+                    event_hooks={"request": [self._count_request]},
+                )
+                self._clients[key] = client
+                self.clients_created += 1
+                logger.debug(f"Created shared HTTP client for {_get_pool_name(key)}")
+            return client
+
+    def get_async_client(
+        self,
+        base_url: Optional[Union[str, httpx.URL]] = None,
+        proxy: Optional[str] = None,
+        follow_redirects: bool = True,
+        scope: Optional[str] = None,
+    ) -> httpx.AsyncClient:
+        """Return the shared async client for a scope, base URL and proxy, for the running event loop."""
+        key = (scope, _get_origin(base_url), proxy, follow_redirects)
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            # Clients created outside a loop (e.g. provider clients built in sync code) can't be shared safely
+            loop = None
+
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {}) if loop is not None else {}
+            client = clients.get(key)
+            if client is None or client.is_closed:
+                client = SharedAsyncHttpClient(
+                    **self._get_client_kwargs(proxy, follow_redirects),
+                    event_hooks={"request": [self._acount_request]},
+                )
+                clients[key] = client
+                self.clients_created += 1
+                logger.debug(f"Created shared async HTTP client for {_get_pool_name(key)}")
+            return client
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Number of clients, requests made and the utilization of their connection pools."""
+        with self._lock:
+            clients: List[Tuple[HttpClientKey, Union[httpx.Client, httpx.AsyncClient]]] = list(self._clients.items())
+            for loop_clients in list(self._async_clients.values()):
+                clients.extend(loop_clients.items())
+            stats: Dict[str, Any] = {
+                "clients": len(clients),
+                "clients_created": self.clients_created,
+                "requests": self.requests,
+                "pools": {},
+            }
+
+        for key, client in clients:
+            pool_stats = _get_pool_stats(client)
+            pool_stats["max_connections"] = self.max_connections
+            name = _get_pool_name(key)
+            existing = stats["pools"].get(name)
+            if existing is not None:
+                for field in ("connections", "idle_connections", "queued_requests"):
+                    existing[field] += pool_stats[field]
+            else:
+                stats["pools"][name] = pool_stats
+        return stats
+
+    def close(self) -> None:
+        """Close the shared sync clients. Async clients are closed with `aclose()`."""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            _close_client(client)
+
+    async def aclose(self) -> None:
+        """Close all shared clients."""
+        self.close()
+        with self._lock:
+            loop_clients = list(self._async_clients.values())
+            self._async_clients = WeakKeyDictionary()
+        for clients in loop_clients:
+            for client in clients.values():
+                try:
+                    if isinstance(client, SharedAsyncHttpClient):
+                        await client.aclose_shared()
+                    else:
+                        await client.aclose()
+                except Exception as e:
+                    logger.debug(f"Error closing shared async HTTP client: {e}")
+
+
+_http_client_registry = HttpClientRegistry()
+
+
+def get_http_client_registry() -> HttpClientRegistry:
+    """Return the process-wide HTTP client registry."""
+    return _http_client_registry
+
+
+def get_http_client(
+    base_url: Optional[Union[str, httpx.URL]] = None,
+    proxy: Optional[str] = None,
+    follow_redirects: bool = True,
+    scope: Optional[str] = None,
+) -> httpx.Client:
+    """Return the shared sync HTTP client for a scope, base URL and proxy."""
+    return _http_client_registry.get_client(
+        base_url=base_url, proxy=proxy, follow_redirects=follow_redirects, scope=scope
+    )
+
+
+def get_async_http_client(
+    base_url: Optional[Union[str, httpx.URL]] = None,
+    proxy: Optional[str] = None,
+    follow_redirects: bool = True,
+    scope: Optional[str] = None,
+) -> httpx.AsyncClient:
+    """Return the shared async HTTP client for a scope, base URL and proxy, for the running event loop."""
+    return _http_client_registry.get_async_client(
+        base_url=base_url, proxy=proxy, follow_redirects=follow_redirects, scope=scope
+    )
@@ -0,0 +1,244 @@
+import asyncio
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
+
+from anyio import BrokenResourceError, ClosedResourceError, EndOfStream
+
+from agno.utils.log import log_debug, log_warning
+
+# Errors raised when the transport under a session is gone
+CONNECTION_ERRORS = (BrokenResourceError, ClosedResourceError, EndOfStream, ConnectionError, EOFError)
+
+TOOLS_LIST_CHANGED = "notifications/tools/list_changed"
+
+# Opens a session on the given exit stack and returns it, initialized
+SessionFactory = Callable[[AsyncExitStack], Awaitable[Any]]
+
+
+class _PooledSession:
+    def __init__(self, index: int):
+        self.index = index
+        self.session: Optional[Any] = None
+        self.last_used: float = 0.0
+        # Task that entered the session's contexts, and exits them once `closing` is set
+        self.owner: Optional[asyncio.Task] = None
+        self.closing: Optional[asyncio.Event] = None
+
+    def get_session(self) -> Any:
+        """The open session, which is None once the slot has been discarded"""
+        if self.session is None:
+            raise ConnectionError(f"MCP session {self.index} is closed")
+        return self.session
+
+
+class MCPSessionPool:
+    """A pool of client sessions to one MCP server.
+
+    Each tool call checks out a session, so up to `size` calls (or stdio server processes) run in parallel instead of
+    being serialized through one connection. Sessions idle for more than `health_check_interval` seconds are pinged
+    before use, and broken sessions are reopened with exponential backoff. The server's tool list is fetched once
+    and cached until the server sends a `tools/list_changed` notification.
+
+    Each session is opened and closed by its own task, as anyio requires the contexts of a transport to be exited
+    from the task that entered them.
+    """
+
+    def __init__(
+        self,
+        connect: SessionFactory,
+        size: int = 1,
+        call_timeout: Optional[float] = None,
+        health_check_interval: Optional[float] = 30,
+        max_reconnect_attempts: int = 3,
+        reconnect_backoff: float = 0.5,
+        name: str = "mcp",
+    ):
+        self.connect = connect
+        self.size = max(1, size)
+        self.call_timeout = call_timeout
+        self.health_check_interval = health_check_interval
+        self.max_reconnect_attempts = max(1, max_reconnect_attempts)
+        self.reconnect_backoff = reconnect_backoff
+        self.name = name
+
+        self._slots: List[_PooledSession] = []
+        self._idle: Optional[asyncio.Queue] = None
+        self._tools: Optional[Any] = None
+        self._tools_lock: Optional[asyncio.Lock] = None
+        self._tools_changed_callbacks: List[Callable[[], Any]] = []
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._started = False
+
+        self.calls: int = 0
+        self.timeouts: int = 0
+        self.reconnects: int = 0
+
+    @property
+    def sessions(self) -> List[Any]:
+        return [slot.session for slot in self._slots if slot.session is not None]
+
+    async def start(self) -> None:
+        """Open all sessions in the pool."""
+        if self._started:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            # Another caller may have started the pool while this one waited for the lock
+            if self._started:
+                return
+            idle: asyncio.Queue = asyncio.Queue()
+            self._tools_lock = asyncio.Lock()
+            self._slots = [_PooledSession(index) for index in range(self.size)]
+            try:
+                for slot in self._slots:
+                    await self._open(slot)
+                    idle.put_nowait(slot)
+            except BaseException:
+                await self.close()
+                raise
+            self._idle = idle
+            self._started = True
+        log_debug(f"{self.name}: opened {self.size} MCP session(s)")
+
+    async def _open(self, slot: _PooledSession) -> None:
+        opened: asyncio.Future = asyncio.get_running_loop().create_future()
+        closing = asyncio.Event()
+        owner = asyncio.create_task(self._own_session(opened, closing))
+        try:
+            slot.session = await opened
+        except BaseException:
+            owner.cancel()
+            await asyncio.gather(owner, return_exceptions=True)
+            raise
+        slot.owner = owner
+        slot.closing = closing
+        slot.last_used = time.monotonic()
+
+    async def _own_session(self, opened: asyncio.Future, closing: asyncio.Event) -> None:
+        """Open a session, keep its contexts open until `closing` is set, then exit them from this same task"""
+        async with AsyncExitStack() as exit_stack:
+            try:
+                session = await self.connect(exit_stack)
+            except Exception as e:
+                if not opened.done():
+                    opened.set_exception(e)
+                raise
+            opened.set_result(session)
+            await closing.wait()
+
+    async def _discard(self, slot: _PooledSession) -> None:
+        owner, closing = slot.owner, slot.closing
+        slot.owner, slot.closing, slot.session = None, None, None
+        if owner is None or closing is None:
+            return
+        closing.set()
+        await asyncio.wait([owner])
+        if not owner.cancelled() and owner.exception() is not None:
+            # The transport may have failed already; the connection is dropped anyway
+            log_debug(f"{self.name}: error closing MCP session {slot.index}: {owner.exception()}")
+
+    async def _reconnect(self, slot: _PooledSession) -> None:
+        await self._discard(slot)
+        delay = self.reconnect_backoff
+        for attempt in range(1, self.max_reconnect_attempts + 1):
+            try:
+                await self._open(slot)
+                self.reconnects += 1
+                log_debug(f"{self.name}: reconnected MCP session {slot.index}")
+                return
+            except Exception as e:
+                log_warning(f"{self.name}: reconnecting MCP session {slot.index} failed (attempt {attempt}): {e}")
+                if attempt == self.max_reconnect_attempts:
+                    raise
+                await asyncio.sleep(delay)
+                delay *= 2
+
+    async def _ensure_healthy(self, slot: _PooledSession) -> None:
+        if slot.session is None:
+            await self._reconnect(slot)
+            return
+        if self.health_check_interval is None or time.monotonic() - slot.last_used < self.health_check_interval:
+            return
+        try:
+            await asyncio.wait_for(slot.session.send_ping(), timeout=self.call_timeout or 10)
+        except Exception as e:
+            log_debug(f"{self.name}: MCP session {slot.index} failed health check: {e}")
+            await self._reconnect(slot)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[_PooledSession]:
+        """Check out a healthy session for the duration of the block."""
+        if not self._started:
+            await self.start()
+        slot = await self._idle.get()  # type: ignore
+        try:
+            await self._ensure_healthy(slot)
+            yield slot
+        finally:
+            slot.last_used = time.monotonic()
+            self._idle.put_nowait(slot)  # type: ignore
+
+    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Any:
+        """Call a tool on a pooled session, reopening the session and retrying once if the connection broke."""
+        self.calls += 1
+        async with self.acquire() as slot:
+            try:
+                return await asyncio.wait_for(slot.get_session().call_tool(name, arguments), timeout=self.call_timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                # The server may still answer the abandoned request, so don't reuse this session
+                await self._discard(slot)
+                raise TimeoutError(f"MCP tool '{name}' timed out after {self.call_timeout} seconds")
+            except CONNECTION_ERRORS as e:
+                log_warning(f"{self.name}: MCP session {slot.index} broke during '{name}': {e}")
+                await self._reconnect(slot)
+                return await asyncio.wait_for(slot.get_session().call_tool(name, arguments), timeout=self.call_timeout)
+
+    async def list_tools(self, refresh: bool = False) -> Any:
+        """Return the server's tool list, fetching it only if it isn't cached or has changed."""
+        if not self._started:
+            await self.start()
+        async with self._tools_lock:  # type: ignore
+            if self._tools is None or refresh:
+                async with self.acquire() as slot:
+                    self._tools = await slot.get_session().list_tools()
+            return self._tools
+
+    def on_tools_changed(self, callback: Callable[[], Any]) -> None:
+        """Register a callback to run when the server reports its tool list changed."""
+        self._tools_changed_callbacks.append(callback)
+
+    async def handle_message(self, message: Any) -> None:
+        """Message handler for the pooled sessions, to pick up tool list changes."""
+        if getattr(getattr(message, "root", None), "method", None) != TOOLS_LIST_CHANGED:
+            return
+        log_debug(f"{self.name}: MCP server tool list changed")
+        self._tools = None
+        for callback in self._tools_changed_callbacks:
+            result = callback()
+            if asyncio.iscoroutine(result):
+                # Run in the background: this handler runs in the session's receive loop, which a callback
+                # calling the server would otherwise deadlock
+                task = asyncio.create_task(result)
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
+    async def close(self) -> None:
+        for slot in self._slots:
+            await self._discard(slot)
+        self._slots = []
+        self._idle = None
+        self._tools = None
+        self._started = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "idle": self._idle.qsize() if self._idle is not None else 0,
+            "calls": self.calls,
+            "timeouts": self.timeouts,
+            "reconnects": self.reconnects,
+        }
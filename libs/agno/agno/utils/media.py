@@ -6,6 +6,7 @@ from typing import List
 
 import httpx
 
+from agno.utils.http import get_http_client
 from agno.utils.log import log_info, log_warning
 
 
@@ -26,7 +27,7 @@ def download_image(url: str, output_path: str) -> bool:
     """
     try:
         # Send HTTP GET request to the image URL
-        response = httpx.get(url)
+        response = get_http_client(follow_redirects=False).get(url)
         response.raise_for_status()  # Raise an exception for HTTP errors
 
         # Check if the response contains image content
@@ -57,7 +58,7 @@ def download_image(url: str, output_path: str) -> bool:
 
 def download_video(url: str, output_path: str) -> str:
     """Download video from URL"""
-    response = httpx.get(url)
+    response = get_http_client(follow_redirects=False).get(url)
     response.raise_for_status()
 
     with open(output_path, "wb") as f:
@@ -78,7 +79,7 @@ def download_file(url: str, output_path: str) -> None:
         httpx.HTTPError: If the download fails
     """
     try:
-        response = httpx.get(url)
+        response = get_http_client(follow_redirects=False).get(url)
         response.raise_for_status()
 
         output_file = Path(output_path)
@@ -0,0 +1,229 @@
+import base64
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from agno.utils.log import log_debug, log_warning
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+DEFAULT_URL_TTL = 24 * 60 * 60  # 1 day
+
+
+class MediaCache:
+    """Content-addressed cache for fetched media bytes and their base64 encodings.
+
+    Media attached to a run (images, audio, video, files) is formatted for the model on every model call,
+    which means URL media is downloaded and all media is base64-encoded again on every tool-loop iteration
+    and every later turn that replays history. The cache keeps:
+
+    - fetched bytes keyed by URL (or by path + mtime + size for local files)
+    - base64 encodings keyed by the content they encode
+
+    The in-memory tier is a bounded LRU. If `cache_dir` is set, fetched URL bytes are also written to disk
+    so they survive process restarts. URL content is fetched again once it is older than `url_ttl` seconds,
+    so that changes to the remote media are picked up.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        cache_dir: Optional[Union[str, Path]] = None,
+        enabled: bool = True,
+        url_ttl: Optional[float] = DEFAULT_URL_TTL,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.cache_dir: Optional[Path] = Path(cache_dir) if cache_dir else None
+        self.enabled = enabled
+        # Seconds after which URL content is fetched again. None keeps it until it is evicted.
+        self.url_ttl = url_ttl
+
+        self._entries: "OrderedDict[Tuple[str, Any], Tuple[Any, Any, int]]" = OrderedDict()
+        self._size: int = 0
+        self._lock = Lock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    # --- In-memory LRU ---
+
+    def _get(self, key: Tuple[str, Any], source: Any = None) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, entry_source, _ = entry
+            # Guard against hash collisions when the key is derived from the content itself
+            if source is not None and entry_source is not source and entry_source != source:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _set(self, key: Tuple[str, Any], value: Any, size: int, source: Any = None) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[2]
+            self._entries[key] = (value, source, size)
+            self._size += size
+            while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def _is_expired(self, fetched_at: float) -> bool:
+        return self.url_ttl is not None and time.time() - fetched_at > self.url_ttl
+
+    # --- Disk tier ---
+
+    def _disk_path(self, url: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / "media" / hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _read_disk(self, url: str) -> Optional[Tuple[Tuple[bytes, Optional[str]], float]]:
+        """Return the content stored for `url` and when it was fetched, unless it is missing or expired."""
+        path = self._disk_path(url)
+        if path is None or not path.is_file():
+            return None
+        try:
+            fetched_at = path.stat().st_mtime
+            if self._is_expired(fetched_at):
+                return None
+            mime_path = path.with_suffix(".mime")
+            mime_type = mime_path.read_text() if mime_path.is_file() else None
+            return (path.read_bytes(), mime_type), fetched_at
+        except Exception as e:
+            log_warning(f"Error reading media cache file {path}: {e}")
+            return None
+
+    def _write_disk(self, url: str, content: bytes, mime_type: Optional[str] = None) -> None:
+        path = self._disk_path(url)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if mime_type:
+                path.with_suffix(".mime").write_text(mime_type)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            log_warning(f"Error writing media cache file {path}: {e}")
+
+    # --- Public API ---
+
+    def get_url_content(
+        self, url: str, fetch: Callable[[str], Optional[Tuple[bytes, Optional[str]]]]
+    ) -> Optional[Tuple[bytes, Optional[str]]]:
+        """Return `(content, mime_type)` for `url`, calling `fetch(url)` only on a cache miss.
+
+        `fetch` should raise or return None for error responses, which are not cached.
+        """
+        if not self.enabled:
+            return fetch(url)
+
+        key = ("url", url)
+        cached = self._get(key)
+        if cached is not None and not self._is_expired(cached[1]):
+            return cached[0]
+
+        stored = self._read_disk(url)
+        if stored is None:
+            result = fetch(url)
+            if result is None or result[0] is None:
+                return None
+            fetched_at = time.time()
+            self._write_disk(url, result[0], result[1])
+        else:
+            result, fetched_at = stored
+            log_debug(f"Loaded media from disk cache: {url}")
+
+        self._set(key, (result, fetched_at), len(result[0]))
+        return result
+
+    def get_url_bytes(self, url: str, fetch: Callable[[str], Optional[bytes]]) -> Optional[bytes]:
+        """Return the bytes behind `url`, calling `fetch(url)` only on a cache miss."""
+
+        def _fetch(_url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+            content = fetch(_url)
+            return (content, None) if content is not None else None
+
+        result = self.get_url_content(url, _fetch)
+        return result[0] if result is not None else None
+
+    def get_file_bytes(self, filepath: Union[str, Path]) -> bytes:
+        """Return the bytes of a local file, re-reading it only if its mtime or size changed."""
+        path = Path(filepath)
+        if not self.enabled:
+            return path.read_bytes()
+
+        stat = path.stat()
+        key = ("file", (str(path.resolve()), stat.st_mtime_ns, stat.st_size))
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        content = path.read_bytes()
+        self._set(key, content, len(content))
+        return content
+
+    def b64encode(self, content: bytes) -> str:
+        """Return `content` base64-encoded as a utf-8 string, reusing a previous encoding of the same bytes."""
+        if not self.enabled:
+            return base64.b64encode(content).decode("utf-8")
+
+        # hash() of a bytes object is computed once and stored on the object, so repeated lookups are O(1)
+        key = ("b64", (len(content), hash(content)))
+        cached = self._get(key, source=content)
+        if cached is not None:
+            return cached
+
+        encoded = base64.b64encode(content).decode("utf-8")
+        self._set(key, encoded, len(encoded) + len(content), source=content)
+        return encoded
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_media_cache: MediaCache = MediaCache()
+
+
+def get_media_cache() -> MediaCache:
+    """Return the process-wide media cache shared by `agno.media` and the model adapters."""
+    return _media_cache
+
+
+def set_media_cache(media_cache: MediaCache) -> None:
+    """Replace the process-wide media cache, e.g. to enable the disk tier or change its bounds."""
+    global _media_cache
+    _media_cache = media_cache
+
+
+def b64encode_media(content: bytes) -> str:
+    """Base64-encode media bytes through the process-wide media cache."""
+    return _media_cache.b64encode(content)
@@ -39,3 +39,24 @@ def merge_parallel_session_states(original_state: Dict[str, Any], modified_state
     # Apply all collected changes to the original state
     for key, value in all_changes.items():
         original_state[key] = value
+
+
+def apply_session_state_changes(
+    session_state: Dict[str, Any], snapshot: Dict[str, Any], modified_state: Dict[str, Any]
+) -> None:
+    """
+    Apply to session_state the changes made to a copy of the snapshot, leaving the other keys as they are.
+    Nested dictionaries are compared key by key, so that steps changing different keys of the same dictionary
+    don't overwrite each other's changes.
+    """
+    for key, value in modified_state.items():
+        if key not in snapshot:
+            session_state[key] = value
+        elif isinstance(value, dict) and isinstance(snapshot[key], dict) and isinstance(session_state.get(key), dict):
+            apply_session_state_changes(session_state[key], snapshot[key], value)
+        elif snapshot[key] != value:
+            session_state[key] = value
+
+    for key in snapshot:
+        if key not in modified_state:
+            session_state.pop(key, None)
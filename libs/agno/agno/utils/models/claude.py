@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from agno.media import File, Image
 from agno.models.message import Message
 from agno.utils.log import log_error, log_warning
+from agno.utils.media_cache import get_media_cache
 
 try:
     from anthropic.types import (
@@ -44,8 +45,6 @@ def _format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
     """
     using_filetype = False
 
-    import base64
-
     # 'imghdr' was deprecated in Python 3.11: https://docs.python.org/3/library/imghdr.html
     # 'filetype' used as a fallback
     try:
@@ -81,8 +80,7 @@ def _format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
 
             path = Path(image.filepath) if isinstance(image.filepath, str) else image.filepath
             if path.exists() and path.is_file():
-                with open(image.filepath, "rb") as f:
-                    content_bytes = f.read()
+                content_bytes = get_media_cache().get_file_bytes(path)
             else:
                 log_error(f"Image file not found: {image}")
                 return None
@@ -119,7 +117,7 @@ def _format_image_for_message(image: Image) -> Optional[Dict[str, Any]]:
             "source": {
                 "type": "base64",
                 "media_type": media_type,
-                "data": base64.b64encode(content_bytes).decode("utf-8"),  # type: ignore
+                "data": get_media_cache().b64encode(content_bytes),  # type: ignore
             },
         }
 
@@ -160,12 +158,11 @@ def _format_file_for_message(file: File) -> Optional[Dict[str, Any]]:
         }
     # Case 2: Document is a local file path
     elif file.filepath is not None:
-        import base64
         from pathlib import Path
 
         path = Path(file.filepath) if isinstance(file.filepath, str) else file.filepath
         if path.exists() and path.is_file():
-            file_data = base64.standard_b64encode(path.read_bytes()).decode("utf-8")
+            file_data = get_media_cache().b64encode(get_media_cache().get_file_bytes(path))
 
             # Determine media type
             media_type = file.mime_type
@@ -191,9 +188,7 @@ def _format_file_for_message(file: File) -> Optional[Dict[str, Any]]:
             return None
     # Case 3: Document is bytes content
     elif file.content is not None:
-        import base64
-
-        file_data = base64.standard_b64encode(file.content).decode("utf-8")
+        file_data = get_media_cache().b64encode(file.content)
         return {
             "type": "document",
             "source": {"type": "base64", "media_type": file.mime_type or "application/pdf", "data": file_data},
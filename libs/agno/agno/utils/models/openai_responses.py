@@ -3,13 +3,12 @@ from typing import Any, Dict, List, Optional, Sequence, Union
 
 from agno.media import Image
 from agno.utils.log import logger
+from agno.utils.media_cache import get_media_cache
 
 
 def _process_bytes_image(image: bytes) -> Dict[str, Any]:
     """Process bytes image data."""
-    import base64
-
-    base64_image = base64.b64encode(image).decode("utf-8")
+    base64_image = get_media_cache().b64encode(image)
     image_url = f"data:image/jpeg;base64,{base64_image}"
     return {"type": "input_image", "image_url": image_url}
 
@@ -17,7 +16,6 @@ def _process_bytes_image(image: bytes) -> Dict[str, Any]:
 def _process_image_path(image_path: Union[Path, str]) -> Dict[str, Any]:
     """Process image ( file path)."""
     # Process local file image
-    import base64
     import mimetypes
 
     path = image_path if isinstance(image_path, Path) else Path(image_path)
@@ -25,10 +23,9 @@ def _process_image_path(image_path: Union[Path, str]) -> Dict[str, Any]:
         raise FileNotFoundError(f"Image file not found: {image_path}")
 
     mime_type = mimetypes.guess_type(image_path)[0] or "image/jpeg"
-    with open(path, "rb") as image_file:
-        base64_image = base64.b64encode(image_file.read()).decode("utf-8")
-        image_url = f"data:{mime_type};base64,{base64_image}"
-        return {"type": "input_image", "image_url": image_url}
+    base64_image = get_media_cache().b64encode(get_media_cache().get_file_bytes(path))
+    image_url = f"data:{mime_type};base64,{base64_image}"
+    return {"type": "input_image", "image_url": image_url}
 
 
 def _process_image_url(image_url: str) -> Dict[str, Any]:
@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Sequence
 from agno.media import Image
 from agno.models.message import Message
 from agno.utils.log import log_error, log_warning
+from agno.utils.media_cache import get_media_cache
 
 
 def format_images_for_message(message: Message, images: Sequence[Image]) -> Message:
@@ -25,9 +26,7 @@ def format_images_for_message(message: Message, images: Sequence[Image]) -> Mess
                 continue
 
             if image_content is not None:
-                import base64
-
-                base64_image = base64.b64encode(image_content).decode("utf-8")
+                base64_image = get_media_cache().b64encode(image_content)
                 image_url = f"data:image/jpeg;base64,{base64_image}"
                 image_payload = {"type": "image_url", "image_url": {"url": image_url}}
                 message_content_with_image.append(image_payload)
@@ -1,10 +1,10 @@
-import base64
 import mimetypes
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Union
 
 from agno.media import Audio, File, Image
 from agno.utils.log import log_error, log_warning
+from agno.utils.media_cache import get_media_cache
 
 # Ensure .webp is recognized
 mimetypes.add_type("image/webp", ".webp")
@@ -33,7 +33,7 @@ def audio_to_message(audio: Sequence[Audio]) -> List[Dict[str, Any]]:
 
         # The audio is raw data
         if audio_snippet.content:
-            encoded_string = base64.b64encode(audio_snippet.content).decode("utf-8")
+            encoded_string = get_media_cache().b64encode(audio_snippet.content)
             if not audio_format:
                 audio_format = "wav"  # Default format if not provided
 
@@ -41,7 +41,7 @@ def audio_to_message(audio: Sequence[Audio]) -> List[Dict[str, Any]]:
         elif audio_snippet.url:
             audio_bytes = audio_snippet.get_content_bytes()
             if audio_bytes is not None:
-                encoded_string = base64.b64encode(audio_bytes).decode("utf-8")
+                encoded_string = get_media_cache().b64encode(audio_bytes)
                 if not audio_format:
                     # Try to guess format from URL extension
                     try:
@@ -65,8 +65,7 @@ def audio_to_message(audio: Sequence[Audio]) -> List[Dict[str, Any]]:
             path = Path(audio_snippet.filepath)
             if path.exists() and path.is_file():
                 try:
-                    with open(path, "rb") as audio_file:
-                        encoded_string = base64.b64encode(audio_file.read()).decode("utf-8")
+                    encoded_string = get_media_cache().b64encode(get_media_cache().get_file_bytes(path))
                     if not audio_format:
                         audio_format = path.suffix.lstrip(".")
                 except Exception as e:
@@ -95,7 +94,7 @@ def audio_to_message(audio: Sequence[Audio]) -> List[Dict[str, Any]]:
 
 def _process_bytes_image(image: bytes, image_format: Optional[str] = None) -> Dict[str, Any]:
     """Process bytes image data."""
-    base64_image = base64.b64encode(image).decode("utf-8")
+    base64_image = get_media_cache().b64encode(image)
 
     # Use provided format or attempt detection, defaulting to JPEG
     if image_format:
@@ -125,10 +124,9 @@ def _process_image_path(image_path: Union[Path, str]) -> Dict[str, Any]:
 
     mime_type = mimetypes.guess_type(path)[0] or "image/jpeg"  # Default to jpeg if guess fails
     try:
-        with open(path, "rb") as image_file:
-            base64_image = base64.b64encode(image_file.read()).decode("utf-8")
-            image_url = f"data:{mime_type};base64,{base64_image}"
-            return {"type": "image_url", "image_url": {"url": image_url}}
+        base64_image = get_media_cache().b64encode(get_media_cache().get_file_bytes(path))
+        image_url = f"data:{mime_type};base64,{base64_image}"
+        return {"type": "image_url", "image_url": {"url": image_url}}
     except Exception as e:
         log_error(f"Failed to read image file {path}: {e}")
         raise  # Re-raise the exception after logging
@@ -214,10 +212,6 @@ def _format_file_for_message(file: File) -> Optional[Dict[str, Any]]:
     """
     Add a document url, base64 encoded content or OpenAI file to a message.
     """
-    import base64
-    import mimetypes
-    from pathlib import Path
-
     # Case 1: Document is a URL
     if file.url is not None:
         from urllib.parse import urlparse
@@ -229,7 +223,7 @@ def _format_file_for_message(file: File) -> Optional[Dict[str, Any]]:
         content_bytes, mime_type = result
         name = Path(urlparse(file.url).path).name or "file"
         _mime = mime_type or file.mime_type or mimetypes.guess_type(name)[0] or "application/pdf"
-        _encoded = base64.b64encode(content_bytes).decode("utf-8")
+        _encoded = get_media_cache().b64encode(content_bytes)
         _data_url = f"data:{_mime};base64,{_encoded}"
         return {"type": "file", "file": {"filename": name, "file_data": _data_url}}
 
@@ -239,10 +233,10 @@ def _format_file_for_message(file: File) -> Optional[Dict[str, Any]]:
         if not path.is_file():
             log_error(f"File not found: {path}")
             return None
-        data = path.read_bytes()
+        data = get_media_cache().get_file_bytes(path)
 
         _mime = file.mime_type or mimetypes.guess_type(path.name)[0] or "application/pdf"
-        _encoded = base64.b64encode(data).decode("utf-8")
+        _encoded = get_media_cache().b64encode(data)
         _data_url = f"data:{_mime};base64,{_encoded}"
         return {"type": "file", "file": {"filename": path.name, "file_data": _data_url}}
 
@@ -250,7 +244,7 @@ def _format_file_for_message(file: File) -> Optional[Dict[str, Any]]:
     if file.content is not None:
         name = getattr(file, "filename", "file")
         _mime = file.mime_type or mimetypes.guess_type(name)[0] or "application/pdf"
-        _encoded = base64.b64encode(file.content).decode("utf-8")
+        _encoded = get_media_cache().b64encode(file.content)
         _data_url = f"data:{_mime};base64,{_encoded}"
         return {"type": "file", "file": {"filename": name, "file_data": _data_url}}
 
@@ -16,6 +16,7 @@ from agno.reasoning.step import ReasoningStep
 from agno.run.agent import RunEvent, RunOutput, RunOutputEvent, RunPausedEvent
 from agno.utils.log import log_warning
 from agno.utils.message import get_text_from_message
+from agno.utils.print_response.streaming_markdown import StreamingMarkdown
 from agno.utils.response import create_panel, create_paused_run_output_panel, escape_markdown_tags, format_tool_calls
 from agno.utils.timer import Timer
 
@@ -51,9 +52,11 @@ def print_response_stream(
 ):
     _response_content: str = ""
     _response_reasoning_content: str = ""
-    response_content_batch: Union[str, JSON, Markdown] = ""
+    response_content_batch: Union[str, JSON, Markdown, StreamingMarkdown] = ""
     reasoning_steps: List[ReasoningStep] = []
     accumulated_tool_calls: List = []
+    # Only re-parses the end of the response as it streams in
+    response_markdown = StreamingMarkdown(tags_to_escape=tags_to_include_in_markdown)
 
     with Live(console=console) as live_log:
         status = Status("Thinking...", spinner="aesthetic", speed=0.4, refresh_per_second=10)
@@ -144,8 +147,8 @@ def print_response_stream(
 
             # Escape special tags before markdown conversion
             if markdown:
-                escaped_content = escape_markdown_tags(_response_content, tags_to_include_in_markdown)  # type: ignore
-                response_content_batch = Markdown(escaped_content)
+                response_markdown.update(_response_content)
+                response_content_batch = response_markdown
 
             response_content_stream: str = _response_content
 
@@ -156,7 +159,7 @@ def print_response_stream(
                 response_content = response_content_batch  # type: ignore
 
             # Sanitize empty Markdown content
-            if isinstance(response_content, Markdown):
+            if isinstance(response_content, (Markdown, StreamingMarkdown)):
                 if not (response_content.markup and response_content.markup.strip()):
                     response_content = None  # type: ignore
 
@@ -240,8 +243,10 @@ async def aprint_response_stream(
     _response_content: str = ""
     _response_reasoning_content: str = ""
     reasoning_steps: List[ReasoningStep] = []
-    response_content_batch: Union[str, JSON, Markdown] = ""
+    response_content_batch: Union[str, JSON, Markdown, StreamingMarkdown] = ""
     accumulated_tool_calls: List = []
+    # Only re-parses the end of the response as it streams in
+    response_markdown = StreamingMarkdown(tags_to_escape=tags_to_include_in_markdown)
 
     with Live(console=console) as live_log:
         status = Status("Thinking...", spinner="aesthetic", speed=0.4, refresh_per_second=10)
@@ -333,8 +338,8 @@ async def aprint_response_stream(
 
             # Escape special tags before markdown conversion
             if markdown:
-                escaped_content = escape_markdown_tags(_response_content, tags_to_include_in_markdown)  # type: ignore
-                response_content_batch = Markdown(escaped_content)
+                response_markdown.update(_response_content)
+                response_content_batch = response_markdown
 
             # Check if we have any response content to display
             if response_content_stream and not markdown:
@@ -343,7 +348,7 @@ async def aprint_response_stream(
                 response_content = response_content_batch  # type: ignore
 
             # Sanitize empty Markdown content
-            if isinstance(response_content, Markdown):
+            if isinstance(response_content, (Markdown, StreamingMarkdown)):
                 if not (response_content.markup and response_content.markup.strip()):
                     response_content = None  # type: ignore
 
@@ -401,7 +406,7 @@ async def aprint_response_stream(
 
 
 def build_panels_stream(
-    response_content: Union[str, JSON, Markdown],
+    response_content: Union[str, JSON, Markdown, StreamingMarkdown],
     response_event: RunOutputEvent,
     response_timer: Timer,
     response_reasoning_content_buffer: str,
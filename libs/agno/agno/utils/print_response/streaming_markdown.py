@@ -0,0 +1,151 @@
+import re
+from threading import Lock
+from typing import AbstractSet, Any, List, Optional
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.markdown import Markdown
+from rich.segment import Segment
+
+from agno.utils.response import escape_markdown_tags
+
+FENCE_MARKERS = ("```", "~~~")
+LIST_ITEM_PATTERN = re.compile(r"^([-*+]|\d+[.)])(\s|$)")
+
+
+def _render(markdown: Markdown, console: Console, options: ConsoleOptions) -> List[Segment]:
+    lines = console.render_lines(markdown, options, pad=False, new_lines=True)
+    return [segment for line in lines for segment in line]
+
+
+class _Block:
+    """A closed block, with its rendered lines for the last width it was rendered at."""
+
+    def __init__(self, markdown: Markdown):
+        self.markdown = markdown
+        self.width: Optional[int] = None
+        self.segments: List[Segment] = []
+
+        # Whether a blank line follows the block, which rich omits after some elements (horizontal rules)
+        self.new_line = True
+        top_level_tokens = [token for token in markdown.parsed if token.level == 0]
+        if top_level_tokens:
+            element = markdown.elements.get(top_level_tokens[-1].type.replace("_close", "_open"))
+            self.new_line = getattr(element, "new_line", True)
+
+    def render(self, console: Console, options: ConsoleOptions) -> List[Segment]:
+        if self.width != options.max_width:
+            self.segments = _render(self.markdown, console, options)
+            self.width = options.max_width
+        return self.segments
+
+
+class StreamingMarkdown:
+    """A Markdown renderable for a response that is still being streamed.
+
+    Building a `Markdown` from the whole response on every chunk re-parses and re-renders everything received so
+    far, which is quadratic in the length of the response. Instead, the text is split into closed blocks, which end
+    at a blank line outside a code fence and can no longer change, and the trailing open block. Closed blocks are
+    parsed once and their rendered lines are cached, so a redraw only parses and renders the open block. Parsing and
+    rendering happen when the live display refreshes, not when a chunk is added.
+    """
+
+    def __init__(self, markup: str = "", tags_to_escape: Optional[AbstractSet[str]] = None, **markdown_kwargs: Any):
+        self.tags_to_escape = set(tags_to_escape) if tags_to_escape else set()
+        self.markdown_kwargs = markdown_kwargs
+
+        self._text = ""
+        # Offset of the open block
+        self._open_block_start = 0
+        # Offset of the first line that hasn't been scanned for block boundaries
+        self._scan_offset = 0
+        self._fence: Optional[str] = None
+        self._after_blank_line = False
+
+        self._blocks: List[_Block] = []
+        self._lock = Lock()
+
+        if markup:
+            self.update(markup)
+
+    @property
+    def markup(self) -> str:
+        return self._text
+
+    def update(self, text: str) -> None:
+        """Set the full text of the response. Text that extends the current text only scans the new part."""
+        with self._lock:
+            if not text.startswith(self._text):
+                self._reset()
+            self._text = text
+            self._scan()
+
+    def append(self, text: str) -> None:
+        with self._lock:
+            self._text += text
+            self._scan()
+
+    def _reset(self) -> None:
+        self._text = ""
+        self._open_block_start = 0
+        self._scan_offset = 0
+        self._fence = None
+        self._after_blank_line = False
+        self._blocks = []
+
+    def _to_markdown(self, text: str) -> Markdown:
+        if self.tags_to_escape:
+            text = escape_markdown_tags(text, self.tags_to_escape)
+        return Markdown(text, **self.markdown_kwargs)
+
+    def _scan(self) -> None:
+        """Close the blocks that ended in the complete lines received since the last scan."""
+        while True:
+            line_end = self._text.find("\n", self._scan_offset)
+            if line_end == -1:
+                return
+            line_start, self._scan_offset = self._scan_offset, line_end + 1
+            line = self._text[line_start:line_end]
+            stripped = line.strip()
+
+            if self._fence is not None:
+                if stripped.startswith(self._fence) and not stripped.strip(self._fence[0]):
+                    self._fence = None
+                continue
+
+            if not stripped:
+                self._after_blank_line = True
+                continue
+
+            # A block starts at an unindented line after a blank line. Indented lines continue a list item, and list
+            # items continue a list, which renders differently when split.
+            if (
+                self._after_blank_line
+                and not line[0].isspace()
+                and not LIST_ITEM_PATTERN.match(line)
+                and line_start > self._open_block_start
+            ):
+                self._blocks.append(_Block(self._to_markdown(self._text[self._open_block_start : line_start])))
+                self._open_block_start = line_start
+            self._after_blank_line = False
+
+            for marker in FENCE_MARKERS:
+                if stripped.startswith(marker):
+                    self._fence = stripped[: len(stripped) - len(stripped.lstrip(marker[0]))]
+                    break
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        with self._lock:
+            blocks = list(self._blocks)
+            open_block = self._text[self._open_block_start :]
+
+        rendered = [(block.render(console, options), block.new_line) for block in blocks]
+        if open_block.strip():
+            rendered.append((_render(self._to_markdown(open_block), console, options), True))
+
+        new_line = False
+        for segments, block_new_line in rendered:
+            # Blocks are separated by a blank line, which some elements (lists, quotes) already start with
+            if new_line and segments and segments[0].text != "\n":
+                yield Segment.line()
+            yield from segments
+            new_line = block_new_line
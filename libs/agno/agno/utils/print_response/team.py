@@ -350,6 +350,7 @@ def print_response_stream(
     from rich.status import Status
     from rich.text import Text
 
+    from agno.utils.print_response.streaming_markdown import StreamingMarkdown
     from agno.utils.response import format_tool_calls
 
     if not tags_to_include_in_markdown:
@@ -360,6 +361,8 @@ def print_response_stream(
     _response_content: str = ""
     _response_reasoning_content: str = ""
     reasoning_steps: List[ReasoningStep] = []
+    # Only re-parses the end of the response as it streams in
+    response_markdown = StreamingMarkdown(tags_to_escape=tags_to_include_in_markdown)
 
     # Track tool calls by member and team
     member_tool_calls = {}  # type: ignore
@@ -490,11 +493,10 @@ def print_response_stream(
                                 processed_tool_calls.add(tool_id)
                                 member_tool_calls[member_id].append(tool)
 
-            response_content_stream: Union[str, Markdown] = _response_content
-            # Escape special tags before markdown conversion
+            response_content_stream: Union[str, StreamingMarkdown] = _response_content
             if team_markdown:
-                escaped_content = escape_markdown_tags(_response_content, tags_to_include_in_markdown)
-                response_content_stream = Markdown(escaped_content)
+                response_markdown.update(_response_content)
+                response_content_stream = response_markdown
 
             # Create new panels for each chunk
             panels = []
@@ -819,8 +821,8 @@ def print_response_stream(
         if _response_content:
             response_content_stream = _response_content
             if team_markdown:
-                escaped_content = escape_markdown_tags(_response_content, tags_to_include_in_markdown)
-                response_content_stream = Markdown(escaped_content)
+                response_markdown.update(_response_content)
+                response_content_stream = response_markdown
 
             response_panel = create_panel(
                 content=response_content_stream,
@@ -1179,6 +1181,8 @@ async def aprint_response_stream(
     from rich.status import Status
     from rich.text import Text
 
+    from agno.utils.print_response.streaming_markdown import StreamingMarkdown
+
     if not tags_to_include_in_markdown:
         tags_to_include_in_markdown = {"think", "thinking"}
 
@@ -1187,6 +1191,8 @@ async def aprint_response_stream(
     _response_content: str = ""
     _response_reasoning_content: str = ""
     reasoning_steps: List[ReasoningStep] = []
+    # Only re-parses the end of the response as it streams in
+    response_markdown = StreamingMarkdown(tags_to_escape=tags_to_include_in_markdown)
 
     # Track tool calls by member and team
     member_tool_calls = {}  # type: ignore
@@ -1317,11 +1323,10 @@ async def aprint_response_stream(
                                 processed_tool_calls.add(tool_id)
                                 member_tool_calls[member_id].append(tool)
 
-            response_content_stream: Union[str, Markdown] = _response_content
-            # Escape special tags before markdown conversion
+            response_content_stream: Union[str, StreamingMarkdown] = _response_content
             if team_markdown:
-                escaped_content = escape_markdown_tags(_response_content, tags_to_include_in_markdown)
-                response_content_stream = Markdown(escaped_content)
+                response_markdown.update(_response_content)
+                response_content_stream = response_markdown
 
             # Create new panels for each chunk
             panels = []
@@ -1664,8 +1669,8 @@ async def aprint_response_stream(
         if _response_content:
             response_content_stream = _response_content
             if team_markdown:
-                escaped_content = escape_markdown_tags(_response_content, tags_to_include_in_markdown)
-                response_content_stream = Markdown(escaped_content)
+                response_markdown.update(_response_content)
+                response_content_stream = response_markdown
 
             response_panel = create_panel(
                 content=response_content_stream,
@@ -31,6 +31,7 @@ from agno.run.workflow import (
     WorkflowRunOutputEvent,
     WorkflowStartedEvent,
 )
+from agno.utils.print_response.streaming_markdown import StreamingMarkdown
 from agno.utils.response import create_panel
 from agno.utils.timer import Timer
 from agno.workflow.types import StepOutput
@@ -247,6 +248,8 @@ def print_response_stream(
 
     # Streaming execution variables with smart step tracking
     current_step_content = ""
+    # Only re-parses the end of the step content as it streams in
+    current_step_markdown = StreamingMarkdown()
     current_step_name = ""
     current_step_index = 0
     step_results = []
@@ -684,8 +687,10 @@ def print_response_stream(
                                 title = "Custom Function (Streaming...)"
 
                             # Show the streaming content live in orange panel
+                            if markdown:
+                                current_step_markdown.update(current_step_content)
                             live_step_panel = create_panel(
-                                content=Markdown(current_step_content) if markdown else current_step_content,
+                                content=current_step_markdown if markdown else current_step_content,
                                 title=title,
                                 border_style="orange3",
                             )
@@ -980,6 +985,8 @@ async def aprint_response_stream(
 
     # Streaming execution variables
     current_step_content = ""
+    # Only re-parses the end of the step content as it streams in
+    current_step_markdown = StreamingMarkdown()
     current_step_name = ""
     current_step_index = 0
     step_results = []
@@ -1421,8 +1428,10 @@ async def aprint_response_stream(
                                 title = "Custom Function (Streaming...)"
 
                             # Show the streaming content live in orange panel
+                            if markdown:
+                                current_step_markdown.update(current_step_content)
                             live_step_panel = create_panel(
-                                content=Markdown(current_step_content) if markdown else current_step_content,
+                                content=current_step_markdown if markdown else current_step_content,
                                 title=title,
                                 border_style="orange3",
                             )
@@ -0,0 +1,339 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from agno.utils.log import log_debug
+
+if TYPE_CHECKING:
+    from agno.models.message import Message
+
+# Approximate per-message overhead (role, separators) added by chat formats
+MESSAGE_TOKEN_OVERHEAD = 4
+TRUNCATION_MARKER = "\n... [truncated {num_tokens} tokens]"
+
+
+class Tokenizer(ABC):
+    """Counts and truncates text in tokens.
+
+    Counts are memoized in a bounded LRU keyed by the text itself, so the same history message or knowledge
+    document is only tokenized once per process no matter how many runs include it.
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = Lock()
+
+    @abstractmethod
+    def encode(self, text: str) -> List[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, tokens: List[int]) -> str:
+        raise NotImplementedError
+
+    def encode_batch(self, texts: List[str]) -> List[List[int]]:
+        """Encode several texts at once. Tokenizers with a native batch encoder encode them in parallel."""
+        return [self.encode(text) for text in texts]
+
+    def encode_with_offsets(self, text: str) -> Tuple[List[int], List[int]]:
+        """Encode `text` and return the tokens with the character offset where each token starts.
+
+        A character can be split across several tokens, which don't decode on their own. Those tokens are decoded
+        together, and a token that starts inside a character gets the offset of that character.
+        """
+        tokens = self.encode(text)
+        offsets: List[int] = []
+        offset = 0
+        # First token whose characters are not complete yet, and how many of its characters are
+        start = 0
+        complete = 0
+        for i in range(len(tokens)):
+            offsets.append(offset + complete)
+            try:
+                piece = self.decode(tokens[start : i + 1])
+            except UnicodeDecodeError:
+                continue
+            if piece.endswith("\ufffd") and not text.startswith(piece, offset):
+                complete = len(os.path.commonprefix([piece, text[offset : offset + len(piece)]]))
+                continue
+            offset += len(piece)
+            start = i + 1
+            complete = 0
+        return tokens, offsets
+
+    def count_batch(self, texts: List[str]) -> List[int]:
+        """Count the tokens of several texts, encoding the ones that aren't cached in one batch."""
+        counts: Dict[int, int] = {}
+        missing: List[int] = []
+        with self._lock:
+            for i, text in enumerate(texts):
+                cached = self._cache.get(text) if text else 0
+                if cached is None:
+                    missing.append(i)
+                else:
+                    counts[i] = cached
+        if missing:
+            for i, tokens in zip(missing, self.encode_batch([texts[i] for i in missing])):
+                counts[i] = len(tokens)
+            with self._lock:
+                for i in missing:
+                    self._cache[texts[i]] = counts[i]
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return [counts[i] for i in range(len(texts))]
+
+    def _count(self, text: str) -> int:
+        return len(self.encode(text))
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        with self._lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                return cached
+
+        num_tokens = self._count(text)
+        with self._lock:
+            self._cache[text] = num_tokens
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return num_tokens
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Truncate `text` to at most `max_tokens` tokens, noting how much was removed."""
+        num_tokens = self.count(text)
+        if num_tokens <= max_tokens:
+            return text
+        tokens = self.encode(text)
+        return self.decode(tokens[:max_tokens]) + TRUNCATION_MARKER.format(num_tokens=num_tokens - max_tokens)
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Tokenizer backed by `tiktoken`. Encodings are loaded once per process."""
+
+    def __init__(self, encoding_name: str = "o200k_base", **kwargs):
+        super().__init__(**kwargs)
+        self.encoding_name = encoding_name
+
+    def encode(self, text: str) -> List[int]:
+        return _get_tiktoken_encoding(self.encoding_name).encode(text, disallowed_special=())
+
+    def decode(self, tokens: List[int]) -> str:
+        return _get_tiktoken_encoding(self.encoding_name).decode(tokens)
+
+    def encode_batch(self, texts: List[str]) -> List[List[int]]:
+        return _get_tiktoken_encoding(self.encoding_name).encode_batch(texts, disallowed_special=())
+
+    def encode_with_offsets(self, text: str) -> Tuple[List[int], List[int]]:
+        encoding = _get_tiktoken_encoding(self.encoding_name)
+        tokens = encoding.encode(text, disallowed_special=())
+        _, offsets = encoding.decode_with_offsets(tokens)
+        return tokens, offsets
+
+
+class HuggingFaceTokenizer(Tokenizer):
+    """Tokenizer backed by a Hugging Face `tokenizers` tokenizer. Tokenizers are loaded once per process."""
+
+    def __init__(self, model: str, **kwargs):
+        super().__init__(**kwargs)
+        self.model = model
+
+    def encode(self, text: str) -> List[int]:
+        return _get_hf_tokenizer(self.model).encode(text, add_special_tokens=False).ids
+
+    def decode(self, tokens: List[int]) -> str:
+        return _get_hf_tokenizer(self.model).decode(tokens)
+
+    def encode_batch(self, texts: List[str]) -> List[List[int]]:
+        return [
+            encoding.ids for encoding in _get_hf_tokenizer(self.model).encode_batch(texts, add_special_tokens=False)
+        ]
+
+    def encode_with_offsets(self, text: str) -> Tuple[List[int], List[int]]:
+        encoding = _get_hf_tokenizer(self.model).encode(text, add_special_tokens=False)
+        return encoding.ids, [start for start, _ in encoding.offsets]
+
+
+class CharTokenizer(Tokenizer):
+    """Dependency-free approximation that assumes a fixed number of characters per token."""
+
+    def __init__(self, chars_per_token: int = 4, **kwargs):
+        super().__init__(**kwargs)
+        self.chars_per_token = chars_per_token
+
+    def _count(self, text: str) -> int:
+        return -(-len(text) // self.chars_per_token)
+
+    def encode(self, text: str) -> List[int]:
+        # Each token is a chunk of characters, packed into an int with a leading 1 byte so it decodes on its own
+        return [
+            int.from_bytes(b"\x01" + text[i : i + self.chars_per_token].encode("utf-8"), "big")
+            for i in range(0, len(text), self.chars_per_token)
+        ]
+
+    def decode(self, tokens: List[int]) -> str:
+        return b"".join(token.to_bytes((token.bit_length() + 7) // 8, "big")[1:] for token in tokens).decode("utf-8")
+
+    def encode_with_offsets(self, text: str) -> Tuple[List[int], List[int]]:
+        return self.encode(text), list(range(0, len(text), self.chars_per_token))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        num_tokens = self.count(text)
+        if num_tokens <= max_tokens:
+            return text
+        return text[: max_tokens * self.chars_per_token] + TRUNCATION_MARKER.format(num_tokens=num_tokens - max_tokens)
+
+
+@lru_cache(maxsize=None)
+def _get_tiktoken_encoding(encoding_name: str) -> Any:
+    import tiktoken
+
+    return tiktoken.get_encoding(encoding_name)
+
+
+@lru_cache(maxsize=None)
+def _get_hf_tokenizer(model: str) -> Any:
+    try:
+        from tokenizers import Tokenizer as HFTokenizer
+    except ImportError:
+        raise ImportError("`tokenizers` not installed. Please install it with `pip install tokenizers`")
+
+    return HFTokenizer.from_pretrained(model)
+
+
+_default_tokenizer: Optional[Tokenizer] = None
+_tokenizers: Dict[str, Tokenizer] = {}
+_tokenizers_lock = Lock()
+
+
+def get_default_tokenizer() -> Tokenizer:
+    """Return the process-wide tokenizer: tiktoken if it is installed, otherwise a character-based estimate."""
+    global _default_tokenizer
+    if _default_tokenizer is None:
+        try:
+            _get_tiktoken_encoding("o200k_base")
+            _default_tokenizer = TiktokenTokenizer()
+        except Exception:
+            log_debug("tiktoken not available, estimating tokens from characters")
+            _default_tokenizer = CharTokenizer()
+    return _default_tokenizer
+
+
+def _is_tiktoken_encoding(name: str) -> bool:
+    try:
+        import tiktoken
+    except ImportError:
+        # Encoding names all end in "_base", e.g. "o200k_base"
+        return name.endswith("_base")
+    return name in tiktoken.list_encoding_names()
+
+
+def get_tokenizer(name: Optional[str] = None) -> Tokenizer:
+    """Return the process-wide tokenizer for a tiktoken encoding or a Hugging Face model.
+
+    Tokenizers are shared, so everything that uses the same tokenizer also shares its token count cache. Without a
+    name this is the default tokenizer.
+    """
+    if name is None:
+        return get_default_tokenizer()
+    with _tokenizers_lock:
+        tokenizer = _tokenizers.get(name)
+        if tokenizer is None:
+            if _is_tiktoken_encoding(name):
+                tokenizer = TiktokenTokenizer(encoding_name=name)
+            else:
+                tokenizer = HuggingFaceTokenizer(model=name)
+            _tokenizers[name] = tokenizer
+        return tokenizer
+
+
+def count_message_tokens(
+    message: "Message", tokenizer: Optional[Tokenizer] = None, max_tool_result_tokens: Optional[int] = None
+) -> int:
+    """Count the tokens a message contributes to the context: its text content and tool calls.
+
+    With `max_tool_result_tokens`, tool results are counted as they will be once truncated.
+    """
+    tokenizer = tokenizer or get_default_tokenizer()
+    num_tokens = MESSAGE_TOKEN_OVERHEAD
+    if isinstance(message.content, str):
+        content = message.content
+        if max_tool_result_tokens is not None and message.role == "tool":
+            content = tokenizer.truncate(content, max_tool_result_tokens)
+        num_tokens += tokenizer.count(content)
+    elif isinstance(message.content, list):
+        for part in message.content:
+            if isinstance(part, dict) and isinstance(part.get("text"), str):
+                num_tokens += tokenizer.count(part["text"])
+            elif isinstance(part, str):
+                num_tokens += tokenizer.count(part)
+    if message.tool_calls:
+        num_tokens += tokenizer.count(json.dumps(message.tool_calls, default=str))
+    return num_tokens
+
+
+def truncate_tool_results(
+    messages: List["Message"], max_tokens: int, tokenizer: Optional[Tokenizer] = None
+) -> List["Message"]:
+    """Truncate the string content of tool result messages to `max_tokens`. Messages are modified in place."""
+    tokenizer = tokenizer or get_default_tokenizer()
+    for message in messages:
+        if message.role == "tool" and isinstance(message.content, str):
+            message.content = tokenizer.truncate(message.content, max_tokens)
+    return messages
+
+
+def fit_messages_to_token_budget(
+    messages: List["Message"],
+    max_tokens: int,
+    user_role: str = "user",
+    tokenizer: Optional[Tokenizer] = None,
+    max_tool_result_tokens: Optional[int] = None,
+) -> List["Message"]:
+    """Keep the newest conversation turns that fit in `max_tokens`.
+
+    Messages are grouped into turns that start at a `user_role` message, and whole turns are dropped so an
+    assistant tool call is never separated from its tool results. Turns are counted newest first, and counting
+    stops at the first turn that doesn't fit.
+    """
+    tokenizer = tokenizer or get_default_tokenizer()
+
+    turns: List[List["Message"]] = []
+    for message in messages:
+        if message.role == user_role or not turns:
+            turns.append([message])
+        else:
+            turns[-1].append(message)
+
+    selected: List[List["Message"]] = []
+    used_tokens = 0
+    for turn in reversed(turns):
+        turn_tokens = sum(count_message_tokens(m, tokenizer, max_tool_result_tokens) for m in turn)
+        if used_tokens + turn_tokens > max_tokens:
+            break
+        selected.append(turn)
+        used_tokens += turn_tokens
+
+    log_debug(f"Selected {len(selected)}/{len(turns)} turns from history ({used_tokens}/{max_tokens} tokens)")
+    return [message for turn in reversed(selected) for message in turn]
+
+
+def fit_texts_to_token_budget(texts: List[str], max_tokens: int, tokenizer: Optional[Tokenizer] = None) -> List[str]:
+    """Keep texts in order until the next one would exceed `max_tokens`."""
+    tokenizer = tokenizer or get_default_tokenizer()
+    selected: List[str] = []
+    used_tokens = 0
+    for text in texts:
+        num_tokens = tokenizer.count(text)
+        if used_tokens + num_tokens > max_tokens:
+            break
+        selected.append(text)
+        used_tokens += num_tokens
+    return selected
@@ -0,0 +1,37 @@
+from typing import Any, List, Optional, Set
+
+
+def has_step_dependencies(steps: List[Any]) -> bool:
+    """True if any step declares the prior steps it depends on."""
+    return any(getattr(step, "depends_on", None) is not None for step in steps)
+
+
+def get_step_dependencies(steps: List[Any], step_names: List[Optional[str]]) -> List[Set[int]]:
+    """Resolve the indices of the steps each step depends on.
+
+    Steps with `depends_on` depend only on the named steps, which must come before them. Steps without it
+    depend on every step before them, so they keep running in order.
+    """
+    dependencies: List[Set[int]] = []
+    for index, step in enumerate(steps):
+        depends_on = getattr(step, "depends_on", None)
+        if depends_on is None:
+            dependencies.append(set(range(index)))
+            continue
+
+        step_dependencies: Set[int] = set()
+        for name in depends_on:
+            if name not in step_names[:index]:
+                raise ValueError(f"Step '{step_names[index]}' depends on '{name}', which is not a prior step")
+            step_dependencies.add(step_names.index(name))
+        dependencies.append(step_dependencies)
+    return dependencies
+
+
+def get_ready_steps(dependencies: List[Set[int]], started: Set[int], completed: Set[int]) -> List[int]:
+    """Indices of the steps that haven't started and whose dependencies have all completed, in step order."""
+    return [
+        index
+        for index, step_dependencies in enumerate(dependencies)
+        if index not in started and step_dependencies <= completed
+    ]
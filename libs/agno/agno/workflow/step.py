@@ -7,6 +7,7 @@ from uuid import uuid4
 from pydantic import BaseModel
 
 from agno.agent import Agent
+from agno.db.base import BaseDb
 from agno.media import Audio, Image, Video
 from agno.models.metrics import Metrics
 from agno.run.agent import RunOutput
@@ -20,6 +21,13 @@ from agno.run.workflow import (
 from agno.team import Team
 from agno.utils.log import log_debug, logger, use_agent_logger, use_team_logger, use_workflow_logger
 from agno.utils.merge_dict import merge_dictionaries
+from agno.workflow.step_cache import (
+    get_function_fingerprint,
+    get_step_cache_key,
+    get_step_output_cache,
+    get_tools_fingerprint,
+    get_value_fingerprint,
+)
 from agno.workflow.types import StepInput, StepOutput, StepType
 
 StepExecutor = Callable[
@@ -56,10 +64,26 @@ class Step:
 
     skip_on_failure: bool = False
 
+    # Names of the prior steps whose outputs this step uses. When any step sets this, the workflow runs steps
+    # as soon as their dependencies complete. None means the step depends on every step before it.
+    depends_on: Optional[List[str]] = None
+
     # Input validation mode
     # If False, only warn about missing inputs
     strict_input_validation: bool = False
 
+    # If True, replay the cached output when the step receives the same input and session state again
+    cache_results: bool = False
+    # Seconds after which cached outputs expire. None means they never expire.
+    cache_ttl: Optional[int] = None
+    # Only these session_state keys affect the cache key. None means the whole session_state.
+    cache_state_keys: Optional[List[str]] = None
+    # Db to cache outputs in. Defaults to the workflow db, outputs are cached in memory if neither is set.
+    cache_db: Optional[BaseDb] = None
+    # Part of the cache key. Change it to invalidate the cached outputs when something the key doesn't cover
+    # changes, like a mutable global or the configuration of a toolkit.
+    cache_version: Optional[str] = None
+
     _retry_count: int = 0
 
     def __init__(
@@ -74,6 +98,12 @@ class Step:
         timeout_seconds: Optional[int] = None,
         skip_on_failure: bool = False,
         strict_input_validation: bool = False,
+        depends_on: Optional[List[str]] = None,
+        cache_results: bool = False,
+        cache_ttl: Optional[int] = None,
+        cache_state_keys: Optional[List[str]] = None,
+        cache_db: Optional[BaseDb] = None,
+        cache_version: Optional[str] = None,
     ):
         # Auto-detect name for function executors if not provided
         if name is None and executor is not None:
@@ -93,6 +123,12 @@ class Step:
         self.timeout_seconds = timeout_seconds
         self.skip_on_failure = skip_on_failure
         self.strict_input_validation = strict_input_validation
+        self.depends_on = depends_on
+        self.cache_results = cache_results
+        self.cache_ttl = cache_ttl
+        self.cache_state_keys = cache_state_keys
+        self.cache_db = cache_db
+        self.cache_version = cache_version
         self.step_id = step_id
 
         if step_id is None:
@@ -164,6 +200,58 @@ class Step:
             return response.metrics
         return None
 
+    def _get_cache_config(self) -> Dict[str, Any]:
+        """The parts of the step configuration that affect its output"""
+        executor = self.active_executor
+        config: Dict[str, Any] = {
+            "name": self.name,
+            "executor_type": self._executor_type,
+            "cache_version": self.cache_version,
+        }
+        if self._executor_type == "function":
+            config["function"] = get_function_fingerprint(executor)
+        else:
+            model = getattr(executor, "model", None)
+            for attr in ["id", "name", "role", "description", "instructions", "expected_output", "additional_context"]:
+                config[attr] = get_value_fingerprint(getattr(executor, attr, None))
+            config["model"] = [model.provider, model.id] if model is not None else None
+            config["tools"] = get_tools_fingerprint(getattr(executor, "tools", None))
+            members = getattr(executor, "members", None)
+            if members:
+                config["members"] = [
+                    [
+                        getattr(member, "name", None),
+                        get_value_fingerprint(getattr(member, "instructions", None)),
+                        get_tools_fingerprint(getattr(member, "tools", None)),
+                    ]
+                    for member in members
+                ]
+        return config
+
+    def _get_cache_key(self, step_input: StepInput, session_state: Optional[Dict[str, Any]]) -> Optional[str]:
+        if not self.cache_results:
+            return None
+        state = session_state
+        if self.cache_state_keys is not None:
+            state = {k: v for k, v in (session_state or {}).items() if k in self.cache_state_keys}
+        try:
+            return get_step_cache_key(self._get_cache_config(), step_input, state)
+        except Exception as e:
+            logger.warning(f"Could not compute cache key for step {self.name}, not caching: {e}")
+            return None
+
+    def _get_cached_output(self, cache_key: Optional[str]) -> Optional[StepOutput]:
+        if cache_key is None:
+            return None
+        cached_output = get_step_output_cache().get(cache_key, db=self.cache_db)
+        if cached_output is not None:
+            log_debug(f"Replaying cached output for step: {self.name}")
+        return cached_output
+
+    def _cache_step_output(self, cache_key: Optional[str], step_output: StepOutput) -> None:
+        if cache_key is not None and step_output.success:
+            get_step_output_cache().set(cache_key, step_output, ttl=self.cache_ttl, db=self.cache_db)
+
     def _call_custom_function(
         self,
         func: Callable,
@@ -213,6 +301,11 @@ class Step:
 
         session_state_copy = copy(session_state) if session_state is not None else {}
 
+        cache_key = self._get_cache_key(step_input, session_state)
+        cached_output = self._get_cached_output(cache_key)
+        if cached_output is not None:
+            return cached_output
+
         # Execute with retries
         for attempt in range(self.max_retries + 1):
             try:
@@ -318,6 +411,7 @@ class Step:
 
                 # Create StepOutput from response
                 step_output = self._process_step_output(response)  # type: ignore
+                self._cache_step_output(cache_key, step_output)
 
                 return step_output
 
@@ -381,6 +475,24 @@ class Step:
                 parent_step_id=parent_step_id,
             )
 
+        cache_key = self._get_cache_key(step_input, session_state)
+        cached_output = self._get_cached_output(cache_key)
+        if cached_output is not None:
+            yield cached_output
+            if stream_intermediate_steps and workflow_run_response:
+                yield StepCompletedEvent(
+                    run_id=workflow_run_response.run_id or "",
+                    workflow_name=workflow_run_response.workflow_name or "",
+                    workflow_id=workflow_run_response.workflow_id or "",
+                    session_id=workflow_run_response.session_id or "",
+                    step_name=self.name,
+                    step_index=step_index,
+                    content=cached_output.content,
+                    step_response=cached_output,
+                    parent_step_id=parent_step_id,
+                )
+            return
+
         # Execute with retries and streaming
         for attempt in range(self.max_retries + 1):
             try:
@@ -515,6 +627,7 @@ class Step:
 
                 # Yield the step output
                 final_response = self._process_step_output(final_response)
+                self._cache_step_output(cache_key, final_response)
                 yield final_response
 
                 # Emit StepCompletedEvent
@@ -569,6 +682,11 @@ class Step:
         # Create session_state copy once to avoid duplication
         session_state_copy = copy(session_state) if session_state is not None else {}
 
+        cache_key = self._get_cache_key(step_input, session_state)
+        cached_output = self._get_cached_output(cache_key)
+        if cached_output is not None:
+            return cached_output
+
         # Execute with retries
         for attempt in range(self.max_retries + 1):
             try:
@@ -696,6 +814,7 @@ class Step:
 
                 # Create StepOutput from response
                 step_output = self._process_step_output(response)  # type: ignore
+                self._cache_step_output(cache_key, step_output)
 
                 return step_output
 
@@ -746,6 +865,25 @@ class Step:
                 parent_step_id=parent_step_id,
             )
 
+        cache_key = self._get_cache_key(step_input, session_state)
+        cached_output = self._get_cached_output(cache_key)
+        if cached_output is not None:
+            yield cached_output
+            if stream_intermediate_steps and workflow_run_response:
+                yield StepCompletedEvent(
+                    run_id=workflow_run_response.run_id or "",
+                    workflow_name=workflow_run_response.workflow_name or "",
+                    workflow_id=workflow_run_response.workflow_id or "",
+                    session_id=workflow_run_response.session_id or "",
+                    step_name=self.name,
+                    step_index=step_index,
+                    step_id=self.step_id,
+                    content=cached_output.content,
+                    step_response=cached_output,
+                    parent_step_id=parent_step_id,
+                )
+            return
+
         # Execute with retries and streaming
         for attempt in range(self.max_retries + 1):
             try:
@@ -893,6 +1031,7 @@ class Step:
 
                 # Yield the final response
                 final_response = self._process_step_output(final_response)
+                self._cache_step_output(cache_key, final_response)
                 yield final_response
 
                 if stream_intermediate_steps and workflow_run_response:
@@ -0,0 +1,259 @@
+import hashlib
+import inspect
+import json
+import re
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from threading import Lock
+from types import CodeType, FunctionType, MethodType, ModuleType
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from agno.db.base import BaseDb
+from agno.media import Audio, File, Image, Video
+from agno.utils.log import log_debug, log_warning
+from agno.workflow.types import StepInput, StepOutput
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# session_state keys set by the workflow for every run, which must not affect the cache key
+RUN_SCOPED_STATE_KEYS = {
+    "current_session_id",
+    "current_user_id",
+    "current_run_id",
+    "workflow_id",
+    "workflow_name",
+    "run_id",
+    "session_id",
+}
+
+
+# Memory addresses in reprs, which differ between processes
+ADDRESS_PATTERN = re.compile(r" at 0x[0-9a-fA-F]+")
+
+# Values of globals and closure cells that are part of the cache key. Mutable values, like a list the function
+# appends to, would change the key on every call: steps depending on them should set a cache_version instead.
+CONSTANT_TYPES = (str, bytes, int, float, complex, bool, type(None), tuple, frozenset)
+
+
+def _describe_code(code: CodeType) -> List[Any]:
+    """The bytecode, constants and names of a code object, including those of nested functions and lambdas"""
+    consts = [
+        _describe_code(const) if inspect.iscode(const) else get_value_fingerprint(const) for const in code.co_consts
+    ]
+    return [code.co_code.hex(), consts, list(code.co_names)]
+
+
+def _get_global_names(code: CodeType) -> List[str]:
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names.extend(_get_global_names(const))
+    return names
+
+
+def get_value_fingerprint(value: Any, seen: Optional[Set[int]] = None) -> Any:
+    """A description of a value that is the same in every process, as long as the value is the same"""
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    if isinstance(value, bytes):
+        return value.hex()
+    if isinstance(value, (list, tuple)):
+        return [get_value_fingerprint(v, seen) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((get_value_fingerprint(v, seen) for v in value), key=repr)
+    if isinstance(value, dict):
+        return {str(k): get_value_fingerprint(v, seen) for k, v in value.items()}
+    if isinstance(value, ModuleType):
+        return f"module:{value.__name__}"
+    if isinstance(value, MethodType):
+        return get_value_fingerprint(value.__func__, seen)
+    if isinstance(value, FunctionType):
+        return get_function_fingerprint(value, seen)
+    if isinstance(value, type):
+        return f"class:{value.__module__}.{value.__qualname__}"
+    if inspect.iscode(value):
+        return _describe_code(value)
+    return ADDRESS_PATTERN.sub("", repr(value))
+
+
+def get_function_fingerprint(func: Any, seen: Optional[Set[int]] = None) -> Any:
+    """Describe a function by its name and code, and the constant values and functions it references.
+
+    Constants are compared without memory addresses, so the description is stable across processes. Closure cells
+    and globals are included when they hold constants, functions, classes or modules.
+    """
+    func = getattr(func, "__func__", func)
+    name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', type(func).__qualname__)}"
+    code = getattr(func, "__code__", None)
+    if code is None:
+        # Callable objects are described by their __call__ method, builtins by their name
+        call = getattr(type(func), "__call__", None)
+        if isinstance(call, FunctionType):
+            return [name, get_function_fingerprint(call, seen)]
+        return name
+
+    seen = seen if seen is not None else set()
+    if id(func) in seen:
+        return name
+    seen.add(id(func))
+
+    def referenced(value: Any) -> Any:
+        if isinstance(value, CONSTANT_TYPES):
+            return get_value_fingerprint(value, seen)
+        if isinstance(value, (FunctionType, MethodType, type, ModuleType)):
+            return get_value_fingerprint(value, seen)
+        return None
+
+    closure = []
+    for cell in getattr(func, "__closure__", None) or ():
+        try:
+            closure.append(referenced(cell.cell_contents))
+        except ValueError:
+            # Empty cell
+            closure.append(None)
+
+    func_globals = getattr(func, "__globals__", {})
+    global_values = {
+        global_name: referenced(func_globals[global_name])
+        for global_name in sorted(set(_get_global_names(code)))
+        if global_name in func_globals
+    }
+    return [name, _describe_code(code), closure, global_values]
+
+
+def get_tools_fingerprint(tools: Optional[List[Any]]) -> Any:
+    """Describe the tools of an agent or team by their names, schemas and code"""
+    from agno.tools.function import Function
+    from agno.tools.toolkit import Toolkit
+
+    def describe(tool: Any) -> Any:
+        if isinstance(tool, Toolkit):
+            functions = {name: describe(function) for name, function in tool.functions.items()}
+            return [get_value_fingerprint(type(tool)), tool.name, functions]
+        if isinstance(tool, Function):
+            entrypoint = get_function_fingerprint(tool.entrypoint) if tool.entrypoint is not None else None
+            return [tool.name, tool.description, get_value_fingerprint(tool.parameters), entrypoint]
+        if callable(tool):
+            return get_function_fingerprint(tool)
+        return get_value_fingerprint(tool)
+
+    return [describe(tool) for tool in tools or []]
+
+
+def _media_key(media: Any) -> Optional[str]:
+    if isinstance(media, (Image, Video, Audio, File)):
+        if media.url:
+            return media.url
+        if media.filepath:
+            return str(media.filepath)
+        if isinstance(media.content, bytes):
+            return hashlib.sha256(media.content).hexdigest()
+        if media.content is not None:
+            return hashlib.sha256(str(media.content).encode("utf-8")).hexdigest()
+    return getattr(media, "id", None)
+
+
+def get_step_cache_key(step_config: Dict[str, Any], step_input: StepInput, state: Optional[Dict[str, Any]]) -> str:
+    """Stable hash of a step's configuration, its input and the session state it can read."""
+    previous_step_outputs = {
+        name: output.content if output is not None else None
+        for name, output in (step_input.previous_step_outputs or {}).items()
+    }
+    payload = {
+        "step": step_config,
+        "input": step_input.get_input_as_string(),
+        "previous_step_content": step_input.previous_step_content,
+        "previous_step_outputs": previous_step_outputs,
+        "additional_data": step_input.additional_data,
+        "images": [_media_key(image) for image in step_input.images or []],
+        "videos": [_media_key(video) for video in step_input.videos or []],
+        "audio": [_media_key(audio) for audio in step_input.audio or []],
+        "files": [_media_key(file) for file in step_input.files or []],
+        "state": {k: v for k, v in (state or {}).items() if k not in RUN_SCOPED_STATE_KEYS},
+    }
+    serialized = json.dumps(payload, sort_keys=True, default=str)
+    return f"step:{hashlib.sha256(serialized.encode('utf-8')).hexdigest()}"
+
+
+class StepOutputCache:
+    """Cache of memoized step outputs.
+
+    Outputs are stored in the given db when it supports caching, and otherwise in a process-wide LRU.
+    Replayed outputs have no metrics, since no model was called to produce them.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Optional[float], StepOutput]]" = OrderedDict()
+        self._lock = Lock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def _record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key: str, db: Optional[BaseDb] = None) -> Optional[StepOutput]:
+        if db is not None:
+            try:
+                data = db.get_cache_entry(key)
+                self._record(data is not None)
+                return StepOutput.from_dict(data) if data is not None else None
+            except NotImplementedError:
+                pass
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= time.time():
+                self._entries.pop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return replace(entry[1])
+
+    def set(self, key: str, step_output: StepOutput, ttl: Optional[int] = None, db: Optional[BaseDb] = None) -> None:
+        cached_output = replace(step_output, metrics=None)
+        if db is not None:
+            try:
+                data = cached_output.to_dict()
+                data["files"] = [file.to_dict() for file in cached_output.files] if cached_output.files else None
+                db.set_cache_entry(key, data, ttl=ttl)
+                return
+            except NotImplementedError:
+                log_debug("Db does not support caching, caching step output in memory")
+            except Exception as e:
+                log_warning(f"Error caching step output: {e}")
+                return
+
+        with self._lock:
+            expires_at = time.time() + ttl if ttl is not None else None
+            self._entries[key] = (expires_at, cached_output)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_step_output_cache = StepOutputCache()
+
+
+def get_step_output_cache() -> StepOutputCache:
+    """Return the process-wide step output cache."""
+    return _step_output_cache
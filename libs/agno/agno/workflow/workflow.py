@@ -1,5 +1,5 @@
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from os import getenv
 from typing import (
@@ -12,6 +12,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Set,
     Tuple,
     Type,
     Union,
@@ -51,6 +52,7 @@ from agno.run.workflow import (
 )
 from agno.session.workflow import WorkflowSession
 from agno.team.team import Team
+from agno.utils.blob_store import offload_media
 from agno.utils.common import is_typed_dict, validate_typed_dict
 from agno.utils.log import (
     log_debug,
@@ -61,6 +63,7 @@ from agno.utils.log import (
     set_log_level_to_info,
     use_workflow_logger,
 )
+from agno.utils.merge_dict import apply_session_state_changes
 from agno.utils.print_response.workflow import (
     aprint_response,
     aprint_response_stream,
@@ -68,6 +71,7 @@ from agno.utils.print_response.workflow import (
     print_response_stream,
 )
 from agno.workflow.condition import Condition
+from agno.workflow.graph import get_ready_steps, get_step_dependencies, has_step_dependencies
 from agno.workflow.loop import Loop
 from agno.workflow.parallel import Parallel
 from agno.workflow.router import Router
@@ -92,6 +96,9 @@ STEP_TYPE_MAPPING = {
     Router: StepType.ROUTER,
 }
 
+# Key in WorkflowRunOutput.metadata holding the state needed to resume a run
+CHECKPOINT_METADATA_KEY = "checkpoint"
+
 WorkflowSteps = Union[
     Callable[
         ["Workflow", WorkflowExecutionInput],
@@ -157,6 +164,11 @@ class Workflow:
     # Control whether to store executor responses (agent/team responses) in flattened runs
     store_executor_outputs: bool = True
 
+    # Save the run to the db after each step, so a failed or interrupted run can be continued with resume()
+    checkpoint_steps: bool = False
+    # Maximum number of steps run at once when steps declare the steps they depend on
+    max_concurrent_steps: Optional[int] = None
+
     websocket_handler: Optional[WebSocketHandler] = None
 
     # Input schema to validate the input to the workflow
@@ -187,6 +199,8 @@ class Workflow:
         store_events: bool = False,
         events_to_skip: Optional[List[Union[WorkflowRunEvent, RunEvent, TeamRunEvent]]] = None,
         store_executor_outputs: bool = True,
+        checkpoint_steps: bool = False,
+        max_concurrent_steps: Optional[int] = None,
         input_schema: Optional[Type[BaseModel]] = None,
         metadata: Optional[Dict[str, Any]] = None,
         cache_session: bool = False,
@@ -206,6 +220,8 @@ class Workflow:
         self.stream = stream
         self.stream_intermediate_steps = stream_intermediate_steps
         self.store_executor_outputs = store_executor_outputs
+        self.checkpoint_steps = checkpoint_steps
+        self.max_concurrent_steps = max_concurrent_steps
         self.input_schema = input_schema
         self.metadata = metadata
         self.cache_session = cache_session
@@ -585,7 +601,8 @@ class Workflow:
         try:
             if not self.db:
                 raise ValueError("Db not initialized")
-            result = self.db.upsert_session(session=session)
+            with offload_media():
+                result = self.db.upsert_session(session=session)
             return result if isinstance(result, (WorkflowSession, type(None))) else None
         except Exception as e:
             log_warning(f"Error upserting session into db: {e}")
@@ -843,6 +860,355 @@ class Workflow:
             steps=steps_dict,
         )
 
+    def _restore_checkpoint(
+        self, workflow_run_response: WorkflowRunOutput
+    ) -> Tuple[int, List[str], List[Union[StepOutput, List[StepOutput]]], Dict[str, StepOutput]]:
+        """Return the index of the first step to run and the outputs of the steps already completed"""
+        checkpoint = (workflow_run_response.metadata or {}).get(CHECKPOINT_METADATA_KEY)
+        if not checkpoint:
+            return 0, [], [], {}
+
+        step_output_names: List[str] = list(checkpoint.get("step_output_names") or [])
+        collected_step_outputs = list(workflow_run_response.step_results or [])[: len(step_output_names)]
+        previous_step_outputs: Dict[str, StepOutput] = {}
+        for step_name, step_output in zip(step_output_names, collected_step_outputs):
+            previous_step_outputs[step_name] = cast(StepOutput, step_output)
+
+        start_step_index = checkpoint.get("next_step_index", 0)
+        if start_step_index > 0:
+            log_debug(f"Resuming run {workflow_run_response.run_id} from step {start_step_index + 1}")
+        return start_step_index, step_output_names, collected_step_outputs, previous_step_outputs
+
+    def _save_checkpoint(
+        self,
+        session: WorkflowSession,
+        workflow_run_response: WorkflowRunOutput,
+        execution_input: WorkflowExecutionInput,
+        next_step_index: int,
+        step_output_names: List[str],
+        collected_step_outputs: List[Union[StepOutput, List[StepOutput]]],
+        output_media: Tuple[List[Image], List[Video], List[Audio], List[File]],
+    ) -> None:
+        """Save the completed steps of a run to the db so the run can be resumed"""
+        if not self.checkpoint_steps or self.db is None:
+            return
+
+        output_images, output_videos, output_audio, output_files = output_media
+        workflow_run_response.step_results = collected_step_outputs
+        workflow_run_response.images = output_images
+        workflow_run_response.videos = output_videos
+        workflow_run_response.audio = output_audio
+        workflow_run_response.metadata = {
+            **(workflow_run_response.metadata or {}),
+            CHECKPOINT_METADATA_KEY: {
+                "next_step_index": next_step_index,
+                "step_output_names": list(step_output_names),
+                "additional_data": execution_input.additional_data,
+                "files": [file.to_dict() for file in output_files],
+            },
+        }
+        session.upsert_run(run=workflow_run_response)
+
+        # save_session() strips run-scoped keys from the session_state in place, so save a copy mid-run
+        session_data = dict(session.session_data or {})
+        if isinstance(session_data.get("session_state"), dict):
+            session_data["session_state"] = dict(session_data["session_state"])
+        self.save_session(session=replace(session, session_data=session_data))
+        log_debug(f"Saved checkpoint for run {workflow_run_response.run_id} at step {next_step_index}")
+
+    def _clear_checkpoint(self, workflow_run_response: WorkflowRunOutput) -> None:
+        if workflow_run_response.metadata and CHECKPOINT_METADATA_KEY in workflow_run_response.metadata:
+            workflow_run_response.metadata.pop(CHECKPOINT_METADATA_KEY)
+            if not workflow_run_response.metadata:
+                workflow_run_response.metadata = None
+
+    def _restore_graph_step_outputs(
+        self,
+        step_names: List[str],
+        step_output_names: List[str],
+        collected_step_outputs: List[Union[StepOutput, List[StepOutput]]],
+    ) -> Dict[int, StepOutput]:
+        """Map the outputs restored from a checkpoint to the index of the step that produced them, by step name"""
+        step_indexes: Dict[str, int] = {}
+        for i, step_name in enumerate(step_names):
+            step_indexes.setdefault(step_name, i)
+        return {
+            step_indexes[step_name]: cast(StepOutput, step_output)
+            for step_name, step_output in zip(step_output_names, collected_step_outputs)
+            if step_name in step_indexes
+        }
+
+    def _create_graph_step_input(
+        self,
+        execution_input: WorkflowExecutionInput,
+        step_names: List[str],
+        step_dependencies: Set[int],
+        step_outputs: Dict[int, StepOutput],
+    ) -> StepInput:
+        """Create the StepInput of a scheduled step from the outputs of the steps it depends on"""
+        previous_step_outputs = {step_names[j]: step_outputs[j] for j in sorted(step_dependencies)}
+        dependency_outputs = list(previous_step_outputs.values())
+        return self._create_step_input(
+            execution_input=execution_input,
+            previous_step_outputs=previous_step_outputs,
+            shared_images=(execution_input.images or []) + [i for o in dependency_outputs for i in o.images or []],
+            shared_videos=(execution_input.videos or []) + [v for o in dependency_outputs for v in o.videos or []],
+            shared_audio=(execution_input.audio or []) + [a for o in dependency_outputs for a in o.audio or []],
+            shared_files=(execution_input.files or []) + [f for o in dependency_outputs for f in o.files or []],
+        )
+
+    def _collect_graph_step_outputs(
+        self,
+        session: WorkflowSession,
+        execution_input: WorkflowExecutionInput,
+        workflow_run_response: WorkflowRunOutput,
+        step_names: List[str],
+        step_outputs: Dict[int, StepOutput],
+        next_index: int,
+        step_output_names: List[str],
+        collected_step_outputs: List[Union[StepOutput, List[StepOutput]]],
+        previous_step_outputs: Dict[str, StepOutput],
+        output_media: Tuple[List[Image], List[Video], List[Audio], List[File]],
+        finished: bool = False,
+    ) -> int:
+        """Collect the completed outputs in step order, and checkpoint the steps completed so far.
+
+        Returns the index of the first step that isn't collected yet.
+        """
+        output_images, output_videos, output_audio, output_files = output_media
+        start_index = next_index
+        last_index = max(step_outputs) + 1 if finished and step_outputs else next_index
+        while next_index in step_outputs or next_index < last_index:
+            step_output = step_outputs.get(next_index)
+            next_index += 1
+            # Steps that never ran because an earlier step requested early termination are skipped
+            if step_output is None:
+                continue
+            step_name = step_names[next_index - 1]
+            step_output_names.append(step_name)
+            collected_step_outputs.append(step_output)
+            previous_step_outputs[step_name] = step_output
+            output_images.extend(step_output.images or [])
+            output_videos.extend(step_output.videos or [])
+            output_audio.extend(step_output.audio or [])
+            output_files.extend(step_output.files or [])
+
+        if next_index > start_index and not finished:
+            self._save_checkpoint(
+                session=session,
+                workflow_run_response=workflow_run_response,
+                execution_input=execution_input,
+                next_step_index=next_index,
+                step_output_names=step_output_names,
+                collected_step_outputs=collected_step_outputs,
+                output_media=output_media,
+            )
+        return next_index
+
+    def _execute_step_graph(
+        self,
+        session: WorkflowSession,
+        execution_input: WorkflowExecutionInput,
+        workflow_run_response: WorkflowRunOutput,
+        session_state: Optional[Dict[str, Any]],
+        start_step_index: int,
+        step_output_names: List[str],
+        collected_step_outputs: List[Union[StepOutput, List[StepOutput]]],
+        previous_step_outputs: Dict[str, StepOutput],
+        output_media: Tuple[List[Image], List[Video], List[Audio], List[File]],
+    ) -> int:
+        """Run each step in a thread as soon as the steps it depends on have completed.
+
+        Returns the number of steps handled, which is all of them.
+        """
+        from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+        from copy import deepcopy
+
+        steps = list(self.steps)  # type: ignore[arg-type]
+        step_names = [getattr(step, "name", f"step_{i + 1}") for i, step in enumerate(steps)]
+        dependencies = get_step_dependencies(steps, step_names)
+
+        step_outputs = self._restore_graph_step_outputs(step_names, step_output_names, collected_step_outputs)
+        started = set(step_outputs)
+        next_index = start_step_index
+        stop = False
+
+        running: Dict[Future, Tuple[int, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_steps) as executor:
+            try:
+                while True:
+                    raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
+                    ready_steps = [] if stop else get_ready_steps(dependencies, started, set(step_outputs))
+                    # Steps get their own copy of the session_state, and only the keys they change are applied back
+                    snapshot = deepcopy(session_state) if session_state is not None and ready_steps else None
+                    for i in ready_steps:
+                        log_debug(f"Scheduling step {i + 1}/{len(steps)}: {step_names[i]}")
+                        started.add(i)
+                        step_input = self._create_graph_step_input(
+                            execution_input, step_names, dependencies[i], step_outputs
+                        )
+                        step_session_state = deepcopy(snapshot) if snapshot is not None else None
+                        future = executor.submit(
+                            steps[i].execute,  # type: ignore[union-attr]
+                            step_input,
+                            session_id=session.session_id,
+                            user_id=self.user_id,
+                            workflow_run_response=workflow_run_response,
+                            session_state=step_session_state,
+                            store_executor_outputs=self.store_executor_outputs,
+                        )
+                        running[future] = (i, snapshot, step_session_state)
+
+                    if not running:
+                        break
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        i, snapshot, step_session_state = running.pop(future)
+                        step_output = future.result()
+                        if session_state is not None and snapshot is not None and step_session_state is not None:
+                            apply_session_state_changes(session_state, snapshot, step_session_state)
+                        step_outputs[i] = step_output
+                        if step_output.stop:
+                            logger.info(f"Early termination requested by step {step_names[i]}")
+                            stop = True
+
+                    next_index = self._collect_graph_step_outputs(
+                        session,
+                        execution_input,
+                        workflow_run_response,
+                        step_names,
+                        step_outputs,
+                        next_index,
+                        step_output_names,
+                        collected_step_outputs,
+                        previous_step_outputs,
+                        output_media,
+                    )
+            except BaseException:
+                for future in running:
+                    future.cancel()
+                raise
+
+        self._collect_graph_step_outputs(
+            session,
+            execution_input,
+            workflow_run_response,
+            step_names,
+            step_outputs,
+            next_index,
+            step_output_names,
+            collected_step_outputs,
+            previous_step_outputs,
+            output_media,
+            finished=True,
+        )
+        return len(steps)
+
+    async def _aexecute_step_graph(
+        self,
+        session: WorkflowSession,
+        execution_input: WorkflowExecutionInput,
+        workflow_run_response: WorkflowRunOutput,
+        session_state: Optional[Dict[str, Any]],
+        start_step_index: int,
+        step_output_names: List[str],
+        collected_step_outputs: List[Union[StepOutput, List[StepOutput]]],
+        previous_step_outputs: Dict[str, StepOutput],
+        output_media: Tuple[List[Image], List[Video], List[Audio], List[File]],
+    ) -> int:
+        """Run each step in a task as soon as the steps it depends on have completed.
+
+        Returns the number of steps handled, which is all of them.
+        """
+        from copy import deepcopy
+
+        steps = list(self.steps)  # type: ignore[arg-type]
+        step_names = [getattr(step, "name", f"step_{i + 1}") for i, step in enumerate(steps)]
+        dependencies = get_step_dependencies(steps, step_names)
+        semaphore = asyncio.Semaphore(self.max_concurrent_steps) if self.max_concurrent_steps else None
+
+        async def execute_step(i: int, step_input: StepInput, step_session_state: Optional[Dict[str, Any]]):
+            kwargs: Dict[str, Any] = dict(
+                session_id=session.session_id,
+                user_id=self.user_id,
+                workflow_run_response=workflow_run_response,
+                session_state=step_session_state,
+                store_executor_outputs=self.store_executor_outputs,
+            )
+            if semaphore is None:
+                return await steps[i].aexecute(step_input, **kwargs)  # type: ignore[union-attr]
+            async with semaphore:
+                return await steps[i].aexecute(step_input, **kwargs)  # type: ignore[union-attr]
+
+        step_outputs = self._restore_graph_step_outputs(step_names, step_output_names, collected_step_outputs)
+        started = set(step_outputs)
+        next_index = start_step_index
+        stop = False
+
+        running: Dict[asyncio.Task, Tuple[int, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]] = {}
+        try:
+            while True:
+                raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
+                ready_steps = [] if stop else get_ready_steps(dependencies, started, set(step_outputs))
+                # Steps get their own copy of the session_state, and only the keys they change are applied back
+                snapshot = deepcopy(session_state) if session_state is not None and ready_steps else None
+                for i in ready_steps:
+                    log_debug(f"Scheduling async step {i + 1}/{len(steps)}: {step_names[i]}")
+                    started.add(i)
+                    step_input = self._create_graph_step_input(
+                        execution_input, step_names, dependencies[i], step_outputs
+                    )
+                    step_session_state = deepcopy(snapshot) if snapshot is not None else None
+                    task = asyncio.create_task(execute_step(i, step_input, step_session_state))
+                    running[task] = (i, snapshot, step_session_state)
+
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    i, snapshot, step_session_state = running.pop(task)
+                    step_output = task.result()
+                    if session_state is not None and snapshot is not None and step_session_state is not None:
+                        apply_session_state_changes(session_state, snapshot, step_session_state)
+                    step_outputs[i] = step_output
+                    if step_output.stop:
+                        logger.info(f"Early termination requested by step {step_names[i]}")
+                        stop = True
+
+                next_index = self._collect_graph_step_outputs(
+                    session,
+                    execution_input,
+                    workflow_run_response,
+                    step_names,
+                    step_outputs,
+                    next_index,
+                    step_output_names,
+                    collected_step_outputs,
+                    previous_step_outputs,
+                    output_media,
+                )
+        except BaseException:
+            for task in running:
+                task.cancel()
+            raise
+
+        self._collect_graph_step_outputs(
+            session,
+            execution_input,
+            workflow_run_response,
+            step_names,
+            step_outputs,
+            next_index,
+            step_output_names,
+            collected_step_outputs,
+            previous_step_outputs,
+            output_media,
+            finished=True,
+        )
+        return len(steps)
+
     def _call_custom_function(self, func: Callable, execution_input: WorkflowExecutionInput, **kwargs: Any) -> Any:
         """Call custom function with only the parameters it expects"""
         from inspect import signature
@@ -915,8 +1281,10 @@ class Workflow:
         else:
             try:
                 # Track outputs from each step for enhanced data flow
-                collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
-                previous_step_outputs: Dict[str, StepOutput] = {}
+                # Steps completed before a checkpoint are restored when resuming a run
+                start_step_index, step_output_names, collected_step_outputs, previous_step_outputs = (
+                    self._restore_checkpoint(workflow_run_response)
+                )
 
                 shared_images: List[Image] = execution_input.images or []
                 output_images: List[Image] = (execution_input.images or []).copy()  # Start with input images
@@ -926,8 +1294,33 @@ class Workflow:
                 output_audio: List[Audio] = (execution_input.audio or []).copy()  # Start with input audio
                 shared_files: List[File] = execution_input.files or []
                 output_files: List[File] = (execution_input.files or []).copy()  # Start with input files
+                self._save_checkpoint(
+                    session=session,
+                    workflow_run_response=workflow_run_response,
+                    execution_input=execution_input,
+                    next_step_index=start_step_index,
+                    step_output_names=step_output_names,
+                    collected_step_outputs=collected_step_outputs,
+                    output_media=(output_images, output_videos, output_audio, output_files),
+                )
+
+                if has_step_dependencies(self.steps):  # type: ignore[arg-type]
+                    # The graph scheduler runs all remaining steps, leaving none for the loop below
+                    start_step_index = self._execute_step_graph(
+                        session=session,
+                        execution_input=execution_input,
+                        workflow_run_response=workflow_run_response,
+                        session_state=session_state,
+                        start_step_index=start_step_index,
+                        step_output_names=step_output_names,
+                        collected_step_outputs=collected_step_outputs,
+                        previous_step_outputs=previous_step_outputs,
+                        output_media=(output_images, output_videos, output_audio, output_files),
+                    )
 
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                    if i < start_step_index:
+                        continue
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Executing step {i + 1}/{self._get_step_count()}: {step_name}")
@@ -960,6 +1353,7 @@ class Workflow:
                     # Update the workflow-level previous_step_outputs dictionary
                     previous_step_outputs[step_name] = step_output
                     collected_step_outputs.append(step_output)
+                    step_output_names.append(step_name)
 
                     # Update shared media for next step
                     shared_images.extend(step_output.images or [])
@@ -975,6 +1369,16 @@ class Workflow:
                         logger.info(f"Early termination requested by step {step_name}")
                         break
 
+                    self._save_checkpoint(
+                        session=session,
+                        workflow_run_response=workflow_run_response,
+                        execution_input=execution_input,
+                        next_step_index=i + 1,
+                        step_output_names=step_output_names,
+                        collected_step_outputs=collected_step_outputs,
+                        output_media=(output_images, output_videos, output_audio, output_files),
+                    )
+
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
                     workflow_run_response.metrics = self._aggregate_workflow_metrics(collected_step_outputs)
@@ -998,6 +1402,7 @@ class Workflow:
                 workflow_run_response.images = output_images
                 workflow_run_response.videos = output_videos
                 workflow_run_response.audio = output_audio
+                self._clear_checkpoint(workflow_run_response)
                 workflow_run_response.status = RunStatus.completed
 
             except (InputCheckError, OutputCheckError) as e:
@@ -1082,8 +1487,10 @@ class Workflow:
         else:
             try:
                 # Track outputs from each step for enhanced data flow
-                collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
-                previous_step_outputs: Dict[str, StepOutput] = {}
+                # Steps completed before a checkpoint are restored when resuming a run
+                start_step_index, step_output_names, collected_step_outputs, previous_step_outputs = (
+                    self._restore_checkpoint(workflow_run_response)
+                )
 
                 shared_images: List[Image] = execution_input.images or []
                 output_images: List[Image] = (execution_input.images or []).copy()  # Start with input images
@@ -1093,10 +1500,21 @@ class Workflow:
                 output_audio: List[Audio] = (execution_input.audio or []).copy()  # Start with input audio
                 shared_files: List[File] = execution_input.files or []
                 output_files: List[File] = (execution_input.files or []).copy()  # Start with input files
+                self._save_checkpoint(
+                    session=session,
+                    workflow_run_response=workflow_run_response,
+                    execution_input=execution_input,
+                    next_step_index=start_step_index,
+                    step_output_names=step_output_names,
+                    collected_step_outputs=collected_step_outputs,
+                    output_media=(output_images, output_videos, output_audio, output_files),
+                )
 
                 early_termination = False
 
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                    if i < start_step_index:
+                        continue
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Streaming step {i + 1}/{self._get_step_count()}: {step_name}")
@@ -1127,6 +1545,7 @@ class Workflow:
                         if isinstance(event, StepOutput):
                             step_output = event
                             collected_step_outputs.append(step_output)
+                            step_output_names.append(step_name)
 
                             # Update the workflow-level previous_step_outputs dictionary
                             previous_step_outputs[step_name] = step_output
@@ -1181,6 +1600,16 @@ class Workflow:
                     if "early_termination" in locals() and early_termination:
                         break
 
+                    self._save_checkpoint(
+                        session=session,
+                        workflow_run_response=workflow_run_response,
+                        execution_input=execution_input,
+                        next_step_index=i + 1,
+                        step_output_names=step_output_names,
+                        collected_step_outputs=collected_step_outputs,
+                        output_media=(output_images, output_videos, output_audio, output_files),
+                    )
+
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
                     workflow_run_response.metrics = self._aggregate_workflow_metrics(collected_step_outputs)
@@ -1204,6 +1633,7 @@ class Workflow:
                 workflow_run_response.images = output_images
                 workflow_run_response.videos = output_videos
                 workflow_run_response.audio = output_audio
+                self._clear_checkpoint(workflow_run_response)
                 workflow_run_response.status = RunStatus.completed
 
             except (InputCheckError, OutputCheckError) as e:
@@ -1378,8 +1808,10 @@ class Workflow:
         else:
             try:
                 # Track outputs from each step for enhanced data flow
-                collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
-                previous_step_outputs: Dict[str, StepOutput] = {}
+                # Steps completed before a checkpoint are restored when resuming a run
+                start_step_index, step_output_names, collected_step_outputs, previous_step_outputs = (
+                    self._restore_checkpoint(workflow_run_response)
+                )
 
                 shared_images: List[Image] = execution_input.images or []
                 output_images: List[Image] = (execution_input.images or []).copy()  # Start with input images
@@ -1389,8 +1821,33 @@ class Workflow:
                 output_audio: List[Audio] = (execution_input.audio or []).copy()  # Start with input audio
                 shared_files: List[File] = execution_input.files or []
                 output_files: List[File] = (execution_input.files or []).copy()  # Start with input files
+                self._save_checkpoint(
+                    session=session,
+                    workflow_run_response=workflow_run_response,
+                    execution_input=execution_input,
+                    next_step_index=start_step_index,
+                    step_output_names=step_output_names,
+                    collected_step_outputs=collected_step_outputs,
+                    output_media=(output_images, output_videos, output_audio, output_files),
+                )
+
+                if has_step_dependencies(self.steps):  # type: ignore[arg-type]
+                    # The graph scheduler runs all remaining steps, leaving none for the loop below
+                    start_step_index = await self._aexecute_step_graph(
+                        session=session,
+                        execution_input=execution_input,
+                        workflow_run_response=workflow_run_response,
+                        session_state=session_state,
+                        start_step_index=start_step_index,
+                        step_output_names=step_output_names,
+                        collected_step_outputs=collected_step_outputs,
+                        previous_step_outputs=previous_step_outputs,
+                        output_media=(output_images, output_videos, output_audio, output_files),
+                    )
 
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                    if i < start_step_index:
+                        continue
                     raise_if_cancelled(workflow_run_response.run_id)  # type: ignore
                     step_name = getattr(step, "name", f"step_{i + 1}")
                     log_debug(f"Async Executing step {i + 1}/{self._get_step_count()}: {step_name}")
@@ -1423,6 +1880,7 @@ class Workflow:
                     # Update the workflow-level previous_step_outputs dictionary
                     previous_step_outputs[step_name] = step_output
                     collected_step_outputs.append(step_output)
+                    step_output_names.append(step_name)
 
                     # Update shared media for next step
                     shared_images.extend(step_output.images or [])
@@ -1438,6 +1896,16 @@ class Workflow:
                         logger.info(f"Early termination requested by step {step_name}")
                         break
 
+                    self._save_checkpoint(
+                        session=session,
+                        workflow_run_response=workflow_run_response,
+                        execution_input=execution_input,
+                        next_step_index=i + 1,
+                        step_output_names=step_output_names,
+                        collected_step_outputs=collected_step_outputs,
+                        output_media=(output_images, output_videos, output_audio, output_files),
+                    )
+
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
                     workflow_run_response.metrics = self._aggregate_workflow_metrics(collected_step_outputs)
@@ -1461,6 +1929,7 @@ class Workflow:
                 workflow_run_response.images = output_images
                 workflow_run_response.videos = output_videos
                 workflow_run_response.audio = output_audio
+                self._clear_checkpoint(workflow_run_response)
                 workflow_run_response.status = RunStatus.completed
 
             except (InputCheckError, OutputCheckError) as e:
@@ -1549,8 +2018,10 @@ class Workflow:
         else:
             try:
                 # Track outputs from each step for enhanced data flow
-                collected_step_outputs: List[Union[StepOutput, List[StepOutput]]] = []
-                previous_step_outputs: Dict[str, StepOutput] = {}
+                # Steps completed before a checkpoint are restored when resuming a run
+                start_step_index, step_output_names, collected_step_outputs, previous_step_outputs = (
+                    self._restore_checkpoint(workflow_run_response)
+                )
 
                 shared_images: List[Image] = execution_input.images or []
                 output_images: List[Image] = (execution_input.images or []).copy()  # Start with input images
@@ -1560,10 +2031,21 @@ class Workflow:
                 output_audio: List[Audio] = (execution_input.audio or []).copy()  # Start with input audio
                 shared_files: List[File] = execution_input.files or []
                 output_files: List[File] = (execution_input.files or []).copy()  # Start with input files
+                self._save_checkpoint(
+                    session=session,
+                    workflow_run_response=workflow_run_response,
+                    execution_input=execution_input,
+                    next_step_index=start_step_index,
+                    step_output_names=step_output_names,
+                    collected_step_outputs=collected_step_outputs,
+                    output_media=(output_images, output_videos, output_audio, output_files),
+                )
 
                 early_termination = False
 
                 for i, step in enumerate(self.steps):  # type: ignore[arg-type]
+                    if i < start_step_index:
+                        continue
                     if workflow_run_response.run_id:
                         raise_if_cancelled(workflow_run_response.run_id)
                     step_name = getattr(step, "name", f"step_{i + 1}")
@@ -1595,6 +2077,7 @@ class Workflow:
                         if isinstance(event, StepOutput):
                             step_output = event
                             collected_step_outputs.append(step_output)
+                            step_output_names.append(step_name)
 
                             # Update the workflow-level previous_step_outputs dictionary
                             previous_step_outputs[step_name] = step_output
@@ -1648,6 +2131,16 @@ class Workflow:
                     if "early_termination" in locals() and early_termination:
                         break
 
+                    self._save_checkpoint(
+                        session=session,
+                        workflow_run_response=workflow_run_response,
+                        execution_input=execution_input,
+                        next_step_index=i + 1,
+                        step_output_names=step_output_names,
+                        collected_step_outputs=collected_step_outputs,
+                        output_media=(output_images, output_videos, output_audio, output_files),
+                    )
+
                 # Update the workflow_run_response with completion data
                 if collected_step_outputs:
                     workflow_run_response.metrics = self._aggregate_workflow_metrics(collected_step_outputs)
@@ -1671,6 +2164,7 @@ class Workflow:
                 workflow_run_response.images = output_images
                 workflow_run_response.videos = output_videos
                 workflow_run_response.audio = output_audio
+                self._clear_checkpoint(workflow_run_response)
                 workflow_run_response.status = RunStatus.completed
 
             except (InputCheckError, OutputCheckError) as e:
@@ -2266,6 +2760,113 @@ class Workflow:
                 **kwargs,
             )
 
+    def _prepare_resume(
+        self,
+        run_id: str,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        session_state: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[WorkflowSession, WorkflowRunOutput, WorkflowExecutionInput, Dict[str, Any]]:
+        """Load a checkpointed run and rebuild the inputs needed to continue it"""
+        if self.db is None:
+            raise ValueError("A db is required to resume a workflow run")
+        if self.steps is None or callable(self.steps):
+            raise ValueError("Only workflows with a list of steps can be resumed")
+
+        self._set_debug()
+        self.initialize_workflow()
+        session_id, user_id, session_state = self._initialize_session(
+            session_id=session_id, user_id=user_id, session_state=session_state, run_id=run_id
+        )
+
+        workflow_session = self.read_or_create_session(session_id=session_id, user_id=user_id)
+        workflow_run_response = workflow_session.get_run(run_id)
+        if workflow_run_response is None:
+            raise ValueError(f"Run {run_id} not found in session {session_id}")
+
+        checkpoint = (workflow_run_response.metadata or {}).get(CHECKPOINT_METADATA_KEY)
+        if workflow_run_response.status != RunStatus.completed and checkpoint is None:
+            raise ValueError(f"Run {run_id} has no checkpoint. Set checkpoint_steps=True to make runs resumable.")
+
+        self._update_metadata(session=workflow_session)
+        session_state = self._load_session_state(session=workflow_session, session_state=session_state)
+        self._prepare_steps()
+
+        # The checkpointed media already includes the input media
+        checkpoint = checkpoint or {}
+        files = [File.model_validate(file) for file in checkpoint.get("files") or []]
+        inputs = WorkflowExecutionInput(
+            input=self._validate_input(workflow_run_response.input),  # type: ignore
+            additional_data=checkpoint.get("additional_data"),
+            images=list(workflow_run_response.images or []),
+            videos=list(workflow_run_response.videos or []),
+            audio=list(workflow_run_response.audio or []),
+            files=files,
+        )
+        self.update_agents_and_teams_session_info()
+        return workflow_session, workflow_run_response, inputs, session_state
+
+    def resume(
+        self,
+        run_id: str,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        session_state: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> WorkflowRunOutput:
+        """Continue a checkpointed run from its first incomplete step.
+
+        The run must have been started with `checkpoint_steps=True`. Completed steps are not executed again;
+        their stored outputs are passed on to the remaining steps.
+
+        Args:
+            run_id (str): The ID of the run to resume.
+            session_id (Optional[str]): The session the run belongs to. Defaults to the workflow's session_id.
+
+        Returns:
+            WorkflowRunOutput: The resumed run. Completed runs are returned as they are.
+        """
+        workflow_session, workflow_run_response, inputs, session_state = self._prepare_resume(
+            run_id=run_id, session_id=session_id, user_id=user_id, session_state=session_state
+        )
+        if workflow_run_response.status == RunStatus.completed:
+            log_debug(f"Run {run_id} is already completed")
+            return workflow_run_response
+
+        log_debug(f"Workflow Run Resume: {self.name}", center=True)
+        return self._execute(
+            session=workflow_session,
+            execution_input=inputs,
+            workflow_run_response=workflow_run_response,
+            session_state=session_state,
+            **kwargs,
+        )
+
+    async def aresume(
+        self,
+        run_id: str,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        session_state: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> WorkflowRunOutput:
+        """Continue a checkpointed run from its first incomplete step asynchronously. See `resume()`."""
+        workflow_session, workflow_run_response, inputs, session_state = self._prepare_resume(
+            run_id=run_id, session_id=session_id, user_id=user_id, session_state=session_state
+        )
+        if workflow_run_response.status == RunStatus.completed:
+            log_debug(f"Run {run_id} is already completed")
+            return workflow_run_response
+
+        log_debug(f"Workflow Async Run Resume: {self.name}", center=True)
+        return await self._aexecute(
+            session=workflow_session,
+            execution_input=inputs,
+            workflow_run_response=workflow_run_response,
+            session_state=session_state,
+            **kwargs,
+        )
+
     def _prepare_steps(self):
         """Prepare the steps for execution"""
         if not callable(self.steps) and self.steps is not None:
@@ -2292,8 +2893,22 @@ class Workflow:
                     raise ValueError(f"Invalid step type: {type(step).__name__}")
 
             self.steps = prepared_steps  # type: ignore
+            if self.db is not None:
+                for step in prepared_steps:
+                    self._propagate_db_to_step_cache(step)
             log_debug("Step preparation completed")
 
+    def _propagate_db_to_step_cache(self, step):
+        """Recursively make the workflow db the cache db of steps that cache their results"""
+        if isinstance(step, Step) and step.cache_results and step.cache_db is None:
+            step.cache_db = self.db
+
+        for attr_name in ["steps", "choices"]:
+            attr_value = getattr(step, attr_name, None)
+            if attr_value and isinstance(attr_value, list):
+                for nested_step in attr_value:
+                    self._propagate_db_to_step_cache(nested_step)
+
     def print_response(
         self,
         input: Union[str, Dict[str, Any], List[Any], BaseModel, List[Message]],
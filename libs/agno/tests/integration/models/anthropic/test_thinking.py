@@ -173,13 +173,14 @@ async def test_thinking_with_storage():
         assert len(response.reasoning_content) > 0
 
         # Read the storage files to verify thinking was persisted
-        session_files = [f for f in os.listdir(storage_dir) if f.endswith(".json")]
+        session_files = [f for f in os.listdir(storage_dir) if f.endswith(".jsonl")]
 
         thinking_persisted = False
         for session_file in session_files:
-            if session_file == "test_session.json":
+            if session_file == "test_session.jsonl":
                 with open(os.path.join(storage_dir, session_file), "r") as f:
-                    session_data = json.load(f)
+                    # The log holds every version of the session, the latest last
+                    session_data = [json.loads(line)["v"] for line in f.readlines()[1:]][-1:]
 
                 # Check messages in this session
                 if session_data and session_data[0] and session_data[0]["runs"]:
@@ -217,13 +218,14 @@ async def test_thinking_with_streaming_storage():
         assert hasattr(final_response, "reasoning_content") and final_response.reasoning_content is not None  # type: ignore
 
         # Verify storage contains the thinking content
-        session_files = [f for f in os.listdir(storage_dir) if f.endswith(".json")]
+        session_files = [f for f in os.listdir(storage_dir) if f.endswith(".jsonl")]
 
         thinking_persisted = False
         for session_file in session_files:
-            if session_file == "test_session_stream.json":
+            if session_file == "test_session_stream.jsonl":
                 with open(os.path.join(storage_dir, session_file), "r") as f:
-                    session_data = json.load(f)
+                    # The log holds every version of the session, the latest last
+                    session_data = [json.loads(line)["v"] for line in f.readlines()[1:]][-1:]
 
                 # Check messages in this session
                 if session_data and session_data[0] and session_data[0]["runs"]:
@@ -347,13 +349,14 @@ async def test_interleaved_thinking_with_storage():
         assert len(response.reasoning_content) > 0
 
         # Read the storage files to verify thinking was persisted
-        session_files = [f for f in os.listdir(storage_dir) if f.endswith(".json")]
+        session_files = [f for f in os.listdir(storage_dir) if f.endswith(".jsonl")]
 
         thinking_persisted = False
         for session_file in session_files:
-            if session_file == "test_session_interleaved.json":
+            if session_file == "test_session_interleaved.jsonl":
                 with open(os.path.join(storage_dir, session_file), "r") as f:
-                    session_data = json.load(f)
+                    # The log holds every version of the session, the latest last
+                    session_data = [json.loads(line)["v"] for line in f.readlines()[1:]][-1:]
 
                 # Check messages in this session
                 if session_data and session_data[0] and session_data[0]["runs"]:
@@ -395,13 +398,14 @@ async def test_interleaved_thinking_streaming_with_storage():
         assert hasattr(final_response, "reasoning_content") and final_response.reasoning_content is not None  # type: ignore
 
         # Verify storage contains the thinking content
-        session_files = [f for f in os.listdir(storage_dir) if f.endswith(".json")]
+        session_files = [f for f in os.listdir(storage_dir) if f.endswith(".jsonl")]
 
         thinking_persisted = False
         for session_file in session_files:
-            if session_file == "test_session_interleaved_stream.json":
+            if session_file == "test_session_interleaved_stream.jsonl":
                 with open(os.path.join(storage_dir, session_file), "r") as f:
-                    session_data = json.load(f)
+                    # The log holds every version of the session, the latest last
+                    session_data = [json.loads(line)["v"] for line in f.readlines()[1:]][-1:]
 
                 # Check messages in this session
                 if session_data and session_data[0] and session_data[0]["runs"]:
@@ -110,13 +110,14 @@ async def test_thinking_with_storage():
         assert len(response.reasoning_content) > 0
 
         # Read the storage files to verify thinking was persisted
-        session_files = [f for f in os.listdir(storage_dir) if f.endswith(".json")]
+        session_files = [f for f in os.listdir(storage_dir) if f.endswith(".jsonl")]
 
         thinking_persisted = False
         for session_file in session_files:
-            if session_file == "test_session.json":
+            if session_file == "test_session.jsonl":
                 with open(os.path.join(storage_dir, session_file), "r") as f:
-                    session_data = json.load(f)
+                    # The log holds every version of the session, the latest last
+                    session_data = [json.loads(line)["v"] for line in f.readlines()[1:]][-1:]
 
                 # Check messages in this session
                 if session_data and session_data[0] and session_data[0]["runs"]:
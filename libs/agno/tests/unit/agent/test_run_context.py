@@ -0,0 +1,125 @@
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.agent import Agent
+from agno.models.mock import MockModel
+from agno.run.agent import RunOutput
+from agno.run.context import RunContext, iterate_with_run_context, use_run_context
+from agno.run.team import TeamRunOutput
+from agno.session import AgentSession
+from agno.team import Team
+from agno.tools.function import Function
+
+
+def read_state(session_state: dict) -> str:
+    """Read the session state."""
+    return session_state["name"]
+
+
+def build_tools(agent: Agent, session_state: dict, model=None) -> None:
+    agent._determine_tools_for_model(
+        model=model or MagicMock(supports_native_structured_outputs=False),
+        run_response=RunOutput(run_id="run"),
+        session=AgentSession(session_id="session"),
+        session_state=session_state,
+    )
+
+
+def test_concurrent_runs_get_their_own_functions():
+    tool = Function(name="read_state", entrypoint=read_state)
+    agent = Agent(tools=[tool])
+    barrier = threading.Barrier(2)
+    functions = {}
+
+    def run(name: str) -> None:
+        with use_run_context(agent, RunContext(run_id=name)):
+            build_tools(agent, {"name": name})
+            barrier.wait()
+            functions[name] = agent._functions_for_model["read_state"]
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert functions["a"] is not functions["b"]
+    assert functions["a"]._session_state == {"name": "a"}
+    assert functions["b"]._session_state == {"name": "b"}
+    # The tool shared by both runs is left untouched
+    assert tool._session_state is None
+    assert agent._functions_for_model is None
+
+
+def test_streams_see_their_own_run_context():
+    agent = Agent()
+
+    def stream():
+        for _ in range(2):
+            yield agent._tool_instructions
+
+    first = iterate_with_run_context(agent, RunContext(tool_instructions=["a"]), stream())
+    second = iterate_with_run_context(agent, RunContext(tool_instructions=["b"]), stream())
+
+    # Interleave the two streams in the same thread
+    assert [next(first), next(second), next(first), next(second)] == [["a"], ["b"], ["a"], ["b"]]
+    assert agent._tool_instructions is None
+
+
+def greet(name: str) -> str:
+    """Greet someone."""
+    return f"Hello {name}"
+
+
+def test_runs_reuse_tools_that_do_not_depend_on_the_run():
+    agent = Agent(tools=[greet])
+    model = MagicMock(supports_native_structured_outputs=False)
+    get_tools = MagicMock(wraps=agent.get_tools)
+    agent.get_tools = get_tools  # type: ignore
+    functions = {}
+
+    for name in ("a", "b"):
+        with use_run_context(agent, RunContext(run_id=name)):
+            build_tools(agent, {"name": name}, model)
+            functions[name] = agent._functions_for_model["greet"]
+
+    assert get_tools.call_count == 1
+    assert functions["a"] is not functions["b"]
+    assert functions["a"]._session_state == {"name": "a"}
+    assert functions["b"]._session_state == {"name": "b"}
+    assert functions["b"].parameters == functions["a"].parameters
+
+    agent.add_tool(read_state)
+    with use_run_context(agent, RunContext(run_id="c")):
+        build_tools(agent, {"name": "c"}, model)
+        assert set(agent._functions_for_model) == {"greet", "read_state"}  # type: ignore
+    assert get_tools.call_count == 2
+
+
+def test_run_copies_do_not_share_parameters():
+    tool = Function(name="greet", entrypoint=greet)
+    tool.process_entrypoint()
+    copy = tool.copy_for_run()
+    copy.parameters["required"] = []
+
+    assert tool.parameters["required"] == ["name"]
+
+
+@pytest.mark.parametrize("owner", ["agent", "team"])
+def test_streaming_run_does_not_change_later_runs(owner):
+    model = MockModel(default_response="hello")
+    if owner == "agent":
+        runner: Any = Agent(model=model, telemetry=False)
+    else:
+        runner = Team(members=[Agent(model=MockModel())], model=model, telemetry=False)
+
+    list(runner.run("hi", stream=True, stream_intermediate_steps=True))
+    response = runner.run("hi")
+
+    assert isinstance(response, (RunOutput, TeamRunOutput))
+    assert response.content == "hello"
+    assert runner.stream is None
+    assert runner.stream_intermediate_steps is False
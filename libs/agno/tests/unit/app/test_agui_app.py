@@ -1266,3 +1266,54 @@ async def test_message_id_regression_prevention():
     assert len(all_referenced_ids) == 3, (
         f"Should have exactly 3 unique message IDs in the conversation. Found: {sorted(all_referenced_ids)}"
     )
+
+
+def test_get_new_agui_messages_skips_stored_messages():
+    """Test that only the messages not stored in the session are forwarded"""
+    from ag_ui.core import AssistantMessage, UserMessage
+
+    from agno.models.message import Message
+    from agno.os.interfaces.agui.utils import get_new_agui_messages
+
+    stored = [
+        Message(role="user", content="Hi"),
+        Message(role="assistant", content="Hello!"),
+        Message(role="user", content="Yes"),
+        Message(role="assistant", content="Great"),
+    ]
+    transcript = [
+        UserMessage(id="1", role="user", content="Hi"),
+        AssistantMessage(id="2", role="assistant", content="Hello!"),
+        UserMessage(id="3", role="user", content="Yes"),
+        AssistantMessage(id="4", role="assistant", content="Great"),
+        UserMessage(id="5", role="user", content="Yes"),
+    ]
+
+    assert [m.id for m in get_new_agui_messages(transcript, stored)] == ["5"]
+    # Messages of a thread unknown to the session are all forwarded
+    assert get_new_agui_messages(transcript, []) == transcript
+    # Without new input, the last message is sent again
+    assert [m.id for m in get_new_agui_messages(transcript[:3], stored)] == ["3"]
+
+
+def test_convert_agno_messages_to_agui_messages():
+    """Test that stored messages are converted to an AG-UI transcript"""
+    from agno.models.message import Message
+    from agno.os.interfaces.agui.utils import convert_agno_messages_to_agui_messages
+
+    tool_call = {"id": "call_1", "type": "function", "function": {"name": "search", "arguments": '{"q": "x"}'}}
+    messages = [
+        Message(role="system", content="Be brief"),
+        Message(role="user", content="Search x"),
+        Message(role="assistant", tool_calls=[tool_call]),
+        Message(role="tool", tool_call_id="call_1", content="Found x"),
+        Message(role="assistant", content="Here is x"),
+    ]
+
+    converted = convert_agno_messages_to_agui_messages(messages, id_prefix="thread_1")
+
+    assert [m.role for m in converted] == ["user", "assistant", "tool", "assistant"]
+    assert converted[0].id == "thread_1-1"
+    assert converted[1].tool_calls[0].function.name == "search"  # type: ignore
+    assert converted[2].tool_call_id == "call_1"  # type: ignore
+    assert converted[3].content == "Here is x"
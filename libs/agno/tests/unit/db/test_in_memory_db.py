@@ -0,0 +1,118 @@
+from agno.db.base import SessionType
+from agno.db.in_memory import InMemoryDb
+from agno.db.in_memory.table import IndexedTable
+from agno.db.in_memory.utils import apply_sorting
+from agno.db.schemas.memory import UserMemory
+from agno.session.agent import AgentSession
+from agno.session.team import TeamSession
+
+
+def test_sessions_are_looked_up_by_type_and_user():
+    db = InMemoryDb()
+    db.upsert_session(AgentSession(session_id="s1", agent_id="a1", user_id="u1", session_data={"session_name": "x"}))
+    db.upsert_session(TeamSession(session_id="s1", team_id="t1", user_id="u1"))
+
+    assert isinstance(db.get_session("s1", SessionType.AGENT), AgentSession)
+    assert isinstance(db.get_session("s1", SessionType.TEAM), TeamSession)
+    assert db.get_session("s1", SessionType.AGENT, user_id="u2") is None
+    assert db.get_session("s2", SessionType.AGENT) is None
+
+
+def test_reads_do_not_share_state_with_the_store():
+    db = InMemoryDb()
+    session = AgentSession(session_id="s1", agent_id="a1", session_data={"session_name": "first"})
+    stored = db.upsert_session(session, deserialize=False)
+
+    stored["session_data"]["session_name"] = "changed"  # type: ignore
+    session.session_data["session_name"] = "changed"  # type: ignore
+    db.get_session("s1", SessionType.AGENT, deserialize=False)["session_data"]["session_name"] = "changed"  # type: ignore
+
+    assert db.get_session("s1", SessionType.AGENT).session_data == {"session_name": "first"}  # type: ignore
+
+
+def test_upsert_updates_the_session_in_place():
+    db = InMemoryDb()
+    db.upsert_session(AgentSession(session_id="s1", agent_id="a1", created_at=1))
+    db.upsert_session(AgentSession(session_id="s2", agent_id="a1", created_at=2))
+    db.upsert_session(AgentSession(session_id="s1", agent_id="a1", created_at=1, summary=None, metadata={"v": 2}))
+
+    sessions, total = db.get_sessions(SessionType.AGENT, deserialize=False)
+    assert total == 2
+    assert [session["session_id"] for session in sessions] == ["s1", "s2"]
+    assert sessions[0]["metadata"] == {"v": 2}
+
+
+def test_get_sessions_filters_sorts_and_paginates():
+    db = InMemoryDb()
+    for i in range(10):
+        db.upsert_session(
+            AgentSession(
+                session_id=f"s{i}",
+                agent_id=f"a{i % 2}",
+                user_id=f"u{i % 3}",
+                created_at=100 + i // 2,
+                session_data={"session_name": f"Session {i}"},
+            )
+        )
+    db.upsert_session(TeamSession(session_id="t", team_id="a0", user_id="u0", created_at=100))
+
+    def ids(**kwargs):
+        sessions, total = db.get_sessions(SessionType.AGENT, deserialize=False, **kwargs)
+        return [session["session_id"] for session in sessions], total
+
+    assert ids(component_id="a0") == (["s0", "s2", "s4", "s6", "s8"], 5)
+    assert ids(user_id="u0", component_id="a1") == (["s3", "s9"], 2)
+    assert ids(session_name="SESSION 1") == (["s1"], 1)
+    assert ids(start_timestamp=103, end_timestamp=103) == (["s6", "s7"], 2)
+    # Equal values keep their insertion order, like a stable sort
+    assert ids(sort_by="created_at", sort_order="desc", limit=3, page=1) == (["s8", "s9", "s6"], 10)
+    assert ids(sort_by="created_at", sort_order="desc", limit=3, page=2) == (["s7", "s4", "s5"], 10)
+    assert ids(sort_by="created_at", sort_order="asc", limit=3, page=2) == (["s3", "s4", "s5"], 10)
+    assert ids(sort_by="session_id", sort_order="asc", limit=2) == (["s0", "s1"], 10)
+    assert ids(sort_by="unknown", limit=2) == (["s0", "s1"], 10)
+
+
+def test_sorted_pages_match_apply_sorting():
+    table = IndexedTable(sorted_fields=("updated_at",))
+    rows = [{"id": i, "updated_at": (i * 7) % 5, "data": {"i": i}} for i in range(20)]
+    for row in rows:
+        table.put(row["id"], row)
+
+    for sort_order in ("asc", "desc", None):
+        expected = apply_sorting(rows, "updated_at", sort_order)
+        for page in range(1, 6):
+            selected = table.select(table.keys(), sort_by="updated_at", sort_order=sort_order, limit=4, page=page)
+            assert selected == expected[(page - 1) * 4 : page * 4]
+        sort_rows = lambda rows: apply_sorting(rows, "data", sort_order)  # noqa: E731
+        assert table.select(table.keys(), sort_by="data", sort_order=sort_order, sort_rows=sort_rows) == rows
+
+
+def test_deletes_update_the_indexes():
+    db = InMemoryDb()
+    db.upsert_session(AgentSession(session_id="s1", agent_id="a1", user_id="u1"))
+    db.upsert_session(AgentSession(session_id="s2", agent_id="a1", user_id="u1"))
+
+    assert db.delete_session("s1") is True
+    assert db.delete_session("s1") is False
+    assert db.get_sessions(SessionType.AGENT, user_id="u1", deserialize=False)[1] == 1
+
+    db.delete_sessions(["s2"])
+    assert db.get_sessions(SessionType.AGENT, component_id="a1", deserialize=False) == ([], 0)
+
+
+def test_user_memories():
+    db = InMemoryDb()
+    db.upsert_user_memory(UserMemory(memory_id="m1", memory="Likes Paris", user_id="u1", topics=["travel"]))
+    db.upsert_user_memory(UserMemory(memory_id="m2", memory="Likes tea", user_id="u1", topics=["food"]))
+    db.upsert_user_memory(UserMemory(memory_id="m3", memory="Likes rome", user_id="u2", topics=["travel"]))
+
+    memories = db.get_user_memories(user_id="u1", topics=["travel", "music"])
+    assert [memory.memory_id for memory in memories] == ["m1"]  # type: ignore
+    assert db.get_user_memories(search_content="LIKES", deserialize=False)[1] == 3  # type: ignore
+    assert sorted(db.get_all_memory_topics()) == ["food", "travel"]
+
+    db.delete_user_memory("m1", user_id="u2")
+    assert db.get_user_memory("m1") is not None
+    assert db.get_user_memory("m1", user_id="u2") is None
+    db.delete_user_memories(["m1", "m3"], user_id="u1")
+    assert [memory.memory_id for memory in db.get_user_memories()] == ["m2", "m3"]  # type: ignore
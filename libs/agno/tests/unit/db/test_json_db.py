@@ -0,0 +1,120 @@
+import json
+import multiprocessing
+
+import pytest
+
+from agno.db.base import SessionType
+from agno.db.json import JsonDb
+from agno.db.schemas.memory import UserMemory
+from agno.session.agent import AgentSession
+
+
+def _upsert_memories(db_path: str, worker: int, count: int) -> None:
+    db = JsonDb(db_path=db_path)
+    for i in range(count):
+        db.upsert_user_memory(UserMemory(memory_id=f"{worker}-{i}", memory=f"Memory {i}", user_id=f"u{worker}"))
+
+
+def test_sessions_round_trip(tmp_path):
+    db = JsonDb(db_path=str(tmp_path))
+    db.upsert_session(AgentSession(session_id="s1", agent_id="a1", user_id="u1", session_data={"session_name": "One"}))
+    db.upsert_session(AgentSession(session_id="s2", agent_id="a1", user_id="u2", created_at=1))
+
+    session = db.get_session("s1", SessionType.AGENT)
+    assert isinstance(session, AgentSession)
+    assert session.session_data == {"session_name": "One"}
+
+    sessions, total = db.get_sessions(SessionType.AGENT, component_id="a1", sort_by="created_at", deserialize=False)
+    assert total == 2
+    assert [s["session_id"] for s in sessions] == ["s1", "s2"]  # type: ignore
+
+    db.rename_session("s2", SessionType.AGENT, "Two")
+    assert db.get_sessions(SessionType.AGENT, session_name="two", deserialize=False)[1] == 1
+    assert db.delete_session("s1") is True
+    assert db.get_session("s1", SessionType.AGENT) is None
+
+
+def test_writes_are_appended(tmp_path):
+    db = JsonDb(db_path=str(tmp_path))
+    db.upsert_session(AgentSession(session_id="s1", agent_id="a1"))
+    log_path = tmp_path / "agno_sessions.jsonl"
+    size = log_path.stat().st_size
+
+    db.upsert_session(AgentSession(session_id="s2", agent_id="a1"))
+
+    lines = log_path.read_text().splitlines()
+    assert len(lines) == 3
+    assert log_path.stat().st_size > size
+    assert json.loads(lines[-1])["v"]["session_id"] == "s2"
+
+
+def test_instances_see_each_others_writes(tmp_path):
+    first = JsonDb(db_path=str(tmp_path))
+    second = JsonDb(db_path=str(tmp_path))
+
+    first.upsert_user_memory(UserMemory(memory_id="m1", memory="Likes tea", user_id="u1"))
+    assert second.get_user_memory("m1", deserialize=False)["memory"] == "Likes tea"  # type: ignore
+
+    second.upsert_user_memory(UserMemory(memory_id="m1", memory="Likes coffee", user_id="u1"))
+    second.delete_user_memory("m1", user_id="u2")
+    assert first.get_user_memory("m1", deserialize=False)["memory"] == "Likes coffee"  # type: ignore
+
+    second.delete_user_memory("m1")
+    assert first.get_user_memory("m1") is None
+
+
+def test_log_is_compacted(tmp_path):
+    writer = JsonDb(db_path=str(tmp_path))
+    reader = JsonDb(db_path=str(tmp_path))
+    table = writer._get_table("memories")
+    table.min_compaction_bytes = 2000
+
+    for i in range(100):
+        writer.upsert_user_memory(UserMemory(memory_id=f"m{i % 3}", memory=f"Memory {i}", user_id="u1"))
+        if i == 50:
+            assert reader.get_user_memories(deserialize=False)[1] == 3  # type: ignore
+
+    assert table.path.stat().st_size < 2 * 2000
+    memories, total = reader.get_user_memories(sort_by="memory", sort_order="asc", deserialize=False)  # type: ignore
+    assert total == 3
+    assert [memory["memory"] for memory in memories] == ["Memory 97", "Memory 98", "Memory 99"]  # type: ignore
+
+
+def test_legacy_table_is_migrated(tmp_path):
+    legacy_sessions = [
+        {"session_id": "s1", "session_type": "agent", "agent_id": "a1", "created_at": 1, "updated_at": 1},
+        {"session_id": "s1", "session_type": "team", "team_id": "t1", "created_at": 2, "updated_at": 2},
+    ]
+    (tmp_path / "agno_sessions.json").write_text(json.dumps(legacy_sessions))
+
+    db = JsonDb(db_path=str(tmp_path))
+
+    assert db.get_session("s1", SessionType.TEAM, deserialize=False)["team_id"] == "t1"  # type: ignore
+    assert (tmp_path / "agno_sessions.jsonl").exists()
+    assert JsonDb(db_path=str(tmp_path)).get_sessions(SessionType.AGENT, deserialize=False)[1] == 1
+
+
+def test_incomplete_writes_are_ignored_and_repaired(tmp_path):
+    db = JsonDb(db_path=str(tmp_path))
+    db.upsert_user_memory(UserMemory(memory_id="m1", memory="Complete", user_id="u1"))
+    log_path = tmp_path / "agno_memories.jsonl"
+    with open(log_path, "a") as f:
+        f.write('{"k": "m2", "v": {"memory_id": "m2", "mem')
+
+    reader = JsonDb(db_path=str(tmp_path))
+    assert reader.get_user_memories(deserialize=False)[1] == 1  # type: ignore
+
+    reader.upsert_user_memory(UserMemory(memory_id="m3", memory="After", user_id="u1"))
+    assert [json.loads(line)["k"] for line in log_path.read_text().splitlines()[1:]] == ["m1", "m3"]
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="Requires fork")
+def test_concurrent_processes_do_not_lose_writes(tmp_path):
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_upsert_memories, args=(str(tmp_path), worker, 25)) for worker in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert JsonDb(db_path=str(tmp_path)).get_user_memories(deserialize=False)[1] == 100  # type: ignore
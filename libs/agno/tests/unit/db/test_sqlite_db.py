@@ -0,0 +1,88 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import event, text
+
+from agno.db.base import SessionType
+from agno.db.schemas.memory import UserMemory
+from agno.db.sqlite import SqliteDb
+from agno.session.agent import AgentSession
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SqliteDb(db_file=str(tmp_path / "agno.db"), concurrent=True)
+    yield db
+    db.close()
+
+
+def test_concurrent_mode_uses_wal(db):
+    db.upsert_session(AgentSession(session_id="s1", agent_id="a1", created_at=1))
+
+    with db.Session() as sess:
+        assert sess.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert sess.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+    assert db.get_session("s1", SessionType.AGENT).agent_id == "a1"  # type: ignore
+
+
+def test_concurrent_writes_are_committed_in_batches(db):
+    db.upsert_user_memory(UserMemory(memory_id="m0", memory="First", user_id="u1"))
+    commits = []
+    event.listen(db.writer.engine, "commit", lambda conn: commits.append(1))  # type: ignore
+
+    def write(i: int) -> None:
+        db.upsert_user_memory(UserMemory(memory_id=f"m{i}", memory=f"Memory {i}", user_id="u1"))
+        assert db.get_user_memory(f"m{i}", deserialize=False)["memory"] == f"Memory {i}"  # type: ignore
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(write, range(1, 201)))
+
+    assert db.get_user_memories(user_id="u1", deserialize=False)[1] == 201  # type: ignore
+    assert 0 < len(commits) < 200
+
+
+def test_failed_write_does_not_affect_its_batch(db):
+    db.upsert_session(AgentSession(session_id="s1", agent_id="a1", created_at=1))
+    release = threading.Event()
+
+    def failing_write(sess):
+        db.delete_session("s1")
+        raise RuntimeError("Failed write")
+
+    # Queue both writes while the writer is busy, so that they are committed together
+    db.writer.submit(lambda sess: release.wait())  # type: ignore
+    failing = db.writer.submit(failing_write)  # type: ignore
+    upsert = db.writer.submit(
+        lambda sess: db.upsert_session(AgentSession(session_id="s2", agent_id="a1", created_at=1))
+    )  # type: ignore
+    release.set()
+
+    with pytest.raises(RuntimeError):
+        failing.result()
+    assert upsert.result().session_id == "s2"
+    assert db.get_session("s1", SessionType.AGENT) is not None
+    assert db.get_session("s2", SessionType.AGENT) is not None
+
+
+def test_concurrent_mode_requires_a_file():
+    with pytest.raises(ValueError):
+        SqliteDb(db_url="sqlite://", concurrent=True)
+
+
+def test_default_mode_creates_tables_once_under_concurrent_first_use(tmp_path):
+    db = SqliteDb(db_file=str(tmp_path / "agno.db"))
+    created = []
+    create_table = db._create_table
+
+    def spy(**kwargs):
+        created.append(kwargs["table_name"])
+        return create_table(**kwargs)
+
+    db._create_table = spy  # type: ignore
+    sessions = [AgentSession(session_id=f"s{i}", agent_id="a1", created_at=i) for i in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(db.upsert_session, sessions))
+
+    assert created == [db.session_table_name]
+    assert len(db.get_sessions(SessionType.AGENT)) == 8  # type: ignore
@@ -0,0 +1,188 @@
+import asyncio
+import time
+from threading import Lock
+from types import SimpleNamespace
+
+from agno.db.in_memory import InMemoryDb
+from agno.eval.accuracy import AccuracyAgentResponse, AccuracyEval
+from agno.eval.batch import BatchEval, EvalRateLimiter
+from agno.eval.reliability import ReliabilityEval
+from agno.exceptions import ModelRateLimitError
+from agno.models.message import Message
+from agno.run.agent import RunOutput
+
+
+class FakeAgent:
+    """Answers with the input, tracking how many runs are in flight."""
+
+    def __init__(self, delay: float = 0.0, failures=()):
+        self.id = "fake-agent"
+        self.name = "Fake Agent"
+        self.model = None
+        self.delay = delay
+        self.failures = list(failures)
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.session_ids: list = []
+        self._lock = Lock()
+
+    def _start(self, session_id):
+        with self._lock:
+            self.calls += 1
+            self.session_ids.append(session_id)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            return self.failures.pop(0) if self.failures else None
+
+    def _stop(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def run(self, input, session_id=None):
+        failure = self._start(session_id)
+        time.sleep(self.delay)
+        self._stop()
+        if failure is not None:
+            raise failure
+        return SimpleNamespace(content=f"answer to {input}")
+
+    async def arun(self, input, session_id=None):
+        failure = self._start(session_id)
+        await asyncio.sleep(self.delay)
+        self._stop()
+        if failure is not None:
+            raise failure
+        return SimpleNamespace(content=f"answer to {input}")
+
+
+class FakeEvaluator:
+    def __init__(self, failures=()):
+        self.failures = list(failures)
+
+    def _response(self):
+        if self.failures:
+            raise self.failures.pop(0)
+        return SimpleNamespace(content=AccuracyAgentResponse(accuracy_score=8, accuracy_reason="Close enough"))
+
+    def run(self, input, session_id=None):
+        return self._response()
+
+    async def arun(self, input, session_id=None):
+        return self._response()
+
+
+def _accuracy_eval(agent, num_iterations=1, evaluator=None, **kwargs) -> AccuracyEval:
+    return AccuracyEval(
+        input="What is 2 + 2?",
+        expected_output="4",
+        agent=agent,  # type: ignore
+        evaluator_agent=evaluator or FakeEvaluator(),  # type: ignore
+        num_iterations=num_iterations,
+        telemetry=False,
+        **kwargs,
+    )
+
+
+def test_iterations_run_concurrently_up_to_the_limit():
+    agent = FakeAgent(delay=0.05)
+    db = InMemoryDb()
+    batch = BatchEval(
+        evals=[_accuracy_eval(agent, num_iterations=3) for _ in range(4)],
+        batch_id="batch",
+        max_concurrency=3,
+        db=db,
+        telemetry=False,
+    )
+
+    result = batch.run()
+
+    assert agent.calls == 12
+    assert agent.max_in_flight == 3
+    assert len(set(agent.session_ids)) == 12
+    assert [case.status for case in result.cases] == ["completed"] * 4
+    assert all(len(case.result.results) == 3 for case in result.cases)  # type: ignore
+    stored = db.get_eval_run("batch_2")
+    assert stored is not None and stored.eval_input["batch_id"] == "batch"  # type: ignore
+
+
+def test_accuracy_eval_outside_a_batch_keeps_the_agent_session():
+    agent = FakeAgent()
+
+    result = _accuracy_eval(agent, num_iterations=2).run(print_summary=False, print_results=False)
+
+    assert result is not None and len(result.results) == 2
+    assert agent.session_ids == [None, None]
+
+
+def test_rate_limit_errors_are_retried_after_a_pause():
+    agent = FakeAgent(failures=[ModelRateLimitError("slow down"), ModelRateLimitError("slow down")])
+    batch = BatchEval(evals=[_accuracy_eval(agent)], max_concurrency=1, rate_limit_backoff=0.01, telemetry=False)
+
+    result = batch.run()
+
+    assert agent.calls == 3
+    assert result.cases[0].status == "completed"
+
+
+def test_evaluator_rate_limit_errors_are_retried():
+    agent = FakeAgent()
+    evaluator = FakeEvaluator(failures=[ModelRateLimitError("slow down")])
+    batch = BatchEval(
+        evals=[_accuracy_eval(agent, evaluator=evaluator)], max_concurrency=1, rate_limit_backoff=0.01, telemetry=False
+    )
+
+    result = batch.run()
+
+    assert agent.calls == 2
+    assert result.cases[0].status == "completed"
+    assert result.cases[0].result.avg_score == 8  # type: ignore
+
+
+def test_failed_cases_are_rerun_when_the_batch_resumes():
+    db = InMemoryDb()
+    agent = FakeAgent(failures=[RuntimeError("provider down")])
+    evals = [_accuracy_eval(agent, db=db), _accuracy_eval(agent, db=db)]
+    first = BatchEval(evals=evals, batch_id="resumable", max_concurrency=1, telemetry=False).run()
+
+    assert [case.status for case in first.cases] == ["failed", "completed"]
+    assert first.cases[0].errors == ["provider down"]
+
+    agent.calls = 0
+    second = BatchEval(evals=evals, batch_id="resumable", max_concurrency=1, telemetry=False).run()
+
+    assert [case.status for case in second.cases] == ["completed", "resumed"]
+    assert second.cases[1].result.avg_score == 8  # type: ignore
+    assert agent.calls == 1
+
+
+def test_async_batch_runs_accuracy_and_reliability_evals():
+    agent = FakeAgent(delay=0.02)
+    response = RunOutput(
+        agent_id="fake-agent",
+        messages=[Message(role="assistant", tool_calls=[{"function": {"name": "multiply", "arguments": "{}"}}])],
+    )
+    reliability_eval = ReliabilityEval(agent_response=response, expected_tool_calls=["multiply"], telemetry=False)
+    db = InMemoryDb()
+    batch = BatchEval(
+        evals=[_accuracy_eval(agent, num_iterations=4), reliability_eval],
+        max_concurrency=2,
+        db=db,
+        telemetry=False,
+    )
+
+    result = asyncio.run(batch.arun())
+
+    assert agent.max_in_flight == 2
+    assert [case.status for case in result.cases] == ["completed", "completed"]
+    assert result.cases[1].result.eval_status == "PASSED"  # type: ignore
+    assert len(db.get_eval_runs()) == 2  # type: ignore
+
+
+def test_rate_limiter_spaces_iterations():
+    limiter = EvalRateLimiter(iterations_per_minute=1200)
+    started_at = time.monotonic()
+    for _ in range(4):
+        limiter.wait()
+
+    assert time.monotonic() - started_at >= 0.15
@@ -0,0 +1,33 @@
+import pytest
+
+from agno.eval.benchmarks import BENCHMARKS, main, run_benchmarks
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_benchmarks_run_offline(name):
+    report = run_benchmarks(names=[name], num_iterations=2, warmup_runs=0)
+
+    assert [result.name for result in report.results] == [name]
+    assert report.results[0].median_run_time > 0
+    assert report.passed
+
+
+def test_slower_runs_than_the_baseline_are_regressions(tmp_path):
+    baseline = {"agent_run": {"median_run_time": 1e-9}, "agent_instantiation": {"median_run_time": 60.0}}
+
+    report = run_benchmarks(
+        names=["agent_run", "agent_instantiation"], num_iterations=2, warmup_runs=0, baseline=baseline
+    )
+
+    assert [result.name for result in report.regressions] == ["agent_run"]
+    assert not report.passed
+
+    baseline_path = tmp_path / "baseline.json"
+    report.save_baseline(baseline_path)
+    args = ["agent_instantiation", "--iterations", "2", "--warmup", "0", "--baseline", str(baseline_path)]
+    assert main([*args, "--tolerance", "100"]) == 0
+
+
+def test_unknown_benchmarks_are_rejected():
+    with pytest.raises(ValueError):
+        run_benchmarks(names=["nope"])
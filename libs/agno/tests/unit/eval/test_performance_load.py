@@ -0,0 +1,106 @@
+import asyncio
+import time
+from threading import Lock
+
+import pytest
+
+from agno.db.in_memory import InMemoryDb
+from agno.db.schemas.evals import EvalType
+from agno.eval.performance import LoadTestResult, PerformanceEval
+
+
+class SlowFunction:
+    def __init__(self, delay: float = 0.02, fail_every: int = 0):
+        self.__name__ = "slow_function"
+        self.delay = delay
+        self.fail_every = fail_every
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            fail = self.fail_every and self.calls % self.fail_every == 0
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if fail:
+            raise RuntimeError("failed")
+
+
+def _load_eval(func, **kwargs) -> PerformanceEval:
+    return PerformanceEval(func=func, warmup_runs=0, telemetry=False, **kwargs)
+
+
+def test_workers_call_the_function_concurrently():
+    func = SlowFunction(fail_every=10)
+    result = _load_eval(func, concurrency=5, num_iterations=20).run_load()
+
+    assert func.calls == 20
+    assert func.max_in_flight == 5
+    assert result.total_requests == 20
+    assert result.errors == 2
+    assert len(result.latencies) == 18
+    # Five workers get through the calls much faster than one at a time
+    assert result.throughput > 2 / func.delay
+    assert result.p50_latency <= result.p95_latency <= result.p99_latency <= result.max_latency
+    assert result.peak_rss_mib > 0
+
+
+def test_target_rate_spaces_calls_over_the_duration():
+    func = SlowFunction(delay=0.001)
+    result = _load_eval(func, concurrency=2, target_rps=100, load_duration=0.2).run_load()
+
+    assert 18 <= result.total_requests <= 20
+    assert result.duration >= 0.19
+    assert result.target_rps == 100
+
+
+def test_blocking_async_calls_show_event_loop_lag():
+    async def blocking():
+        time.sleep(0.03)
+
+    async def non_blocking():
+        await asyncio.sleep(0.03)
+
+    blocked = asyncio.run(_load_eval(blocking, concurrency=2, num_iterations=6).arun_load(lag_interval=0.005))
+    free = asyncio.run(_load_eval(non_blocking, concurrency=2, num_iterations=6).arun_load(lag_interval=0.005))
+
+    assert blocked.max_event_loop_lag >= 0.02
+    assert free.max_event_loop_lag < blocked.max_event_loop_lag
+    # Non blocking calls overlap, blocking ones run one after the other
+    assert free.duration < blocked.duration
+
+
+def test_load_results_are_stored_as_performance_evals():
+    db = InMemoryDb()
+    _load_eval(SlowFunction(delay=0.001), concurrency=2, num_iterations=4, db=db, eval_id="load").run_load()
+
+    eval_run = db.get_eval_run("load")
+    assert eval_run.eval_type == EvalType.PERFORMANCE  # type: ignore
+    assert eval_run.eval_data["load"]["total_requests"] == 4  # type: ignore
+    assert eval_run.eval_input["concurrency"] == 2  # type: ignore
+
+
+def test_percentiles_of_a_single_call():
+    result = LoadTestResult(latencies=[0.5], duration=1.0)
+
+    assert result.p50_latency == result.p99_latency == 0.5
+    assert result.throughput == 1.0
+
+
+def test_target_rps_must_be_positive():
+    with pytest.raises(ValueError):
+        _load_eval(SlowFunction(), target_rps=0).run_load()
+
+
+def test_rss_is_read_without_sysconf(monkeypatch):
+    from agno.eval import performance
+
+    monkeypatch.delattr(performance.os, "sysconf", raising=False)
+
+    assert performance._get_rss_mib() >= 0
@@ -0,0 +1,121 @@
+import asyncio
+import re
+from threading import Lock
+from types import SimpleNamespace
+
+from agno.knowledge.chunking.agentic import AgenticChunking
+from agno.knowledge.document.base import Document
+from agno.knowledge.reader.base import Reader
+
+SENTENCES = [f"Sentence number {i} is about topic {i % 7}." for i in range(200)]
+TEXT = " ".join(SENTENCES)
+
+
+def _window_text(messages) -> str:
+    return messages[0].content.split("\n\n            ", 1)[1]
+
+
+class SentenceModel:
+    """Answers with the positions after each sentence in the prompt text."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = Lock()
+
+    def _answer(self, messages) -> SimpleNamespace:
+        text = _window_text(messages)
+        positions = [m.end() for m in re.finditer(r"\.", text)]
+        return SimpleNamespace(content=", ".join(str(p) for p in positions))
+
+    def response(self, messages):
+        with self._lock:
+            self.calls += 1
+        return self._answer(messages)
+
+    async def aresponse(self, messages):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return self._answer(messages)
+
+
+class FailingModel:
+    def response(self, messages):
+        raise RuntimeError("model unavailable")
+
+    async def aresponse(self, messages):
+        raise RuntimeError("model unavailable")
+
+
+def _assert_chunks_cover_text(chunks, max_chunk_size):
+    assert all(len(chunk.content) <= max_chunk_size for chunk in chunks)
+    assert " ".join(chunk.content for chunk in chunks) == TEXT
+    assert [chunk.meta_data["chunk"] for chunk in chunks] == list(range(1, len(chunks) + 1))
+
+
+def test_sequential_chunking_uses_model_breakpoints():
+    class FirstSentenceModel:
+        def response(self, messages):
+            return SimpleNamespace(content=str(_window_text(messages).index(".") + 1))
+
+    chunker = AgenticChunking(model=FirstSentenceModel(), max_chunk_size=100)  # type: ignore
+    chunks = chunker.chunk(Document(id="doc", content=TEXT))
+
+    assert [chunk.content for chunk in chunks] == SENTENCES
+    assert chunks[1].id == "doc_2"
+
+
+def test_parallel_chunking_splits_at_sentence_boundaries():
+    model = SentenceModel()
+    chunker = AgenticChunking(model=model, max_chunk_size=300, parallel=True, window_overlap=100)  # type: ignore
+    chunks = chunker.chunk(Document(name="doc", content=TEXT))
+
+    _assert_chunks_cover_text(chunks, 300)
+    assert all(chunk.content.endswith(".") for chunk in chunks)
+    assert model.calls == len(chunker._get_windows(TEXT))
+
+
+def test_overlapping_breakpoints_are_taken_once():
+    chunker = AgenticChunking(model=SentenceModel(), max_chunk_size=100, window_overlap=40)  # type: ignore
+    windows = chunker._get_windows("x" * 250)
+
+    assert windows == [(0, 100), (60, 160), (120, 220), (180, 250)]
+    # Both windows see the break point at 90, which lies in the second window's half of the overlap
+    breakpoints = chunker._reconcile_breakpoints(windows, [[30, 90], [30, 70], [], []])
+    assert breakpoints == [30, 90, 130]
+
+
+def test_model_failures_fall_back_to_max_size_chunks():
+    chunker = AgenticChunking(model=FailingModel(), max_chunk_size=500, parallel=True)  # type: ignore
+    chunks = chunker.chunk(Document(content=TEXT))
+
+    assert len(chunks) == -(-len(TEXT) // 500)
+    assert "".join(chunk.content for chunk in chunks).replace(" ", "") == TEXT.replace(" ", "")
+
+
+def test_async_parallel_chunking_limits_concurrency():
+    model = SentenceModel(delay=0.01)
+    chunker = AgenticChunking(model=model, max_chunk_size=300, parallel=True, max_concurrency=3)  # type: ignore
+
+    chunks = asyncio.run(chunker.async_chunk(Document(content=TEXT)))
+
+    _assert_chunks_cover_text(chunks, 300)
+    assert model.max_in_flight == 3
+
+
+def test_readers_chunk_a_batch_asynchronously_within_the_limit():
+    model = SentenceModel(delay=0.01)
+    chunker = AgenticChunking(model=model, max_chunk_size=300, parallel=True, max_concurrency=3)  # type: ignore
+    reader = Reader(chunking_strategy=chunker)
+
+    chunks = asyncio.run(reader.chunk_documents_async([Document(content=TEXT) for _ in range(4)]))
+
+    # The model is only called through aresponse, and all the documents share the limit
+    assert model.calls == 4 * len(chunker._get_windows(TEXT))
+    assert model.max_in_flight == 3
+    assert len(chunks) == 4 * len(chunker.chunk(Document(content=TEXT)))
@@ -0,0 +1,64 @@
+import pytest
+
+from agno.knowledge.chunking.document import DocumentChunking
+from agno.knowledge.chunking.fixed import FixedSizeChunking
+from agno.knowledge.chunking.recursive import RecursiveChunking
+from agno.knowledge.chunking.row import RowChunking
+from agno.knowledge.document.base import Document
+
+TEXT = "\n\n".join(
+    f"Paragraph {i}.\tIt has  some   spacing,\r\nand a second line about topic {i % 5}." for i in range(300)
+)
+
+
+def _pieces(text: str, size: int = 7):
+    for i in range(0, len(text), size):
+        yield text[i : i + size]
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        FixedSizeChunking(chunk_size=200, overlap=20),
+        RecursiveChunking(chunk_size=200, overlap=20),
+        DocumentChunking(chunk_size=200),
+        RowChunking(),
+    ],
+)
+def test_streamed_text_chunks_like_the_whole_text(strategy):
+    document = Document(id="doc", name="doc", content=TEXT, meta_data={"source": "test"})
+
+    expected = strategy.chunk(document)
+    streamed = list(
+        strategy.iter_chunks(Document(id="doc", name="doc", content="", meta_data={"source": "test"}), _pieces(TEXT))
+    )
+
+    assert [(d.id, d.content, d.meta_data) for d in streamed] == [(d.id, d.content, d.meta_data) for d in expected]
+
+
+def test_clean_text_stream_collapses_whitespace_across_pieces():
+    strategy = FixedSizeChunking()
+
+    assert "".join(strategy.clean_text_stream(["a \n", "\t\tb", "  ", " c"])) == strategy.clean_text("a \n\t\tb   c")
+
+
+def test_chunks_are_yielded_before_the_stream_ends():
+    read = []
+
+    def texts():
+        for piece in _pieces(TEXT, 50):
+            read.append(piece)
+            yield piece
+
+    chunks = FixedSizeChunking(chunk_size=100).iter_chunks(Document(content=""), texts())
+    next(chunks)
+
+    assert len(read) <= 4
+
+
+def test_rows_spanning_many_pieces():
+    text = "a" * 1000 + "\r\n" + "b" * 10 + "\r" + "\n\nc"
+
+    rows = list(RowChunking._iter_rows(_pieces(text, 3)))
+
+    assert rows == text.splitlines()
@@ -0,0 +1,88 @@
+import re
+from typing import List, Tuple
+
+from agno.knowledge.chunking.document import DocumentChunking
+from agno.knowledge.chunking.fixed import FixedSizeChunking
+from agno.knowledge.chunking.recursive import RecursiveChunking
+from agno.knowledge.document.base import Document
+from agno.utils.tokens import HuggingFaceTokenizer, TiktokenTokenizer, Tokenizer, get_tokenizer
+
+TEXT = " ".join(f"Sentence {i} talks about a subject with several words." for i in range(100))
+
+
+class WordTokenizer(Tokenizer):
+    """One token per word, including its leading whitespace, like BPE tokenizers."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches: List[int] = []
+
+    def encode(self, text: str) -> List[int]:
+        return [len(m.group()) for m in re.finditer(r"\s*\S+", text)]
+
+    def decode(self, tokens: List[int]) -> str:
+        raise NotImplementedError
+
+    def encode_batch(self, texts: List[str]) -> List[List[int]]:
+        self.batches.append(len(texts))
+        return super().encode_batch(texts)
+
+    def encode_with_offsets(self, text: str) -> Tuple[List[int], List[int]]:
+        matches = list(re.finditer(r"\s*\S+", text))
+        return [len(m.group()) for m in matches], [m.start() for m in matches]
+
+
+def test_fixed_chunks_are_measured_in_tokens():
+    tokenizer = WordTokenizer()
+    chunks = FixedSizeChunking(chunk_size=25, tokenizer=tokenizer).chunk(Document(content=TEXT))
+
+    assert all(tokenizer.count(chunk.content) == chunk.meta_data["chunk_tokens"] <= 25 for chunk in chunks)
+    assert "".join(chunk.content for chunk in chunks) == TEXT
+    # Chunks are full: only the last one has fewer tokens
+    assert all(chunk.meta_data["chunk_tokens"] == 25 for chunk in chunks[:-1])
+
+
+def test_fixed_token_chunks_overlap():
+    tokenizer = WordTokenizer()
+    chunks = FixedSizeChunking(chunk_size=20, overlap=5, tokenizer=tokenizer).chunk(Document(content=TEXT))
+
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.content.split()[:5] == previous.content.split()[-5:]
+
+
+def test_recursive_token_chunks_end_at_sentences():
+    tokenizer = WordTokenizer()
+    chunks = RecursiveChunking(chunk_size=40, tokenizer=tokenizer).chunk(Document(content=TEXT))
+
+    assert len(chunks) > 1
+    assert all(chunk.content.endswith(".") for chunk in chunks)
+    assert all(tokenizer.count(chunk.content) <= 40 for chunk in chunks)
+    assert "".join(chunk.content for chunk in chunks) == TEXT
+
+
+def test_document_chunking_counts_paragraphs_in_one_batch():
+    tokenizer = WordTokenizer()
+    strategy = DocumentChunking(chunk_size=10, tokenizer=tokenizer)
+    paragraphs = ["one two three four five six", "seven eight nine", "ten eleven twelve"]
+    # clean_text collapses newlines, so split the cleaned text on the paragraph separator used here
+    strategy.clean_text = lambda text: text  # type: ignore
+
+    chunks = strategy.chunk(Document(content="\n\n".join(paragraphs)))
+
+    assert [chunk.content for chunk in chunks] == [f"{paragraphs[0]}\n\n{paragraphs[1]}", paragraphs[2]]
+    assert tokenizer.batches == [3]
+
+
+def test_count_batch_uses_the_cache():
+    tokenizer = WordTokenizer()
+    assert tokenizer.count_batch(["a b", "c", "a b"]) == [2, 1, 2]
+    assert tokenizer.count_batch(["a b", "c"]) == [2, 1]
+
+    assert tokenizer.batches == [3]
+
+
+def test_tokenizers_are_shared_by_name():
+    assert get_tokenizer("o200k_base") is get_tokenizer("o200k_base")
+    assert isinstance(get_tokenizer("cl100k_base"), TiktokenTokenizer)
+    assert isinstance(get_tokenizer("BAAI/bge-small-en-v1.5"), HuggingFaceTokenizer)
+    assert FixedSizeChunking(tokenizer="o200k_base").tokenizer is get_tokenizer("o200k_base")
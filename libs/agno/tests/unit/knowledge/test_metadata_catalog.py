@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agno.db.in_memory import InMemoryDb
+from agno.db.json import JsonDb
+from agno.db.sqlite import SqliteDb
+from agno.knowledge.content import Content
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.metadata_catalog import MetadataCatalog
+
+
+def test_catalog_tracks_key_and_value_counts():
+    catalog = MetadataCatalog.build([{"user": "a", "topic": "x"}, {"user": "b"}, None])
+
+    assert catalog.keys() == {"user", "topic"}
+    assert catalog.key_counts["user"] == 2
+    assert catalog.get_value_cardinality("user") == 2
+
+    catalog.remove({"user": "a", "topic": "x"})
+    assert catalog.keys() == {"user"}
+    assert catalog.get_value_cardinality("user") == 1
+
+
+def test_catalog_replace_is_noop_for_same_metadata():
+    catalog = MetadataCatalog.build([{"user": "a"}])
+
+    assert catalog.replace({"user": "a"}, {"user": "a"}) is False
+    assert catalog.replace({"user": "a"}, {"user": "b"}) is True
+    assert catalog.value_counts["user"] == {"b": 1}
+
+
+def test_catalog_stops_tracking_high_cardinality_values():
+    catalog = MetadataCatalog.build([{"id": i} for i in range(5)], max_tracked_values=3)
+
+    assert catalog.key_counts["id"] == 5
+    assert catalog.get_value_cardinality("id") is None
+
+    restored = MetadataCatalog.from_dict(catalog.to_dict())
+    assert restored.keys() == {"id"}
+    assert restored.get_value_cardinality("id") is None
+
+
+@pytest.fixture(params=["in_memory", "sqlite"])
+def contents_db(request, tmp_path):
+    if request.param == "in_memory":
+        return InMemoryDb()
+    return SqliteDb(db_file=str(tmp_path / "knowledge.db"))
+
+
+def test_knowledge_picks_up_new_filter_keys(contents_db):
+    knowledge = Knowledge(contents_db=contents_db)
+    knowledge._add_to_contents_db(Content(id="1", name="one", metadata={"user": "a"}))
+    assert knowledge.get_valid_filters() == {"user"}
+
+    knowledge._add_to_contents_db(Content(id="2", name="two", metadata={"topic": "x"}))
+    valid_filters, invalid_keys = knowledge.validate_filters({"topic": "x", "missing": 1})
+    assert valid_filters == {"topic": "x"}
+    assert invalid_keys == ["missing"]
+
+    knowledge._update_content(Content(id="2", metadata={"category": "y"}))
+    knowledge.remove_content_by_id("1")
+    assert knowledge.get_metadata_catalog().keys() == {"category"}  # type: ignore
+
+
+def test_catalog_is_persisted_in_contents_db(tmp_path):
+    contents_db = SqliteDb(db_file=str(tmp_path / "knowledge.db"))
+    Knowledge(contents_db=contents_db)._add_to_contents_db(Content(id="1", name="one", metadata={"user": "a"}))
+
+    stored = contents_db.get_knowledge_metadata_catalog(contents_db.knowledge_table_name)
+    assert stored is not None and stored["key_counts"] == {"user": 1}
+    assert Knowledge(contents_db=contents_db).get_metadata_catalog().keys() == {"user"}  # type: ignore
+
+
+@pytest.mark.parametrize("db_type", ["in_memory", "sqlite", "json"])
+def test_concurrent_changes_are_not_lost(db_type, tmp_path):
+    if db_type == "in_memory":
+        contents_db = InMemoryDb()
+    elif db_type == "sqlite":
+        contents_db = SqliteDb(db_file=str(tmp_path / "knowledge.db"))
+    else:
+        contents_db = JsonDb(db_path=str(tmp_path / "knowledge"))
+    Knowledge(contents_db=contents_db)._add_to_contents_db(Content(id="0", name="zero", metadata={"key_0": 0}))
+
+    def add(i: int) -> None:
+        # A knowledge instance per writer, as in separate processes
+        knowledge = Knowledge(contents_db=contents_db)
+        knowledge._add_to_contents_db(Content(id=str(i), name=f"content {i}", metadata={f"key_{i}": i}))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(add, range(1, 33)))
+
+    stored = contents_db.get_knowledge_metadata_catalog(contents_db.knowledge_table_name)
+    assert stored is not None and set(stored["key_counts"]) == {f"key_{i}" for i in range(33)}
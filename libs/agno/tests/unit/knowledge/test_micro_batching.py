@@ -0,0 +1,66 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from agno.knowledge.batching import MicroBatcher
+
+
+class RecordingModel:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def encode(self, texts):
+        with self.lock:
+            self.calls.append(list(texts))
+        return [len(text) for text in texts]
+
+
+def test_concurrent_requests_are_coalesced():
+    model = RecordingModel()
+    batcher = MicroBatcher(model.encode, max_batch_size=64, max_wait_ms=50)
+
+    texts = [f"text {'x' * i}" for i in range(16)]
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(lambda text: batcher([text])[0], texts))
+
+    assert results == [len(text) for text in texts]
+    assert len(model.calls) < len(texts)
+    assert sum(len(call) for call in model.calls) == len(texts)
+    batcher.close()
+
+
+def test_batches_respect_max_batch_size():
+    model = RecordingModel()
+    batcher = MicroBatcher(model.encode, max_batch_size=4, max_wait_ms=20)
+
+    futures = [batcher.submit(["a", "bb"]) for _ in range(5)]
+
+    assert [future.result() for future in futures] == [[1, 2]] * 5
+    assert all(len(call) <= 4 for call in model.calls)
+    batcher.close()
+
+
+def test_errors_are_raised_in_every_caller():
+    def fail(_):
+        raise RuntimeError("model failed")
+
+    batcher = MicroBatcher(fail, max_wait_ms=1)
+
+    with pytest.raises(RuntimeError, match="model failed"):
+        batcher(["a"])
+    batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_async_callers_await_the_worker():
+    model = RecordingModel()
+    batcher = MicroBatcher(model.encode, max_wait_ms=50)
+
+    results = await asyncio.gather(*[asyncio.wrap_future(batcher.submit([text])) for text in ["a", "bb", "ccc"]])
+
+    assert results == [[1], [2], [3]]
+    assert model.calls == [["a", "bb", "ccc"]]
+    batcher.close()
@@ -0,0 +1,77 @@
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agno.knowledge.document import Document
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.search_cache import SearchCache
+
+
+@pytest.fixture
+def vector_db():
+    vector_db = MagicMock()
+    vector_db.search.return_value = [Document(content="cached doc")]
+    vector_db.async_search = AsyncMock(return_value=[Document(content="cached doc")])
+    return vector_db
+
+
+def test_search_results_are_cached_by_normalized_query(vector_db):
+    knowledge = Knowledge(vector_db=vector_db, cache_search_results=True)
+
+    first = knowledge.search("What is  Agno?")
+    second = knowledge.search("what is agno?")
+
+    assert first[0].content == second[0].content == "cached doc"
+    assert vector_db.search.call_count == 1
+    stats = knowledge.get_search_cache_stats()
+    assert stats is not None and stats["hits"] == 1 and stats["hit_rate"] == 0.5
+
+
+def test_filters_and_limit_are_part_of_the_key(vector_db):
+    knowledge = Knowledge(vector_db=vector_db, cache_search_results=True)
+
+    knowledge.search("query", filters={"user": "a"})
+    knowledge.search("query", filters={"user": "b"})
+    knowledge.search("query", max_results=3, filters={"user": "a"})
+    knowledge.search("query", filters={"user": "a"})
+
+    assert vector_db.search.call_count == 3
+
+
+def test_removing_content_invalidates_cache(vector_db):
+    knowledge = Knowledge(vector_db=vector_db, cache_search_results=True)
+
+    knowledge.search("query")
+    knowledge.remove_content_by_id("content-1")
+    knowledge.search("query")
+
+    assert vector_db.search.call_count == 2
+
+
+def test_results_from_before_invalidation_are_not_stored():
+    cache = SearchCache()
+    key = cache.get_key("query", limit=5)
+    cache.invalidate()
+    cache.set(key, [Document(content="stale")])
+
+    assert cache.get(cache.get_key("query", limit=5)) is None
+
+
+def test_cached_results_expire():
+    cache = SearchCache(ttl=0.01)
+    key = cache.get_key("query", limit=5)
+    cache.set(key, [Document(content="doc")])
+    time.sleep(0.02)
+
+    assert cache.get(key) is None
+
+
+@pytest.mark.asyncio
+async def test_async_search_uses_cache(vector_db):
+    knowledge = Knowledge(vector_db=vector_db, cache_search_results=True)
+
+    await knowledge.async_search("query")
+    await knowledge.async_search("query")
+
+    assert vector_db.async_search.await_count == 1
@@ -0,0 +1,59 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from agno.db.in_memory import InMemoryDb
+from agno.knowledge.chunking.row import RowChunking
+from agno.knowledge.content import ContentStatus
+from agno.knowledge.knowledge import Knowledge
+from agno.knowledge.reader.text_reader import TextReader
+
+
+def _vector_db() -> MagicMock:
+    vector_db = MagicMock()
+    vector_db.content_hash_exists.return_value = False
+    vector_db.upsert_available.return_value = True
+    vector_db.async_upsert = AsyncMock()
+    vector_db.async_insert = AsyncMock()
+    return vector_db
+
+
+def test_streamed_files_are_inserted_in_batches(tmp_path):
+    path = tmp_path / "rows.txt"
+    path.write_text("".join(f"row {i}\n" for i in range(5)))
+    vector_db = _vector_db()
+    knowledge = Knowledge(vector_db=vector_db, stream_batch_size=2)
+    reader = TextReader(chunking_strategy=RowChunking())
+
+    asyncio.run(knowledge.add_content_async(path=str(path), reader=reader))
+
+    # The first batch replaces the documents of the content, and the next ones are added to it
+    batches = [vector_db.async_upsert.call_args.args[1]]
+    batches += [call.kwargs["documents"] for call in vector_db.async_insert.call_args_list]
+    assert [[doc.content for doc in batch] for batch in batches] == [["row 0", "row 1"], ["row 2", "row 3"], ["row 4"]]
+    assert all(doc.content_id is not None for batch in batches for doc in batch)
+
+
+def test_read_errors_mid_stream_fail_the_content(tmp_path):
+    path = tmp_path / "rows.txt"
+    # The invalid byte is in the second block the reader decodes, after the first rows were inserted
+    path.write_bytes("".join(f"row {i:<60}\n" for i in range(20000)).encode() + b"\xff\n")
+    vector_db = _vector_db()
+    knowledge = Knowledge(vector_db=vector_db, contents_db=InMemoryDb(), stream_batch_size=5000)
+    reader = TextReader(chunking_strategy=RowChunking())
+
+    asyncio.run(knowledge.add_content_async(path=str(path), reader=reader))
+
+    contents, _ = knowledge.get_content()
+    assert vector_db.async_upsert.called
+    assert knowledge.get_content_status(contents[0].id) == (ContentStatus.FAILED, "Could not read content")  # type: ignore
+
+
+def test_upsert_of_an_empty_stream_removes_the_old_documents(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    vector_db = _vector_db()
+    knowledge = Knowledge(vector_db=vector_db)
+
+    asyncio.run(knowledge.add_content_async(path=str(path), reader=TextReader(chunking_strategy=RowChunking())))
+
+    assert vector_db.async_upsert.call_args.args[1] == []
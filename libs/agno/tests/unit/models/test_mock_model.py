@@ -0,0 +1,76 @@
+import asyncio
+from copy import deepcopy
+
+import pytest
+from pydantic import BaseModel
+
+from agno.agent import Agent
+from agno.exceptions import ModelRateLimitError
+from agno.models.mock import MockModel, MockResponse
+
+
+def get_weather(city: str) -> str:
+    """Get the weather in a city."""
+    return f"Sunny in {city}"
+
+
+def test_scripted_tool_call_then_answer():
+    model = MockModel(
+        responses=[MockResponse(tool_calls=[{"name": "get_weather", "arguments": {"city": "Paris"}}]), "It is sunny."],
+        record_calls=True,
+    )
+    response = Agent(model=model, tools=[get_weather], telemetry=False).run("Weather in Paris?")
+
+    assert response.content == "It is sunny."
+    assert [tool.tool_name for tool in response.tools] == ["get_weather"]  # type: ignore
+    # The second call sees the result of the tool
+    assert model.calls[1][-1].role == "tool"
+    assert model.calls[1][-1].content == "Sunny in Paris"
+    assert response.metrics.output_tokens == 3  # type: ignore
+
+
+def test_stream_is_chunked_by_tokens():
+    model = MockModel(default_response="one two three four five", tokens_per_chunk=2)
+    agent = Agent(model=model, telemetry=False)
+
+    chunks = [event.content for event in agent.run("count", stream=True) if event.event == "RunContent"]
+
+    assert chunks == ["one two", " three four", " five"]
+
+
+def test_script_cycles_and_callables_see_the_messages():
+    model = MockModel(responses=["first", lambda messages: f"echo: {messages[-1].content}"], cycle=True)
+    agent = Agent(model=model, telemetry=False)
+
+    assert [agent.run(text).content for text in ["a", "b", "c"]] == ["first", "echo: b", "first"]
+
+
+def test_latency_and_token_rate():
+    model = MockModel(default_response="one two three four", latency=0.02, tokens_per_second=100)
+    agent = Agent(model=model, telemetry=False)
+
+    response = asyncio.run(agent.arun("count"))
+
+    assert response.metrics.duration >= 0.06  # type: ignore
+
+
+def test_structured_output_and_scripted_errors():
+    class City(BaseModel):
+        name: str
+
+    model = MockModel(responses=[MockResponse(content=City(name="Paris"))])
+    agent = Agent(model=model, output_schema=City, telemetry=False)
+    assert agent.run("Capital of France?").content == City(name="Paris")
+
+    failing = Agent(model=MockModel(responses=[MockResponse(error=ModelRateLimitError("slow down"))]), telemetry=False)
+    with pytest.raises(ModelRateLimitError):
+        failing.run("hi")
+
+
+def test_models_have_their_own_lock_and_record_calls_on_request():
+    model = MockModel()
+    Agent(model=model, telemetry=False).run("hi")
+
+    assert model.calls == []
+    assert model._script_lock is not MockModel()._script_lock
+    assert deepcopy(model)._script_lock is not model._script_lock
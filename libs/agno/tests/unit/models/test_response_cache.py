@@ -0,0 +1,160 @@
+import asyncio
+from dataclasses import dataclass
+from typing import List
+
+from agno.db.in_memory import InMemoryDb
+from agno.models.base import Model
+from agno.models.cache import ResponseCache
+from agno.models.message import Message
+from agno.models.metrics import Metrics
+from agno.models.response import ModelResponse
+
+
+@dataclass
+class CountingModel(Model):
+    id: str = "counting-model"
+    temperature: float = 0.0
+
+    def __post_init__(self):
+        super().__post_init__()
+        # Not a field, so it isn't part of the cache key
+        self.calls: List[str] = []
+
+    def invoke(self, *args, **kwargs) -> ModelResponse:
+        self.calls.append("invoke")
+        return ModelResponse(role="assistant", content="hello", response_usage=Metrics(input_tokens=3))
+
+    async def ainvoke(self, *args, **kwargs) -> ModelResponse:
+        self.calls.append("ainvoke")
+        return ModelResponse(role="assistant", content="hello")
+
+    def invoke_stream(self, *args, **kwargs):
+        self.calls.append("invoke_stream")
+        yield ModelResponse(content="hel")
+        yield ModelResponse(content="lo")
+
+    async def ainvoke_stream(self, *args, **kwargs):
+        self.calls.append("ainvoke_stream")
+        yield ModelResponse(content="hel")
+        yield ModelResponse(content="lo")
+
+    def _parse_provider_response(self, response, **kwargs) -> ModelResponse:
+        return ModelResponse(content=response)
+
+    def _parse_provider_response_delta(self, response) -> ModelResponse:
+        return ModelResponse(content=response)
+
+
+class KeywordEmbedder:
+    """Embeds a prompt by whether it mentions the weather."""
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [1.0, 0.0] if "weather" in text else [0.0, 1.0]
+
+    async def async_get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+
+def _messages(prompt: str = "Say hello") -> List[Message]:
+    return [Message(role="system", content="Be brief"), Message(role="user", content=prompt)]
+
+
+def test_responses_are_not_cached_by_default():
+    model = CountingModel()
+
+    model.response(messages=_messages())
+    model.response(messages=_messages())
+
+    assert model.calls == ["invoke", "invoke"]
+
+
+def test_identical_calls_are_served_from_the_cache():
+    cache = ResponseCache()
+    model = CountingModel(cache_response=True, response_cache=cache)
+
+    first = model.response(messages=_messages())
+    second = model.response(messages=_messages())
+
+    assert model.calls == ["invoke"]
+    assert first.content == second.content == "hello"
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_cache_key_includes_prompt_and_sampling_params():
+    cache = ResponseCache()
+    model = CountingModel(cache_response=True, response_cache=cache)
+
+    model.response(messages=_messages("Say hello"))
+    model.response(messages=_messages("Say goodbye"))
+    model.temperature = 0.7
+    model.response(messages=_messages("Say hello"))
+
+    assert model.calls == ["invoke", "invoke", "invoke"]
+
+
+def test_cached_stream_is_replayed():
+    model = CountingModel(cache_response=True, response_cache=ResponseCache())
+
+    first = [r.content for r in model.response_stream(messages=_messages()) if isinstance(r, ModelResponse)]
+    second = [r.content for r in model.response_stream(messages=_messages()) if isinstance(r, ModelResponse)]
+
+    assert model.calls == ["invoke_stream"]
+    assert first == second == ["hel", "lo"]
+
+
+def test_async_calls_use_the_cache():
+    model = CountingModel(cache_response=True, response_cache=ResponseCache())
+
+    async def run():
+        await model.aresponse(messages=_messages())
+        await model.aresponse(messages=_messages())
+        return [r.content async for r in model.aresponse_stream(messages=_messages())]
+
+    assert asyncio.run(run()) == ["hel", "lo"]
+    assert model.calls == ["ainvoke", "ainvoke_stream"]
+
+
+def test_ttl_expires_entries():
+    cache = ResponseCache(ttl=0)
+    model = CountingModel(cache_response=True, response_cache=cache)
+
+    model.response(messages=_messages())
+    model.response(messages=_messages())
+
+    assert model.calls == ["invoke", "invoke"]
+
+
+def test_lru_evicts_oldest_entry():
+    cache = ResponseCache(max_entries=1)
+    model = CountingModel(cache_response=True, response_cache=cache)
+
+    model.response(messages=_messages("a"))
+    model.response(messages=_messages("b"))
+    model.response(messages=_messages("a"))
+
+    assert len(model.calls) == 3
+
+
+def test_responses_are_stored_in_db():
+    db = InMemoryDb()
+    model = CountingModel(cache_response=True, response_cache=ResponseCache(db=db))
+    model.response(messages=_messages())
+
+    # A new cache on the same db sees the stored response
+    other = CountingModel(cache_response=True, response_cache=ResponseCache(db=db))
+    response = other.response(messages=_messages())
+
+    assert other.calls == []
+    assert response.content == "hello"
+
+
+def test_similar_prompts_use_semantic_cache():
+    cache = ResponseCache(embedder=KeywordEmbedder(), similarity_threshold=0.9)  # type: ignore
+    model = CountingModel(cache_response=True, response_cache=cache)
+
+    model.response(messages=_messages("What's the weather like?"))
+    model.response(messages=_messages("How is the weather today?"))
+    model.response(messages=_messages("Tell me a joke"))
+
+    assert model.calls == ["invoke", "invoke"]
+    assert cache.get_stats()["semantic_hits"] == 1
@@ -6,6 +6,7 @@ from unittest.mock import patch
 
 import pytest
 
+from agno.knowledge.chunking.fixed import FixedSizeChunking
 from agno.knowledge.document.base import Document
 from agno.knowledge.reader.text_reader import TextReader
 
@@ -336,3 +337,18 @@ async def test_async_parallel_chunking():
     finally:
         # Restore original processor
         reader._async_chunk_document = original_processor
+
+
+def test_iter_read_yields_chunks_of_the_whole_file(tmp_path):
+    test_data = " ".join(f"Sentence {i} of the file, with 中文." for i in range(500))
+    text_path = tmp_path / "large.txt"
+    text_path.write_text(test_data, encoding="utf-8")
+
+    reader = TextReader(chunking_strategy=FixedSizeChunking(chunk_size=100))
+    expected = [doc.content for doc in reader.read(text_path)]
+
+    assert [doc.content for doc in reader.iter_read(text_path, block_size=64)] == expected
+    # Multi-byte characters split across blocks are decoded once the block that completes them is read
+    assert [
+        doc.content for doc in reader.iter_read(BytesIO(test_data.encode()), name="large", block_size=5)
+    ] == expected
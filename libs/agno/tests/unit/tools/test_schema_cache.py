@@ -0,0 +1,148 @@
+import gc
+import weakref
+
+from agno.tools.function import Function
+from agno.tools.schema_cache import get_schema_cache
+
+
+def lookup(city: str, days: int = 1, agent=None) -> str:
+    """Look up the weather.
+
+    Args:
+        city: The city to look up
+        days: Number of days to forecast
+    """
+    return city
+
+
+def test_processing_is_cached_across_functions():
+    schema_cache = get_schema_cache()
+    schema_cache.clear()
+
+    first = Function(name="lookup", entrypoint=lookup)
+    first.process_entrypoint()
+    second = Function(name="lookup", entrypoint=lookup)
+    second.process_entrypoint()
+
+    assert schema_cache.get_stats()["hits"] == 1
+    assert second.parameters == first.parameters
+    assert second.parameters["required"] == ["city"]
+    assert second.description == "Look up the weather."
+    assert second.entrypoint is first.entrypoint
+
+
+def test_cached_schemas_are_not_shared():
+    get_schema_cache().clear()
+
+    first = Function(name="lookup", entrypoint=lookup)
+    first.process_entrypoint()
+    first.parameters["properties"]["city"]["description"] = "changed"
+
+    second = Function(name="lookup", entrypoint=lookup)
+    second.process_entrypoint()
+    assert second.parameters["properties"]["city"]["description"] != "changed"
+
+
+def test_options_are_part_of_the_key():
+    get_schema_cache().clear()
+
+    plain = Function(name="lookup", entrypoint=lookup)
+    plain.process_entrypoint()
+    strict = Function(name="lookup", entrypoint=lookup)
+    strict.process_entrypoint(strict=True)
+    described = Function(name="lookup", description="Custom", entrypoint=lookup)
+    described.process_entrypoint()
+
+    assert plain.parameters["required"] == ["city"]
+    assert strict.parameters["required"] == ["city", "days"]
+    assert described.description == "Custom"
+
+
+def test_reprocessing_matches_uncached_result():
+    get_schema_cache().clear()
+    function = Function(name="lookup", entrypoint=lookup)
+    function.process_entrypoint()
+    function.process_entrypoint()
+    expected = function.parameters
+
+    get_schema_cache().clear()
+    uncached = Function(name="lookup", entrypoint=lookup)
+    uncached.process_entrypoint()
+    uncached._process_entrypoint()
+
+    assert expected == uncached.parameters
+
+
+def test_from_callable_is_cached():
+    get_schema_cache().clear()
+
+    first = Function.from_callable(lookup)
+    second = Function.from_callable(lookup, name="renamed")
+
+    assert get_schema_cache().get_stats()["hits"] == 1
+    assert second.name == "renamed"
+    assert second.parameters == first.parameters
+    assert get_schema_cache().get_parameter_names(lookup) == {"city", "days", "agent"}
+
+
+class Weather:
+    def __init__(self, unit: str):
+        self.unit = unit
+
+    def forecast(self, city: str) -> str:
+        """Forecast the weather.
+
+        Args:
+            city: The city to forecast
+        """
+        return f"{city} in {self.unit}"
+
+
+def test_methods_share_entries_across_instances():
+    get_schema_cache().clear()
+
+    celsius = Function(name="forecast", entrypoint=Weather("celsius").forecast)
+    celsius.process_entrypoint()
+    fahrenheit = Function(name="forecast", entrypoint=Weather("fahrenheit").forecast)
+    fahrenheit.process_entrypoint()
+
+    assert get_schema_cache().get_stats()["hits"] == 1
+    assert fahrenheit.parameters["required"] == ["city"]
+    assert celsius.entrypoint(city="Paris") == "Paris in celsius"  # type: ignore
+    assert fahrenheit.entrypoint(city="Paris") == "Paris in fahrenheit"  # type: ignore
+
+
+def test_entries_do_not_keep_instances_alive():
+    get_schema_cache().clear()
+    weather = Weather("celsius")
+    instance = weakref.ref(weather)
+
+    function = Function(name="forecast", entrypoint=weather.forecast)
+    function.process_entrypoint()
+    del weather, function
+    gc.collect()
+
+    assert instance() is None
+
+
+def build_search_tool(run_output: Weather) -> Function:
+    def search(query: str) -> str:
+        """Search the knowledge base."""
+        return f"{query} for {run_output.unit}"
+
+    return Function.from_callable(search)
+
+
+def test_per_run_closures_are_not_cached():
+    get_schema_cache().clear()
+    run_outputs = []
+
+    for i in range(3):
+        run_output = Weather(f"run-{i}")
+        run_outputs.append(weakref.ref(run_output))
+        build_search_tool(run_output).process_entrypoint()
+        del run_output
+    gc.collect()
+
+    assert all(run_output() is None for run_output in run_outputs)
+    assert get_schema_cache().get_stats() == {"entries": 0, "hits": 0, "misses": 0}
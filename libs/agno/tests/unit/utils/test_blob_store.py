@@ -0,0 +1,108 @@
+import pytest
+
+from agno.media import Audio, Image
+from agno.models.message import Message
+from agno.run.agent import RunOutput
+from agno.session.agent import AgentSession
+from agno.utils.blob_store import LocalBlobStore, get_blob_store, offload_media, set_blob_store
+
+
+@pytest.fixture
+def blob_store(tmp_path):
+    previous = get_blob_store()
+    store = LocalBlobStore(base_dir=tmp_path)
+    set_blob_store(store)
+    yield store
+    set_blob_store(previous)
+
+
+def test_put_is_content_addressed(blob_store, tmp_path):
+    ref_1 = blob_store.put(b"image bytes")
+    ref_2 = blob_store.put(b"image bytes")
+
+    assert ref_1 == ref_2
+    assert ref_1.startswith("sha256:")
+    assert blob_store.get(ref_1) == b"image bytes"
+    assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+
+
+def test_media_inline_outside_offload_context(blob_store):
+    image_dict = Image(content=b"image bytes").to_dict()
+
+    assert "content" in image_dict
+    assert "content_ref" not in image_dict
+
+
+def test_media_offloaded_and_hydrated(blob_store):
+    with offload_media():
+        image_dict = Image(content=b"image bytes", format="png").to_dict()
+
+    assert "content" not in image_dict
+    restored = Image.model_validate(image_dict)
+    assert restored.get_content() == b"image bytes"
+    assert restored.format == "png"
+
+
+def test_session_round_trip_keeps_only_references(blob_store):
+    payload = b"x" * 100_000
+    run = RunOutput(run_id="run-1", images=[Image(content=payload)], audio=[Audio(content=payload)])
+    session = AgentSession(session_id="session-1", runs=[run])
+
+    with offload_media():
+        session_dict = session.to_dict()
+
+    assert len(str(session_dict)) < 10_000
+    restored = AgentSession.from_dict(session_dict)
+    assert restored is not None and restored.runs is not None
+    assert restored.runs[0].images[0].get_content() == payload  # type: ignore
+    assert restored.runs[0].audio[0].get_content() == payload  # type: ignore
+
+
+def test_content_is_loaded_when_needed(blob_store, monkeypatch):
+    with offload_media():
+        image_dict = Image(content=b"image bytes").to_dict()
+    reads = []
+    read = blob_store.read
+    monkeypatch.setattr(blob_store, "read", lambda key: reads.append(key) or read(key))
+
+    image = Image.model_validate(image_dict)
+    assert reads == []
+    # Saving it again doesn't load it either
+    with offload_media():
+        assert image.to_dict()["content_ref"] == image_dict["content_ref"]
+    assert reads == []
+
+    assert image.content is None
+    assert image.get_content() == b"image bytes"
+    assert image.get_content_bytes() == b"image bytes"
+    assert len(reads) == 1
+
+
+def test_dumps_include_the_content(blob_store):
+    with offload_media():
+        image_dict = Image(content=b"image bytes").to_dict()
+
+    assert Image.model_validate(image_dict).model_dump()["content"] == b"image bytes"
+
+
+def test_history_messages_load_their_media(blob_store):
+    run = RunOutput(
+        run_id="run-1",
+        agent_id="agent",
+        messages=[Message(role="user", content="Describe it", images=[Image(content=b"image bytes")])],
+    )
+    with offload_media():
+        session_dict = AgentSession(session_id="session-1", runs=[run]).to_dict()
+    session = AgentSession.from_dict(session_dict)
+
+    history = session.get_messages_from_last_n_runs(agent_id="agent")  # type: ignore
+
+    assert history[0].images[0].content == b"image bytes"  # type: ignore
+
+
+def test_missing_blob_keeps_the_reference(blob_store):
+    image = Image.model_validate({"content_ref": "sha256:missing"})
+
+    assert image.content is None
+    assert image.content_ref == "sha256:missing"
+    assert image.to_dict()["content_ref"] == "sha256:missing"
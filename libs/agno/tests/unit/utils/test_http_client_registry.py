@@ -0,0 +1,103 @@
+import asyncio
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
+import pytest
+
+from agno.utils.http import HttpClientRegistry
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = (self.headers.get("Cookie") or "ok").encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "session=secret; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = HTTPServer(("127.0.0.1", 0), OkHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_clients_are_shared_per_origin_and_proxy():
+    registry = HttpClientRegistry()
+
+    client = registry.get_client("https://api.example.com/v1")
+
+    assert registry.get_client("https://api.example.com/v2") is client
+    assert registry.get_client("https://other.example.com") is not client
+    assert registry.get_client("https://api.example.com", proxy="http://proxy:8080") is not client
+    assert registry.get_client("https://api.example.com", follow_redirects=False) is not client
+    assert registry.get_client(scope="Groq") is not registry.get_client(scope="OpenAI")
+    registry.close()
+
+
+def test_closing_a_shared_client_keeps_it_open():
+    registry = HttpClientRegistry()
+    client = registry.get_client()
+    client.close()
+    with client:
+        pass
+
+    assert not client.is_closed
+    assert registry.get_client() is client
+    registry.close()
+    assert client.is_closed
+    assert registry.get_client() is not client
+
+
+def test_shared_clients_do_not_keep_cookies(server_url):
+    registry = HttpClientRegistry()
+    client = registry.get_client()
+
+    client.get(server_url)
+
+    assert client.get(server_url).text == "ok"
+    assert len(client.cookies) == 0
+    # Cookie headers set by the caller are still sent
+    assert client.get(server_url, headers={"Cookie": "a=b"}).text == "a=b"
+    registry.close()
+
+
+def test_async_clients_are_shared_per_event_loop():
+    registry = HttpClientRegistry()
+
+    async def get_clients():
+        return registry.get_async_client(), registry.get_async_client()
+
+    first, second = asyncio.run(get_clients())
+    other_loop, _ = asyncio.run(get_clients())
+
+    assert first is second
+    assert other_loop is not first
+
+
+def test_stats_count_requests_and_pooled_connections(server_url):
+    registry = HttpClientRegistry(max_connections=10)
+    client = registry.get_client(server_url)
+
+    for _ in range(3):
+        assert client.get(f"{server_url}/ping").text == "ok"
+
+    stats = registry.get_stats()
+    pool = stats["pools"][server_url]
+    assert stats["requests"] == 3
+    assert stats["clients"] == 1
+    # Keep-alive reuses the same connection for every request
+    assert pool["connections"] == 1
+    assert pool["idle_connections"] == 1
+    assert pool["max_connections"] == 10
+    registry.close()
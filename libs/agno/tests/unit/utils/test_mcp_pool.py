@@ -0,0 +1,152 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from anyio import ClosedResourceError
+
+from agno.utils.mcp_pool import TOOLS_LIST_CHANGED, MCPSessionPool
+
+
+class FakeSession:
+    def __init__(self, server):
+        self.server = server
+        self.broken = False
+
+    async def call_tool(self, name, arguments=None):
+        if self.broken:
+            raise ClosedResourceError()
+        self.server.in_flight += 1
+        self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        await asyncio.sleep(self.server.delay)
+        self.server.in_flight -= 1
+        return f"{name}:{arguments}"
+
+    async def list_tools(self):
+        self.server.list_calls += 1
+        return ["tool"]
+
+    async def send_ping(self):
+        if self.broken:
+            raise ClosedResourceError()
+
+
+class FakeServer:
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.list_calls = 0
+        self.opened = []
+
+    async def connect(self, exit_stack):
+        await asyncio.sleep(0)
+        session = FakeSession(self)
+        self.opened.append(session)
+        return session
+
+
+@pytest.mark.asyncio
+async def test_calls_run_concurrently_across_sessions():
+    server = FakeServer()
+    pool = MCPSessionPool(server.connect, size=3)
+
+    results = await asyncio.gather(*[pool.call_tool("echo", {"i": i}) for i in range(6)])
+
+    assert results == [f"echo:{{'i': {i}}}" for i in range(6)]
+    assert len(server.opened) == 3
+    assert server.max_in_flight == 3
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_broken_session_is_reopened():
+    server = FakeServer(delay=0)
+    pool = MCPSessionPool(server.connect, size=1, reconnect_backoff=0)
+    await pool.start()
+    server.opened[0].broken = True
+
+    assert await pool.call_tool("echo") == "echo:None"
+    assert len(server.opened) == 2
+    assert pool.get_stats()["reconnects"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_calls_time_out():
+    server = FakeServer(delay=1)
+    pool = MCPSessionPool(server.connect, call_timeout=0.01)
+
+    with pytest.raises(TimeoutError):
+        await pool.call_tool("slow")
+    # The timed out session is replaced before it's used again
+    server.delay = 0
+    assert await pool.call_tool("fast") == "fast:None"
+    assert len(server.opened) == 2
+
+
+@pytest.mark.asyncio
+async def test_tool_list_is_cached_until_it_changes():
+    server = FakeServer()
+    pool = MCPSessionPool(server.connect)
+    changes = []
+    pool.on_tools_changed(lambda: changes.append(True))
+
+    await pool.list_tools()
+    await pool.list_tools()
+    assert server.list_calls == 1
+
+    await pool.handle_message(SimpleNamespace(root=SimpleNamespace(method=TOOLS_LIST_CHANGED)))
+    await pool.list_tools()
+    assert server.list_calls == 2
+    assert changes == [True]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_start_the_pool_once():
+    server = FakeServer(delay=0)
+    pool = MCPSessionPool(server.connect, size=2)
+
+    await asyncio.gather(*[pool.call_tool("echo") for _ in range(5)])
+
+    assert len(server.opened) == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_sessions_are_closed_by_the_task_that_opened_them():
+    tasks = []
+
+    class TaskBoundContext:
+        async def __aenter__(self):
+            tasks.append(asyncio.current_task())
+
+        async def __aexit__(self, *exc_info):
+            # anyio cancel scopes raise when exited from another task
+            assert asyncio.current_task() is tasks[0]
+
+    server = FakeServer(delay=0)
+
+    async def connect(exit_stack):
+        await exit_stack.enter_async_context(TaskBoundContext())
+        return await server.connect(exit_stack)
+
+    pool = MCPSessionPool(connect)
+    await pool.start()
+    # Close from a different task than the one that started the pool
+    await asyncio.create_task(pool.close())
+
+    assert tasks[0].done() and tasks[0].exception() is None
+
+
+@pytest.mark.asyncio
+async def test_discarded_session_raises_a_connection_error():
+    server = FakeServer(delay=0)
+    pool = MCPSessionPool(server.connect)
+    await pool.start()
+    slot = pool._slots[0]
+    await pool._discard(slot)
+
+    with pytest.raises(ConnectionError):
+        slot.get_session()
+    # The next call opens a new session
+    assert await pool.call_tool("echo") == "echo:None"
+    await pool.close()
@@ -0,0 +1,121 @@
+import base64
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from agno.media import Image
+from agno.utils.media_cache import MediaCache, get_media_cache, set_media_cache
+
+
+@pytest.fixture
+def media_cache():
+    previous = get_media_cache()
+    cache = MediaCache()
+    set_media_cache(cache)
+    yield cache
+    set_media_cache(previous)
+
+
+def test_url_bytes_fetched_once(media_cache):
+    fetch = MagicMock(return_value=b"image-bytes")
+
+    assert media_cache.get_url_bytes("https://example.com/a.png", fetch) == b"image-bytes"
+    assert media_cache.get_url_bytes("https://example.com/a.png", fetch) == b"image-bytes"
+    assert fetch.call_count == 1
+
+
+def test_failed_fetch_is_not_cached(media_cache):
+    fetch = MagicMock(side_effect=[None, b"image-bytes"])
+
+    assert media_cache.get_url_bytes("https://example.com/a.png", fetch) is None
+    assert media_cache.get_url_bytes("https://example.com/a.png", fetch) == b"image-bytes"
+    assert fetch.call_count == 2
+
+
+def test_b64encode_reuses_encoding(media_cache):
+    content = b"some media content"
+    first = media_cache.b64encode(content)
+    second = media_cache.b64encode(content)
+
+    assert first == base64.b64encode(content).decode("utf-8")
+    assert first is second
+    assert media_cache.get_stats()["hits"] == 1
+
+
+def test_file_bytes_reloaded_when_file_changes(media_cache, tmp_path):
+    path = tmp_path / "audio.wav"
+    path.write_bytes(b"v1")
+    assert media_cache.get_file_bytes(path) == b"v1"
+
+    path.write_bytes(b"version-2")
+    assert media_cache.get_file_bytes(path) == b"version-2"
+
+
+def test_lru_eviction_respects_bounds():
+    cache = MediaCache(max_entries=2)
+    for i in range(3):
+        cache.get_url_bytes(f"https://example.com/{i}.png", lambda url: url.encode())
+
+    stats = cache.get_stats()
+    assert stats["entries"] == 2
+    fetch = MagicMock(return_value=b"refetched")
+    assert cache.get_url_bytes("https://example.com/0.png", fetch) == b"refetched"
+    assert fetch.call_count == 1
+
+
+def test_disk_tier_survives_new_cache(tmp_path):
+    fetch = MagicMock(return_value=b"remote-bytes")
+    MediaCache(cache_dir=tmp_path).get_url_bytes("https://example.com/a.png", fetch)
+
+    fresh_fetch = MagicMock()
+    assert MediaCache(cache_dir=tmp_path).get_url_bytes("https://example.com/a.png", fresh_fetch) == b"remote-bytes"
+    fresh_fetch.assert_not_called()
+
+
+def test_expired_url_content_is_fetched_again(tmp_path):
+    cache = MediaCache(cache_dir=tmp_path, url_ttl=60)
+    fetch = MagicMock(side_effect=[b"v1", b"v2"])
+    assert cache.get_url_bytes("https://example.com/a.png", fetch) == b"v1"
+
+    cache.clear()
+    path = cache._disk_path("https://example.com/a.png")
+    stale = time.time() - 120
+    os.utime(path, (stale, stale))  # type: ignore
+    assert cache.get_url_bytes("https://example.com/a.png", fetch) == b"v2"
+    assert MediaCache(cache_dir=tmp_path, url_ttl=60).get_url_bytes("https://example.com/a.png", MagicMock()) == b"v2"
+
+    cache.url_ttl = 0.001
+    time.sleep(0.01)
+    assert cache.get_url_bytes("https://example.com/a.png", MagicMock(return_value=b"v3")) == b"v3"
+
+
+def test_error_responses_are_not_cached(media_cache):
+    request = httpx.Request("GET", "https://example.com/cat.png")
+    responses = [
+        httpx.Response(503, content=b"busy", request=request),
+        httpx.Response(200, content=b"cat", request=request),
+    ]
+    with patch("httpx.Client.get", side_effect=responses):
+        with pytest.raises(httpx.HTTPStatusError):
+            Image(url="https://example.com/cat.png").get_content_bytes()
+        assert Image(url="https://example.com/cat.png").get_content_bytes() == b"cat"
+
+
+def test_image_get_content_bytes_uses_cache(media_cache):
+    response = MagicMock(content=b"remote-image")
+    with patch("httpx.Client.get", return_value=response) as mock_get:
+        image = Image(url="https://example.com/cat.png")
+        assert image.get_content_bytes() == b"remote-image"
+        assert Image(url="https://example.com/cat.png").to_base64() == base64.b64encode(b"remote-image").decode()
+        assert mock_get.call_count == 1
+
+
+def test_disabled_cache_always_fetches():
+    cache = MediaCache(enabled=False)
+    fetch = MagicMock(return_value=b"bytes")
+    cache.get_url_bytes("https://example.com/a.png", fetch)
+    cache.get_url_bytes("https://example.com/a.png", fetch)
+    assert fetch.call_count == 2
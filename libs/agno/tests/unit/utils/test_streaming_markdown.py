@@ -0,0 +1,83 @@
+import pytest
+from rich.console import Console
+from rich.markdown import Markdown
+
+from agno.utils.print_response.streaming_markdown import StreamingMarkdown
+from agno.utils.response import escape_markdown_tags
+
+RESPONSE = """# Title
+
+Some *emphasis* and `code`
+on two lines.
+
+```python
+x = 1
+
+y = 2
+```
+
+1. one
+2. two
+
+   continued
+
+3. three
+
+<think>hidden</think> shown
+
+- a
+
+- b
+
+> quote
+
+| a | b |
+|---|---|
+| 1 | 2 |
+
+---
+
+Last paragraph"""
+
+
+def _render(renderable, width: int) -> str:
+    console = Console(width=width, record=True, color_system=None)
+    console.print(renderable)
+    return console.export_text()
+
+
+@pytest.mark.parametrize("width", [30, 80])
+def test_renders_like_markdown_when_streamed(width):
+    markdown = StreamingMarkdown(tags_to_escape={"think"})
+    for char in RESPONSE:
+        markdown.append(char)
+
+    assert _render(markdown, width) == _render(Markdown(escape_markdown_tags(RESPONSE, {"think"})), width)
+
+
+def test_closed_blocks_are_parsed_once():
+    markdown = StreamingMarkdown()
+    markdown.update("First paragraph.\n\nSecond paragraph.\n")
+    first_block = markdown._blocks[0]
+
+    markdown.update("First paragraph.\n\nSecond paragraph.\n\nThird paragraph.\n")
+
+    assert markdown._blocks[0] is first_block
+    assert len(markdown._blocks) == 2
+
+
+def test_code_fences_are_not_split_at_blank_lines():
+    markdown = StreamingMarkdown()
+    markdown.update("```\na\n\nb\n")
+
+    assert markdown._blocks == []
+
+
+def test_replaced_text_is_reparsed():
+    markdown = StreamingMarkdown()
+    markdown.update("Draft answer.\n\nMore")
+    markdown.update("Final answer.")
+
+    assert markdown.markup == "Final answer."
+    assert markdown._blocks == []
+    assert "Final answer." in _render(markdown, 40)
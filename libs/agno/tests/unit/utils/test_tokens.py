@@ -0,0 +1,180 @@
+import pytest
+
+from agno.agent.agent import Agent
+from agno.models.message import Message
+from agno.models.mock import MockModel, MockResponse
+from agno.run.agent import RunOutput
+from agno.session.agent import AgentSession
+from agno.utils.tokens import (
+    CharTokenizer,
+    Tokenizer,
+    count_message_tokens,
+    fit_messages_to_token_budget,
+    fit_texts_to_token_budget,
+    truncate_tool_results,
+)
+
+
+def test_char_tokenizer_counts_and_caches():
+    tokenizer = CharTokenizer(chars_per_token=4)
+    assert tokenizer.count("a" * 10) == 3
+    assert tokenizer.count("a" * 10) == 3
+    assert len(tokenizer._cache) == 1
+
+
+def test_char_tokenizer_decodes_its_tokens():
+    tokenizer = CharTokenizer(chars_per_token=3)
+    text = "caf\u00e9 \u4f60\u597d \U0001f600\x00!"
+    tokens, offsets = tokenizer.encode_with_offsets(text)
+
+    assert tokenizer.decode(tokens) == text
+    assert tokenizer.decode(tokens[1:2]) == text[3:6]
+    assert offsets == list(range(0, len(text), 3))
+    assert tokenizer.truncate("a" * 10, 2) == "aaaaaa" + "\n... [truncated 2 tokens]"
+
+
+class ByteTokenizer(Tokenizer):
+    """Packs `size` UTF-8 bytes in each token, so multibyte characters are split across tokens"""
+
+    def __init__(self, size: int = 1, errors: str = "replace"):
+        super().__init__()
+        self.size = size
+        self.errors = errors
+
+    def encode(self, text):
+        data = text.encode("utf-8")
+        return [int.from_bytes(b"\x01" + data[i : i + self.size], "big") for i in range(0, len(data), self.size)]
+
+    def decode(self, tokens):
+        data = b"".join(token.to_bytes((token.bit_length() + 7) // 8, "big")[1:] for token in tokens)
+        return data.decode("utf-8", errors=self.errors)
+
+
+@pytest.mark.parametrize(
+    "tokenizer, expected",
+    [
+        (ByteTokenizer(), [0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 3, 4, 5]),
+        (ByteTokenizer(errors="strict"), [0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 3, 4, 5]),
+        # "a" and the first byte of the first character, then tokens that start inside characters
+        (ByteTokenizer(size=2), [0, 1, 2, 2, 3, 3, 5]),
+    ],
+)
+def test_offsets_of_characters_split_across_tokens(tokenizer, expected):
+    text = "a\u4f60\u597d\U0001f600 b"
+    tokens, offsets = tokenizer.encode_with_offsets(text)
+
+    assert tokenizer.decode(tokens) == text
+    assert offsets == expected
+
+
+def test_truncate_tool_results_only_touches_tool_messages():
+    tokenizer = CharTokenizer(chars_per_token=1)
+    messages = [Message(role="user", content="x" * 50), Message(role="tool", content="y" * 50)]
+    truncate_tool_results(messages, max_tokens=10, tokenizer=tokenizer)
+
+    assert messages[0].content == "x" * 50
+    assert messages[1].content.startswith("y" * 10)  # type: ignore
+    assert "truncated 40 tokens" in messages[1].content  # type: ignore
+
+
+def test_fit_messages_keeps_newest_whole_turns():
+    tokenizer = CharTokenizer(chars_per_token=1)
+    messages = [
+        Message(role="user", content="old question"),
+        Message(role="assistant", content="old answer"),
+        Message(role="user", content="new question"),
+        Message(role="assistant", tool_calls=[{"id": "1", "function": {"name": "f", "arguments": "{}"}}]),
+        Message(role="tool", content="result", tool_call_id="1"),
+        Message(role="assistant", content="new answer"),
+    ]
+    budget = sum(count_message_tokens(m, tokenizer) for m in messages[2:])
+
+    kept = fit_messages_to_token_budget(messages, budget, tokenizer=tokenizer)
+    assert kept == messages[2:]
+
+
+def test_fit_texts_stops_at_budget():
+    tokenizer = CharTokenizer(chars_per_token=1)
+    assert fit_texts_to_token_budget(["aaaa", "bbbb", "cc"], 9, tokenizer=tokenizer) == ["aaaa", "bbbb"]
+
+
+def test_agent_history_uses_token_budget():
+    runs = []
+    for i in range(5):
+        runs.append(
+            RunOutput(
+                run_id=f"run-{i}",
+                agent_id="agent",
+                messages=[
+                    Message(role="user", content=f"question {i} " + "q" * 100),
+                    Message(role="assistant", content=f"answer {i} " + "a" * 100),
+                ],
+            )
+        )
+    session = AgentSession(session_id="session", runs=runs)
+    tokenizer = CharTokenizer(chars_per_token=1)
+    agent = Agent(id="agent", build_context=False, max_history_tokens=500, tokenizer=tokenizer)
+
+    run_messages = agent._get_run_messages(
+        run_response=RunOutput(run_id="new"), input="hi", session=session, add_history_to_context=True
+    )
+    history = [m for m in run_messages.messages if m.from_history]
+
+    assert len(history) == 4
+    assert history[0].content.startswith("question 3")  # type: ignore
+    assert history[-1].content.startswith("answer 4")  # type: ignore
+
+
+def test_agent_history_budget_reads_only_the_newest_runs():
+    runs = [
+        RunOutput(
+            run_id=f"run-{i}",
+            agent_id="agent",
+            messages=[Message(role="user", content="q" * 100), Message(role="assistant", content="a" * 100)],
+        )
+        for i in range(64)
+    ]
+    session = AgentSession(session_id="session", runs=runs)
+    agent = Agent(
+        id="agent",
+        build_context=False,
+        num_history_runs=1,
+        max_history_tokens=500,
+        tokenizer=CharTokenizer(chars_per_token=1),
+    )
+    read_runs = []
+    get_messages = session.get_messages_from_last_n_runs
+
+    def spy(**kwargs):
+        read_runs.append(kwargs["last_n"])
+        return get_messages(**kwargs)
+
+    session.get_messages_from_last_n_runs = spy  # type: ignore
+
+    history = agent._get_history_within_token_budget(session)
+
+    assert len(history) == 4
+    assert read_runs == [1, 2, 4]
+
+
+def test_agent_truncates_tool_results_of_the_current_run():
+    def fetch() -> str:
+        """Fetch a large document"""
+        return "x" * 100
+
+    model = MockModel(
+        responses=[MockResponse(tool_calls=[{"name": "fetch", "arguments": {}}]), "done"], record_calls=True
+    )
+    agent = Agent(model=model, tools=[fetch], max_tool_result_tokens=10, tokenizer=CharTokenizer(chars_per_token=1))
+
+    agent.run("fetch it")
+
+    tool_message = next(m for m in model.calls[-1] if m.role == "tool")
+    assert tool_message.content == "x" * 10 + "\n... [truncated 90 tokens]"
+
+
+def test_agent_knowledge_references_use_token_budget():
+    agent = Agent(max_knowledge_tokens=30, tokenizer=CharTokenizer(chars_per_token=1))
+    docs = ["first document", "second document", "third document"]
+
+    assert agent._convert_documents_to_string(docs) == '[\n  "first document",\n  "second document"\n]'
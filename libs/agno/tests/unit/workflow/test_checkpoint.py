@@ -0,0 +1,86 @@
+import pytest
+
+from agno.db.sqlite import SqliteDb
+from agno.run.base import RunStatus
+from agno.workflow.parallel import Parallel
+from agno.workflow.step import Step
+from agno.workflow.types import StepInput, StepOutput
+from agno.workflow.workflow import Workflow
+
+
+class Pipeline:
+    """Steps that record their calls, with a step that fails until `fail` is switched off."""
+
+    def __init__(self):
+        self.calls = []
+        self.fail = True
+
+    def research(self, step_input: StepInput) -> StepOutput:
+        self.calls.append("research")
+        return StepOutput(content=f"research on {step_input.input}")
+
+    def sources(self, step_input: StepInput) -> StepOutput:
+        self.calls.append("sources")
+        return StepOutput(content="sources")
+
+    def write(self, step_input: StepInput) -> StepOutput:
+        self.calls.append("write")
+        if self.fail:
+            raise RuntimeError("model timed out")
+        gathered = step_input.get_step_content("gather")
+        return StepOutput(content=f"article from {gathered['research']}")  # type: ignore
+
+    def workflow(self, db: SqliteDb) -> Workflow:
+        return Workflow(
+            name="Checkpointed",
+            db=db,
+            session_id="session-1",
+            checkpoint_steps=True,
+            telemetry=False,
+            steps=[
+                Parallel(
+                    Step(name="research", executor=self.research),
+                    Step(name="sources", executor=self.sources),
+                    name="gather",
+                ),
+                Step(name="write", executor=self.write),
+            ],
+        )
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SqliteDb(db_file=str(tmp_path / "workflow.db"))
+
+
+def test_resume_continues_from_first_incomplete_step(db):
+    pipeline = Pipeline()
+    with pytest.raises(RuntimeError):
+        pipeline.workflow(db).run("agno")
+
+    session = db.get_session(session_id="session-1", session_type="workflow")
+    failed_run = session.runs[0]  # type: ignore
+    assert failed_run.status == RunStatus.error
+    assert len(failed_run.step_results) == 1
+    assert len(failed_run.step_results[0].steps) == 2  # type: ignore
+
+    pipeline.calls.clear()
+    pipeline.fail = False
+    result = pipeline.workflow(db).resume(failed_run.run_id)
+
+    assert pipeline.calls == ["write"]
+    assert result.status == RunStatus.completed
+    assert result.content == "article from research on agno"
+    assert not (result.metadata or {}).get("checkpoint")
+
+
+def test_resume_requires_a_checkpoint(db):
+    pipeline = Pipeline()
+    pipeline.fail = False
+    workflow = pipeline.workflow(db)
+    workflow.checkpoint_steps = False
+    run = workflow.run("agno")
+
+    assert workflow.resume(run.run_id).content == run.content  # type: ignore
+    with pytest.raises(ValueError):
+        workflow.resume("missing-run")
@@ -0,0 +1,114 @@
+import json
+
+import pytest
+
+from agno.agent import Agent
+from agno.db.sqlite import SqliteDb
+from agno.models.mock import MockModel
+from agno.workflow.step import Step
+from agno.workflow.step_cache import get_step_output_cache
+from agno.workflow.types import StepInput, StepOutput
+from agno.workflow.workflow import Workflow
+
+calls = []
+
+
+def summarize(step_input: StepInput) -> StepOutput:
+    calls.append(step_input.input)
+    return StepOutput(content=f"summary of {step_input.input}")
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    calls.clear()
+    get_step_output_cache().clear()
+    yield
+    get_step_output_cache().clear()
+
+
+def test_step_output_is_replayed_for_same_input():
+    workflow = Workflow(telemetry=False, steps=[Step(name="summarize", executor=summarize, cache_results=True)])
+
+    first = workflow.run("report")
+    second = workflow.run("report")
+    workflow.run("other report")
+
+    assert first.content == second.content == "summary of report"
+    assert calls == ["report", "other report"]
+
+
+def test_steps_without_caching_always_run():
+    workflow = Workflow(telemetry=False, steps=[Step(name="summarize", executor=summarize)])
+
+    workflow.run("report")
+    workflow.run("report")
+
+    assert calls == ["report", "report"]
+
+
+def test_session_state_is_part_of_the_key():
+    step = Step(name="summarize", executor=summarize, cache_results=True, cache_state_keys=["language"])
+    workflow = Workflow(telemetry=False, steps=[step])
+
+    workflow.run("report", session_state={"language": "en", "counter": 1})
+    workflow.run("report", session_state={"language": "en", "counter": 2})
+    workflow.run("report", session_state={"language": "fr", "counter": 2})
+
+    assert calls == ["report", "report"]
+
+
+def test_outputs_are_cached_in_workflow_db(tmp_path):
+    db = SqliteDb(db_file=str(tmp_path / "workflow.db"))
+
+    def make_workflow() -> Workflow:
+        return Workflow(telemetry=False, db=db, steps=[Step(name="summarize", executor=summarize, cache_results=True)])
+
+    make_workflow().run("report")
+    get_step_output_cache().clear()
+    result = make_workflow().run("report")
+
+    assert result.content == "summary of report"
+    assert calls == ["report"]
+
+
+def make_step(suffix: str, **kwargs) -> Step:
+    def summarize_with_suffix(step_input: StepInput) -> StepOutput:
+        return StepOutput(content=f"summary of {step_input.input}{suffix}")
+
+    return Step(name="summarize", executor=summarize_with_suffix, cache_results=True, **kwargs)
+
+
+def test_cache_key_is_stable_across_function_objects():
+    step_input = StepInput(input="report")
+
+    assert make_step("!")._get_cache_key(step_input, None) == make_step("!")._get_cache_key(step_input, None)
+    assert make_step("!")._get_cache_key(step_input, None) != make_step("?")._get_cache_key(step_input, None)
+    assert make_step("!", cache_version="2")._get_cache_key(step_input, None) != make_step("!")._get_cache_key(
+        step_input, None
+    )
+
+
+def test_cache_key_ignores_memory_addresses():
+    def with_lambda(step_input: StepInput) -> StepOutput:
+        return StepOutput(content=sorted([step_input.input], key=lambda x: x)[0])
+
+    assert "0x" not in json.dumps(Step(name="a", executor=with_lambda)._get_cache_config(), default=str)
+
+
+def test_agent_tools_are_part_of_the_key():
+    def search(query: str) -> str:
+        """Search the web"""
+        return query
+
+    def lookup(query: str) -> str:
+        """Look up a word"""
+        return query
+
+    step_input = StepInput(input="report")
+
+    def key(tools: list) -> str:
+        agent = Agent(model=MockModel(), instructions="Summarize", tools=tools)
+        return Step(name="summarize", agent=agent, cache_results=True)._get_cache_key(step_input, None)  # type: ignore
+
+    assert key([search]) == key([search])
+    assert key([search]) != key([lookup])
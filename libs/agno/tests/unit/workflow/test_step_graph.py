@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agno.workflow.graph import get_step_dependencies
+from agno.workflow.step import Step
+from agno.workflow.types import StepInput, StepOutput
+from agno.workflow.workflow import Workflow
+
+
+def make_research_step(name: str, running: list, delay: float = 0.1) -> Step:
+    lock = threading.Lock()
+
+    def research(step_input: StepInput) -> StepOutput:
+        with lock:
+            running.append(name)
+        time.sleep(delay)
+        return StepOutput(content=f"{name} on {step_input.input}")
+
+    return Step(name=name, executor=research, depends_on=[])
+
+
+def write(step_input: StepInput) -> StepOutput:
+    sources = sorted(step_input.previous_step_outputs or {})
+    return StepOutput(content=f"article from {', '.join(sources)}")
+
+
+def make_workflow(running: list, **kwargs) -> Workflow:
+    return Workflow(
+        telemetry=False,
+        steps=[
+            make_research_step("web", running),
+            make_research_step("papers", running),
+            make_research_step("news", running),
+            Step(name="write", executor=write, depends_on=["web", "papers"]),
+        ],
+        **kwargs,
+    )
+
+
+def test_independent_steps_run_concurrently():
+    running: list = []
+    start = time.perf_counter()
+    result = make_workflow(running).run("agents")
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.25
+    assert result.content == "article from papers, web"
+    assert [step.step_name for step in result.step_results] == ["web", "papers", "news", "write"]  # type: ignore
+
+
+def test_max_concurrent_steps_limits_parallelism():
+    running: list = []
+    start = time.perf_counter()
+    make_workflow(running, max_concurrent_steps=1).run("agents")
+
+    assert time.perf_counter() - start >= 0.3
+
+
+@pytest.mark.asyncio
+async def test_async_graph_execution():
+    async def fetch(step_input: StepInput) -> StepOutput:
+        await asyncio.sleep(0.1)
+        return StepOutput(content="fetched")
+
+    workflow = Workflow(
+        telemetry=False,
+        steps=[
+            Step(name="a", executor=fetch, depends_on=[]),
+            Step(name="b", executor=fetch, depends_on=[]),
+            Step(name="write", executor=write, depends_on=["a", "b"]),
+        ],
+    )
+    start = time.perf_counter()
+    result = await workflow.arun("agents")
+
+    assert time.perf_counter() - start < 0.18
+    assert result.content == "article from a, b"
+
+
+def test_dependencies_must_be_prior_steps():
+    steps = [Step(name="a", executor=write, depends_on=["b"]), Step(name="b", executor=write)]
+
+    with pytest.raises(ValueError):
+        get_step_dependencies(steps, ["a", "b"])
+
+
+def test_steps_without_dependencies_keep_running_in_order():
+    steps = [Step(name="a", executor=write, depends_on=[]), Step(name="b", executor=write)]
+
+    assert get_step_dependencies(steps, ["a", "b"]) == [set(), {0}]
+
+
+def test_concurrent_steps_keep_each_others_session_state_changes():
+    def make_step(name: str, delay: float) -> Step:
+        def research(step_input: StepInput, session_state: dict) -> StepOutput:
+            time.sleep(delay)
+            session_state["results"][name] = delay
+            session_state[f"{name}_done"] = True
+            return StepOutput(content=name)
+
+        return Step(name=name, executor=research, depends_on=[])
+
+    def summarize(step_input: StepInput, session_state: dict) -> StepOutput:
+        done = sorted(key for key in session_state if key.endswith("_done"))
+        return StepOutput(content=f"{sorted(session_state['results'])} {done}")
+
+    workflow = Workflow(
+        telemetry=False,
+        steps=[
+            make_step("web", 0.05),
+            make_step("papers", 0.1),
+            Step(name="summarize", executor=summarize, depends_on=["web", "papers"]),
+        ],
+        session_state={"results": {}},
+    )
+    result = workflow.run("agents")
+
+    assert result.content == "['papers', 'web'] ['papers_done', 'web_done']"